@@ -0,0 +1,221 @@
+"""Benchmark seed generation over the bundled presets.
+
+Generates a fixed set of seeds for each preset and records the wall time and peak memory of every
+phase of the generation, from the spans it emits. Results are written as JSON, so two commits can be compared with --compare.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+
+from randomizer.CompileLogic import PreloadLogicSources
+from randomizer.Fill import Fill_Spoiler, Generate_Spoiler
+from randomizer.Patching.Patcher import load_base_rom
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+from version import version
+
+PRESET_FILE = "static/presets/preset_files.json"
+LOGIC_PATH = "logic"
+FULL_PATH = "full"
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak resident set size of this process, returning whether it's supported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss() -> int:
+    """Get the peak resident set size of this process in bytes, since it was last reset if supported."""
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux but in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class PhaseRecorder:
+    """Records the peak memory of every phase of a seed from the spans it emits."""
+
+    def __init__(self) -> None:
+        """Initialize with an empty record."""
+        self.phases = {}
+
+    def on_event(self, event: dict) -> None:
+        """Reset the peak memory when a phase starts, and add the phase to the record when it ends."""
+        if event["type"] not in ("span_start", "span_end") or event["depth"] != 0:
+            return
+        if event["type"] == "span_start":
+            reset_peak_rss()
+            return
+        record = self.phases.setdefault(event["name"], {"time": 0.0, "peak_rss": 0, "calls": 0})
+        record["time"] += event["duration"]
+        record["peak_rss"] = max(record["peak_rss"], get_peak_rss())
+        record["calls"] += 1
+
+
+def load_presets(names: list) -> list:
+    """Load the presets with a settings string, limited to the given names if any."""
+    with open(PRESET_FILE, "r") as file:
+        presets = [preset for preset in json.load(file) if preset.get("settings_string")]
+    if names:
+        presets = [preset for preset in presets if preset.get("name") in names]
+        missing = set(names) - {preset.get("name") for preset in presets}
+        if missing:
+            raise ValueError("Unknown presets: " + ", ".join(sorted(missing)))
+    return presets
+
+
+def generate_seed(settings_string: str, seed: int, patch_rom: bool) -> dict:
+    """Generate one seed and return its result. Without patching the ROM, only the world is built and filled."""
+    recorder = PhaseRecorder()
+    result = {"seed": seed, "success": True, "error": None}
+    reset_peak_rss()
+    started = time.perf_counter()
+    spoiler = None
+    try:
+        if patch_rom:
+            load_base_rom()
+        settings_dict = decrypt_settings_string_enum(settings_string)
+        settings_dict["seed"] = seed
+        spoiler = Spoiler(Settings(settings_dict))
+        spoiler.events.addListener(recorder.on_event)
+        if patch_rom:
+            Generate_Spoiler(spoiler)
+        else:
+            Fill_Spoiler(spoiler)
+    except Exception as ex:
+        result["success"] = False
+        result["error"] = f"{type(ex).__name__}: {ex}"
+        traceback.print_exc()
+    result["time"] = time.perf_counter() - started
+    # Phases reset the peak, so the seed's peak is the highest of theirs and what came after them
+    result["peak_rss"] = max([get_peak_rss()] + [record["peak_rss"] for record in recorder.phases.values()])
+    result["phases"] = recorder.phases
+    if spoiler is not None:
+        result["fill_retries"] = spoiler.events.getCounter("retries", phase="fill")
+        result["counters"] = spoiler.events.getSummary()["counters"]
+    else:
+        result["fill_retries"] = 0
+        result["counters"] = []
+    return result
+
+
+def summarize(runs: list) -> dict:
+    """Summarize the successful runs of a preset."""
+    successes = [run for run in runs if run["success"]]
+    summary = {"runs": len(runs), "failures": len(runs) - len(successes)}
+    if not successes:
+        return summary
+    summary["time"] = {"mean": statistics.mean(run["time"] for run in successes), "median": statistics.median(run["time"] for run in successes)}
+    summary["peak_rss"] = max(run["peak_rss"] for run in successes)
+    summary["fill_retries"] = sum(run["fill_retries"] for run in successes)
+    phases = {}
+    for run in successes:
+        for phase, record in run["phases"].items():
+            phases.setdefault(phase, []).append(record)
+    summary["phases"] = {
+        phase: {
+            "median": statistics.median(record["time"] for record in records),
+            "max": max(record["time"] for record in records),
+            "peak_rss": max(record["peak_rss"] for record in records),
+        }
+        for phase, records in phases.items()
+    }
+    return summary
+
+
+def get_commit() -> str:
+    """Get the commit being benchmarked, if this is a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(args) -> dict:
+    """Run the benchmark for every preset and path requested."""
+    paths = [LOGIC_PATH, FULL_PATH] if args.path == "both" else [args.path]
+    if FULL_PATH in paths and not os.path.exists("dk64.z64"):
+        print("dk64.z64 not found, only benchmarking the logic.")
+        paths = [LOGIC_PATH]
+    if FULL_PATH in paths:
+        load_base_rom()
+    PreloadLogicSources()
+    seeds = [args.first_seed + index for index in range(args.seeds)]
+    output = {
+        "version": version,
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.time(),
+        "seeds": seeds,
+        "results": {},
+    }
+    for preset in load_presets(args.preset):
+        name = preset.get("name")
+        output["results"][name] = {}
+        for path in paths:
+            runs = []
+            for seed in seeds:
+                print(f"{name} ({path}): seed {seed}")
+                runs.append(generate_seed(preset["settings_string"], seed, path == FULL_PATH))
+            output["results"][name][path] = {"summary": summarize(runs), "runs": runs}
+    return output
+
+
+def compare(old: dict, new: dict) -> None:
+    """Print the median phase times of two benchmark results side by side."""
+    print(f"{'Preset':<32} {'Path':<6} {'Phase':<20} {'Old':>9} {'New':>9} {'Ratio':>7}")
+    for name, paths in new["results"].items():
+        for path, data in paths.items():
+            old_summary = old["results"].get(name, {}).get(path, {}).get("summary", {})
+            new_summary = data["summary"]
+            rows = [("Total", old_summary.get("time", {}).get("median"), new_summary.get("time", {}).get("median"))]
+            for phase, record in new_summary.get("phases", {}).items():
+                rows.append((phase, old_summary.get("phases", {}).get(phase, {}).get("median"), record["median"]))
+            for phase, old_time, new_time in rows:
+                old_text = "-" if old_time is None else f"{old_time:.2f}"
+                ratio = "-" if not old_time else f"{new_time / old_time:.2f}x"
+                print(f"{name[:32]:<32} {path:<6} {phase:<20} {old_text:>9} {new_time:>9.2f} {ratio:>7}")
+
+
+def main():
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description="Benchmark seed generation over the bundled presets.")
+    parser.add_argument("--seeds", type=int, default=3, help="Number of seeds generated for each preset")
+    parser.add_argument("--first_seed", type=int, default=1000, help="Seed ID of the first seed, the rest follow it")
+    parser.add_argument("--preset", action="append", help="Name of a preset to benchmark, can be repeated. Defaults to every preset")
+    parser.add_argument("--path", choices=[LOGIC_PATH, FULL_PATH, "both"], default="both", help="Benchmark the logic only, the full generation with patching, or both")
+    parser.add_argument("--output", default="benchmark.json", help="File the results are written to")
+    parser.add_argument("--compare", help="Results of an earlier benchmark to compare against")
+    args = parser.parse_args()
+    output = run_benchmark(args)
+    with open(args.output, "w") as file:
+        json.dump(output, file, indent=4)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        with open(args.compare, "r") as file:
+            compare(json.load(file), output)
+
+
+if __name__ == "__main__":
+    main()
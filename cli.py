@@ -1,6 +1,7 @@
-"""CLI script for running seed generation."""
+"""CLI script for generating batches of seeds offline."""
 
 import argparse
+import base64
 import codecs
 import json
 import os
@@ -10,101 +11,146 @@ import time
 import traceback
 import zipfile
 from io import BytesIO
+from multiprocessing import Pool
 
-import boto3
-
+from randomizer.CompileLogic import PreloadLogicSources
 from randomizer.Enums.Settings import SettingsMap
 from randomizer.Fill import Generate_Spoiler
-from randomizer.Patching.Patcher import load_base_rom
+from randomizer.Patching.Patcher import create_base_rom_file, load_base_rom
 from randomizer.Settings import Settings
 from randomizer.SettingStrings import decrypt_settings_string_enum
 from randomizer.Spoiler import Spoiler
+from version import version
+
+PRESET_FILE = "static/presets/preset_files.json"
+# Sections of the spoiler log kept in the patch file when the spoiler log isn't generated
+SECTIONS_TO_RETAIN = ["Settings", "Cosmetics", "Spoiler Hints", "Spoiler Hints Data", "Spoiler Hints Human Readable", "Generated Time", "Item Pool"]
+
+
+def start_worker(base_rom):
+    """Load everything a generation needs once per worker process."""
+    load_base_rom(default_file=base_rom)
+    PreloadLogicSources()
+
+
+def generate(setting_data, seed, base_rom):
+    """Generate one seed, returning its result or the reason it failed."""
+    started = time.perf_counter()
+    try:
+        load_base_rom(default_file=base_rom)
+        generate_settings = dict(setting_data)
+        generate_settings["seed"] = seed
+        settings = Settings(generate_settings)
+        spoiler = Spoiler(settings)
+        patch, spoiler = Generate_Spoiler(spoiler)
+        return {
+            "seed": seed,
+            "success": True,
+            "time": time.perf_counter() - started,
+            "patch": patch,
+            "hash": spoiler.settings.seed_hash,
+            "seed_id": spoiler.settings.seed_id,
+            "spoiler_log": spoiler.json,
+            "generate_spoilerlog": spoiler.settings.generate_spoilerlog,
+        }
+    except Exception as e:
+        print(traceback.format_exc())
+        return {"seed": seed, "success": False, "time": time.perf_counter() - started, "error": str(type(e).__name__) + ": " + str(e)}
+
+
+def generate_task(task):
+    """Generate a seed from a task sent to a worker process."""
+    return generate(*task)
+
 
-load_base_rom()
-dynamodb = boto3.resource("dynamodb", aws_access_key_id=os.environ.get("AWS_ID"), aws_secret_access_key=os.environ.get("AWS_KEY"), region_name="us-west-2")
-
-
-def generate(generate_settings, file_name):
-    """Gen a seed and write the file to an output file."""
-    settings = Settings(generate_settings)
-    spoiler = Spoiler(settings)
-    patch, spoiler = Generate_Spoiler(spoiler)
-    hash = spoiler.settings.seed_hash
-    spoiler_log = json.loads(spoiler.json)
-    # Only retain the Settings section and the Cosmetics section.
-    if os.environ.get("HOSTED_SERVER") is not None:
-        seed_table = dynamodb.Table("seed_db")
-        seed_table.put_item(
-            Item={
-                "time": str(time.time()) + str(hash),
-                "seed_id": str(spoiler.settings.seed_id),
-                "spoiler_log": str(json.dumps(spoiler_log)),
-            }
-        )
-    sections_to_retain = ["Settings", "Cosmetics", "Spoiler Hints", "Spoiler Hints Human Readable", "Item Pool"]
-    if spoiler.settings.generate_spoilerlog is False:
-        spoiler_log = {k: v for k, v in spoiler_log.items() if k in sections_to_retain}
-
-    # Zip all the data into a single file.
-    # Create a new zip file
+def make_lanky(result) -> str:
+    """Get the contents of the patch file of a generated seed, as loaded by the site."""
+    spoiler_log = json.loads(result["spoiler_log"])
+    if result["generate_spoilerlog"] is False:
+        spoiler_log = {k: v for k, v in spoiler_log.items() if k in SECTIONS_TO_RETAIN}
     zip_data = BytesIO()
     with zipfile.ZipFile(zip_data, "w") as zip_file:
-        # Write each variable to the zip file
-        zip_file.writestr("patch", patch)
-        zip_file.writestr("hash", str(hash))
+        zip_file.writestr("patch", result["patch"])
+        zip_file.writestr("hash", str(result["hash"]))
         zip_file.writestr("spoiler_log", str(json.dumps(spoiler_log)))
-        zip_file.writestr("seed_id", str(spoiler.settings.seed_id))
-    zip_data.seek(0)
+        zip_file.writestr("seed_id", str(result["seed_id"]))
+        zip_file.writestr("version", version)
+    return codecs.encode(zip_data.getvalue(), "base64").decode()
 
-    # Convert the zip to a string of base64 data
-    zip_conv = codecs.encode(zip_data.getvalue(), "base64").decode()
-    with open(str(file_name), "w") as file_object:
-        file_object.write(zip_conv)
 
+class DirectoryOutput:
+    """Writes the patch file and full spoiler log of each seed to a directory."""
 
-def main():
-    """CLI Entrypoint for generating seeds."""
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--settings_string", help="The settings string to use to generate a seed", required=False)
-    parser.add_argument("--json_data", help="The json data to use to generate a seed", required=False)
-    parser.add_argument("--preset", help="Preset to use", required=False)
-    parser.add_argument("--output", help="File to name patch file", required=True)
-    parser.add_argument("--seed", help="Seed ID to use", required=False)
-    args = parser.parse_args()
-    print("This file is disabled till further notice.")
-    sys.exit(1)
-    if args.json_data is None:
-        if args.settings_string is not None:
-            try:
-                setting_data = decrypt_settings_string_enum(args.settings_string)
-            except Exception:
-                print("Invalid settings String")
-                sys.exit(2)
-        elif args.preset is not None:
-            presets = json.load(open("static/presets/preset_files.json"))
-            found = False
-            for file in presets:
-                with open("static/presets/" + file, "r") as preset_file:
-                    data = json.load(preset_file)
-                    if args.preset == data.get("name"):
-                        setting_data = default
-                        for key in data:
-                            setting_data[key] = data[key]
-                        setting_data.pop("name")
-                        setting_data.pop("description")
-                        found = True
-            if found is False:
-                sys.exit(2)
-        if args.seed is not None:
-            setting_data["seed"] = args.seed
-        else:
-            setting_data["seed"] = random.randint(0, 100000000)
-    else:
-        print(args.json_data)
-        setting_data = json.loads(str(args.json_data))
-        if not setting_data.get("seed"):
-            setting_data["seed"] = random.randint(0, 100000000)
-    # Convert string data to enums where possible.
+    def __init__(self, path):
+        """Create the directory if needed."""
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, result):
+        """Write a generated seed."""
+        with open(os.path.join(self.path, f"{result['seed']}.lanky"), "w") as file:
+            file.write(make_lanky(result))
+        with open(os.path.join(self.path, f"{result['seed']}.json"), "w") as file:
+            file.write(result["spoiler_log"])
+
+    def close(self):
+        """Finish writing."""
+        pass
+
+
+class ZipOutput:
+    """Writes the patch file and full spoiler log of each seed to a zip archive."""
+
+    def __init__(self, path):
+        """Open the archive."""
+        self.archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+
+    def write(self, result):
+        """Write a generated seed."""
+        self.archive.writestr(f"{result['seed']}.lanky", make_lanky(result))
+        self.archive.writestr(f"{result['seed']}.json", result["spoiler_log"])
+
+    def close(self):
+        """Finish writing the archive."""
+        self.archive.close()
+
+
+class JsonLinesOutput:
+    """Writes each seed as a line of JSON holding its patch, hash and spoiler log."""
+
+    def __init__(self, path):
+        """Open the file."""
+        self.file = open(path, "w")
+
+    def write(self, result):
+        """Write a generated seed."""
+        line = {
+            "seed": result["seed"],
+            "seed_id": result["seed_id"],
+            "hash": result["hash"],
+            "patch": base64.b64encode(result["patch"]).decode(),
+            "spoiler_log": json.loads(result["spoiler_log"]),
+        }
+        self.file.write(json.dumps(line) + "\n")
+        # Flushed every seed, so finished seeds are kept if the batch is stopped
+        self.file.flush()
+
+    def close(self):
+        """Finish writing the file."""
+        self.file.close()
+
+
+def open_output(path):
+    """Open where results are written, picking the format from the path."""
+    if path.endswith(".jsonl"):
+        return JsonLinesOutput(path)
+    if path.endswith(".zip"):
+        return ZipOutput(path)
+    return DirectoryOutput(path)
+
+
+def convert_settings(setting_data):
+    """Convert string data to enums where possible."""
     for k, v in setting_data.items():
         if k in SettingsMap:
             if type(v) is list:
@@ -119,18 +165,106 @@ def main():
                 setting_data[k] = SettingsMap[k](v)
             else:
                 setting_data[k] = SettingsMap[k][v]
+    return setting_data
+
+
+def load_settings(args):
+    """Get the settings to generate with from the arguments."""
+    if args.json_data is not None:
+        return convert_settings(json.loads(str(args.json_data)))
+    settings_string = args.settings_string
+    if args.preset is not None:
+        with open(PRESET_FILE, "r") as file:
+            presets = [preset for preset in json.load(file) if preset.get("name") == args.preset and preset.get("settings_string")]
+        if len(presets) == 0:
+            print(f"No preset named {args.preset}")
+            sys.exit(2)
+        settings_string = presets[0]["settings_string"]
+    if settings_string is None:
+        print("One of --settings_string, --preset or --json_data is required")
+        sys.exit(2)
     try:
-        generate(setting_data, args.output)
-    except Exception as e:
-        if os.environ.get("HOSTED_SERVER") is not None:
-            error_table = dynamodb.Table("dk64_error_db")
-            error_table.put_item(
-                Item={
-                    "time": str(time.time()),
-                    "error_data": str(traceback.format_exc()),
-                }
-            )
-        print(traceback.format_exc())
+        return decrypt_settings_string_enum(settings_string)
+    except Exception:
+        print("Invalid settings String")
+        sys.exit(2)
+
+
+def get_seeds(args):
+    """Get the seeds to generate from the arguments."""
+    if args.seeds is not None:
+        first, _, last = args.seeds.partition("-")
+        try:
+            first = int(first)
+            last = int(last) if last else first
+        except ValueError:
+            print("--seeds must be a seed or a range of seeds, like 1000-1199")
+            sys.exit(2)
+        return list(range(first, last + 1))
+    if args.seed is not None:
+        return [args.seed]
+    return [random.randint(0, 100000000)]
+
+
+def print_report(results, started):
+    """Print the timing of every seed and why any failed."""
+    print(f"{'Seed':>12} {'Time':>8}  Result")
+    for result in sorted(results, key=lambda result: result["seed"]):
+        outcome = "ok" if result["success"] else result["error"]
+        print(f"{result['seed']:>12} {result['time']:>7.1f}s  {outcome}")
+    failures = len([result for result in results if not result["success"]])
+    print(f"Generated {len(results) - failures} of {len(results)} seeds in {time.time() - started:.1f}s, {failures} failed.")
+
+
+def main():
+    """CLI Entrypoint for generating seeds."""
+    parser = argparse.ArgumentParser(description="Generate a batch of seeds offline across every core.")
+    parser.add_argument("--settings_string", help="The settings string to use to generate seeds", required=False)
+    parser.add_argument("--json_data", help="The json data to use to generate seeds", required=False)
+    parser.add_argument("--preset", help="Name of the preset to use", required=False)
+    parser.add_argument("--output", help="Directory, .zip or .jsonl file the seeds are written to", required=True)
+    parser.add_argument("--seed", type=int, help="Seed ID to use", required=False)
+    parser.add_argument("--seeds", help="Range of seed IDs to generate, like 1000-1199", required=False)
+    parser.add_argument("--fill_attempt", type=int, help="Fill attempt to use, to reproduce a seed the server generated with several fill attempts", required=False)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of seeds generated at once")
+    parser.add_argument("--report", help="File to write the timing and result of every seed to as JSON", required=False)
+    args = parser.parse_args()
+    setting_data = load_settings(args)
+    if args.fill_attempt is not None:
+        setting_data["fill_attempt"] = args.fill_attempt
+    seeds = get_seeds(args)
+    if not os.path.exists("dk64.z64"):
+        print("No ROM was found, please make sure you have dk64.z64 in the root directory of the project.")
+        sys.exit(2)
+    base_rom = create_base_rom_file()
+    output = open_output(args.output)
+    results = []
+    started = time.time()
+    workers = max(min(args.workers or 1, len(seeds)), 1)
+    # Seeds generated at once already use every core, so only a lone seed splits the checks of its placed world between them
+    if workers == 1:
+        os.environ.setdefault("WHAT_IF_WORKERS", str(os.cpu_count() or 1))
+    try:
+        with Pool(workers, initializer=start_worker, initargs=(base_rom,)) as pool:
+            tasks = [(setting_data, seed, base_rom) for seed in seeds]
+            for result in pool.imap_unordered(generate_task, tasks):
+                if result["success"]:
+                    try:
+                        output.write(result)
+                    except Exception as e:
+                        result["success"] = False
+                        result["error"] = "Writing output failed: " + str(type(e).__name__) + ": " + str(e)
+                    # Only the report is kept once the seed is written
+                    result = {key: result[key] for key in ("seed", "success", "time", "error", "hash") if key in result}
+                results.append(result)
+                print(f"[{len(results)}/{len(seeds)}] Seed {result['seed']} " + ("done" if result["success"] else "failed: " + result["error"]) + f" in {result['time']:.1f}s")
+    finally:
+        output.close()
+    print_report(results, started)
+    if args.report is not None:
+        with open(args.report, "w") as file:
+            json.dump(results, file, indent=4, default=str)
+    if any(not result["success"] for result in results):
         sys.exit(1)
 
 
@@ -1,6 +1,7 @@
 """Generate UI elements via jinja2 to display on page load."""
 
 import json
+import numpy
 import PIL
 from jinja2 import Environment, FunctionLoader
 from pyodide_importer import register_hook  # type: ignore  # noqa
@@ -0,0 +1,418 @@
+"""Job queue, generator process pool and result store for the server."""
+
+import os
+import pickle
+import signal
+import sqlite3
+import threading
+import time
+import traceback
+from collections import OrderedDict, deque
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+
+from randomizer.Instrumentation import mergeSummaries
+
+JOB_PENDING = "PENDING"
+JOB_RUNNING = "RUNNING"
+JOB_FINISHED = "FINISHED"
+# Lower values are taken off the queue first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LEVELS = 2
+# Jobs whose events are kept, the events of older jobs only count towards the totals
+EVENT_LOG_SIZE = 1000
+
+
+class JobStore:
+    """SQLite store of every job and its result, so jobs and results survive the server restarting."""
+
+    def __init__(self, file_path: str):
+        """Open the store, creating it if needed."""
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    gen_key TEXT PRIMARY KEY,
+                    post_body BLOB,
+                    priority INTEGER,
+                    status TEXT,
+                    submitted REAL,
+                    started REAL,
+                    finished REAL,
+                    failed INTEGER,
+                    result BLOB
+                )"""
+            )
+
+    def add(self, gen_key: str, post_body: dict, priority: int):
+        """Record a new job waiting to be generated."""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO jobs (gen_key, post_body, priority, status, submitted) VALUES (?, ?, ?, ?, ?)",
+                (gen_key, pickle.dumps(post_body), priority, JOB_PENDING, time.time()),
+            )
+
+    def start(self, gen_key: str) -> dict:
+        """Mark a job as running, returning its post body."""
+        with self.lock, self.connection:
+            self.connection.execute("UPDATE jobs SET status = ?, started = ? WHERE gen_key = ?", (JOB_RUNNING, time.time(), gen_key))
+            row = self.connection.execute("SELECT post_body FROM jobs WHERE gen_key = ?", (gen_key,)).fetchone()
+        return pickle.loads(row[0])
+
+    def finish(self, gen_key: str, result):
+        """Store the result of a job."""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET status = ?, finished = ?, failed = ?, result = ?, post_body = NULL WHERE gen_key = ?",
+                (JOB_FINISHED, time.time(), type(result) is str, pickle.dumps(result), gen_key),
+            )
+
+    def status(self, gen_key: str):
+        """Get the status of a job, or None if there's no such job."""
+        with self.lock:
+            row = self.connection.execute("SELECT status FROM jobs WHERE gen_key = ?", (gen_key,)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def result(self, gen_key: str, remove: bool = False):
+        """Get the result of a finished job, optionally removing the job from the store.
+
+        Returns None if the job hasn't finished or has already been removed.
+        """
+        with self.lock, self.connection:
+            row = self.connection.execute("SELECT result FROM jobs WHERE gen_key = ? AND status = ?", (gen_key, JOB_FINISHED)).fetchone()
+            if row is not None and remove:
+                self.connection.execute("DELETE FROM jobs WHERE gen_key = ?", (gen_key,))
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def unfinished(self) -> list:
+        """Get the key and priority of every job that hadn't finished, in the order they were submitted."""
+        with self.lock:
+            return self.connection.execute("SELECT gen_key, priority FROM jobs WHERE status != ? ORDER BY submitted", (JOB_FINISHED,)).fetchall()
+
+    def prune(self, max_age: float):
+        """Remove finished jobs older than the max age in seconds which were never collected."""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM jobs WHERE status = ? AND finished < ?", (JOB_FINISHED, time.time() - max_age))
+
+    def metrics(self, since: float) -> dict:
+        """Get wall time metrics of the jobs finished since the given time."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT COUNT(*), SUM(failed), AVG(started - submitted), MAX(started - submitted), AVG(finished - started), MAX(finished - started) FROM jobs WHERE status = ? AND finished >= ?",
+                (JOB_FINISHED, since),
+            ).fetchone()
+            waiting = self.connection.execute("SELECT status, COUNT(*) FROM jobs WHERE status != ? GROUP BY status", (JOB_FINISHED,)).fetchall()
+        counts = dict(waiting)
+        return {
+            "finished": row[0],
+            "failed": row[1] or 0,
+            "average_wait": row[2] or 0,
+            "max_wait": row[3] or 0,
+            "average_run": row[4] or 0,
+            "max_run": row[5] or 0,
+            "pending": counts.get(JOB_PENDING, 0),
+            "running": counts.get(JOB_RUNNING, 0),
+        }
+
+
+class JobQueue:
+    """FIFO queue of jobs for each priority, which can tell a job's position without scanning the queue."""
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self.condition = threading.Condition()
+        self.queues = [deque() for _ in range(PRIORITY_LEVELS)]
+        # Tickets are handed out in order for each priority, so a job's position is its ticket minus the ticket at the front
+        self.next_ticket = [0] * PRIORITY_LEVELS
+        self.tickets = {}
+
+    def put(self, gen_key: str, priority: int = PRIORITY_NORMAL):
+        """Add a job to the back of the queue for its priority."""
+        with self.condition:
+            ticket = self.next_ticket[priority]
+            self.next_ticket[priority] += 1
+            self.queues[priority].append((ticket, gen_key))
+            self.tickets[gen_key] = (priority, ticket)
+            self.condition.notify()
+
+    def get(self) -> str:
+        """Take the next job off the queue, waiting for one if it's empty."""
+        with self.condition:
+            while True:
+                for queue in self.queues:
+                    if len(queue) > 0:
+                        _, gen_key = queue.popleft()
+                        del self.tickets[gen_key]
+                        return gen_key
+                self.condition.wait()
+
+    def position(self, gen_key: str) -> int:
+        """Get the amount of jobs ahead of a job, or None if it isn't queued."""
+        with self.condition:
+            if gen_key not in self.tickets:
+                return None
+            priority, ticket = self.tickets[gen_key]
+            ahead = ticket - self.queues[priority][0][0]
+            for queue in self.queues[:priority]:
+                ahead += len(queue)
+            return ahead
+
+
+class EventLog:
+    """Events of the most recent jobs, and totals of the events of every job since the server started."""
+
+    def __init__(self, size: int = EVENT_LOG_SIZE):
+        """Initialize an empty log."""
+        self.lock = threading.Lock()
+        self.size = size
+        self.jobs = OrderedDict()
+        self.totals = mergeSummaries([])
+
+    def add(self, gen_key: str, summary: dict):
+        """Add the events of a finished job."""
+        with self.lock:
+            self.jobs[gen_key] = summary
+            while len(self.jobs) > self.size:
+                self.jobs.popitem(last=False)
+            self.totals = mergeSummaries([self.totals, summary])
+
+    def get(self, gen_key: str) -> dict:
+        """Get the events of a job, or None if they aren't kept."""
+        with self.lock:
+            return self.jobs.get(gen_key)
+
+    def get_totals(self) -> dict:
+        """Get the totals of every job."""
+        with self.lock:
+            return self.totals
+
+
+def run_generator(connection):
+    """Run one attempt of a job sent to a generator process.
+
+    The attempt is filled first. If it fails the error is sent back, otherwise True is sent and the attempt
+    waits to be told to finish, which only the attempt whose result is used ever is.
+    """
+    try:
+        function, finish, args = connection.recv()
+    except EOFError:
+        return
+    try:
+        state = function(*args)
+    except Exception as e:
+        print(traceback.format_exc())
+        state = str(type(e).__name__) + ": " + str(e)
+    if type(state) is str:
+        connection.send(state)
+        return
+    connection.send(True)
+    try:
+        connection.recv()
+    except EOFError:
+        return
+    try:
+        result = finish(state)
+    except Exception as e:
+        print(traceback.format_exc())
+        result = str(type(e).__name__) + ": " + str(e)
+    connection.send(result)
+
+
+def zygote_loop(connection, initializer, initargs, environment):
+    """Warm up once, then fork a generator process for every connection sent to the zygote."""
+    os.environ.update(environment)
+    if initializer is not None:
+        initializer(*initargs)
+    # Generator processes are never waited on, let the kernel clean them up when they exit
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    while True:
+        try:
+            worker_connection = connection.recv()
+        except EOFError:
+            return
+        pid = os.fork()
+        if pid == 0:
+            # Each generator leads its own process group, so stopping it also stops any process it forked
+            os.setpgid(0, 0)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            connection.close()
+            try:
+                run_generator(worker_connection)
+            finally:
+                os._exit(0)
+        try:
+            # Also set here, so the group exists before the generator can be stopped
+            os.setpgid(pid, pid)
+        except OSError:
+            pass
+        worker_connection.close()
+        connection.send(pid)
+
+
+class Zygote:
+    """Process which loads everything a generation needs once, then forks generator processes from that state.
+
+    Starting a generator this way skips importing the randomizer and loading the base ROM, so a fresh process
+    can be used for every attempt of every job, and generators are never forked from the threaded server.
+    """
+
+    def __init__(self, initializer=None, initargs=(), environment=None):
+        """Start the zygote process, with the environment variables given added to its environment."""
+        self.lock = threading.Lock()
+        self.connection, child_connection = Pipe()
+        self.process = Process(target=zygote_loop, args=(child_connection, initializer, initargs, environment or {}), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def fork(self):
+        """Fork a new generator process, returning a connection to it and its pid."""
+        connection, worker_connection = Pipe()
+        with self.lock:
+            self.connection.send(worker_connection)
+            pid = self.connection.recv()
+        worker_connection.close()
+        return connection, pid
+
+
+class Generator:
+    """Generator process forked from the zygote for one attempt of one job, which exits once the attempt is done."""
+
+    def __init__(self, zygote: Zygote, function, finish, args: tuple):
+        """Fork the process and send it the attempt."""
+        self.connection, self.pid = zygote.fork()
+        self.connection.send((function, finish, args))
+
+    def receive(self):
+        """Wait for the next message from the process, which is an error if the process died."""
+        try:
+            return self.connection.recv()
+        except EOFError:
+            return "Generator process stopped unexpectedly"
+
+    def stop(self):
+        """Kill the process and any process it forked, if they're still running."""
+        try:
+            os.killpg(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.connection.close()
+
+
+class GenerationService:
+    """Runs queued jobs in generator processes and keeps their results in a job store.
+
+    Every attempt of a job gets a new generator process, forked from a zygote which ran the initializer once,
+    so nothing a generation leaves behind reaches the next job.
+
+    Each job is filled by one process per attempt, calling the function with the post body and the attempt index.
+    The lowest attempt that succeeds is used, however fast the others are, so a seed is the same every time
+    it's generated. Only that attempt is finished, which turns what the function returned into the result.
+    A job whose post body has a fill_attempt only runs that attempt, to reproduce a seed generated with it.
+
+    A result which is a string is treated as an error. Events the generation recorded, under the "events" key
+    of a result, are moved to the event log.
+
+    Generators split the what-if checks of a placed world between up to what_if_workers processes, fewer if
+    every generator running at once doing so would use more processes than there are cores.
+    """
+
+    def __init__(self, store: JobStore, function, finish, workers: int, attempts: int, timeout: float, initializer=None, initargs=(), what_if_workers: int = 1):
+        """Start the zygote and the threads handing out jobs."""
+        self.store = store
+        self.queue = JobQueue()
+        self.events = EventLog()
+        self.function = function
+        self.finish = finish
+        self.timeout = timeout
+        self.attempts = max(attempts, 1)
+        # Anything left from before a restart is run again
+        for gen_key, priority in store.unfinished():
+            self.queue.put(gen_key, priority)
+        slots = max(workers // self.attempts, 1)
+        self.what_if_workers = max(min(what_if_workers, (os.cpu_count() or 1) // (slots * self.attempts)), 1)
+        # The zygote is started before any thread, so it's forked from a single threaded process
+        self.zygote = Zygote(initializer, initargs, {"WHAT_IF_WORKERS": str(self.what_if_workers)})
+        self.slots = []
+        for _ in range(slots):
+            thread = threading.Thread(target=self.run_slot, daemon=True)
+            thread.start()
+            self.slots.append(thread)
+
+    def submit(self, gen_key: str, post_body: dict, priority: int = PRIORITY_NORMAL):
+        """Add a job to the queue."""
+        self.store.add(gen_key, post_body, priority)
+        self.queue.put(gen_key, priority)
+
+    def status(self, gen_key: str):
+        """Get the status of a job, or None if there's no such job."""
+        return self.store.status(gen_key)
+
+    def position(self, gen_key: str) -> int:
+        """Get the amount of jobs ahead of a job, which is 0 once it's running."""
+        position = self.queue.position(gen_key)
+        if position is None:
+            return 0
+        return position
+
+    def result(self, gen_key: str, remove: bool = False):
+        """Get the result of a finished job."""
+        return self.store.result(gen_key, remove)
+
+    def run_slot(self):
+        """Run jobs one at a time for as long as the server runs."""
+        while True:
+            gen_key = self.queue.get()
+            try:
+                post_body = self.store.start(gen_key)
+                result = self.run_job(post_body)
+            except Exception as e:
+                print(traceback.format_exc())
+                result = str(type(e).__name__) + ": " + str(e)
+            if type(result) is dict and "events" in result:
+                self.events.add(gen_key, result.pop("events"))
+            self.store.finish(gen_key, result)
+
+    def run_job(self, post_body: dict):
+        """Run every attempt of a job, returning the result of the lowest attempt that succeeds or the first error if they all fail."""
+        if post_body.get("fill_attempt") is not None:
+            attempts = [int(post_body["fill_attempt"])]
+        else:
+            attempts = range(self.attempts)
+        generators = []
+        try:
+            for attempt in attempts:
+                generators.append(Generator(self.zygote, self.function, self.finish, (post_body, attempt)))
+            deadline = time.time() + self.timeout
+            outcomes = {}
+            for index, generator in enumerate(generators):
+                # Attempts are settled in order, waiting on the ones before a success even when it came first
+                while index not in outcomes:
+                    running = {other.connection: other_index for other_index, other in enumerate(generators) if other_index not in outcomes}
+                    ready = wait(list(running.keys()), timeout=max(deadline - time.time(), 0))
+                    if len(ready) == 0:
+                        return "Seed Generation Timed Out"
+                    for connection in ready:
+                        outcomes[running[connection]] = generators[running[connection]].receive()
+                if outcomes[index] is True:
+                    return self.finish_attempt(generator, generators, deadline)
+            return outcomes[0]
+        finally:
+            # Stop any attempts still running, every job starts from fresh processes
+            for generator in generators:
+                generator.stop()
+
+    def finish_attempt(self, generator: Generator, generators: list, deadline: float):
+        """Stop every other attempt, then finish the one whose result is used."""
+        for other in generators:
+            if other is not generator:
+                other.stop()
+        generator.connection.send(True)
+        if len(wait([generator.connection], timeout=max(deadline - time.time(), 0))) == 0:
+            return "Seed Generation Timed Out"
+        return generator.receive()
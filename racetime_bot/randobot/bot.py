@@ -14,6 +14,13 @@ class RandoBot(Bot):
         super().__init__(*args, **kwargs)
         self.DK64 = DK64()
 
+    def run(self):
+        """Run the bot, closing its connections to the generator once it stops."""
+        try:
+            super().run()
+        finally:
+            self.loop.run_until_complete(self.DK64.close())
+
     def get_handler_class(self):
         """Class override."""
         return RandoHandler
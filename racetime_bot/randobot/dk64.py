@@ -1,13 +1,19 @@
 """Main web endpoint API calls for the bot."""
 
+import asyncio
 import json
 import os
-import requests
 import time
 
+import aiohttp
+
 
 class DK64:
-    """Class for interacting with dk64randomizer.com to generate seeds and available presets."""
+    """Class for interacting with dk64randomizer.com to generate seeds and available presets.
+
+    One instance is shared by every race room the bot is in. Its requests go through one pool of connections, and rooms
+    asking for the same thing at once, such as the presets or the status of a seed, share a single request.
+    """
 
     hash_map = {
         0: {"Bongos": 908522167522709545},
@@ -22,6 +28,19 @@ class DK64:
         9: {"Saxophone": 908522167296208956},
     }
 
+    # Most connections open to the generator at once
+    max_connections = 20
+    # Seconds a single request may take
+    request_timeout = 30
+    # Seconds the presets are used for before being loaded again
+    presets_ttl = 600
+    # Seconds between checks of a seed's status, growing by the backoff each check up to the max
+    poll_delay = 1
+    poll_backoff = 1.5
+    max_poll_delay = 10
+    # Seconds a seed is waited on before giving up
+    max_status_wait = 60
+
     def __init__(self):
         """Initialize the API class."""
         if os.environ.get("DEV_SERVER", False):
@@ -39,66 +58,124 @@ class DK64:
             self.data_endpoint = "https://generate.dk64rando.com/get_seed_data"
             self.status_endpoint = "https://generate.dk64rando.com/status"
         self.discord_webhook = os.environ.get("DISCORD_WEBHOOK", None)
-        self.presets = self.load_presets()
+        # Created on first use, as it has to be made inside the bot's event loop
+        self.session = None
+        # Requests being made, by what they ask for, so identical requests can wait on the same response
+        self.in_flight = {}
+        self.presets = {}
+        self.presets_loaded = None
+
+    def get_session(self):
+        """Get the session shared by every request, creating it if needed."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+        return self.session
+
+    async def close(self):
+        """Close the session and its connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def request(self, method, url, params=None, body=None):
+        """Make a request, returning its status code and JSON body, or None if the body isn't JSON.
 
-    def load_presets(self):
+        A request identical to one still in flight waits on that one instead of being sent again.
+        """
+        key = (method, url, json.dumps(params, sort_keys=True), json.dumps(body, sort_keys=True))
+        pending = self.in_flight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self.send_request(method, url, params, body))
+            self.in_flight[key] = pending
+            pending.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        # Shielded so a room giving up on the request doesn't cancel it for the other rooms waiting on it
+        return await asyncio.shield(pending)
+
+    async def send_request(self, method, url, params, body):
+        """Send a request, returning its status code and JSON body."""
+        async with self.get_session().request(method, url, params=params, json=body) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = None
+            return response.status, data
+
+    async def get_presets(self):
+        """Get the available seed presets, loading them again once they are older than presets_ttl."""
+        if self.presets_loaded is None or time.monotonic() - self.presets_loaded > self.presets_ttl:
+            try:
+                await self.load_presets()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Keep using the presets already loaded if the generator can't be reached
+                if self.presets_loaded is None:
+                    raise
+        return self.presets
+
+    async def load_presets(self):
         """Load and return available seed presets."""
-        presets = requests.get(self.preset_endpoint).json()
+        _, presets = await self.request("GET", self.preset_endpoint)
         # turn the presets into a dict of name being the key with the settings_string as the value
         presets_dict = {}
         for preset in presets:
             presets_dict[preset["name"].lower()] = preset
+        self.presets = presets_dict
+        self.presets_loaded = time.monotonic()
         return presets_dict
 
-    def roll_seed(self, preset, race):
+    async def roll_seed(self, preset, race):
         """Generate a seed and return its public URL."""
         # Roll with provided preset for non-draft races.
         if preset is not None:
-            converted_settings = requests.post(
-                self.json_converter,
-                json.dumps({"settings_string": self.presets[preset]["settings_string"]}),
-                headers={"Content-Type": "application/json"},
-            ).json()
+            presets = await self.get_presets()
+            _, converted_settings = await self.request("POST", self.json_converter, body={"settings_string": presets[preset]["settings_string"]})
             if race:
                 converted_settings["generate_spoilerlog"] = False
             req_body = {"post_body": json.dumps(converted_settings)}
-            data = requests.post(
-                self.seed_endpoint,
-                headers={"Content-Type": "application/json"},
-                params={"gen_key": time.time()},
-                json=req_body,
-            ).json()
+            _, data = await self.request("POST", self.seed_endpoint, params={"gen_key": str(time.time())}, body=req_body)
             data["id"] = data["start_time"]
             return data["start_time"]
         return None, None
 
-    def get_status(self, seed_id):
+    async def get_status(self, seed_id):
         """Get the status of a seed."""
-        data = requests.get(
-            self.status_endpoint,
-            params={
-                "gen_key": seed_id,
-            },
-        )
-        if data.status_code == 200 and data.json()["status"] in ["failure", "stopped", "error"]:
+        try:
+            status_code, data = await self.request("GET", self.status_endpoint, params={"gen_key": seed_id})
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Treated as still generating, the next check may get through
+            return 0
+        if status_code == 200 and data is not None and data.get("status") in ["failure", "stopped", "error"]:
             return 2
-        elif data.status_code == 200 and data.json()["status"] == "ready":
+        elif status_code == 200 and data is not None and data.get("status") == "ready":
             return 1
         else:
             return 0
 
-    def get_hash(self, seed_id):
+    async def wait_for_seed(self, seed_id):
+        """Check the status of a seed until it is done, waiting longer between each check, and return its last status."""
+        delay = self.poll_delay
+        waited = 0
+        while True:
+            await asyncio.sleep(delay)
+            waited += delay
+            status = await self.get_status(seed_id)
+            if status != 0 or waited >= self.max_status_wait:
+                return status
+            delay = min(delay * self.poll_backoff, self.max_poll_delay, self.max_status_wait - waited)
+
+    async def get_hash(self, seed_id):
         """Get the hash for a seed."""
-        data = requests.get(
-            self.data_endpoint,
-            params={
-                "gen_key": seed_id,
-            },
-        ).json()
-        if data.get("status") == "complete":
+        _, data = await self.request("GET", self.data_endpoint, params={"gen_key": seed_id})
+        if data is not None and data.get("status") == "complete":
             return (
                 " ".join([next(iter(self.hash_map.get(index, {}).keys()), next(iter(self.hash_map.values()))) for index in data["hash"]]),
                 data.get("seed_number"),
                 self.seed_url,
             )
         return None, None, None
+
+    async def post_webhook(self, embed_data):
+        """Post a message to the Discord webhook, if there is one."""
+        if self.discord_webhook:
+            await self.request("POST", self.discord_webhook, body=embed_data)
@@ -1,8 +1,6 @@
 """Backebd for RandoBot."""
 
-from asyncio import sleep
 import random
-import requests
 from racetime_bot import RaceHandler, monitor_cmd, can_moderate, can_monitor, msg_actions
 
 
@@ -10,7 +8,6 @@ class RandoHandler(RaceHandler):
     """RandoBot race handler. Generates seeds, presets, and frustration."""
 
     stop_at = ["cancelled", "finished"]
-    max_status_checks = 50
     greetings = (
         "Let me roll a seed for you. I promise it won't hurt.",
         "I promise that today's seed will be nice.",
@@ -26,6 +23,7 @@ class RandoHandler(RaceHandler):
     async def begin(self):
         """Send introduction messages."""
         if not self.state.get("intro_sent") and not self._race_in_progress():
+            presets = await self.dk64.get_presets()
             await self.send_message(
                 "Welcome to DK64R! " + random.choice(self.greetings),
                 actions=[
@@ -38,7 +36,7 @@ class RandoHandler(RaceHandler):
                             msg_actions.SelectInput(
                                 name="preset",
                                 label="Preset",
-                                options={key: value["name"] for key, value in self.dk64.presets.items()},
+                                options={key: value["name"] for key, value in presets.items()},
                                 default="season 2 race settings",
                             ),
                         ),
@@ -52,7 +50,7 @@ class RandoHandler(RaceHandler):
                             msg_actions.SelectInput(
                                 name="preset",
                                 label="Preset",
-                                options={key: value["name"] for key, value in self.dk64.presets.items()},
+                                options={key: value["name"] for key, value in presets.items()},
                                 default="season 2 race settings",
                             ),
                         ),
@@ -186,11 +184,11 @@ class RandoHandler(RaceHandler):
 
     async def roll(self, preset, reply_to, race):
         """Generate a seed and send it to the race room."""
-        if preset not in self.dk64.presets:
+        if preset not in await self.dk64.get_presets():
             res_cmd = "!presets"
             await self.send_message("Sorry %(reply_to)s, I don't recognise that preset. Use " "%(res_cmd)s to see what is available." % {"res_cmd": res_cmd, "reply_to": reply_to or "friend"})
             return
-        seed_id = self.dk64.roll_seed(preset, race)
+        seed_id = await self.dk64.roll_seed(preset, race)
 
         await self.send_message("%(reply_to)s, your seed is generating. Please wait..." % {"reply_to": reply_to or "Okay"})
         if self.state.get("pinned_msg"):
@@ -198,19 +196,13 @@ class RandoHandler(RaceHandler):
             del self.state["pinned_msg"]
 
         self.state["seed_id"] = seed_id
-        self.state["status_checks"] = 0
         self.state["preset"] = preset
         await self.check_seed_status()
 
     async def check_seed_status(self):
-        """Check the status of the seed generation."""
-        await sleep(1)
-        status = self.dk64.get_status(self.state["seed_id"])
-        if status == 0:
-            self.state["status_checks"] += 1
-            if self.state["status_checks"] < self.max_status_checks:
-                await self.check_seed_status()
-        elif status == 1:
+        """Wait for the seed generation to finish."""
+        status = await self.dk64.wait_for_seed(self.state["seed_id"])
+        if status == 1:
             await self.load_seed_hash()
         elif status >= 2:
             self.state["seed_id"] = None
@@ -218,7 +210,7 @@ class RandoHandler(RaceHandler):
 
     async def load_seed_hash(self):
         """When the seed is ready, get the data."""
-        seed_hash, public_id, url = self.dk64.get_hash(self.state["seed_id"])
+        seed_hash, public_id, url = await self.dk64.get_hash(self.state["seed_id"])
         await self.set_bot_raceinfo(
             "%(seed_hash)s\n%(seed_url)s"
             % {
@@ -263,8 +255,7 @@ class RandoHandler(RaceHandler):
             "avatar_url": "https://mario.wiki.gallery/images/b/b3/DK64_Racecar.png",
             "attachments": [],
         }
-        if self.dk64.discord_webhook:
-            requests.post(self.dk64.discord_webhook, json=embed_data)
+        await self.dk64.post_webhook(embed_data)
 
     async def send_presets(self, dev):
         """Send a list of known presets to the race room."""
@@ -273,7 +264,7 @@ class RandoHandler(RaceHandler):
             for name, preset in self.dk64.presets_dev.items():
                 await self.send_message("%s – %s" % (name, preset["name"]))
         else:
-            for name, preset in self.dk64.presets.items():
+            for name, preset in (await self.dk64.get_presets()).items():
                 await self.send_message("%s – %s" % (name, preset["name"]))
 
     def _race_in_progress(self):
@@ -21,10 +21,10 @@ setup(
     },
     version="1.0.0",
     install_requires=[
+        "aiohttp>=3.8.0,<4.0",
         "gql[aiohttp]>=3.4.0,<4.0",
         "isodate>=0.6.1,<0.7",
         "racetime_bot>=1.5.0,<3.0",
-        "requests>=2.25.1,<3.0",
     ],
     packages=find_packages(),
     entry_points={
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 from math import ceil, floor, sqrt
-import random
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 from randomizer.Enums.MoveTypes import MoveTypes
 
@@ -44,6 +43,7 @@ from randomizer.Lists.ShufflableExit import ShufflableExits
 from randomizer.Lists.WrinklyHints import ClearHintMessages, hints
 from randomizer.Patching.UpdateHints import UpdateHint
 from randomizer.Patching.Lib import plando_colors
+from randomizer.RandomStreams import hint_random
 
 if TYPE_CHECKING:
     from randomizer.Lists.WrinklyHints import HintLocation
@@ -544,9 +544,8 @@ def compileHints(spoiler: Spoiler) -> bool:
     ]
     # Precalculate the locations of the Keys - this info is used by distribution generation and hint generation
     key_location_ids = {}
-    for location_id, location in spoiler.LocationList.items():
-        if location.item in ItemPool.Keys():
-            key_location_ids[location.item] = location_id
+    for location_id in spoiler.location_index.getLocationsWithItems(ItemPool.Keys()):
+        key_location_ids[spoiler.LocationList[location_id].item] = location_id
 
     # Some locations are particularly useless to hint
     useless_locations = {Items.HideoutHelmKey: [], Maps.KroolDonkeyPhase: [], Maps.KroolDiddyPhase: [], Maps.KroolLankyPhase: [], Maps.KroolTinyPhase: [], Maps.KroolChunkyPhase: []}
@@ -707,8 +706,9 @@ def compileHints(spoiler: Spoiler) -> bool:
                 all_hintable_moves.append(Items.Snide)
         optional_hintable_locations = []
         slam_locations = []
-        # Loop through all locations, finding the location of all of these hintable moves
-        for id, location in spoiler.LocationList.items():
+        # Loop through the locations of slams and all of these hintable moves
+        for id in spoiler.location_index.getLocationsWithItems([Items.ProgressiveSlam] + kongs_to_hint + all_hintable_moves):
+            location = spoiler.LocationList[id]
             # Note the location of slams - these will always be at least optionally hintable and sometimes required to be hinted
             if location.item == Items.ProgressiveSlam:
                 slam_locations.append(id)
@@ -729,11 +729,11 @@ def compileHints(spoiler: Spoiler) -> bool:
         # If there's room, always hint a slam if we haven't hinted one already
         hinted_slam_locations = [loc for loc in slam_locations if loc in item_region_locations_to_hint or spoiler.LocationList[loc].type in (Types.TrainingBarrel, Types.PreGivenMove)]
         if len(item_region_locations_to_hint) < hint_distribution[HintType.ItemHinting] and len(hinted_slam_locations) < 2:
-            loc_to_hint = random.choice([loc for loc in slam_locations if loc not in hinted_slam_locations])
+            loc_to_hint = hint_random.choice([loc for loc in slam_locations if loc not in hinted_slam_locations])
             item_region_locations_to_hint.append(loc_to_hint)
             optional_hintable_locations.remove(loc_to_hint)
         # Fill with other random move locations as best as we can
-        random.shuffle(optional_hintable_locations)
+        hint_random.shuffle(optional_hintable_locations)
         while len(item_region_locations_to_hint) < hint_distribution[HintType.ItemHinting] and len(optional_hintable_locations) > 0:
             item_region_locations_to_hint.append(optional_hintable_locations.pop())
         # If there's so many WotH things we can't hint them all, some WotH things will go unhinted. Unlucky.
@@ -746,14 +746,14 @@ def compileHints(spoiler: Spoiler) -> bool:
                 if ItemList[spoiler.LocationList[loc_id].item].type not in (Types.Kong, Types.Key):
                     less_important_location_ids.append(loc_id)
             # Randomly remove some of them so we don't bias towards early/late items - if you miss it, unlucky
-            random.shuffle(less_important_location_ids)
+            hint_random.shuffle(less_important_location_ids)
             while too_many_count > 0:
                 # If we can, remove less important moves first
                 if len(less_important_location_ids) > 0:
                     item_region_locations_to_hint.remove(less_important_location_ids.pop())
                 # Otherwise, tough luck - this is probably just for plando though
                 else:
-                    removed_hint = random.choice(item_region_locations_to_hint)
+                    removed_hint = hint_random.choice(item_region_locations_to_hint)
                     item_region_locations_to_hint.remove(removed_hint)
                 too_many_count -= 1
         # If you start with a ton of moves, there may be only a handful of things to hint
@@ -771,18 +771,18 @@ def compileHints(spoiler: Spoiler) -> bool:
             # If we can find an unlocked valid hint type (I think this is impossible?), let's remove that
             unlocked_valid_hint_types = [typ for typ in valid_types if typ not in locked_hint_types and hint_distribution[typ] > 0]
             if len(unlocked_valid_hint_types) > 0:
-                removed_type = random.choice(unlocked_valid_hint_types)
+                removed_type = hint_random.choice(unlocked_valid_hint_types)
             # Otherwise, remove anything that isn't a Plando hint - hopefully this doesn't brick the hints!
             else:
-                removed_type = random.choice([typ for typ in valid_types if hint_distribution[typ] > 0 and typ != HintType.Plando])
+                removed_type = hint_random.choice([typ for typ in valid_types if hint_distribution[typ] > 0 and typ != HintType.Plando])
             hint_distribution[removed_type] -= 1
             hint_count -= 1
         # In some unusual cases we may be under the cap here - fill extra hints if we need them
         while hint_count < HINT_CAP:
-            filler_type = random.choice(valid_types)
+            filler_type = hint_random.choice(valid_types)
             if filler_type == HintType.Joke:
                 # Make it roll joke twice to add an extra joke hint
-                filler_type = random.choice(valid_types)
+                filler_type = hint_random.choice(valid_types)
             if filler_type in locked_hint_types or filler_type in maxed_hint_types:
                 continue  # Some hint types cannot be filled with
             hint_distribution[filler_type] += 1
@@ -883,11 +883,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                     hint_distribution[HintType.RequiredWinConditionHint] = len([kong for kong in spoiler.settings.krool_order if len(spoiler.krool_paths[kong]) - len(useless_locations[kong]) > 0])
                 # Some win conditions need help finding the camera (if you don't start with it) - variable amount of unique hints for it
                 if spoiler.settings.win_condition_item in (WinConditionComplex.req_fairy, WinConditionComplex.krem_kapture) and spoiler.settings.shockwave_status != ShockwaveStatus.start_with:
-                    camera_location_id = None
-                    for id, loc in spoiler.LocationList.items():
-                        if loc.item in (Items.Camera, Items.CameraAndShockwave):
-                            camera_location_id = id
-                            break
+                    camera_location_id = spoiler.location_index.getLocationWithItem((Items.Camera, Items.CameraAndShockwave))
                     # Don't make a Camera path hint if Camera isn't woth
                     if camera_location_id in spoiler.woth_paths.keys():
                         valid_types.append(HintType.RequiredWinConditionHint)
@@ -919,7 +915,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             # The number of multipath hints is a percentage of all eligible locations while still guaranteeing every goal gets at least one hint
             hint_distribution[HintType.Multipath] = max(len(multipath_dict_hints.keys()) * 0.59, min_value)
             # That percentage likely turns out a decimal - that decimal becomes a % chance to get an extra hint
-            rng = random.random()
+            rng = hint_random.random()
             if hint_distribution[HintType.Multipath] % 1 > rng:
                 hint_distribution[HintType.Multipath] = ceil(hint_distribution[HintType.Multipath])
             else:
@@ -945,13 +941,13 @@ def compileHints(spoiler: Spoiler) -> bool:
                 hint_distribution[type] = 0
         # Fill extra hints if we need them
         while hint_count < HINT_CAP:
-            filler_type = random.choice(valid_types)
+            filler_type = hint_random.choice(valid_types)
             if filler_type == HintType.Joke:
                 # Make it roll joke twice to add an extra joke hint
-                filler_type = random.choice(valid_types)
+                filler_type = hint_random.choice(valid_types)
                 if filler_type == HintType.Joke:
                     # Just kidding, make it roll joke thrice to add an extra joke hint
-                    filler_type = random.choice(valid_types)
+                    filler_type = hint_random.choice(valid_types)
             if filler_type in locked_hint_types or filler_type in maxed_hint_types:
                 continue  # Some hint types cannot be filled with
             hint_distribution[filler_type] += 1
@@ -969,18 +965,18 @@ def compileHints(spoiler: Spoiler) -> bool:
                 if HintType.Multipath in valid_types and hint_distribution[HintType.Multipath] > 0:
                     hint_distribution[HintType.Multipath] -= 1
                 elif hint_distribution[HintType.RequiredKeyHint] > 0:
-                    key_to_lose_a_hint = random.choice([key for key in key_hint_dict.keys() if key_hint_dict[key] > 0])
+                    key_to_lose_a_hint = hint_random.choice([key for key in key_hint_dict.keys() if key_hint_dict[key] > 0])
                     key_hint_dict[key_to_lose_a_hint] -= 1
                     hint_distribution[HintType.RequiredKeyHint] -= 1
                 # We may have to remove a random required hint - this is highly unfortunate and hopefully should only happen in plando
                 else:
                     # typ for typ in valid_types if hint_distribution[typ] > 0 and typ != HintType.Plando
-                    removed_type = random.choice([typ for typ in valid_types if hint_distribution[typ] > 0 and typ != HintType.Plando])
+                    removed_type = hint_random.choice([typ for typ in valid_types if hint_distribution[typ] > 0 and typ != HintType.Plando])
                     hint_distribution[removed_type] -= 1
                 hint_count -= 1
                 continue
             # In all other cases, remove a random hint that is eligible to be removed
-            removed_type = random.choice(valid_types)
+            removed_type = hint_random.choice(valid_types)
             if removed_type in locked_hint_types:
                 continue  # Some hint types cannot have fewer than specified by the settings
             if removed_type in minned_hint_types and hint_distribution[removed_type] == 1:
@@ -1059,8 +1055,9 @@ def compileHints(spoiler: Spoiler) -> bool:
         if hint_location is not None:
             # Loop through locations looking for the slams - from prior calculations we can guarantee there are at least two in non-starting move locations
             slam_levels = []
-            for id, location in spoiler.LocationList.items():
-                if location.item == Items.ProgressiveSlam and id not in PreGivenLocations and id not in TrainingBarrelLocations:  # Ignore anything pre-given
+            for id in spoiler.location_index.getLocationsWithItem(Items.ProgressiveSlam):
+                location = spoiler.LocationList[id]
+                if id not in PreGivenLocations and id not in TrainingBarrelLocations:  # Ignore anything pre-given
                     if location.level not in slam_levels:
                         slam_levels.append(location.level)
             # Assemble a hint that resembles the microhint - only hint the levels the slams are in
@@ -1073,7 +1070,7 @@ def compileHints(spoiler: Spoiler) -> bool:
     if hint_distribution[HintType.RequiredKongHint] > 0:
         placed_requiredkonghints = 0
         # The length of this list should match hint_distribution[HintType.RequiredKongHint]
-        kong_location_ids = [id for id, location in spoiler.LocationList.items() if location.item in (Items.Donkey, Items.Diddy, Items.Lanky, Items.Tiny, Items.Chunky)]
+        kong_location_ids = spoiler.location_index.getLocationsWithItems((Items.Donkey, Items.Diddy, Items.Lanky, Items.Tiny, Items.Chunky))
         for kong_location_id in kong_location_ids:
             # In some rare circumstances, you may not have enough hints allocated for all kongs - whoever you missed a hint for is sad and you should feel bad
             if placed_requiredkonghints >= hint_distribution[HintType.RequiredKongHint]:
@@ -1084,7 +1081,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             if kong_location_id in spoiler.accessible_hints_for_location.keys():  # This will fail if the Kong is not WotH
                 hint_options = getHintLocationsForAccessibleHintItems(spoiler.accessible_hints_for_location[kong_location_id])  # This will return [] if there are no hint doors available
             if len(hint_options) > 0:
-                hint_location = random.choice(hint_options)
+                hint_location = hint_random.choice(hint_options)
             # If there are no doors available early (very rare) or the Kong is not WotH (obscenely rare) then just get a random one. Tough luck.
             else:
                 if spoiler.settings.enable_progressive_hints:  # In progressive hints we'll still stick the hint in the first 20 hints
@@ -1095,9 +1092,9 @@ def compileHints(spoiler: Spoiler) -> bool:
             freeing_kong_name = kong_list[kong_location.kong]
             if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
                 if kong_location.level == Levels.Shops:  # Exactly Jetpac
-                    level_name = "\x08" + random.choice(crankys_cryptic) + "\x08"
+                    level_name = "\x08" + hint_random.choice(crankys_cryptic) + "\x08"
                 else:
-                    level_name = "\x08" + random.choice(level_cryptic_helm_isles[kong_location.level]) + "\x08"
+                    level_name = "\x08" + hint_random.choice(level_cryptic_helm_isles[kong_location.level]) + "\x08"
             else:
                 if kong_location.level == Levels.Shops:  # Exactly Jetpac
                     level_name = "Cranky's Lab"
@@ -1108,7 +1105,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             if kong_location.type in item_type_names.keys():
                 location_name = item_type_names[kong_location.type]
                 if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
-                    location_name = "\x06" + random.choice(item_type_names_cryptic[kong_location.type]) + "\x06"
+                    location_name = "\x06" + hint_random.choice(item_type_names_cryptic[kong_location.type]) + "\x06"
                 message = f"{freed_kong} is held by {location_name} in {level_name}."
             elif kong_location.type == Types.Shop:
                 message = f"{freed_kong} can be bought in {level_name}."
@@ -1127,7 +1124,7 @@ def compileHints(spoiler: Spoiler) -> bool:
     hinted_kongs = []
     placed_kong_hints = 0
     while placed_kong_hints < hint_distribution[HintType.KongLocation]:
-        kong_map = random.choice(kong_placement_levels)
+        kong_map = hint_random.choice(kong_placement_levels)
         kong_index = spoiler.shuffled_kong_placement[kong_map["name"]]["locked"]["kong"]
         free_kong = spoiler.shuffled_kong_placement[kong_map["name"]]["puzzle"]["kong"]
         level_index = kong_map["level"]
@@ -1157,8 +1154,8 @@ def compileHints(spoiler: Spoiler) -> bool:
             freeing_kong_name = kong_list[free_kong]
             if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
                 if not kong_index == Kongs.any:
-                    kong_name = "\x07" + random.choice(kong_cryptic[kong_index]) + "\x07"
-                level_name = "\x08" + random.choice(level_cryptic[level_index]) + "\x08"
+                    kong_name = "\x07" + hint_random.choice(kong_cryptic[kong_index]) + "\x07"
+                level_name = "\x08" + hint_random.choice(level_cryptic[level_index]) + "\x08"
             else:
                 if not kong_index == Kongs.any:
                     kong_name = kong_list[kong_index]
@@ -1198,11 +1195,11 @@ def compileHints(spoiler: Spoiler) -> bool:
                         hintable_levels = [Levels.HideoutHelm]
                     else:
                         hintable_levels.append(Levels.HideoutHelm)
-        hinted_level = random.choice(hintable_levels)
+        hinted_level = hint_random.choice(hintable_levels)
         hinted_blocker_combos.append((hint_location.level, hinted_level))
         level_name = level_colors[hinted_level] + level_list[hinted_level] + level_colors[hinted_level]
         if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
-            level_name = "\x08" + random.choice(level_cryptic[hinted_level]) + "\x08"
+            level_name = "\x08" + hint_random.choice(level_cryptic[hinted_level]) + "\x08"
         message = f"The barrier to {level_name} can be cleared by obtaining \x04{spoiler.settings.BLockerEntryCount[hinted_level]} Golden Bananas\x04."
         hint_location.hint_type = HintType.BLocker
         UpdateHint(hint_location, message)
@@ -1216,7 +1213,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             if loc_id in spoiler.accessible_hints_for_location.keys():
                 hint_options = getHintLocationsForAccessibleHintItems(spoiler.accessible_hints_for_location[loc_id])
                 if len(hint_options) > 0:
-                    hint_location = random.choice(hint_options)
+                    hint_location = hint_random.choice(hint_options)
             # If this location's goals do not restrict hint door location OR all the restricted hint door options are taken (staggeringly unlikely), get a random hint door
             if hint_location is None or len(hint_options) == 0:
                 level_limit = None
@@ -1251,7 +1248,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                         item_name = "shared kong moves"
                     else:
                         # 50/50 chance for kong moves to either...
-                        coin_flip = random.choice([1, 2])
+                        coin_flip = hint_random.choice([1, 2])
                         if coin_flip == 1:
                             # Hint the kong the move belongs to
                             item_name = colorless_kong_list[item.kong] + " moves"
@@ -1283,7 +1280,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                         if ItemPool.GetKongForItem(location.item) == index:
                             message = message.replace(item.name, "Krusha")
             # Two options for hinting the location, do a coin flip
-            coin_flip = random.choice([1, 2])
+            coin_flip = hint_random.choice([1, 2])
             if coin_flip == 1:
                 # Option A: hint the region the item is in
                 region = spoiler.RegionList[GetRegionIdOfLocation(spoiler, loc_id)]
@@ -1318,7 +1315,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                 # If there are no valid options, that means everything on this path is either worthless to hint or already hinted, so we're good
                 if len(location_options) != 0:
                     # Otherwise pick a random location on this path - this guarantees each Key has at least one hint in its direction
-                    location_to_hint = random.choice(location_options)
+                    location_to_hint = hint_random.choice(location_options)
                     hinted_path_locations.append(location_to_hint)
         # If K. Rool is our goal, do the same with K. Rool phases
         if spoiler.settings.win_condition_item == WinConditionComplex.beat_krool:
@@ -1331,7 +1328,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                     # If there are no valid options, that means everything on this path is worthless to hint/already hinted or there's nothing on the path at all (Donkey...) so we're good
                     if len(location_options) != 0:
                         # Otherwise pick a random location on this path - this guarantees each K. Rool phase has at least one hint in its direction
-                        location_to_hint = random.choice(location_options)
+                        location_to_hint = hint_random.choice(location_options)
                         hinted_path_locations.append(location_to_hint)
         # If the camera is critical to the win condition, guarantee one path hint for it
         if spoiler.settings.win_condition_item in (WinConditionComplex.req_fairy, WinConditionComplex.krem_kapture) and spoiler.settings.shockwave_status != ShockwaveStatus.start_with:
@@ -1351,16 +1348,16 @@ def compileHints(spoiler: Spoiler) -> bool:
                     # If there are no valid options, that means everything on this path is worthless to hint (but I don't think the camera interacts with this)
                     if len(location_options) != 0:
                         # Otherwise pick a random location on this path - this guarantees the camera has at least one hint in its direction
-                        location_to_hint = random.choice(location_options)
+                        location_to_hint = hint_random.choice(location_options)
                         hinted_path_locations.append(location_to_hint)
         # If we attempt to hint more locations than the distribution allows for, we'll error
         # This should only happen if we're plandoing a ton of hints
         if len(hinted_path_locations) > hint_distribution[HintType.Multipath]:
             # We have to randomly choose from what we want to hint - if this culls some endpoints out of being hinted, so be it
-            hinted_path_locations = random.sample(hinted_path_locations, hint_distribution[HintType.Multipath])
+            hinted_path_locations = hint_random.sample(hinted_path_locations, hint_distribution[HintType.Multipath])
         # pick randomly from remaining locations in the keys to the multipath dict
         while len(hinted_path_locations) < hint_distribution[HintType.Multipath]:
-            location_to_hint = random.choice([loc for loc in multipath_dict_hints.keys() if loc not in hinted_path_locations])
+            location_to_hint = hint_random.choice([loc for loc in multipath_dict_hints.keys() if loc not in hinted_path_locations])
             hinted_path_locations.append(location_to_hint)
         # When placing hints, go from start to finish by woth_locations - this *roughly* places hints in most-restricted to least-restricted order
         for loc in spoiler.woth_locations:
@@ -1378,7 +1375,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             if len(hint_door_options) > 0:
                 hint_options = getHintLocationsForAccessibleHintItems(hint_door_options)
                 if len(hint_options) > 0:
-                    hint_location = random.choice(hint_options)
+                    hint_location = hint_random.choice(hint_options)
             # If this location's goals do not restrict hint door location OR all the restricted hint door options are taken (staggeringly unlikely), get a random hint door
             if len(hint_door_options) == 0 or hint_location is None:
                 hint_location = getRandomHintLocation()
@@ -1430,24 +1427,24 @@ def compileHints(spoiler: Spoiler) -> bool:
                     kong_index = spoiler.settings.boss_kongs[location.level]
                 if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
                     if location.level == Levels.Shops:
-                        level_name = "\x08" + random.choice(crankys_cryptic) + "\x08"
+                        level_name = "\x08" + hint_random.choice(crankys_cryptic) + "\x08"
                     else:
-                        level_name = "\x08" + random.choice(level_cryptic_helm_isles[location.level]) + "\x08"
-                    kong_name = "\x07" + random.choice(kong_cryptic[kong_index]) + "\x07"
+                        level_name = "\x08" + hint_random.choice(level_cryptic_helm_isles[location.level]) + "\x08"
+                    kong_name = "\x07" + hint_random.choice(kong_cryptic[kong_index]) + "\x07"
                 else:
                     level_name = level_colors[location.level] + level_list[location.level] + level_colors[location.level]
                     kong_name = kong_list[kong_index]
                 # Attempt to find a door that will be accessible before the Key
                 hint_options = getHintLocationsForAccessibleHintItems(spoiler.accessible_hints_for_location[key_location_ids[key_id]])
                 if len(hint_options) > 0:
-                    hint_location = random.choice(hint_options)
+                    hint_location = hint_random.choice(hint_options)
                 # If there are no doors available (pretty unlikely) then just get a random one. Tough luck.
                 else:
                     hint_location = getRandomHintLocation()
                 if location.type in item_type_names.keys():
                     location_name = item_type_names[location.type]
                     if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
-                        location_name = "\x06" + random.choice(item_type_names_cryptic[location.type]) + "\x06"
+                        location_name = "\x06" + hint_random.choice(item_type_names_cryptic[location.type]) + "\x06"
                     message = f"\x04{key_item.name}\x04 is held by {location_name} in {level_name}."
                 elif location.type == Types.Shop:
                     message = f"\x04{key_item.name}\x04 can be bought in {level_name}."
@@ -1470,11 +1467,11 @@ def compileHints(spoiler: Spoiler) -> bool:
                         path = [loc for loc in path if loc != Locations.HelmKey]
                     # Never hint the same location for the same path twice and avoid useless locations for Key 8 (if applicable)
                     hintable_location_ids = [loc for loc in path if loc not in already_hinted_locations and not (key_id == Items.HideoutHelmKey and loc in useless_locations[Items.HideoutHelmKey])]
-                    path_location_id = random.choice(hintable_location_ids)
+                    path_location_id = hint_random.choice(hintable_location_ids)
                     # Soft reroll duplicate hints based on hint reroll parameters
                     rerolls = 0
-                    while rerolls < hint_reroll_cap and path_location_id in globally_hinted_location_ids and random.random() <= hint_reroll_chance:
-                        path_location_id = random.choice(hintable_location_ids)
+                    while rerolls < hint_reroll_cap and path_location_id in globally_hinted_location_ids and hint_random.random() <= hint_reroll_chance:
+                        path_location_id = hint_random.choice(hintable_location_ids)
                         rerolls += 1
                     # After this point, the path_location_id is locked in and cannot be changed!
 
@@ -1485,7 +1482,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                     # Attempt to find a door that will be accessible before the Key
                     hint_options = getHintLocationsForAccessibleHintItems(spoiler.accessible_hints_for_location[key_location_ids[key_id]])
                     if len(hint_options) > 0:
-                        hint_location = random.choice(hint_options)
+                        hint_location = hint_random.choice(hint_options)
                     # If there are no doors available (very unlikely) then just get a random one. Tough luck.
                     else:
                         hint_location = getRandomHintLocation()
@@ -1524,11 +1521,11 @@ def compileHints(spoiler: Spoiler) -> bool:
                     UpdateHint(hint_location, message)
                     chosen_krool_path_location_cap -= 1  # This is a K. Rool hint, but isn't a location so we have to lower the cap on the loop
                     continue
-                path_location_id = random.choice(hintable_location_ids)
+                path_location_id = hint_random.choice(hintable_location_ids)
                 # Soft reroll duplicate hints based on hint reroll parameters
                 rerolls = 0
-                while rerolls < hint_reroll_cap and path_location_id in globally_hinted_location_ids and random.random() <= hint_reroll_chance:
-                    path_location_id = random.choice(hintable_location_ids)
+                while rerolls < hint_reroll_cap and path_location_id in globally_hinted_location_ids and hint_random.random() <= hint_reroll_chance:
+                    path_location_id = hint_random.choice(hintable_location_ids)
                     rerolls += 1
                 # After this point, the path_location_id is locked in and cannot be changed!
 
@@ -1544,7 +1541,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                     already_chosen_krool_path_locations.append(path_location_id)
                     chosen_krool_path_location_cap += 1  # Increment this by one so we go through the loop an extra time and don't lose a hint
                     continue
-                hinted_kong = random.choice(hintable_phases)
+                hinted_kong = hint_random.choice(hintable_phases)
                 hinted_item_id = spoiler.LocationList[path_location_id].item
                 # Every hint door is available before K. Rool so we can pick randomly...
                 hint_location = getRandomHintLocation()
@@ -1558,7 +1555,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                     hint_options = getHintLocationsForAccessibleHintItems(spoiler.accessible_hints_for_location[path_location_id])
                     # If no hint options are available (this should be quite unlikely), it will default to the random one
                     if len(hint_options) > 0:
-                        hint_location = random.choice(hint_options)
+                        hint_location = hint_random.choice(hint_options)
                 globally_hinted_location_ids.append(path_location_id)
                 already_chosen_krool_path_locations.append(path_location_id)
                 # Begin to build the hint - determine the region of the location
@@ -1589,11 +1586,11 @@ def compileHints(spoiler: Spoiler) -> bool:
             already_chosen_camera_path_locations = []
             for i in range(hint_distribution[HintType.RequiredWinConditionHint]):
                 hintable_location_ids = [loc for loc in path if loc not in already_chosen_camera_path_locations]
-                path_location_id = random.choice(hintable_location_ids)
+                path_location_id = hint_random.choice(hintable_location_ids)
                 # Soft reroll duplicate hints based on hint reroll parameters
                 rerolls = 0
-                while rerolls < hint_reroll_cap and path_location_id in globally_hinted_location_ids and random.random() <= hint_reroll_chance:
-                    path_location_id = random.choice(hintable_location_ids)
+                while rerolls < hint_reroll_cap and path_location_id in globally_hinted_location_ids and hint_random.random() <= hint_reroll_chance:
+                    path_location_id = hint_random.choice(hintable_location_ids)
                     rerolls += 1
                 # After this point, the path_location_id is locked in and cannot be changed!
 
@@ -1604,7 +1601,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                 # Attempt to find a door that will be accessible before the Camera
                 hint_options = getHintLocationsForAccessibleHintItems(spoiler.accessible_hints_for_location[camera_location_id])
                 if len(hint_options) > 0:
-                    hint_location = random.choice(hint_options)
+                    hint_location = hint_random.choice(hint_options)
                 # If there are no doors available (unlikely by now) then just get a random one. Tough luck.
                 else:
                     hint_location = getRandomHintLocation()
@@ -1638,7 +1635,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             hint_distribution[HintType.Joke] += hint_diff
             hint_distribution[HintType.MoveLocation] -= hint_diff
             break
-        woth_item_location = random.choice(valid_woth_item_locations)
+        woth_item_location = hint_random.choice(valid_woth_item_locations)
         index_of_level_with_location = spoiler.LocationList[woth_item_location].level
         # Now we need to find the Item object associated with this name
         woth_item = spoiler.LocationList[woth_item_location].item
@@ -1706,7 +1703,7 @@ def compileHints(spoiler: Spoiler) -> bool:
 
         shop_level = level_colors[index_of_level_with_location] + level_list[index_of_level_with_location] + level_colors[index_of_level_with_location]
         if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
-            shop_level = "\x08" + random.choice(level_cryptic_helm_isles[index_of_level_with_location]) + "\x08"
+            shop_level = "\x08" + hint_random.choice(level_cryptic_helm_isles[index_of_level_with_location]) + "\x08"
         shop_name = shop_owners[spoiler.LocationList[woth_item_location].vendor]
         message = f"On the Way of the Hoard, \x05{ItemList[woth_item].name}\x05 is bought from {shop_name} in {shop_level}."
         moves_hinted_and_lobbies[woth_item].append(hint_location.level)
@@ -1757,10 +1754,10 @@ def compileHints(spoiler: Spoiler) -> bool:
                 hint_distribution[HintType.Joke] += hint_diff
                 hint_distribution[HintType.TroffNScoff] -= hint_diff
                 break
-            hinted_level = random.choice(future_tns_levels)
+            hinted_level = hint_random.choice(future_tns_levels)
             level_name = level_colors[hinted_level] + level_list[hinted_level] + level_colors[hinted_level]
             if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
-                level_name = "\x08" + random.choice(level_cryptic[hinted_level]) + "\x08"
+                level_name = "\x08" + hint_random.choice(level_cryptic[hinted_level]) + "\x08"
             count = spoiler.settings.BossBananas[hinted_level]
             cb_name = "Small Bananas"
             if count == 1:
@@ -1929,7 +1926,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                     if transition_id in hint_candidate_entrances:
                         isolated_interesting_transitions.append(transition_id)
                         break
-        random.shuffle(isolated_interesting_transitions)
+        hint_random.shuffle(isolated_interesting_transitions)
         # If Helm access must be prioritized, force it to be hinted first
         if priority_transition_to_helm is not None:
             # Because we are guaranteeing a Helm hint here, we don't want it to be eligible to be hinted again.
@@ -1964,7 +1961,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                 and not (spoiler.settings.key_8_helm and location_id == Locations.HelmKey)
             ):
                 hintable_location_ids.append(location_id)
-        random.shuffle(hintable_location_ids)
+        hint_random.shuffle(hintable_location_ids)
         placed_woth_hints = 0
         while placed_woth_hints < hint_distribution[HintType.WothLocation]:
             # If you run out of hintable woth locations, throw in a foolish for their troubles - this should only happen if there's very few late woth locations.
@@ -1973,11 +1970,11 @@ def compileHints(spoiler: Spoiler) -> bool:
                 hint_distribution[HintType.WothLocation] -= 1
                 hint_distribution[HintType.FoolishRegion] += 1
                 continue
-            hinted_loc_id = random.choice(hintable_location_ids)
+            hinted_loc_id = hint_random.choice(hintable_location_ids)
             # Soft reroll duplicate hints based on hint reroll parameters
             rerolls = 0
-            while rerolls < hint_reroll_cap and hinted_loc_id in globally_hinted_location_ids and random.random() <= hint_reroll_chance:
-                hinted_loc_id = random.choice(hintable_location_ids)
+            while rerolls < hint_reroll_cap and hinted_loc_id in globally_hinted_location_ids and hint_random.random() <= hint_reroll_chance:
+                hinted_loc_id = hint_random.choice(hintable_location_ids)
                 rerolls += 1
             # After this point, the path_location_id is locked in and cannot be changed!
 
@@ -1986,7 +1983,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             # Attempt to find a door that will be accessible before the location is
             hint_options = getHintLocationsForAccessibleHintItems(spoiler.accessible_hints_for_location[hinted_loc_id])
             if len(hint_options) > 0:
-                hint_location = random.choice(hint_options)
+                hint_location = hint_random.choice(hint_options)
             # If there are no doors available, it's likely a very early woth location. Go find a better location to hint.
             else:
                 continue
@@ -2023,7 +2020,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             foolish_location_score = foolish_location_score**1.25  # Exponentiation of this score puts additional emphasis (but not too much) on larger regions
             total_foolish_location_score += foolish_location_score
             foolish_region_location_score[foolish_name] = foolish_location_score
-        random.shuffle(spoiler.foolish_region_names)
+        hint_random.shuffle(spoiler.foolish_region_names)
         for i in range(hint_distribution[HintType.FoolishRegion]):
             # If you run out of foolish regions (maybe in an all medals run?) - this *should* be covered by the distribution earlier but this is a good failsafe
             if len(spoiler.foolish_region_names) == 0 or sum(foolish_region_location_score.values()) == 0:  # You can either expend the whole list or run out of eligible regions
@@ -2031,7 +2028,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                 hint_distribution[HintType.FoolishRegion] -= 1
                 hint_distribution[HintType.RegionItemCount] += 1
                 continue
-            hinted_region_name = random.choices(list(foolish_region_location_score.keys()), foolish_region_location_score.values())[0]  # Weighted random choice from list of foolish region names
+            hinted_region_name = hint_random.choices(list(foolish_region_location_score.keys()), foolish_region_location_score.values())[0]  # Weighted random choice from list of foolish region names
             spoiler.foolish_region_names.remove(hinted_region_name)
             del foolish_region_location_score[hinted_region_name]
             hint_location = getRandomHintLocation()
@@ -2090,7 +2087,7 @@ def compileHints(spoiler: Spoiler) -> bool:
                 hint_distribution[HintType.ForeseenPathless] -= 1
                 hint_distribution[HintType.RegionItemCount] += 1
                 continue
-            pathless_item = random.choices(list(pathless_move_score.keys()), pathless_move_score.values())[0]
+            pathless_item = hint_random.choices(list(pathless_move_score.keys()), pathless_move_score.values())[0]
             del pathless_move_score[pathless_item]
             hint_location = getRandomHintLocation()
             message = f"I have foreseen that there are \x0bno paths to the Hoard\x0b which contain \x04{ItemList[pathless_item].name}\x04."
@@ -2101,7 +2098,7 @@ def compileHints(spoiler: Spoiler) -> bool:
     # Currently it randomly picks a region that has a non-zero amount of potions in it, but it cannot hint shop regions.
     if hint_distribution[HintType.RegionItemCount] > 0:
         hintable_region_names = list(spoiler.region_hintable_count.keys())
-        random.shuffle(hintable_region_names)
+        hint_random.shuffle(hintable_region_names)
         for i in range(hint_distribution[HintType.RegionItemCount]):
             # If somehow you end up with more hints than there are regions with moves in them...
             if len(hintable_region_names) <= 0:
@@ -2193,7 +2190,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             # Always put in at least one Japes hint
             if placed_entrance_hints == 0:
                 japesHintEntrances = [entrance for entrance, back in spoiler.shuffled_exit_data.items() if back.regionId in criticalJapesRegions]
-                random.shuffle(japesHintEntrances)
+                hint_random.shuffle(japesHintEntrances)
                 japesHintPlaced = False
                 while len(japesHintEntrances) > 0:
                     japesHinted = japesHintEntrances.pop()
@@ -2206,7 +2203,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             # Always put in at least one Aztec hint
             elif placed_entrance_hints == 1:
                 aztecHintEntrances = [entrance for entrance, back in spoiler.shuffled_exit_data.items() if back.regionId in criticalAztecRegions]
-                random.shuffle(aztecHintEntrances)
+                hint_random.shuffle(aztecHintEntrances)
                 aztecHintPlaced = False
                 while len(aztecHintEntrances) > 0:
                     aztecHinted = aztecHintEntrances.pop()
@@ -2219,7 +2216,7 @@ def compileHints(spoiler: Spoiler) -> bool:
             # Always put in at least one Factory hint
             elif placed_entrance_hints == 2:
                 factoryHintEntrances = [entrance for entrance, back in spoiler.shuffled_exit_data.items() if back.regionId in criticalFactoryRegions]
-                random.shuffle(factoryHintEntrances)
+                hint_random.shuffle(factoryHintEntrances)
                 factoryHintPlaced = False
                 while len(factoryHintEntrances) > 0:
                     factoryHinted = factoryHintEntrances.pop()
@@ -2230,9 +2227,9 @@ def compileHints(spoiler: Spoiler) -> bool:
                 if not factoryHintPlaced:
                     print("Factory LZR hint unable to be placed!")
             else:
-                region_to_hint = random.choice(usefulRegions)
+                region_to_hint = hint_random.choice(usefulRegions)
                 usefulHintEntrances = [entrance for entrance, back in spoiler.shuffled_exit_data.items() if back.regionId in region_to_hint]
-                random.shuffle(usefulHintEntrances)
+                hint_random.shuffle(usefulHintEntrances)
                 usefulHintPlaced = False
                 while len(usefulHintEntrances) > 0:
                     usefulHinted = usefulHintEntrances.pop()
@@ -2295,7 +2292,7 @@ def compileHints(spoiler: Spoiler) -> bool:
     chosen_shops = []
     for i in range(hint_distribution[HintType.FullShopWithItems]):
         # Shared shop lists are a convenient list of all individual shops in the game, regardless of if something is there
-        shared_shop_location = random.choice([shop for shop in SharedShopLocations if shop not in chosen_shops])
+        shared_shop_location = hint_random.choice([shop for shop in SharedShopLocations if shop not in chosen_shops])
         # Ensure we always hint unique shops
         chosen_shops.append(shared_shop_location)
         # Get the level and vendor type from that location
@@ -2303,19 +2300,19 @@ def compileHints(spoiler: Spoiler) -> bool:
         # Find all locations for this shop
         kongLocationsAtThisShop = [
             location
-            for id, location in spoiler.LocationList.items()
-            if location.type == Types.Shop and location.level == shop_info.level and location.vendor == shop_info.vendor and location.kong != Kongs.any
+            for location in map(spoiler.LocationList.__getitem__, spoiler.location_index.getLocationsOfType(Types.Shop))
+            if location.level == shop_info.level and location.vendor == shop_info.vendor and location.kong != Kongs.any
         ]
         # If this is a shared shop dump...
         if shop_info.item is not None and shop_info.item != Items.NoItem:
             shop_vendor = shop_owners[shop_info.vendor]
             level_name = level_colors[shop_info.level] + level_list[shop_info.level] + level_colors[shop_info.level]
             if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
-                level_name = "\x08" + random.choice(level_cryptic_helm_isles[shop_info.level]) + "\x08"
+                level_name = "\x08" + hint_random.choice(level_cryptic_helm_isles[shop_info.level]) + "\x08"
             move_series = ItemList[shop_info.item].name
         # Else this is a series of Kong-specific purchases
         else:
-            random.shuffle(kongLocationsAtThisShop)  # Shuffle this list so you don't know who buys what
+            hint_random.shuffle(kongLocationsAtThisShop)  # Shuffle this list so you don't know who buys what
             item_names = [ItemList[location.item].name for location in kongLocationsAtThisShop if location.item is not None and location.item != Items.NoItem]
             if len(item_names) == 0:
                 move_series = "nothing"
@@ -2326,7 +2323,7 @@ def compileHints(spoiler: Spoiler) -> bool:
         shop_vendor = shop_owners[shop_info.vendor]
         level_name = level_colors[shop_info.level] + level_list[shop_info.level] + level_colors[shop_info.level]
         if spoiler.settings.wrinkly_hints == WrinklyHints.cryptic:
-            level_name = "\x08" + random.choice(level_cryptic_helm_isles[shop_info.level]) + "\x08"
+            level_name = "\x08" + hint_random.choice(level_cryptic_helm_isles[shop_info.level]) + "\x08"
         hint_location = getRandomHintLocation()
         message = f"{shop_vendor}'s in {level_name} contains {move_series}."
         hint_location.hint_type = HintType.FullShopWithItems
@@ -2354,7 +2351,7 @@ def compileHints(spoiler: Spoiler) -> bool:
 
     # Dirt patch hints are already garbage anyway - no restrictions here
     # for i in range(hint_distribution[HintType.DirtPatch]):
-    #     dirt_patch_name = random.choice(spoiler.dirt_patch_placement)
+    #     dirt_patch_name = hint_random.choice(spoiler.dirt_patch_placement)
     #     hint_location = getRandomHintLocation()
     #     message = f"There is a dirt patch located at {dirt_patch_name}"
     #     hint_location.hint_type = HintType.DirtPatch
@@ -2374,14 +2371,12 @@ def compileHints(spoiler: Spoiler) -> bool:
             message = "What do you think I am, a comedian? Try again in another seed."
         else:
             joke_hint_list = hint_list.copy()
-            random.shuffle(joke_hint_list)
+            hint_random.shuffle(joke_hint_list)
             message = joke_hint_list.pop().hint
         # Way of the Bean joke hint - yes, this IS worth it
         if message == "[[WOTB]]":
-            bean_location_id = None
-            for id, location in spoiler.LocationList.items():
-                if location.item == Items.Bean:
-                    bean_location_id = id
+            bean_locations = spoiler.location_index.getLocationsWithItem(Items.Bean)
+            bean_location_id = bean_locations[-1] if len(bean_locations) > 0 else None
             # If we didn't find the bean, just get another joke hint :(
             if bean_location_id is None:
                 message = joke_hint_list.pop()
@@ -2499,7 +2494,7 @@ def getRandomHintLocation(location_list=None, kongs=None, levels=None, move_name
     # If it's too specific, we may not be able to find any
     if len(valid_unoccupied_hint_locations) == 0:
         return None
-    hint_location = random.choice(valid_unoccupied_hint_locations)
+    hint_location = hint_random.choice(valid_unoccupied_hint_locations)
     # Update the reference so we're updating the main list instead of a copy of it
     for hint in hints:
         if hint.name == hint_location.name:
@@ -2590,38 +2585,38 @@ def compileMicrohints(spoiler: Spoiler) -> None:
         MicrohintsEnabled.all: helm_prog_items.copy() + INSTRUMENT_ITEMS.copy() + SHOPKEEPER_ITEMS.copy() + [Items.ProgressiveSlam],
     }
     items_needing_microhints = microhint_categories[spoiler.settings.microhints_enabled].copy()
-    # Loop through locations looking for the items that need a microhint
-    for id, location in spoiler.LocationList.items():
-        if location.item in items_needing_microhints:
-            item = ItemList[location.item]
-            level_color = level_colors[location.level]
-            if location.item == Items.ProgressiveSlam:
-                # Chunky Phase slam hint
-                if id not in PreGivenLocations and id not in TrainingBarrelLocations:  # Ignore anything pre-given
-                    if location.level not in slam_levels:
-                        slam_levels.append(location.level)
-            elif location.item in (Items.Cranky, Items.Funky, Items.Snide, Items.Candy):
-                hint_text = f"{item.name} has gone on vacation to the {vacation_levels_properties[location.level]} of {level_color}{level_list[location.level]}{level_color}."
-                spoiler.microhints[item.name] = hint_text.upper()
+    # Loop through the locations of the items that need a microhint
+    for id in spoiler.location_index.getLocationsWithItems(items_needing_microhints):
+        location = spoiler.LocationList[id]
+        item = ItemList[location.item]
+        level_color = level_colors[location.level]
+        if location.item == Items.ProgressiveSlam:
+            # Chunky Phase slam hint
+            if id not in PreGivenLocations and id not in TrainingBarrelLocations:  # Ignore anything pre-given
+                if location.level not in slam_levels:
+                    slam_levels.append(location.level)
+        elif location.item in (Items.Cranky, Items.Funky, Items.Snide, Items.Candy):
+            hint_text = f"{item.name} has gone on vacation to the {vacation_levels_properties[location.level]} of {level_color}{level_list[location.level]}{level_color}."
+            spoiler.microhints[item.name] = hint_text.upper()
+        else:
+            if location.type in item_type_names.keys():
+                hint_text = f"You would be better off looking for {item_type_names[location.type]} in {level_color}{level_list[location.level]}{level_color} for this.".upper()
+            elif location.type == Types.Shop:
+                hint_text = f"You would be better off looking for shops in {level_color}{level_list[location.level]}{level_color} for this.".upper()
             else:
-                if location.type in item_type_names.keys():
-                    hint_text = f"You would be better off looking for {item_type_names[location.type]} in {level_color}{level_list[location.level]}{level_color} for this.".upper()
-                elif location.type == Types.Shop:
-                    hint_text = f"You would be better off looking for shops in {level_color}{level_list[location.level]}{level_color} for this.".upper()
-                else:
-                    hint_text = f"You would be better off looking in {level_color}{level_list[location.level]}{level_color} with {kong_list[location.kong]} for this.".upper()
-                settings_values = [
-                    spoiler.settings.kong_model_dk,
-                    spoiler.settings.kong_model_diddy,
-                    spoiler.settings.kong_model_lanky,
-                    spoiler.settings.kong_model_tiny,
-                    spoiler.settings.kong_model_chunky,
-                ]
-                for index, val in enumerate(settings_values):
-                    if val == KongModels.krusha:
-                        if index == location.kong:
-                            hint_text = hint_text.replace(colorless_kong_list[location.kong].upper(), "KRUSHA")
-                spoiler.microhints[item.name] = hint_text
+                hint_text = f"You would be better off looking in {level_color}{level_list[location.level]}{level_color} with {kong_list[location.kong]} for this.".upper()
+            settings_values = [
+                spoiler.settings.kong_model_dk,
+                spoiler.settings.kong_model_diddy,
+                spoiler.settings.kong_model_lanky,
+                spoiler.settings.kong_model_tiny,
+                spoiler.settings.kong_model_chunky,
+            ]
+            for index, val in enumerate(settings_values):
+                if val == KongModels.krusha:
+                    if index == location.kong:
+                        hint_text = hint_text.replace(colorless_kong_list[location.kong].upper(), "KRUSHA")
+            spoiler.microhints[item.name] = hint_text
     if len(slam_levels) > 0:
         slam_text_entries = [f"{level_colors[x]}{level_list[x]}{level_colors[x]}" for x in slam_levels]
         slam_text = " or ".join(slam_text_entries)
@@ -2656,16 +2651,15 @@ def compileSpoilerHints(spoiler):
         important_items.append(Items.Snide)
     if spoiler.settings.climbing_status != ClimbingStatus.normal:
         important_items.append(Items.Climbing)
-    for location_id in spoiler.LocationList.keys():
+    for location_id in spoiler.location_index.getLocationsWithItems(important_items):
         location = spoiler.LocationList[location_id]
         level_of_location = location.level
         if level_of_location == Levels.Shops:  # Jetpac and BlueprintBananas - we want Jetpac in Isles now, but we probably won't want BlueprintBananas there too when those start shuffling
             level_of_location = Levels.DKIsles
-        if location.item in important_items:
-            spoiler.level_spoiler[level_of_location].vial_colors.append(CategorizeItem(ItemList[location.item]))
-            spoiler.level_spoiler[level_of_location].points += PointValueOfItem(spoiler.settings, location.item)
-            if location_id in spoiler.woth_locations:
-                spoiler.level_spoiler[level_of_location].woth_count += 1
+        spoiler.level_spoiler[level_of_location].vial_colors.append(CategorizeItem(ItemList[location.item]))
+        spoiler.level_spoiler[level_of_location].points += PointValueOfItem(spoiler.settings, location.item)
+        if location_id in spoiler.woth_locations:
+            spoiler.level_spoiler[level_of_location].woth_count += 1
     # Convert those spoiler hints to readable text
     spoiler.level_spoiler_human_readable = {
         level_list[Levels.DKIsles]: "",
@@ -2862,17 +2856,9 @@ def UpdateSpoilerHintList(spoiler: Spoiler) -> None:
 
 def GetRegionIdOfLocation(spoiler: Spoiler, location_id: Locations) -> Regions:
     """Given the id of a Location, return the Region it belongs to."""
-    location = spoiler.LocationList[location_id]
-    # Shop locations are tied to the level, not the shop regions
-    if location.type == Types.Shop:
-        for region_id in [id for id, reg in spoiler.RegionList.items() if reg.level == Levels.Shops]:
-            if location_id in [location_logic.id for location_logic in spoiler.RegionList[region_id].locations if not location_logic.isAuxiliaryLocation]:
-                return region_id
-    for region_id in Regions:
-        region = spoiler.RegionList[region_id]
-        if region.level == location.level or location.type == Types.Hint:
-            if location_id in [location_logic.id for location_logic in region.locations if not location_logic.isAuxiliaryLocation]:
-                return region_id
+    region_id = spoiler.location_index.getRegionOfLocation(location_id)
+    if region_id is not None:
+        return region_id
     raise Exception(f"Unable to find Region for Location {location_id.name}")  # This should never trigger!
 
 
@@ -2947,11 +2933,7 @@ def GenerateMultipathDict(
                     relevant_goal_locations.append(Maps(map_id))
         # Determine if this location is on the path to taking photos for certain win conditions
         if spoiler.settings.win_condition_item in (WinConditionComplex.req_fairy, WinConditionComplex.krem_kapture) and spoiler.settings.shockwave_status != ShockwaveStatus.start_with:
-            camera_location_id = None
-            for id, loc in spoiler.LocationList.items():
-                if loc.item in (Items.Camera, Items.CameraAndShockwave):
-                    camera_location_id = id
-                    break
+            camera_location_id = spoiler.location_index.getLocationWithItem((Items.Camera, Items.CameraAndShockwave))
             if camera_location_id in spoiler.woth_paths.keys() and location in spoiler.woth_paths[camera_location_id]:
                 path_to_camera.append("taking photos")
                 relevant_goal_locations.append(Locations(camera_location_id))
@@ -0,0 +1,328 @@
+"""Compile logic lambdas against the settings of a generation."""
+
+from __future__ import annotations
+
+import ast
+from copy import copy
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from randomizer.Logic import CollectibleRegionsOriginal, RegionsOriginal
+
+if TYPE_CHECKING:
+    from randomizer.Logic import LogicVarHolder
+    from randomizer.Spoiler import Spoiler
+
+# Settings read by the logic files that are never changed once the settings have been resolved
+# Anything not listed here (level order, kong freeing order, K. Rool phases...) can change during a fill and is left alone
+ConstantSettings = {
+    "auto_keys",
+    "bonus_barrel_rando",
+    "bonus_barrels",
+    "cannons_require_blast",
+    "crown_placement_rando",
+    "damage_amount",
+    "fast_start_beginning_of_game",
+    "free_trade_items",
+    "fungi_time_internal",
+    "galleon_water_internal",
+    "hard_shooting",
+    "helm_setting",
+    "kasplat_rando",
+    "medal_cb_req",
+    "mermaid_gb_pearls",
+    "remove_wrinkly_puzzles",
+    "shuffle_shops",
+    "sprint_barrel_requires_sprint",
+    "tns_location_rando",
+    "wrinkly_location_rando",
+}
+
+# Glitch logic flags, set once when the logic variables are created
+GlitchFlags = {
+    "phasewalk",
+    "phaseswim",
+    "moonkicks",
+    "ledgeclip",
+    "generalclips",
+    "lanky_blocker_skip",
+    "dk_blocker_skip",
+    "troff_skip",
+    "spawn_snags",
+    "advanced_platforming",
+    "tbs",
+    "swim_through_shores",
+    "boulder_clip",
+    "skew",
+    "moontail",
+    "phasefall",
+}
+
+# Glitch helper methods and the flags they require - if none of the flags are on, the method always returns False
+GlitchMethods = {
+    "CanPhase": ("phasewalk", "phasefall"),
+    "CanPhaseswim": ("phaseswim",),
+    "CanSkew": ("skew",),
+    "CanMoonkick": ("moonkicks",),
+    "CanMoontail": ("moontail",),
+    "CanOStandTBSNoclip": ("tbs",),
+    "CanSTS": ("swim_through_shores",),
+    "CanAccessRNDRoom": ("phasewalk", "phasefall", "generalclips", "tbs"),
+}
+
+# Methods that only read settings, so calls with constant arguments can be resolved ahead of time
+SettingsMethods = {"checkBarrier", "checkFastCheck"}
+
+# Value types that can be written straight back into a lambda as a literal
+LiteralTypes = (bool, int, float, str, type(None))
+
+# Parsed lambdas of each source file, keyed by (line, column) of the lambda body - shared by every compiler since the source never changes
+SourceLambdas: Dict[str, Dict[Tuple[int, int], ast.Lambda]] = {}
+
+
+def AlwaysTrue(l):
+    """Logic which is always met."""
+    return True
+
+
+def AlwaysFalse(l):
+    """Logic which is never met."""
+    return False
+
+
+class LogicCompiler:
+    """Rewrites logic lambdas with their settings-dependent parts resolved.
+
+    Every settings read, glitch check and removed barrier check in a lambda is replaced by its value,
+    then any and/or/not/if expressions that no longer depend on the logic state are folded away.
+    Lambdas are matched back to their source through the ast of the file they were defined in.
+    """
+
+    def __init__(self, logicVariables: LogicVarHolder) -> None:
+        """Initialize with given parameters."""
+        self.logicVariables = logicVariables
+        self.settings = logicVariables.settings
+        # Compiled version of each lambda, keyed by its code object
+        self.compiled: Dict[Any, Callable] = {}
+        self.compiledCount = 0
+        self.foldedCount = 0
+
+    def GetSourceLambda(self, logic: Callable) -> Optional[ast.Lambda]:
+        """Find the ast node a lambda was compiled from."""
+        code = logic.__code__
+        filename = code.co_filename
+        lambdas = LoadSourceLambdas(filename)
+        # The first instruction after RESUME is positioned at the start of the lambda's own body
+        # The innermost lambda whose body contains it is the one this code object came from
+        match = None
+        for line, _, column, _ in list(code.co_positions())[1:2]:
+            for node in lambdas.values():
+                body = node.body
+                if (body.lineno, body.col_offset) <= (line, column) < (body.end_lineno, body.end_col_offset):
+                    if match is None or (body.lineno, body.col_offset) > (match.body.lineno, match.body.col_offset):
+                        match = node
+        if match is None:
+            return None
+        # Make sure the match compiles to exactly the same bytecode
+        expression = ast.fix_missing_locations(ast.Expression(match))
+        original = compile(expression, filename, "eval")
+        candidates = [const for const in original.co_consts if hasattr(const, "co_code")]
+        if len(candidates) != 1 or candidates[0].co_code != code.co_code:
+            return None
+        return match
+
+    def Compile(self, logic: Callable) -> Callable:
+        """Get the compiled version of a logic lambda, or the lambda itself if it can't be compiled."""
+        code = getattr(logic, "__code__", None)
+        # Closures (lambdas built in loops, wrapped enemy logic) depend on more than the logic variables
+        if code is None or code.co_name != "<lambda>" or logic.__closure__ is not None or code.co_argcount != 1:
+            return logic
+        if code in self.compiled:
+            return self.compiled[code]
+        compiled = logic
+        source = self.GetSourceLambda(logic)
+        if source is not None:
+            self.argName = source.args.args[0].arg
+            self.globals = logic.__globals__
+            try:
+                body = self.Fold(source.body, True)
+            except Exception:
+                body = None
+            if body is not None:
+                if body[0]:
+                    compiled = AlwaysTrue if body[1] else AlwaysFalse
+                    self.foldedCount += 1
+                elif ast.dump(body[2]) != ast.dump(source.body):
+                    expression = ast.Expression(ast.Lambda(args=source.args, body=body[2]))
+                    ast.copy_location(expression.body, source)
+                    ast.fix_missing_locations(expression)
+                    compiled = eval(compile(expression, code.co_filename, "eval"), logic.__globals__)
+                    self.compiledCount += 1
+        self.compiled[code] = compiled
+        return compiled
+
+    def Literal(self, value: Any, original: ast.expr) -> ast.expr:
+        """Get an expression for a resolved value, falling back to the original expression if it can't be written as a literal."""
+        if type(value) in LiteralTypes:
+            return ast.copy_location(ast.Constant(value), original)
+        return original
+
+    def Fold(self, node: ast.expr, boolContext: bool) -> Tuple[bool, Any, ast.expr]:
+        """Resolve an expression as far as possible.
+
+        Returns (True, value, node) if the expression is constant for these settings, otherwise (False, None, rewritten node).
+        If boolContext is set, only the truthiness of the expression matters.
+        """
+        logic = self.logicVariables
+        if isinstance(node, ast.Constant):
+            return (True, node.value, node)
+        if isinstance(node, ast.Name):
+            # Only classes and modules are safe to resolve, other globals could be changed later
+            if node.id != self.argName and isinstance(self.globals.get(node.id), (type, ModuleType)):
+                return (True, self.globals[node.id], node)
+            return (False, None, node)
+        if isinstance(node, ast.Attribute):
+            base = node.value
+            # l.settings.x
+            if isinstance(base, ast.Attribute) and isinstance(base.value, ast.Name) and base.value.id == self.argName and base.attr == "settings":
+                if node.attr in ConstantSettings:
+                    return (True, getattr(self.settings, node.attr), node)
+                return (False, None, node)
+            # l.glitch
+            if isinstance(base, ast.Name) and base.id == self.argName:
+                if node.attr in GlitchFlags:
+                    return (True, getattr(logic, node.attr), node)
+                return (False, None, node)
+            # Enum members and other module level constants
+            folded = self.Fold(base, False)
+            if folded[0]:
+                value = getattr(folded[1], node.attr)
+                if not isinstance(folded[1], ModuleType) or isinstance(value, (type, ModuleType)):
+                    return (True, value, node)
+            return (False, None, ast.copy_location(ast.Attribute(value=folded[2], attr=node.attr, ctx=node.ctx), node))
+        if isinstance(node, ast.Call):
+            func = node.func
+            args = [self.Fold(arg, False) for arg in node.args]
+            if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == self.argName and not node.keywords:
+                if func.attr in GlitchMethods and not any(getattr(logic, flag) for flag in GlitchMethods[func.attr]):
+                    return (True, False, node)
+                if func.attr in SettingsMethods and all(arg[0] for arg in args):
+                    return (True, getattr(logic, func.attr)(*[arg[1] for arg in args]), node)
+            newArgs = [self.Literal(arg[1], arg[2]) if arg[0] else arg[2] for arg in args]
+            return (False, None, ast.copy_location(ast.Call(func=func, args=newArgs, keywords=node.keywords), node))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self.Fold(node.operand, True)
+            if operand[0]:
+                return (True, not operand[1], node)
+            return (False, None, ast.copy_location(ast.UnaryOp(op=node.op, operand=operand[2]), node))
+        if isinstance(node, ast.BoolOp):
+            return self.FoldBoolOp(node, boolContext)
+        if isinstance(node, ast.IfExp):
+            test = self.Fold(node.test, True)
+            body = self.Fold(node.body, boolContext)
+            orelse = self.Fold(node.orelse, boolContext)
+            if test[0]:
+                return body if test[1] else orelse
+            body = self.Literal(body[1], body[2]) if body[0] else body[2]
+            orelse = self.Literal(orelse[1], orelse[2]) if orelse[0] else orelse[2]
+            return (False, None, ast.copy_location(ast.IfExp(test=test[2], body=body, orelse=orelse), node))
+        if isinstance(node, ast.Compare):
+            parts = [self.Fold(part, False) for part in [node.left] + node.comparators]
+            if all(part[0] for part in parts):
+                result = True
+                for op, left, right in zip(node.ops, parts, parts[1:]):
+                    result = eval(
+                        compile(ast.Expression(ast.Compare(left=ast.Name("a", ast.Load()), ops=[op], comparators=[ast.Name("b", ast.Load())])), "<fold>", "eval"), {"a": left[1], "b": right[1]}
+                    )
+                    if not result:
+                        break
+                return (True, result, node)
+            parts = [self.Literal(part[1], part[2]) if part[0] else part[2] for part in parts]
+            return (False, None, ast.copy_location(ast.Compare(left=parts[0], ops=node.ops, comparators=parts[1:]), node))
+        # Anything else (arithmetic, subscripts, comprehensions) is left untouched
+        return (False, None, node)
+
+    def FoldBoolOp(self, node: ast.BoolOp, boolContext: bool) -> Tuple[bool, Any, ast.expr]:
+        """Drop the operands of an and/or that are always true or always false."""
+        isOr = isinstance(node.op, ast.Or)
+        values = [self.Fold(value, boolContext) for value in node.values]
+        if not boolContext:
+            # The value of the expression matters, so only fold it if every operand is constant
+            if all(value[0] for value in values):
+                result = values[0][1]
+                for value in values[1:]:
+                    if bool(result) == isOr:
+                        break
+                    result = value[1]
+                return (True, result, node)
+            return (False, None, ast.copy_location(ast.BoolOp(op=node.op, values=[self.Literal(value[1], value[2]) if value[0] else value[2] for value in values]), node))
+        remaining = []
+        for value in values:
+            if value[0]:
+                # True in an or (or False in an and) decides the whole expression, the opposite does nothing
+                if bool(value[1]) == isOr:
+                    if not remaining:
+                        return (True, isOr, node)
+                    remaining.append(ast.copy_location(ast.Constant(isOr), value[2]))
+                    break
+                continue
+            remaining.append(value[2])
+        if not remaining:
+            return (True, not isOr, node)
+        if len(remaining) == 1:
+            return (False, None, remaining[0])
+        return (False, None, ast.copy_location(ast.BoolOp(op=node.op, values=remaining), node))
+
+
+def LoadSourceLambdas(filename: str) -> Dict[Tuple[int, int], ast.Lambda]:
+    """Get the parsed lambdas of a source file, parsing it the first time it's needed."""
+    if filename not in SourceLambdas:
+        lambdas = {}
+        try:
+            with open(filename, "r") as file:
+                tree = ast.parse(file.read(), filename)
+        except (OSError, SyntaxError, ValueError):
+            tree = None
+        if tree is not None:
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Lambda):
+                    lambdas[(node.body.lineno, node.body.col_offset)] = node
+        SourceLambdas[filename] = lambdas
+    return SourceLambdas[filename]
+
+
+def PreloadLogicSources() -> None:
+    """Parse every logic file ahead of time, so the first seed generated by a process doesn't have to."""
+    logicObjects = []
+    for region in RegionsOriginal.values():
+        logicObjects.extend(region.locations + region.events + region.exits)
+    for collectibles in CollectibleRegionsOriginal.values():
+        logicObjects.extend(collectibles)
+    filenames = {logicObject.logic.__code__.co_filename for logicObject in logicObjects if hasattr(logicObject.logic, "__code__")}
+    for filename in sorted(filenames):
+        LoadSourceLambdas(filename)
+
+
+def CompileLogic(spoiler: Spoiler) -> None:
+    """Replace the logic of every region, location, event and collectible with a version compiled against the current settings."""
+    compiler = LogicCompiler(spoiler.LogicVariables)
+
+    def compiledCopies(logicObjects):
+        # Logic objects are shared between worlds, so swap in compiled copies instead of changing them
+        compiledObjects = []
+        for logicObject in logicObjects:
+            logic = compiler.Compile(logicObject.logic)
+            if logic is not logicObject.logic:
+                logicObject = copy(logicObject)
+                logicObject.logic = logic
+            compiledObjects.append(logicObject)
+        return compiledObjects
+
+    for region in spoiler.RegionList.values():
+        region.locations = compiledCopies(region.locations)
+        region.events = compiledCopies(region.events)
+        region.exits = compiledCopies(region.exits)
+        if region.deathwarp is not None:
+            region.deathwarp = compiledCopies([region.deathwarp])[0]
+    for collectibles in spoiler.CollectibleRegions.values():
+        collectibles[:] = compiledCopies(collectibles)
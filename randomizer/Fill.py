@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import pickle
 from math import ceil
-from random import choice, randint, shuffle, uniform
 from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple, Union
 
-import js
 import randomizer.ItemPool as ItemPool
 import randomizer.Lists.Exceptions as Ex
 import randomizer.ShuffleExits as ShuffleExits
 from randomizer.CompileHints import compileHints, compileMicrohints, compileSpoilerHints, getDoorRestrictionsForItem
+from randomizer.CompileLogic import AlwaysTrue, CompileLogic
 from randomizer.Enums.Events import Events
 from randomizer.Enums.Items import Items
 from randomizer.Enums.Kongs import GetKongs, Kongs
@@ -46,9 +47,11 @@ from randomizer.Enums.Settings import (
 from randomizer.Enums.Time import Time
 from randomizer.Enums.Transitions import Transitions
 from randomizer.Enums.Types import Types, BarrierItems
+from randomizer.Instrumentation import addCounted, count, getCountedSince, getCounters, progress, span
 from randomizer.Lists.CustomLocations import resetCustomLocations
 from randomizer.Enums.Maps import Maps
 from randomizer.Lists.Item import ItemList
+from randomizer.LocationIndex import LocationIndex
 from randomizer.Lists.Location import SharedMoveLocations, SharedShopLocations
 from randomizer.Lists.Minigame import BarrelMetaData, MinigameRequirements
 from randomizer.Lists.ShufflableExit import GetLevelShuffledToIndex
@@ -57,6 +60,7 @@ from randomizer.Patching import ApplyRandomizer
 from randomizer.Patching.EnemyRando import randomize_enemies_0
 from randomizer.Patching.Lib import IsItemSelected
 from randomizer.Prices import GetMaxForKong
+from randomizer.RandomStreams import fill_random
 from randomizer.Settings import Settings
 from randomizer.ShuffleBarrels import BarrelShuffle
 from randomizer.ShuffleBosses import CorrectBossKongLocations, ShuffleBossesBasedOnOwnedItems
@@ -104,13 +108,14 @@ def KasplatShuffle(spoiler: Spoiler, LogicVariables: LogicVarHolder) -> None:
                     else:
                         # This is the first VerifyWorld check, and serves as the canary in the coal mine
                         # If we get to this point in the code, the world itself is likely unstable from some combination of settings or bugs
-                        js.postMessage("Settings combination is likely unstable.")
+                        progress("Settings combination is likely unstable.", phase="kasplats", tries=retries)
                         ResetShuffledKasplatLocations(spoiler)
                         raise Ex.SettingsIncompatibleException("Settings combination is likely unstable - report this to the devs!")
                 return
             except Ex.KasplatPlacementException:
                 retries += 1
-                js.postMessage("Kasplat placement failed. Retrying. Tries: " + str(retries))
+                count("retries", phase="kasplats")
+                progress("Kasplat placement failed. Retrying. Tries: " + str(retries), phase="kasplats", tries=retries)
 
 
 def GetExitLevelExit(region: Region) -> Optional[Transitions]:
@@ -179,43 +184,162 @@ def GetLevelExitTransition(region):
         return None
 
 
+# Regions that need a third melon (underwater) or second melon (surface) to enter when water is lava in shuffled worlds
+UnderwaterRegions = {
+    Regions.LighthouseUnderwater,
+    Regions.ShipyardUnderwater,
+    Regions.TreasureRoom,
+    Regions.MermaidRoom,
+    Regions.Submarine,
+    Regions.LankyShip,
+    Regions.TinyShip,
+    Regions.BongosShip,
+    Regions.GuitarShip,
+    Regions.TromboneShip,
+    Regions.SaxophoneShip,
+    Regions.TriangleShip,
+}
+SurfaceWaterRegions = {Regions.Shipyard}
+
+
+def GroupRegions(spoiler: Spoiler) -> None:
+    """Group regions which can always reach each other, so searches visit each group once instead of every region in it.
+
+    Regions are grouped where they are joined both ways by exits with no logic and no time of day restriction, once the logic
+    has been compiled. Shuffled exits, exits out of the start and water regions, which need melons when water is lava, are
+    left out since what they lead to can change during a fill. Each region of a group keeps its exits out of the group.
+    """
+    spoiler.regionGroups = {}
+    spoiler.groupedRegionExits = {}
+
+    def isFixed(regionId: Regions) -> bool:
+        return regionId in spoiler.RegionList and regionId != Regions.GameStart and regionId not in UnderwaterRegions and regionId not in SurfaceWaterRegions
+
+    def isUnconditional(exit: TransitionFront) -> bool:
+        return exit.logic is AlwaysTrue and exit.time == Time.Both and exit.exitShuffleId is None and not exit.assumed and isFixed(exit.dest)
+
+    unconditional = {regionId: [exit.dest for exit in region.exits if isUnconditional(exit)] for regionId, region in spoiler.RegionList.items() if isFixed(regionId)}
+    # Find the strongly connected regions with Tarjan's algorithm, kept iterative as chains of regions can be long
+    index = {}
+    lowLink = {}
+    stack = []
+    onStack = set()
+    for root in unconditional:
+        if root in index:
+            continue
+        work = [(root, iter(unconditional[root]))]
+        index[root] = lowLink[root] = len(index)
+        stack.append(root)
+        onStack.add(root)
+        while len(work) > 0:
+            regionId, destinations = work[-1]
+            destination = next(destinations, None)
+            if destination is not None:
+                if destination not in index:
+                    index[destination] = lowLink[destination] = len(index)
+                    stack.append(destination)
+                    onStack.add(destination)
+                    work.append((destination, iter(unconditional.get(destination, []))))
+                elif destination in onStack:
+                    lowLink[regionId] = min(lowLink[regionId], index[destination])
+                continue
+            work.pop()
+            if len(work) > 0:
+                lowLink[work[-1][0]] = min(lowLink[work[-1][0]], lowLink[regionId])
+            if lowLink[regionId] == index[regionId]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    onStack.remove(member)
+                    component.append(member)
+                    if member == regionId:
+                        break
+                if len(component) > 1:
+                    group = tuple(sorted(component))
+                    for member in group:
+                        spoiler.regionGroups[member] = group
+    for regionId, group in spoiler.regionGroups.items():
+        region = spoiler.RegionList[regionId]
+        spoiler.groupedRegionExits[regionId] = [exit for exit in region.exits if not (exit.dest in group and isUnconditional(exit))]
+    count("region_groups", len(set(spoiler.regionGroups.values())))
+    count("grouped_regions", len(spoiler.regionGroups))
+
+
+def GetRegionGroup(spoiler: Spoiler, regionId: Regions) -> Tuple[Regions, ...]:
+    """Get the regions grouped with a region, including itself."""
+    return spoiler.regionGroups.get(regionId, (regionId,))
+
+
+def ReachRegionGroup(spoiler: Spoiler, accessibleRegions: Set[Regions], regionId: Regions) -> Regions:
+    """Add a region and the regions grouped with it to the regions a kong can access, returning the region its group is searched from."""
+    group = GetRegionGroup(spoiler, regionId)
+    for member in group:
+        accessibleRegions.add(member)
+        spoiler.RegionList[member].id = member
+    return group[0]
+
+
+def SyncRegionGroupAccess(spoiler: Spoiler, group: Tuple[Regions, ...], kong: Kongs) -> bool:
+    """Give every region of a group the times of day any of them can be accessed at, returning whether any region gained access."""
+    regions = [spoiler.RegionList[regionId] for regionId in group]
+    dayAccess = any(region.dayAccess[kong] for region in regions)
+    nightAccess = any(region.nightAccess[kong] for region in regions)
+    if spoiler.settings.fungi_time == FungiTimeSetting.dusk and (dayAccess or nightAccess):
+        dayAccess = nightAccess = True
+    changed = False
+    for region in regions:
+        if dayAccess and not region.dayAccess[kong]:
+            region.dayAccess[kong] = True
+            changed = True
+        if nightAccess and not region.nightAccess[kong]:
+            region.nightAccess[kong] = True
+            changed = True
+    return changed
+
+
 def GetAccessibleLocations(
-    spoiler: Spoiler, startingOwnedItems: List[Union[Any, Items]], searchType: SearchMode, purchaseList: Optional[List[Locations]] = None, targetItemId: None = None
+    spoiler: Spoiler,
+    startingOwnedItems: List[Union[Any, Items]],
+    searchType: SearchMode,
+    purchaseList: Optional[List[Locations]] = None,
+    targetItemId: None = None,
+    resumeFrom: Optional[SearchCheckpoint] = None,
+    captureTo: Optional[SearchCheckpoint] = None,
+    recordTo: Optional[SearchProvenance] = None,
+    untilReached: Optional[Tuple[Set[Locations], Set[Events]]] = None,
 ) -> Union[List[Sphere], List[Locations], bool, Set[Union[Locations, int]]]:
-    """Search to find all reachable locations given owned items."""
+    """Search to find all reachable locations given owned items.
+
+    If resumeFrom is provided, the search picks up where that checkpoint stopped and startingOwnedItems are the items gained since then.
+    If captureTo is provided, the state of the search is saved to it once nothing new can be found.
+    If recordTo is provided, the state of the search is saved to it at the start of every step, along with the step each location and event was reached in.
+    If untilReached is provided, the search stops early once all of its locations and events have been reached.
+    """
     settings = spoiler.settings
+    count("accessible_location_searches", mode=searchType.name)
     # No logic? Calls to this method that are checking things just return True
     if settings.logic_type == LogicType.nologic and searchType in [SearchMode.CheckAllReachable, SearchMode.CheckBeatable, SearchMode.CheckSpecificItemReachable]:
         return True
     if purchaseList is None:
         purchaseList = []
-    accessible = set()
     newLocations = set()
-    ownedItems = startingOwnedItems.copy()
+    if resumeFrom is not None:
+        ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds, newLocations = resumeFrom.Restore(spoiler)
+        ownedItems.extend(startingOwnedItems)
+    else:
+        accessible = set()
+        ownedItems = startingOwnedItems.copy()
+        unpurchasedEmptyShopLocationIds = []
+        kongAccessibleRegions = [{Regions.GameStart}, {Regions.GameStart}, {Regions.GameStart}, {Regions.GameStart}, {Regions.GameStart}]
     newItems = []  # debug code utility
     if searchType == SearchMode.GeneratePlaythrough:
         spoiler.playthroughTransitionOrder = []
     playthroughLocations = []
-    unpurchasedEmptyShopLocationIds = []
-    kongAccessibleRegions = [{Regions.GameStart}, {Regions.GameStart}, {Regions.GameStart}, {Regions.GameStart}, {Regions.GameStart}]
     eventAdded = True
-    UnderwaterRegions = {
-        Regions.LighthouseUnderwater,
-        Regions.ShipyardUnderwater,
-        Regions.TreasureRoom,
-        Regions.MermaidRoom,
-        Regions.Submarine,
-        Regions.LankyShip,
-        Regions.TinyShip,
-        Regions.BongosShip,
-        Regions.GuitarShip,
-        Regions.TromboneShip,
-        Regions.SaxophoneShip,
-        Regions.TriangleShip,
-    }
-    SurfaceWaterRegions = {Regions.Shipyard}
     # Continue doing searches until nothing new is found
     while len(newLocations) > 0 or eventAdded:
+        if recordTo is not None:
+            recordTo.RecordStep(spoiler, ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds, newLocations)
         # Add items and events from the last search iteration
         sphere = Sphere()
         if playthroughLocations:
@@ -260,8 +384,12 @@ def GetAccessibleLocations(
         # If we're checking beatability, check for the Banana Hoard after updating the last set of locations
         if searchType == SearchMode.CheckBeatable and spoiler.LogicVariables.bananaHoard:
             return True
+        # If we're only looking for certain locations and events, there's no need to go on once they've all been reached
+        if untilReached is not None and untilReached[0] <= accessible and all(event in spoiler.LogicVariables.Events for event in untilReached[1]):
+            break
 
         # Do a search for each owned kong
+        regionsVisited = 0
         for kong in set(spoiler.LogicVariables.GetKongs()):
             spoiler.LogicVariables.SetKong(kong)
 
@@ -269,186 +397,192 @@ def GetAccessibleLocations(
             startRegion.id = Regions.GameStart
             startRegion.dayAccess = [Events.Day in spoiler.LogicVariables.Events] * 5
             startRegion.nightAccess = [Events.Night in spoiler.LogicVariables.Events] * 5
-            regionPool = list(kongAccessibleRegions[kong])
+            # Grouped regions are searched together, so the pool only holds the first region of each group
+            regionPool = [regionId for regionId in kongAccessibleRegions[kong] if regionId not in spoiler.regionGroups or spoiler.regionGroups[regionId][0] == regionId]
 
             # Loop for each region until no more accessible regions found
             while len(regionPool) > 0:
-                regionId = regionPool.pop()
-                region = spoiler.RegionList[regionId]
-                # If this region has a tag barrel, everyone can access this region now
-                if region.tagbarrel:
-                    if region.dayAccess[kong]:
-                        region.dayAccess = [True] * 5
-                    if region.nightAccess[kong]:
-                        region.nightAccess = [True] * 5
-                    for i in range(5):
-                        kongAccessibleRegions[i].add(regionId)
-                # Check accessibility for each event in this region
-                for event in region.events:
-                    if event.name not in spoiler.LogicVariables.Events and event.logic(spoiler.LogicVariables):
-                        eventAdded = True
-                        spoiler.LogicVariables.Events.append(event.name)
-                    # Can start searching with night access
-                    # Check this even if Night's already been added, because you could
-                    # lose night access from start to Forest main, then regain it here
-                    if event.name == Events.Night and event.logic(spoiler.LogicVariables):
-                        region.nightAccess[kong] = True
-                    # Same with day
-                    if event.name == Events.Day and event.logic(spoiler.LogicVariables):
-                        region.dayAccess[kong] = True
-                # Check accessibility for collectibles
-                if region.id in spoiler.CollectibleRegions.keys():
-                    for collectible in spoiler.CollectibleRegions[region.id]:
-                        if not collectible.added and collectible.kong in (kong, Kongs.any) and collectible.enabled and collectible.logic(spoiler.LogicVariables):
-                            spoiler.LogicVariables.AddCollectible(collectible, region.level)
-                # Check accessibility for each location in this region
-                for location in region.locations:
-                    if location.id not in newLocations and location.id not in accessible and location.logic(spoiler.LogicVariables):
-                        location_obj = spoiler.LocationList[location.id]
-                        # If this location is flagged as inaccessible, ignore it
-                        if location_obj.inaccessible:
-                            continue
-                        # If this location is a bonus barrel, must make sure its logic is met as well (so long as we're not skipping them)
-                        elif (
-                            (location.bonusBarrel is MinigameType.BonusBarrel and settings.bonus_barrels != MinigameBarrels.skip)
-                            # The first Helm barrel only needs logic checked if we're doing at least one barrel per room
-                            or (location.bonusBarrel is MinigameType.HelmBarrelFirst and settings.helm_barrels != MinigameBarrels.skip and settings.helm_room_bonus_count != HelmBonuses.zero)
-                            # The second Helm barrel only needs logic checked if we're doing both barrels
-                            or (location.bonusBarrel is MinigameType.HelmBarrelSecond and settings.helm_barrels != MinigameBarrels.skip and settings.helm_room_bonus_count == HelmBonuses.two)
-                            # Training barrels only need to be done if fast start beginning of game is off
-                            or (location.bonusBarrel is MinigameType.TrainingBarrel and settings.training_barrels_minigames != MinigameBarrels.skip)
-                        ) and (not MinigameRequirements[BarrelMetaData[location.id].minigame].logic(spoiler.LogicVariables)):
-                            continue
-                        # If this location is a hint door, then make sure we're the right Kong
-                        elif location_obj.type == Types.Hint and not spoiler.LogicVariables.HintAccess(location_obj, region.id):
-                            continue
-                        # If this location has a blueprint, then make sure this is the correct kong
-                        elif (location_obj.item is not None and ItemList[location_obj.item].type == Types.Blueprint) and (not spoiler.LogicVariables.BlueprintAccess(ItemList[location_obj.item])):
-                            continue
-                        # If this location is a Kasplat but doesn't have a blueprint, still make sure this is the correct kong to be accessible at all
-                        elif (location_obj.type == Types.Blueprint) and (not spoiler.LogicVariables.IsKong(location_obj.kong) and not settings.free_trade_items):
-                            continue
-                        # If this location is a shop then we know it's reachable and that we have the money for it, but we may want to purchase the location
-                        elif location_obj.type == Types.Shop:
-                            # The handling of shop locations is a bit complicated so it's broken up for readability
-                            # Empty locations are notable because we don't want to buy empty shops (and waste coins) if the fill is complete
-                            shopIsEmpty = location_obj.item is None or location_obj.item == Items.NoItem
-                            # When handling coin logic we want to buy specific moves, so we may not be allowed to purchase every location
-                            locationCanBeBought = searchType != SearchMode.GetReachableWithControlledPurchases or location.id in purchaseList
-                            # We always buy non-empty locations if we are not prevented from buying this location
-                            if not shopIsEmpty and locationCanBeBought:
-                                spoiler.LogicVariables.PurchaseShopItem(location.id)
-                            # Empty locations are accessible, but we need to note them down and possibly purchase them later depending on the search type
-                            elif shopIsEmpty:
-                                unpurchasedEmptyShopLocationIds.append(location.id)
-                        # If this location is a dirt patch, make sure we have shockwave
-                        elif location_obj.type == Types.RainbowCoin and not spoiler.LogicVariables.shockwave:
-                            continue
-                        elif location.id == Locations.NintendoCoin:
-                            # Spend Two Coins for arcade lever
-                            spoiler.LogicVariables.Coins[Kongs.donkey] -= 2
-                            spoiler.LogicVariables.SpentCoins[Kongs.donkey] += 2
-                        # Crowns in Helm always logically expect you to have finished Helm first
-                        elif location_obj.type == Types.Crown and location_obj.level == Levels.HideoutHelm and Events.HelmFinished not in spoiler.LogicVariables.Events:
-                            continue
-                        newLocations.add(location.id)
-                # Check accessibility for each exit in this region
-                exits = region.exits.copy()
-                # If loading zones are shuffled, the "Exit Level" button in the pause menu could potentially take you somewhere new
-                if settings.shuffle_loading_zones == ShuffleLoadingZones.all and region.level != Levels.DKIsles and region.level != Levels.Shops:
-                    levelExit = GetExitLevelExit(region)
-                    # When shuffling levels, unplaced level entrances will have no destination yet
-                    if levelExit is not None:
-                        dest = ShuffleExits.ShufflableExits[levelExit].back.regionId
-                        exits.append(TransitionFront(dest, lambda l: True))
-                        # If we're generating the final playthrough, note down the order in which we access entrances for LZR purposes
-                        # No need to check access on this transition, it's always accessible
-                        if searchType == SearchMode.GeneratePlaythrough:
-                            levelExitTransitionId = GetLevelExitTransition(region)
-                            if levelExitTransitionId not in spoiler.playthroughTransitionOrder:
-                                spoiler.playthroughTransitionOrder.append(levelExitTransitionId)
-                # If loading zones are not shuffled but you have a random starting location, you may need to exit level to escape some regions
-                elif settings.random_starting_region and region.level != Levels.DKIsles and region.level != Levels.Shops and region.restart is None:
-                    levelLobby = GetLobbyOfRegion(region)
-                    if levelLobby is not None and levelLobby not in kongAccessibleRegions[kong]:
-                        exits.append(TransitionFront(levelLobby, lambda l: True))
-                for exit in exits:
-                    destination = exit.dest
-                    # If this exit has an entrance shuffle id and the shufflable exits list has it marked as shuffled,
-                    # use the entrance it was shuffled to by getting the region of the destination exit.
-                    # If the exit is assumed from root, do not look for a shuffled exit - just explore the destination
-                    if exit.exitShuffleId is not None and not exit.assumed:
-                        shuffledExit = ShuffleExits.ShufflableExits[exit.exitShuffleId]
-                        if shuffledExit.shuffled:
-                            destination = ShuffleExits.ShufflableExits[shuffledExit.shuffledId].back.regionId
-                        elif shuffledExit.toBeShuffled and not exit.assumed:
-                            continue
-                    # If we can access this transition...
-                    if exit.logic(spoiler.LogicVariables):
-                        # ...with one caveat: If water is lava, don't consider underwater locations in Galleon before having 3rd melon
-                        if spoiler.LogicVariables.IsLavaWater() and (settings.shuffle_loading_zones == ShuffleLoadingZones.all or settings.random_starting_region):
-                            if destination in UnderwaterRegions and spoiler.LogicVariables.Melons < 3:
-                                continue
-                            # Mainly Seal Race exit. Situations where this matters are extremely rare.
-                            if destination in SurfaceWaterRegions and spoiler.LogicVariables.Melons < 2:
-                                continue
-                        # Check time of day
-                        timeAccess = True
-                        if exit.time == Time.Night and not region.nightAccess[kong]:
-                            timeAccess = False
-                        elif exit.time == Time.Day and not region.dayAccess[kong]:
-                            timeAccess = False
-                        if timeAccess:
-                            # If we're generating the final playthrough, note down the order in which we access entrances for LZR purposes
-                            if searchType == SearchMode.GeneratePlaythrough and settings.shuffle_loading_zones == ShuffleLoadingZones.all:
-                                if exit.exitShuffleId is not None and exit.exitShuffleId not in spoiler.playthroughTransitionOrder:
-                                    spoiler.playthroughTransitionOrder.append(exit.exitShuffleId)
-                            # If a region is accessible through this exit that has not yet been added, add it to the queue to be visited eventually
-                            if destination not in kongAccessibleRegions[kong]:
-                                kongAccessibleRegions[kong].add(destination)
-                                newRegion = spoiler.RegionList[destination]
-                                newRegion.id = destination
-                                regionPool.append(destination)
-                        # Given that it's accessible, update time of day access whether or not we've already visited it
-                        # This way if a region has access from 2 different regions, one time-restricted and one not,
-                        # it will be known that it can be accessed during either time of day
-                        # If this region has day access and the exit isn't restricted to night-only, then the destination has day access
-                        if region.dayAccess[kong] and exit.time != Time.Night and not spoiler.RegionList[destination].dayAccess[kong]:
-                            spoiler.RegionList[destination].dayAccess[kong] = True
-                            # Count as event added so search doesn't get stuck if region is searched,
-                            # then later a new time of day access is found so it should be re-visited
-                            eventAdded = True
-                        # And vice versa
-                        if region.nightAccess[kong] and exit.time != Time.Day and not spoiler.RegionList[destination].nightAccess[kong]:
-                            spoiler.RegionList[destination].nightAccess[kong] = True
-                            eventAdded = True
-                        # If it's dusk, we don't even have to worry about this at all - it's day and night access always
-                        if settings.fungi_time == FungiTimeSetting.dusk:
-                            spoiler.RegionList[destination].dayAccess[kong] = True
-                            spoiler.RegionList[destination].nightAccess[kong] = True
-                # Deathwarps currently send to the vanilla destination
-                if region.deathwarp is not None and settings.perma_death is False:
-                    destination = region.deathwarp.dest
-                    # If a region is accessible through this exit and has not yet been added, add it to the queue to be visited eventually
-                    if destination not in kongAccessibleRegions[kong] and region.deathwarp.logic(spoiler.LogicVariables):
-                        kongAccessibleRegions[kong].add(destination)
-                        newRegion = spoiler.RegionList[destination]
-                        newRegion.id = destination
-                        regionPool.append(destination)
-                        # If this region has day access, the deathwarp will occur on the same time of day
-                        # Note that no deathwarps are dependent on time of day
+                groupId = regionPool.pop()
+                regionsVisited += 1
+                group = spoiler.regionGroups.get(groupId)
+                if group is not None:
+                    SyncRegionGroupAccess(spoiler, group, kong)
+                for regionId in (groupId,) if group is None else group:
+                    region = spoiler.RegionList[regionId]
+                    # If this region has a tag barrel, everyone can access this region now
+                    if region.tagbarrel:
                         if region.dayAccess[kong]:
-                            spoiler.RegionList[destination].dayAccess[kong] = True
-                            # Count as event added so search doesn't get stuck if region is searched,
-                            # then later a new time of day access is found so it should be re-visited
-                            eventAdded = True
-                        # And vice versa
+                            region.dayAccess = [True] * 5
                         if region.nightAccess[kong]:
-                            spoiler.RegionList[destination].nightAccess[kong] = True
+                            region.nightAccess = [True] * 5
+                        for i in range(5):
+                            kongAccessibleRegions[i].update(GetRegionGroup(spoiler, regionId))
+                    # Check accessibility for each event in this region
+                    for event in region.events:
+                        if event.name not in spoiler.LogicVariables.Events and event.logic(spoiler.LogicVariables):
                             eventAdded = True
+                            spoiler.LogicVariables.Events.append(event.name)
+                        # Can start searching with night access
+                        # Check this even if Night's already been added, because you could
+                        # lose night access from start to Forest main, then regain it here
+                        if event.name == Events.Night and event.logic(spoiler.LogicVariables):
+                            region.nightAccess[kong] = True
+                        # Same with day
+                        if event.name == Events.Day and event.logic(spoiler.LogicVariables):
+                            region.dayAccess[kong] = True
+                    # Check accessibility for collectibles
+                    if region.id in spoiler.CollectibleRegions.keys():
+                        for collectible in spoiler.CollectibleRegions[region.id]:
+                            if not collectible.added and collectible.kong in (kong, Kongs.any) and collectible.enabled and collectible.logic(spoiler.LogicVariables):
+                                spoiler.LogicVariables.AddCollectible(collectible, region.level)
+                    # Check accessibility for each location in this region
+                    for location in region.locations:
+                        if location.id not in newLocations and location.id not in accessible and location.logic(spoiler.LogicVariables):
+                            location_obj = spoiler.LocationList[location.id]
+                            # If this location is flagged as inaccessible, ignore it
+                            if location_obj.inaccessible:
+                                continue
+                            # If this location is a bonus barrel, must make sure its logic is met as well (so long as we're not skipping them)
+                            elif (
+                                (location.bonusBarrel is MinigameType.BonusBarrel and settings.bonus_barrels != MinigameBarrels.skip)
+                                # The first Helm barrel only needs logic checked if we're doing at least one barrel per room
+                                or (location.bonusBarrel is MinigameType.HelmBarrelFirst and settings.helm_barrels != MinigameBarrels.skip and settings.helm_room_bonus_count != HelmBonuses.zero)
+                                # The second Helm barrel only needs logic checked if we're doing both barrels
+                                or (location.bonusBarrel is MinigameType.HelmBarrelSecond and settings.helm_barrels != MinigameBarrels.skip and settings.helm_room_bonus_count == HelmBonuses.two)
+                                # Training barrels only need to be done if fast start beginning of game is off
+                                or (location.bonusBarrel is MinigameType.TrainingBarrel and settings.training_barrels_minigames != MinigameBarrels.skip)
+                            ) and (not MinigameRequirements[BarrelMetaData[location.id].minigame].logic(spoiler.LogicVariables)):
+                                continue
+                            # If this location is a hint door, then make sure we're the right Kong
+                            elif location_obj.type == Types.Hint and not spoiler.LogicVariables.HintAccess(location_obj, region.id):
+                                continue
+                            # If this location has a blueprint, then make sure this is the correct kong
+                            elif (location_obj.item is not None and ItemList[location_obj.item].type == Types.Blueprint) and (not spoiler.LogicVariables.BlueprintAccess(ItemList[location_obj.item])):
+                                continue
+                            # If this location is a Kasplat but doesn't have a blueprint, still make sure this is the correct kong to be accessible at all
+                            elif (location_obj.type == Types.Blueprint) and (not spoiler.LogicVariables.IsKong(location_obj.kong) and not settings.free_trade_items):
+                                continue
+                            # If this location is a shop then we know it's reachable and that we have the money for it, but we may want to purchase the location
+                            elif location_obj.type == Types.Shop:
+                                # The handling of shop locations is a bit complicated so it's broken up for readability
+                                # Empty locations are notable because we don't want to buy empty shops (and waste coins) if the fill is complete
+                                shopIsEmpty = location_obj.item is None or location_obj.item == Items.NoItem
+                                # When handling coin logic we want to buy specific moves, so we may not be allowed to purchase every location
+                                locationCanBeBought = searchType != SearchMode.GetReachableWithControlledPurchases or location.id in purchaseList
+                                # We always buy non-empty locations if we are not prevented from buying this location
+                                if not shopIsEmpty and locationCanBeBought:
+                                    spoiler.LogicVariables.PurchaseShopItem(location.id)
+                                # Empty locations are accessible, but we need to note them down and possibly purchase them later depending on the search type
+                                elif shopIsEmpty:
+                                    unpurchasedEmptyShopLocationIds.append(location.id)
+                            # If this location is a dirt patch, make sure we have shockwave
+                            elif location_obj.type == Types.RainbowCoin and not spoiler.LogicVariables.shockwave:
+                                continue
+                            elif location.id == Locations.NintendoCoin:
+                                # Spend Two Coins for arcade lever
+                                spoiler.LogicVariables.Coins[Kongs.donkey] -= 2
+                                spoiler.LogicVariables.SpentCoins[Kongs.donkey] += 2
+                            # Crowns in Helm always logically expect you to have finished Helm first
+                            elif location_obj.type == Types.Crown and location_obj.level == Levels.HideoutHelm and Events.HelmFinished not in spoiler.LogicVariables.Events:
+                                continue
+                            newLocations.add(location.id)
+                    # Check accessibility for each exit in this region
+                    exits = spoiler.groupedRegionExits.get(regionId, region.exits).copy()
+                    # If loading zones are shuffled, the "Exit Level" button in the pause menu could potentially take you somewhere new
+                    if settings.shuffle_loading_zones == ShuffleLoadingZones.all and region.level != Levels.DKIsles and region.level != Levels.Shops:
+                        levelExit = GetExitLevelExit(region)
+                        # When shuffling levels, unplaced level entrances will have no destination yet
+                        if levelExit is not None:
+                            dest = ShuffleExits.ShufflableExits[levelExit].back.regionId
+                            exits.append(TransitionFront(dest, lambda l: True))
+                            # If we're generating the final playthrough, note down the order in which we access entrances for LZR purposes
+                            # No need to check access on this transition, it's always accessible
+                            if searchType == SearchMode.GeneratePlaythrough:
+                                levelExitTransitionId = GetLevelExitTransition(region)
+                                if levelExitTransitionId not in spoiler.playthroughTransitionOrder:
+                                    spoiler.playthroughTransitionOrder.append(levelExitTransitionId)
+                    # If loading zones are not shuffled but you have a random starting location, you may need to exit level to escape some regions
+                    elif settings.random_starting_region and region.level != Levels.DKIsles and region.level != Levels.Shops and region.restart is None:
+                        levelLobby = GetLobbyOfRegion(region)
+                        if levelLobby is not None and levelLobby not in kongAccessibleRegions[kong]:
+                            exits.append(TransitionFront(levelLobby, lambda l: True))
+                    for exit in exits:
+                        destination = exit.dest
+                        # If this exit has an entrance shuffle id and the shufflable exits list has it marked as shuffled,
+                        # use the entrance it was shuffled to by getting the region of the destination exit.
+                        # If the exit is assumed from root, do not look for a shuffled exit - just explore the destination
+                        if exit.exitShuffleId is not None and not exit.assumed:
+                            shuffledExit = ShuffleExits.ShufflableExits[exit.exitShuffleId]
+                            if shuffledExit.shuffled:
+                                destination = ShuffleExits.ShufflableExits[shuffledExit.shuffledId].back.regionId
+                            elif shuffledExit.toBeShuffled and not exit.assumed:
+                                continue
+                        # If we can access this transition...
+                        if exit.logic(spoiler.LogicVariables):
+                            # ...with one caveat: If water is lava, don't consider underwater locations in Galleon before having 3rd melon
+                            if spoiler.LogicVariables.IsLavaWater() and (settings.shuffle_loading_zones == ShuffleLoadingZones.all or settings.random_starting_region):
+                                if destination in UnderwaterRegions and spoiler.LogicVariables.Melons < 3:
+                                    continue
+                                # Mainly Seal Race exit. Situations where this matters are extremely rare.
+                                if destination in SurfaceWaterRegions and spoiler.LogicVariables.Melons < 2:
+                                    continue
+                            # Check time of day
+                            timeAccess = True
+                            if exit.time == Time.Night and not region.nightAccess[kong]:
+                                timeAccess = False
+                            elif exit.time == Time.Day and not region.dayAccess[kong]:
+                                timeAccess = False
+                            if timeAccess:
+                                # If we're generating the final playthrough, note down the order in which we access entrances for LZR purposes
+                                if searchType == SearchMode.GeneratePlaythrough and settings.shuffle_loading_zones == ShuffleLoadingZones.all:
+                                    if exit.exitShuffleId is not None and exit.exitShuffleId not in spoiler.playthroughTransitionOrder:
+                                        spoiler.playthroughTransitionOrder.append(exit.exitShuffleId)
+                                # If a region is accessible through this exit that has not yet been added, add it to the queue to be visited eventually
+                                if destination not in kongAccessibleRegions[kong]:
+                                    regionPool.append(ReachRegionGroup(spoiler, kongAccessibleRegions[kong], destination))
+                            # Given that it's accessible, update time of day access whether or not we've already visited it
+                            # This way if a region has access from 2 different regions, one time-restricted and one not,
+                            # it will be known that it can be accessed during either time of day
+                            # If this region has day access and the exit isn't restricted to night-only, then the destination has day access
+                            if region.dayAccess[kong] and exit.time != Time.Night and not spoiler.RegionList[destination].dayAccess[kong]:
+                                spoiler.RegionList[destination].dayAccess[kong] = True
+                                # Count as event added so search doesn't get stuck if region is searched,
+                                # then later a new time of day access is found so it should be re-visited
+                                eventAdded = True
+                            # And vice versa
+                            if region.nightAccess[kong] and exit.time != Time.Day and not spoiler.RegionList[destination].nightAccess[kong]:
+                                spoiler.RegionList[destination].nightAccess[kong] = True
+                                eventAdded = True
+                            # If it's dusk, we don't even have to worry about this at all - it's day and night access always
+                            if settings.fungi_time == FungiTimeSetting.dusk:
+                                spoiler.RegionList[destination].dayAccess[kong] = True
+                                spoiler.RegionList[destination].nightAccess[kong] = True
+                    # Deathwarps currently send to the vanilla destination
+                    if region.deathwarp is not None and settings.perma_death is False:
+                        destination = region.deathwarp.dest
+                        # If a region is accessible through this exit and has not yet been added, add it to the queue to be visited eventually
+                        if destination not in kongAccessibleRegions[kong] and region.deathwarp.logic(spoiler.LogicVariables):
+                            regionPool.append(ReachRegionGroup(spoiler, kongAccessibleRegions[kong], destination))
+                            # If this region has day access, the deathwarp will occur on the same time of day
+                            # Note that no deathwarps are dependent on time of day
+                            if region.dayAccess[kong]:
+                                spoiler.RegionList[destination].dayAccess[kong] = True
+                                # Count as event added so search doesn't get stuck if region is searched,
+                                # then later a new time of day access is found so it should be re-visited
+                                eventAdded = True
+                            # And vice versa
+                            if region.nightAccess[kong]:
+                                spoiler.RegionList[destination].nightAccess[kong] = True
+                                eventAdded = True
+                # Time of day access gained while searching the group has to be shared with the rest of it
+                if group is not None and SyncRegionGroupAccess(spoiler, group, kong):
+                    eventAdded = True
+        count("regions_visited", regionsVisited, mode=searchType.name)
+    if captureTo is not None:
+        captureTo.Capture(spoiler, ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds)
     # If we're here to get accessible locations for fill purposes, we need to take a harder look at all the empty shops we didn't buy
     if searchType == SearchMode.GetReachableForFilling:
-        shuffle(unpurchasedEmptyShopLocationIds)  # This shuffle is to not bias fills towards earlier shops
+        fill_random.shuffle(unpurchasedEmptyShopLocationIds)  # This shuffle is to not bias fills towards earlier shops
         # For each location...
         for location_id in unpurchasedEmptyShopLocationIds:
             # If we can, "buy" the empty location. This will affect our ability to buy future locations. It's not a guarantee we'll be able to buy all of these locations.
@@ -486,6 +620,215 @@ def GetAccessibleLocations(
         return [x for x in spoiler.LocationList if x not in accessible and not spoiler.LocationList[x].inaccessible]
 
 
+# Locations whose contents are read directly by the logic - any change to these could make something unreachable
+LogicReadLocations = {
+    Locations.DiddyKong,
+    Locations.JapesDonkeyFreeDiddy,
+    Locations.TinyKong,
+    Locations.LankyKong,
+    Locations.ChunkyKong,
+    Locations.IslesSwimTrainingBarrel,
+    Locations.IslesVinesTrainingBarrel,
+    Locations.IslesBarrelsTrainingBarrel,
+    Locations.IslesOrangesTrainingBarrel,
+}
+
+
+class SearchCheckpoint:
+    """The state of a reachability search at the point it stopped finding anything new."""
+
+    def __init__(self) -> None:
+        """Initialize with given parameters."""
+        self.ownedItems = []
+        self.accessible = set()
+        self.kongAccessibleRegions = []
+        self.unpurchasedEmptyShopLocationIds = []
+        self.logicVariables = {}
+        self.regionAccess = {}
+        self.addedCollectibles = []
+        # Locations found but not yet collected when the search is saved at the start of a step
+        self.newLocations = set()
+        # The contents of every location this search depended on, used to tell what's changed since
+        self.locationState = {}
+        self.coinLimited = False
+        # Whether the saved logic variables counted the saved owned items, so updates after restoring only count the items added to them
+        self.countedOwnedItems = False
+
+    def Capture(self, spoiler: Spoiler, ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds, newLocations=None) -> None:
+        """Save the state of the search in progress."""
+        self.ownedItems = ownedItems.copy()
+        self.accessible = accessible.copy()
+        self.newLocations = set() if newLocations is None else newLocations.copy()
+        self.kongAccessibleRegions = [regions.copy() for regions in kongAccessibleRegions]
+        self.unpurchasedEmptyShopLocationIds = unpurchasedEmptyShopLocationIds.copy()
+        self.logicVariables = spoiler.LogicVariables.Snapshot()
+        self.countedOwnedItems = spoiler.LogicVariables.countedOwnedItems is ownedItems
+        self.coinLimited = spoiler.LogicVariables.failedPriceChecks > 0
+        self.regionAccess = {}
+        for regionId, region in spoiler.RegionList.items():
+            if any(region.dayAccess) or any(region.nightAccess):
+                self.regionAccess[regionId] = (region.dayAccess.copy(), region.nightAccess.copy())
+        self.addedCollectibles = spoiler.addedCollectibles.copy()
+        self.locationState = {}
+        for locationId in accessible | LogicReadLocations:
+            location = spoiler.LocationList[locationId]
+            self.locationState[locationId] = (location.item, location.inaccessible)
+
+    def Restore(self, spoiler: Spoiler):
+        """Put the world back in the state of the saved search and return working copies of the search variables."""
+        spoiler.Reset()
+        spoiler.LogicVariables.Restore(self.logicVariables)
+        for regionId, (dayAccess, nightAccess) in self.regionAccess.items():
+            region = spoiler.RegionList[regionId]
+            region.dayAccess = dayAccess.copy()
+            region.nightAccess = nightAccess.copy()
+        for collectible in self.addedCollectibles:
+            collectible.added = True
+        spoiler.addedCollectibles = self.addedCollectibles.copy()
+        ownedItems = self.ownedItems.copy()
+        if self.countedOwnedItems:
+            spoiler.LogicVariables.countedOwnedItems = ownedItems
+        return (
+            ownedItems,
+            self.accessible.copy(),
+            [regions.copy() for regions in self.kongAccessibleRegions],
+            self.unpurchasedEmptyShopLocationIds.copy(),
+            self.newLocations.copy(),
+        )
+
+
+class IncrementalSearch:
+    """Repeated reachability searches of a world that mostly gains items between searches.
+
+    Fill algorithms search the world again after every placement. If every change since the saved checkpoint is an item
+    placed in a location that was already reachable, the search carries on from the checkpoint instead of starting over.
+    Anything else (removed or replaced items, shops, locations the logic reads directly, coin-limited purchases) gets a full search.
+    """
+
+    def __init__(self, spoiler: Spoiler, searchType: SearchMode = SearchMode.GetReachableForFilling) -> None:
+        """Initialize with given parameters."""
+        self.spoiler = spoiler
+        self.searchType = searchType
+        self.checkpoint = None
+        self.startingOwnedItems = []
+
+    def GetItemsGained(self, ownedItems: List[Items]) -> Optional[List[Items]]:
+        """Get the items gained since the checkpoint, or None if the checkpoint can't be extended."""
+        if self.checkpoint is None or ownedItems != self.startingOwnedItems:
+            return None
+        itemsGained = []
+        for locationId, (item, inaccessible) in self.checkpoint.locationState.items():
+            location = self.spoiler.LocationList[locationId]
+            if location.item == item and location.inaccessible == inaccessible:
+                continue
+            # Only a new item in a reachable, non-shop location is a pure addition
+            if locationId in LogicReadLocations or location.inaccessible != inaccessible or item is not None or location.type == Types.Shop:
+                return None
+            # Blueprints restrict which kongs can reach their location
+            if ItemList[location.item].type == Types.Blueprint:
+                return None
+            itemsGained.append(location.item)
+        return itemsGained
+
+    def Search(self, ownedItems: List[Items], keepCheckpoint: bool = True) -> Set[Locations]:
+        """Get all reachable locations given owned items, extending the checkpoint if possible."""
+        spoiler = self.spoiler
+        itemsGained = self.GetItemsGained(ownedItems)
+        if itemsGained is not None:
+            rngState = fill_random.getstate()
+            checkpoint = SearchCheckpoint() if keepCheckpoint else None
+            accessible = GetAccessibleLocations(spoiler, itemsGained, self.searchType, resumeFrom=self.checkpoint, captureTo=checkpoint)
+            # If coins ran short at any point, purchase order matters and this may differ from a full search
+            if spoiler.LogicVariables.failedPriceChecks == 0:
+                if spoiler.settings.extreme_debugging:
+                    resumedRngState = fill_random.getstate()
+                    fill_random.setstate(rngState)
+                    spoiler.Reset()
+                    if GetAccessibleLocations(spoiler, ownedItems, self.searchType) != accessible:
+                        print("red alert - incremental search disagrees with a full search")
+                    fill_random.setstate(resumedRngState)
+                if keepCheckpoint:
+                    self.checkpoint = checkpoint
+                return set(sorted(accessible))
+            fill_random.setstate(rngState)
+        spoiler.Reset()
+        checkpoint = SearchCheckpoint() if keepCheckpoint else None
+        accessible = GetAccessibleLocations(spoiler, ownedItems, self.searchType, captureTo=checkpoint)
+        if keepCheckpoint:
+            self.checkpoint = None if checkpoint.coinLimited else checkpoint
+            self.startingOwnedItems = ownedItems.copy()
+        return set(sorted(accessible))
+
+
+class SearchProvenance:
+    """The steps of one reachability search, and the step every location and event was first reached in.
+
+    Each step of a search collects the items found by the step before it, then looks for anything new. The item in a location can only
+    change a search before it's collected if the logic reads it directly, it's a blueprint or it's in a shop whose price depends on it.
+    For any other location, a search of the same world with that location emptied matches this one until the step that found it, so it
+    can be resumed from there, and anything this search reached before that step is still reached.
+    """
+
+    def __init__(self, searchType: SearchMode = SearchMode.GetReachable) -> None:
+        """Initialize with given parameters."""
+        self.searchType = searchType
+        # The state of the search at the start of each step
+        self.checkpoints = []
+        self.locationSteps = {}
+        self.eventSteps = {}
+
+    def RecordStep(self, spoiler: Spoiler, ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds, newLocations) -> None:
+        """Save the state of the search at the start of a step, noting what the step before it reached."""
+        step = len(self.checkpoints) - 1
+        for locationId in newLocations:
+            self.locationSteps.setdefault(locationId, step)
+        for event in spoiler.LogicVariables.Events:
+            self.eventSteps.setdefault(event, step)
+        checkpoint = SearchCheckpoint()
+        checkpoint.Capture(spoiler, ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds, newLocations)
+        self.checkpoints.append(checkpoint)
+
+    def GetResumableStep(self, spoiler: Spoiler, locationId: Locations) -> Optional[int]:
+        """Get the step a search without the item at a location can be resumed from, or None if it needs a full search."""
+        location = spoiler.LocationList[locationId]
+        if locationId not in self.locationSteps or locationId in LogicReadLocations:
+            return None
+        # Prices are only ignored when coins are assumed to be infinite
+        if location.type == Types.Shop and not spoiler.LogicVariables.assumeInfiniteCoins:
+            return None
+        if location.item is not None and ItemList[location.item].type == Types.Blueprint:
+            return None
+        return self.locationSteps[locationId]
+
+    def FindMissingWithout(self, spoiler: Spoiler, locationId: Locations, startingOwnedItems: List[Items], targetLocations, targetEvents) -> Tuple[Set[Locations], Set[Events]]:
+        """Find the target locations and events that can't be reached without the item at a location.
+
+        No search is needed if every target other than the location itself was reached before the location was. Otherwise
+        the search is resumed from the step that reached the location if possible, and stops once every target is reached.
+        """
+        step = self.GetResumableStep(spoiler, locationId)
+        if (
+            step is not None
+            and all(self.locationSteps.get(target, step) < step for target in targetLocations if target != locationId)
+            and all(self.eventSteps.get(event, step) < step for event in targetEvents)
+        ):
+            count("provenance_searches", outcome="skipped")
+            return set(), set()
+        location = spoiler.LocationList[locationId]
+        item = location.item
+        location.item = None
+        untilReached = (set(targetLocations), set(targetEvents))
+        if step is not None:
+            count("provenance_searches", outcome="resumed")
+            accessible = GetAccessibleLocations(spoiler, [], self.searchType, resumeFrom=self.checkpoints[step], untilReached=untilReached)
+        else:
+            count("provenance_searches", outcome="full")
+            spoiler.Reset()
+            accessible = GetAccessibleLocations(spoiler, startingOwnedItems, self.searchType, untilReached=untilReached)
+        location.PlaceItem(spoiler, item)
+        return {target for target in targetLocations if target not in accessible}, {event for event in targetEvents if event not in spoiler.LogicVariables.Events}
+
+
 def VerifyWorld(spoiler: Spoiler) -> bool:
     """Make sure all item locations are reachable on current world graph with no items placed and all items owned."""
     settings = spoiler.settings
@@ -710,13 +1053,75 @@ def VerifyWorldWithWorstCoinUsage(spoiler: Spoiler) -> bool:
         locationsToPurchase.append(locationToBuy)
 
 
+def GetWhatIfWorkers() -> int:
+    """Get the number of processes checks of a placed world are split between, set by WHAT_IF_WORKERS and otherwise only this one.
+
+    Generations usually run alongside others, so more processes are only used where the caller knows there are cores to spare.
+    """
+    return int(os.environ.get("WHAT_IF_WORKERS", 1))
+
+
+def CheckBeatableWithout(spoiler: Spoiler, locationId: Locations) -> Tuple[bool, List]:
+    """Check if the game is beatable without the item at a location, returning that and the hints accessible in the search.
+
+    The item is put back afterwards.
+    """
+    location = spoiler.LocationList[locationId]
+    item = location.item
+    location.item = None
+    spoiler.Reset()
+    beatable = GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable)
+    hints = spoiler.LogicVariables.Hints.copy()
+    location.PlaceItem(spoiler, item)
+    return beatable, hints
+
+
+def CheckBeatableWithoutEach(spoiler: Spoiler, locationIds: List[Locations]) -> List[Tuple[bool, List]]:
+    """Run CheckBeatableWithout for each location, with results in the same order as the locations.
+
+    Every check puts its item back, so the checks only depend on the world as it's placed now. Where processes can be forked,
+    they're split between worker processes, which each get a copy of the world to take items out of.
+    """
+    workers = min(GetWhatIfWorkers(), len(locationIds))
+    if workers <= 1 or not hasattr(os, "fork"):
+        return [CheckBeatableWithout(spoiler, locationId) for locationId in locationIds]
+    counters = getCounters()
+    children = []
+    for worker in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                results = {index: CheckBeatableWithout(spoiler, locationIds[index]) for index in range(worker, len(locationIds), workers)}
+                with os.fdopen(write_fd, "wb") as pipe:
+                    pickle.dump((results, getCountedSince(counters)), pipe)
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        children.append((pid, read_fd))
+    results = {}
+    for pid, read_fd in children:
+        with os.fdopen(read_fd, "rb") as pipe:
+            data = pipe.read()
+        os.waitpid(pid, 0)
+        # A worker that failed sends nothing, and its checks are run here instead
+        if data:
+            worker_results, counted = pickle.loads(data)
+            results.update(worker_results)
+            addCounted(counted)
+    count("what_if_checks", len(locationIds), workers=workers)
+    return [results[index] if index in results else CheckBeatableWithout(spoiler, locationId) for index, locationId in enumerate(locationIds)]
+
+
 def ParePlaythrough(spoiler: Spoiler, PlaythroughLocations: List[Sphere]) -> None:
     """Pare playthrough down to only the essential elements."""
     settings = spoiler.settings
     AccessibleHintsForLocation = {}
     locationsToAddBack = []
     mostExpensiveBLocker = max([settings.blocker_0, settings.blocker_1, settings.blocker_2, settings.blocker_3, settings.blocker_4, settings.blocker_5, settings.blocker_6, settings.blocker_7])
-    # Check every location in the list of spheres.
+    # Find every location in the list of spheres that needs checking.
+    candidates = []
     for i in range(len(PlaythroughLocations) - 1, -1, -1):
         # We can immediately ignore spheres past the first sphere that is beaten
         if i > 0 and PlaythroughLocations[i - 1].seedBeaten:
@@ -737,32 +1142,42 @@ def ParePlaythrough(spoiler: Spoiler, PlaythroughLocations: List[Sphere]) -> Non
                 continue
             if location.item is not None and ItemList[location.item].type == Types.Blueprint:
                 continue
+            candidates.append((sphere, locationId))
+    # In item rando, every item is put back after its check, so the checks don't depend on each other and can be run all at once
+    if spoiler.settings.shuffle_items:
+        results = CheckBeatableWithoutEach(spoiler, [locationId for sphere, locationId in candidates])
+    for index, (sphere, locationId) in enumerate(candidates):
+        location = spoiler.LocationList[locationId]
+        item = location.item
+        if spoiler.settings.shuffle_items:
+            beatable, hints = results[index]
+        else:
             # Copy out item from location
-            item = location.item
             location.item = None
             # Check if the game is still beatable
             spoiler.Reset()
-            if GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable):
-                # If the game is still beatable, this is an unnecessary location. We remove it from the playthrough, as it is not strictly required.
-                sphere.locations.remove(locationId)
-                # In non-item rando, put back the items on a delay
-                if not spoiler.settings.shuffle_items:
-                    # We delay the item to ensure future locations which may rely on this one do not give a false positive for beatability.
-                    # This is legacy behavior I'm not convinced needs to exist. It stays in non-item rando because the performance cost is negligible there.
-                    location.SetDelayedItem(item)
-                    locationsToAddBack.append(locationId)
-                # In item rando, we do additional WotH paring via paths later, so we don't need to worry about getting it perfect here
-                else:
-                    location.PlaceItem(spoiler, item)
-            else:
-                # If the game is not beatable without this item, don't remove it from the playthrough and add the item back. This is now a WotH candidate.
+            beatable = GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable)
+            hints = spoiler.LogicVariables.Hints.copy()
+        if beatable:
+            # If the game is still beatable, this is an unnecessary location. We remove it from the playthrough, as it is not strictly required.
+            sphere.locations.remove(locationId)
+            # In non-item rando, put back the items on a delay
+            if not spoiler.settings.shuffle_items:
+                # We delay the item to ensure future locations which may rely on this one do not give a false positive for beatability.
+                # This is legacy behavior I'm not convinced needs to exist. It stays in non-item rando because the performance cost is negligible there.
+                location.SetDelayedItem(item)
+                locationsToAddBack.append(locationId)
+            # In item rando, we do additional WotH paring via paths later, so we don't need to worry about getting it perfect here
+        else:
+            # If the game is not beatable without this item, don't remove it from the playthrough and add the item back. This is now a WotH candidate.
+            if not spoiler.settings.shuffle_items:
                 location.PlaceItem(spoiler, item)
-                # Make note of what hints are accessible without this WotH candidate in case it gets hinted later
-                AccessibleHintsForLocation[locationId] = spoiler.LogicVariables.Hints.copy()
-                # Some items have inherent door restrictions depending on the settings
-                restrictions = getDoorRestrictionsForItem(spoiler, item)
-                if len(restrictions) > 0:
-                    AccessibleHintsForLocation[locationId] = [hint for hint in AccessibleHintsForLocation[locationId] if hint in restrictions]
+            # Make note of what hints are accessible without this WotH candidate in case it gets hinted later
+            AccessibleHintsForLocation[locationId] = hints
+            # Some items have inherent door restrictions depending on the settings
+            restrictions = getDoorRestrictionsForItem(spoiler, item)
+            if len(restrictions) > 0:
+                AccessibleHintsForLocation[locationId] = [hint for hint in AccessibleHintsForLocation[locationId] if hint in restrictions]
     # Record that dictionary of hint access for when we compile hints
     spoiler.accessible_hints_for_location = AccessibleHintsForLocation
     # Check if there are any empty spheres, if so remove them
@@ -803,18 +1218,13 @@ def PareWoth(spoiler: Spoiler, PlaythroughLocations: List[Sphere]) -> List[Union
     # Non-item rando needs additional WotH paring due to the delayed item re-placing done when paring the playthrough
     else:
         # Check every item location to see if removing it by itself makes the game unbeatable
+        # Each item is added back after its check, so the checks can be run all at once
+        results = CheckBeatableWithoutEach(spoiler, WothLocations)
         for i in range(len(WothLocations) - 1, -1, -1):
-            locationId = WothLocations[i]
-            location = spoiler.LocationList[locationId]
-            item = location.item
-            location.item = None
-            # Check if game is still beatable
-            spoiler.Reset()
-            if GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable):
+            beatable, hints = results[i]
+            if beatable:
                 # If game is still beatable, this location is not hard required
-                WothLocations.remove(locationId)
-            # Either way, add location back
-            location.PlaceItem(spoiler, item)
+                WothLocations.remove(WothLocations[i])
     # We kept Keys around to generate paths better, but we don't need them in the spoiler log or being hinted (except for the Helm Key if it's there and also keep the Banana Hoard path)
     WothLocations = [loc for loc in WothLocations if not spoiler.LocationList[loc].constant or loc == Locations.HelmKey or loc == Locations.BananaHoard]
     if spoiler.settings.shuffle_items:
@@ -943,65 +1353,81 @@ def CalculateWothPaths(spoiler: Spoiler, WothLocations: List[Union[Locations, in
             spoiler.other_paths[locationId] = [locationId]
             ordered_interesting_locations.append(locationId)
 
+    final_boss_associated_event = {
+        Maps.JapesBoss: Events.KRoolDillo1,
+        Maps.AztecBoss: Events.KRoolDog1,
+        Maps.FactoryBoss: Events.KRoolJack,
+        Maps.GalleonBoss: Events.KRoolPufftoss,
+        Maps.FungiBoss: Events.KRoolDog2,
+        Maps.CavesBoss: Events.KRoolDillo2,
+        Maps.CastleBoss: Events.KRoolKKO,
+        Maps.KroolDonkeyPhase: Events.KRoolDonkey,
+        Maps.KroolDiddyPhase: Events.KRoolDiddy,
+        Maps.KroolLankyPhase: Events.KRoolLanky,
+        Maps.KroolTinyPhase: Events.KRoolTiny,
+        Maps.KroolChunkyPhase: Events.KRoolChunky,
+    }
+    rap_assoc_name = {
+        "Donkey Verse": Events.DonkeyVerse,
+        "Diddy Verse": Events.DiddyVerse,
+        "Lanky Verse": Events.LankyVerse,
+        "Tiny Verse": Events.TinyVerse,
+        "Chunky Verse": Events.ChunkyVerse,
+        "The Fridge": Events.FridgeVerse,
+    }
+    target_events = []
     # If K. Rool is the win condition, prepare phase-specific paths as well
     if spoiler.settings.win_condition_item == WinConditionComplex.beat_krool:
         for phase in spoiler.settings.krool_order:
             spoiler.krool_paths[phase] = []
+        target_events = [final_boss_associated_event[map_id] for map_id in final_boss_associated_event if map_id in spoiler.settings.krool_order]
+    elif spoiler.settings.win_condition_item == WinConditionComplex.dk_rap_items:
+        for verse_name in rap_assoc_name:
+            if verse_name not in spoiler.rap_win_con_paths:
+                spoiler.rap_win_con_paths[verse_name] = []
+        target_events = list(rap_assoc_name.values())
+    target_locations = list(WothLocations) + [locationId for locationId in spoiler.other_paths.keys()]
+    # We also need to assume Kongs in order to get a "pure" path instead of Kong paths being a subset of most later paths.
+    # Anything locked behind a a Kong will then require everything that Kong requires.
+    # This sort of defeats the purpose of paths, as it would put everything in a Kong's path into the path of many, many items.
+    assumedItems = ItemPool.Kongs(spoiler.settings)
+    # Search once with every item placed to learn when each location is reached. Removing an item can only cut off what's reached after it,
+    # so most locations need no search of their own and the rest resume from the step that reached them.
+    provenance = SearchProvenance()
+    spoiler.Reset()
+    GetAccessibleLocations(spoiler, assumedItems, SearchMode.GetReachable, recordTo=provenance)
     for locationId in ordered_interesting_locations:
-        # Remove the item from the location
-        location = spoiler.LocationList[locationId]
-        item_id = location.item
-        location.item = None
-        # We also need to assume Kongs in order to get a "pure" path instead of Kong paths being a subset of most later paths.
-        # Anything locked behind a a Kong will then require everything that Kong requires.
-        # This sort of defeats the purpose of paths, as it would put everything in a Kong's path into the path of many, many items.
-        assumedItems = ItemPool.Kongs(spoiler.settings)
-        # Find all accessible locations without this item placed
-        spoiler.Reset()
-        accessible = GetAccessibleLocations(spoiler, assumedItems, SearchMode.GetReachable)
+        # Find everything that can't be reached without the item in this location
+        missing_locations, missing_events = provenance.FindMissingWithout(spoiler, locationId, assumedItems, target_locations, target_events)
+        if spoiler.settings.extreme_debugging:
+            # Compare against a full search with the item removed
+            location = spoiler.LocationList[locationId]
+            item_id = location.item
+            location.item = None
+            spoiler.Reset()
+            accessible = GetAccessibleLocations(spoiler, assumedItems, SearchMode.GetReachable)
+            location.PlaceItem(spoiler, item_id)
+            if missing_locations != {target for target in target_locations if target not in accessible} or missing_events != {
+                event for event in target_events if event not in spoiler.LogicVariables.Events
+            }:
+                print("red alert - path search disagrees with a full search for " + spoiler.LocationList[locationId].name)
         # Then check every other WotH location for accessibility
         for other_location in WothLocations:
             # If it is no longer accessible, then this location is on the path of that other location
-            if other_location not in accessible:
+            if other_location in missing_locations:
                 spoiler.woth_paths[other_location].append(locationId)
         for other_location in spoiler.other_paths.keys():
-            if other_location not in accessible:
+            if other_location in missing_locations:
                 spoiler.other_paths[other_location].append(locationId)
         # If the win condition is K. Rool, also add this location to those paths as applicable
         if spoiler.settings.win_condition_item == WinConditionComplex.beat_krool:
-            final_boss_associated_event = {
-                Maps.JapesBoss: Events.KRoolDillo1,
-                Maps.AztecBoss: Events.KRoolDog1,
-                Maps.FactoryBoss: Events.KRoolJack,
-                Maps.GalleonBoss: Events.KRoolPufftoss,
-                Maps.FungiBoss: Events.KRoolDog2,
-                Maps.CavesBoss: Events.KRoolDillo2,
-                Maps.CastleBoss: Events.KRoolKKO,
-                Maps.KroolDonkeyPhase: Events.KRoolDonkey,
-                Maps.KroolDiddyPhase: Events.KRoolDiddy,
-                Maps.KroolLankyPhase: Events.KRoolLanky,
-                Maps.KroolTinyPhase: Events.KRoolTiny,
-                Maps.KroolChunkyPhase: Events.KRoolChunky,
-            }
             for map_id in final_boss_associated_event:
-                if map_id in spoiler.settings.krool_order and final_boss_associated_event[map_id] not in spoiler.LogicVariables.Events:
+                if map_id in spoiler.settings.krool_order and final_boss_associated_event[map_id] in missing_events:
                     spoiler.krool_paths[map_id].append(locationId)
         elif spoiler.settings.win_condition_item == WinConditionComplex.dk_rap_items:
-            rap_assoc_name = {
-                "Donkey Verse": Events.DonkeyVerse,
-                "Diddy Verse": Events.DiddyVerse,
-                "Lanky Verse": Events.LankyVerse,
-                "Tiny Verse": Events.TinyVerse,
-                "Chunky Verse": Events.ChunkyVerse,
-                "The Fridge": Events.FridgeVerse,
-            }
             for verse_name in rap_assoc_name:
-                if verse_name not in spoiler.rap_win_con_paths:
-                    spoiler.rap_win_con_paths[verse_name] = []
-                if rap_assoc_name[verse_name] not in spoiler.LogicVariables.Events:
+                if rap_assoc_name[verse_name] in missing_events:
                     spoiler.rap_win_con_paths[verse_name].append(locationId)
-        # Put the item back for future calculations
-        location.PlaceItem(spoiler, item_id)
     # After everything is calculated, get rid of paths for false WotH locations
     # If an item doesn't show up on any other paths, it's not actually WotH
     # This is rare, but could happen if the item at the location is needed for coins or B. Lockers - it's often required, but not helpful to hint at all
@@ -1154,7 +1580,7 @@ def RandomFill(spoiler: Spoiler, itemsToPlace: List[Items], inOrder: bool = Fals
     """Randomly place given items in any location disregarding logic."""
     settings = spoiler.settings
     if not inOrder:
-        shuffle(itemsToPlace)
+        fill_random.shuffle(itemsToPlace)
     # Get all remaining empty locations
     empty = []
     for id, location in spoiler.LocationList.items():
@@ -1173,7 +1599,7 @@ def RandomFill(spoiler: Spoiler, itemsToPlace: List[Items], inOrder: bool = Fals
                 accessible_empty_locations = [x for x in empty_locations if not x.inaccessible]
                 noitem_locations = [x for x in spoiler.LocationList.values() if x.type != Types.Shop and x.item is Items.NoItem]
             return len(itemsToPlace) + 1
-        shuffle(itemEmpty)
+        fill_random.shuffle(itemEmpty)
         locationId = itemEmpty.pop()
         spoiler.LocationList[locationId].PlaceItem(spoiler, item)
         empty.remove(locationId)
@@ -1199,7 +1625,7 @@ def CarefulRandomFill(spoiler: Spoiler, itemsToPlace: List[Union[Any, Items]], o
     owned.extend(itemsToPlace)
     reachable = GetAccessibleLocations(spoiler, owned, SearchMode.GetReachableForFilling)
     # Place items randomly in the accessible locations
-    shuffle(itemsToPlace)
+    fill_random.shuffle(itemsToPlace)
     while len(itemsToPlace) > 0:
         item = itemsToPlace.pop()
         validLocations = settings.GetValidLocationsForItem(item)
@@ -1212,8 +1638,8 @@ def CarefulRandomFill(spoiler: Spoiler, itemsToPlace: List[Union[Any, Items]], o
                 accessible_empty_locations = [x for x in empty_locations if not x.inaccessible]
                 noitem_locations = [x for x in spoiler.LocationList.values() if x.type != Types.Shop and x.item is Items.NoItem]
             return len(itemsToPlace) + 1
-        shuffle(itemEmpty)
-        shuffle(itemEmpty)
+        fill_random.shuffle(itemEmpty)
+        fill_random.shuffle(itemEmpty)
         locationId = itemEmpty.pop()
         spoiler.LocationList[locationId].PlaceItem(spoiler, item)
         # If you hit a shop location, we have to do some stuff
@@ -1259,8 +1685,10 @@ def ForwardFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
     if ownedItems is None:
         ownedItems = []
     if not inOrder:
-        shuffle(itemsToPlace)
+        fill_random.shuffle(itemsToPlace)
     needToRefreshReachable = True
+    # Owned items never change here, so each search can usually extend the last one
+    search = IncrementalSearch(spoiler)
     # While there are items to place
     while len(itemsToPlace) > 0:
         # Get a random item
@@ -1268,8 +1696,7 @@ def ForwardFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
         # In "doubleTime", only refresh the list of reachable locations every other item to reduce calls to this method - this should have minimal impact on randomization depending on the item filling here
         if not doubleTime or needToRefreshReachable:
             # Find a random empty location which is reachable with current items
-            spoiler.Reset()
-            reachable = GetAccessibleLocations(spoiler, ownedItems.copy(), SearchMode.GetReachableForFilling)
+            reachable = search.Search(ownedItems)
         validLocations = settings.GetValidLocationsForItem(item)
         validReachable = [x for x in reachable if spoiler.LocationList[x].item is None and x in validLocations]
         if len(validReachable) == 0:  # If there are no empty reachable locations, reached a dead end
@@ -1277,7 +1704,7 @@ def ForwardFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
                 invalid_empty_reachable = [x for x in reachable if spoiler.LocationList[x].item is None and x not in validLocations]
                 valid_empty = [x for x in spoiler.LocationList.keys() if spoiler.LocationList[x].item is None and x in validLocations]
             return len(itemsToPlace) + 1
-        shuffle(validReachable)
+        fill_random.shuffle(validReachable)
         locationId = validReachable.pop()
         # Place the item
         spoiler.LocationList[locationId].PlaceItem(spoiler, item)
@@ -1343,7 +1770,10 @@ def AssumedFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
         ownedItems = []
     # While there are items to place
     if not inOrder:
-        shuffle(itemsToPlace)
+        fill_random.shuffle(itemsToPlace)
+    # Checking a placement only adds an item to the world, so it can extend the search done without the item
+    # The search for each item owns one item fewer than the search before it, which can't be extended, so that search is always a full one
+    search = IncrementalSearch(spoiler)
     while len(itemsToPlace) > 0:
         # Get a random item, check which empty locations are still accessible without owning it
         item = itemsToPlace.pop(0)
@@ -1353,8 +1783,7 @@ def AssumedFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
 
         itemValidLocations = settings.GetValidLocationsForItem(item)
         # Find all valid reachable locations for this item
-        spoiler.Reset()
-        reachable = GetAccessibleLocations(spoiler, owned, SearchMode.GetReachableForFilling)
+        reachable = search.Search(owned)
         validReachable = [x for x in reachable if spoiler.LocationList[x].item is None and x in itemValidLocations]
         # If there are no empty reachable locations, reached a dead end
         if len(validReachable) == 0:
@@ -1367,9 +1796,13 @@ def AssumedFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
                 currentKongsFreed.insert(i, kong)
             currentMovesOwned = [ItemList[x].name for x in owned if ItemList[x].type in (Types.Shop, Types.TrainingBarrel, Types.Shockwave, Types.Climbing)]
             currentGbCount = len([x for x in owned if ItemList[x].type == Types.Banana])
-            js.postMessage("Current Moves owned at failure: " + str(currentMovesOwned) + " with GB count: " + str(currentGbCount) + " and kongs freed: " + str(currentKongsFreed))
+            progress(
+                "Current Moves owned at failure: " + str(currentMovesOwned) + " with GB count: " + str(currentGbCount) + " and kongs freed: " + str(currentKongsFreed),
+                reason="no_reachable_locations",
+                item=ItemList[item].name,
+            )
             return len(itemsToPlace) + 1
-        shuffle(validReachable)
+        fill_random.shuffle(validReachable)
         # Get a random, empty, reachable location
         for locationId in validReachable:
             # Atempt to place the item here
@@ -1379,15 +1812,18 @@ def AssumedFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
                 # Need to re-assign owned items since the search adds a bunch of extras
                 owned = itemsToPlace.copy()
                 owned.extend(ownedItems)
-                spoiler.Reset()
-                reachable = GetAccessibleLocations(spoiler, owned, SearchMode.GetReachableForFilling)
+                reachable = search.Search(owned, keepCheckpoint=False)
                 valid = True
                 # For each remaining item, ensure that it has a valid location reachable after placing this item
                 for checkItem in itemsToPlace:
                     itemValid = settings.GetValidLocationsForItem(checkItem)
                     validReachable = [x for x in reachable if x in itemValid and x != locationId]
                     if len(validReachable) == 0:
-                        js.postMessage("Failed placing item " + ItemList[item].name + " in location " + spoiler.LocationList[locationId].name + ", due to too few remaining locations in play")
+                        progress(
+                            "Failed placing item " + ItemList[item].name + " in location " + spoiler.LocationList[locationId].name + ", due to too few remaining locations in play",
+                            reason="too_few_locations",
+                            item=ItemList[item].name,
+                        )
                         valid = False
                         break
                     reachable.remove(validReachable[0])  # Remove one so same location can't be "used" twice
@@ -1408,7 +1844,9 @@ def AssumedFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
                     BanAllRemainingSharedShops(spoiler)
             break
         if not itemShuffled:
-            js.postMessage("Failed placing item " + ItemList[item].name + " in any of remaining " + str(ItemList[item].type) + " type possible locations")
+            progress(
+                "Failed placing item " + ItemList[item].name + " in any of remaining " + str(ItemList[item].type) + " type possible locations", reason="no_valid_location", item=ItemList[item].name
+            )
             return len(itemsToPlace) + 1
         elif settings.extreme_debugging:
             spoiler.Reset()
@@ -1491,7 +1929,7 @@ def GetUnplacedItemPrerequisites(spoiler: Spoiler, targetItemId, placedMoves, ow
     for move in placedMoves:
         if move in moveList:
             moveList.remove(move)
-    shuffle(moveList)
+    fill_random.shuffle(moveList)
     itemWasFound = False
     # Every item in moveList could be a required item
     for i in range(0, len(moveList)):
@@ -1612,7 +2050,7 @@ def FillHelmLocations(spoiler: Spoiler, placed_types: List[Types], placed_items:
             unplaced_items.remove(item)
     debug_failed_to_place_items = []
     possible_items = [item for item in unplaced_items if item != Items.GoldenBanana]  # To save some time, we know GBs can't be in Helm
-    shuffle(possible_items)
+    fill_random.shuffle(possible_items)
     # Until we have placed enough items...
     while len(placed_in_helm) < len(empty_helm_locations):
         if len(possible_items) == 0:
@@ -1662,7 +2100,7 @@ def FillBossLocations(spoiler: Spoiler, placed_types: List[Types], placed_items:
             unplaced_items.remove(item)
     debug_failed_to_place_items = []
     possible_items = [item for item in unplaced_items if item < Items.JungleJapesDonkeyBlueprint or item > Items.DKIslesChunkyBlueprint]  # To save some time, we know blueprints can't be on bosses
-    shuffle(possible_items)
+    fill_random.shuffle(possible_items)
     # Until we have placed enough items...
     while len(placed_on_bosses) < len(empty_boss_locations):
         if len(possible_items) == 0:
@@ -2018,10 +2456,10 @@ def FillTrainingMoves(spoiler: Spoiler, placedMoves: List[Items]):
         for item in placedMoves:
             if item in possibleStartingMoves:
                 possibleStartingMoves.remove(item)
-        shuffle(possibleStartingMoves)
+        fill_random.shuffle(possibleStartingMoves)
         # Assemble the starting move pool
         startingMovePool = [move for move in spoiler.settings.random_starting_move_list_selected]  # These are the user-chosen moves eligible to be random starting moves
-        shuffle(startingMovePool)
+        fill_random.shuffle(startingMovePool)
         startingMovePool.extend(spoiler.settings.starting_move_list_selected)  # Append the guaranteed starting moves at the end so they're always picked first
         # For each location needing a move, put in a random valid move
         for locationId in locationsNeedingMoves:
@@ -2114,7 +2552,7 @@ def ShuffleSharedMoves(spoiler: Spoiler, placedMoves: List[Items], placedTypes:
 
 def GeneratePlaythrough(spoiler: Spoiler) -> None:
     """Generate playthrough and way of the hoard and update spoiler."""
-    js.postMessage("Seed generated! Finalizing spoiler...")
+    progress("Seed generated! Finalizing spoiler...")
     spoiler.LogicVariables.assumeFillSuccess = True  # Now that we know the seed is valid, we can assume fill success for the sake of generating the playthrough and WotH
     # Generate and display the playthrough
     spoiler.Reset()
@@ -2211,29 +2649,29 @@ def PlaceKongsInKongLocations(spoiler: Spoiler, kongItems, kongLocations):
     # Instead, we place Kongs in a specific order to guarantee we'll at least have an eligible freer.
     # To be at least somewhat nice to no logic users, we also use this section here so kongs don't lock each other.
     if spoiler.settings.shuffle_loading_zones == ShuffleLoadingZones.all or spoiler.settings.logic_type == LogicType.nologic:
-        shuffle(kongItems)
+        fill_random.shuffle(kongItems)
         if Locations.ChunkyKong in kongLocations:
             kongItemToBeFreed = kongItems.pop()
             spoiler.LocationList[Locations.ChunkyKong].PlaceItem(spoiler, kongItemToBeFreed)
-            spoiler.settings.chunky_freeing_kong = choice(ownedKongs)
+            spoiler.settings.chunky_freeing_kong = fill_random.choice(ownedKongs)
             ownedKongs.append(ItemPool.GetKongForItem(kongItemToBeFreed))
         if Locations.DiddyKong in kongLocations:
             kongItemToBeFreed = kongItems.pop()
             spoiler.LocationList[Locations.DiddyKong].PlaceItem(spoiler, kongItemToBeFreed)
-            spoiler.settings.diddy_freeing_kong = choice(ownedKongs)
+            spoiler.settings.diddy_freeing_kong = fill_random.choice(ownedKongs)
             ownedKongs.append(ItemPool.GetKongForItem(kongItemToBeFreed))
         # The Lanky location can't be your first in cases where the Lanky freeing Kong can't get into the llama temple and you need a second Kong
         if Locations.LankyKong in kongLocations:
             kongItemToBeFreed = kongItems.pop()
             spoiler.LocationList[Locations.LankyKong].PlaceItem(spoiler, kongItemToBeFreed)
-            spoiler.settings.lanky_freeing_kong = choice(ownedKongs)
+            spoiler.settings.lanky_freeing_kong = fill_random.choice(ownedKongs)
             ownedKongs.append(ItemPool.GetKongForItem(kongItemToBeFreed))
         # Placing the Tiny location last guarantees we have one of Diddy or Chunky
         if Locations.TinyKong in kongLocations:
             kongItemToBeFreed = kongItems.pop()
             spoiler.LocationList[Locations.TinyKong].PlaceItem(spoiler, kongItemToBeFreed)
             eligibleFreers = list(set(ownedKongs).intersection([Kongs.diddy, Kongs.chunky]))
-            spoiler.settings.tiny_freeing_kong = choice(eligibleFreers)
+            spoiler.settings.tiny_freeing_kong = fill_random.choice(eligibleFreers)
             ownedKongs.append(ItemPool.GetKongForItem(kongItemToBeFreed))
     # In level order shuffling, we need to be very particular about who we unlock and in what order so as to guarantee completion
     # Vanilla levels can be treated as if the level shuffler randomly placed all the levels in the same order
@@ -2249,22 +2687,22 @@ def PlaceKongsInKongLocations(spoiler: Spoiler, kongItems, kongLocations):
                 raise Ex.EntrancePlacementException("Levels shuffled in a way that makes Kong unlocks impossible. SEND THIS TO THE DEVS!")
             # Begin by finding the currently accessible Kong locations
             # Randomly pick an accessible location
-            progressionLocation = choice(logicallyAccessibleKongLocations)
+            progressionLocation = fill_random.choice(logicallyAccessibleKongLocations)
             logicallyAccessibleKongLocations.remove(progressionLocation)
             # Pick a Kong to free this location from the Kongs we currently have
             if progressionLocation == Locations.DiddyKong:
-                spoiler.settings.diddy_freeing_kong = choice(ownedKongs)
+                spoiler.settings.diddy_freeing_kong = fill_random.choice(ownedKongs)
             elif progressionLocation == Locations.LankyKong:
-                spoiler.settings.lanky_freeing_kong = choice(ownedKongs)
+                spoiler.settings.lanky_freeing_kong = fill_random.choice(ownedKongs)
             elif progressionLocation == Locations.TinyKong:
                 eligibleFreers = list(set(ownedKongs).intersection([Kongs.diddy, Kongs.chunky]))
-                spoiler.settings.tiny_freeing_kong = choice(eligibleFreers)
+                spoiler.settings.tiny_freeing_kong = fill_random.choice(eligibleFreers)
             elif progressionLocation == Locations.ChunkyKong:
-                spoiler.settings.chunky_freeing_kong = choice(ownedKongs)
+                spoiler.settings.chunky_freeing_kong = fill_random.choice(ownedKongs)
             # Remove this location from any considerations
             kongLocations.remove(progressionLocation)
             # Pick a Kong to unlock from the locked Kongs
-            kongToBeFreed = choice(kongItems)
+            kongToBeFreed = fill_random.choice(kongItems)
             # With this kong, we can progress one level further (if we care about this logic)
             if not spoiler.settings.hard_level_progression:
                 latestLogicallyAllowedLevel += 1
@@ -2286,7 +2724,7 @@ def PlaceKongsInKongLocations(spoiler: Spoiler, kongItems, kongLocations):
                     if len(progressionKongItems) == 0:
                         raise Ex.FillException("Kongs placed in a way that is impossible to unlock everyone. SEND THIS TO THE DEVS!")
                     # Pick a random Kong from the Kongs that guarantee progression
-                    kongToBeFreed = choice(progressionKongItems)
+                    kongToBeFreed = fill_random.choice(progressionKongItems)
             # Now that we have a combination guaranteed to not break the seed or logic, lock it in
             spoiler.LocationList[progressionLocation].PlaceItem(spoiler, kongToBeFreed)
             spoiler.settings.debug_fill[spoiler.LocationList[progressionLocation].name] = kongToBeFreed
@@ -2296,13 +2734,13 @@ def PlaceKongsInKongLocations(spoiler: Spoiler, kongItems, kongLocations):
             logicallyAccessibleKongLocations = GetLogicallyAccessibleKongLocations(spoiler, kongLocations, ownedKongs, latestLogicallyAllowedLevel)
     # Pick freeing kongs for any that are still "any" with no restrictions.
     if spoiler.settings.diddy_freeing_kong == Kongs.any:
-        spoiler.settings.diddy_freeing_kong = choice(GetKongs())
+        spoiler.settings.diddy_freeing_kong = fill_random.choice(GetKongs())
     if spoiler.settings.lanky_freeing_kong == Kongs.any:
-        spoiler.settings.lanky_freeing_kong = choice(GetKongs())
+        spoiler.settings.lanky_freeing_kong = fill_random.choice(GetKongs())
     if spoiler.settings.tiny_freeing_kong == Kongs.any:
-        spoiler.settings.tiny_freeing_kong = choice([Kongs.diddy, Kongs.chunky])
+        spoiler.settings.tiny_freeing_kong = fill_random.choice([Kongs.diddy, Kongs.chunky])
     if spoiler.settings.chunky_freeing_kong == Kongs.any:
-        spoiler.settings.chunky_freeing_kong = choice(GetKongs())
+        spoiler.settings.chunky_freeing_kong = fill_random.choice(GetKongs())
     # Update the locations' assigned kong with the set freeing kong list
     spoiler.LocationList[Locations.DiddyKong].kong = spoiler.settings.diddy_freeing_kong
     spoiler.LocationList[Locations.JapesDonkeyFrontofCage].kong = spoiler.settings.diddy_freeing_kong
@@ -2325,10 +2763,10 @@ def FillKongs(spoiler: Spoiler, placedTypes: List[Types], placedItems: List[Item
     # If Kongs can be placed anywhere, we don't need anything special
     if spoiler.settings.shuffle_items and Types.Kong in spoiler.settings.shuffled_location_types:
         # First, randomly pick who opens what cage - this prevents cases where a Kong locks themselves
-        spoiler.settings.diddy_freeing_kong = choice(GetKongs())
-        spoiler.settings.lanky_freeing_kong = choice(GetKongs())
-        spoiler.settings.tiny_freeing_kong = choice([Kongs.diddy, Kongs.chunky])
-        spoiler.settings.chunky_freeing_kong = choice(GetKongs())
+        spoiler.settings.diddy_freeing_kong = fill_random.choice(GetKongs())
+        spoiler.settings.lanky_freeing_kong = fill_random.choice(GetKongs())
+        spoiler.settings.tiny_freeing_kong = fill_random.choice([Kongs.diddy, Kongs.chunky])
+        spoiler.settings.chunky_freeing_kong = fill_random.choice(GetKongs())
         if spoiler.settings.enable_plandomizer:
             if spoiler.settings.plandomizer_dict["plando_kong_rescue_diddy"] != -1:
                 spoiler.settings.diddy_freeing_kong = Kongs(spoiler.settings.plandomizer_dict["plando_kong_rescue_diddy"])
@@ -2459,6 +2897,7 @@ def FillWorld(spoiler: Spoiler) -> None:
     """Fill all locations with Kongs, moves, items, and etc."""
     # Level order rando may have to affect the progression to be fillable - no logic doesn't care about your silly progression, however
     wipe_progression = spoiler.settings.shuffle_loading_zones != ShuffleLoadingZones.all and spoiler.settings.logic_type != LogicType.nologic
+    spoiler.settings.set_fill_attempt_seed()
     retries = 0
     error_log = []
     while 1:
@@ -2474,7 +2913,8 @@ def FillWorld(spoiler: Spoiler) -> None:
             spoiler.settings.medal_requirement = spoiler.settings.logical_medal_requirement
             spoiler.settings.rareware_gb_fairies = spoiler.settings.logical_fairy_requirement
             # Fill locations
-            Fill(spoiler)
+            with span("Fill"):
+                Fill(spoiler)
             if wipe_progression:
                 # Update progression requirements based on what is now accessible after all shuffles are done
                 if spoiler.settings.hard_level_progression:
@@ -2501,19 +2941,22 @@ def FillWorld(spoiler: Spoiler) -> None:
             spoiler.ClearAllLocations()
             retries += 1
             if retries == 10:
-                js.postMessage("Fill failed, out of retries.")
+                progress("Fill failed, out of retries.", phase="fill", tries=retries)
                 raise ex
             spoiler.settings.shuffle_prices(spoiler)
             # Every 3rd fill, retry more aggressively by reshuffling level order, move prices, and starting location as applicable
+            count("retries", phase="fill")
             if retries % 3 == 0:
-                js.postMessage("Retrying fill really hard. Tries: " + str(retries))
+                progress("Retrying fill really hard. Tries: " + str(retries), phase="fill", tries=retries)
                 if spoiler.settings.random_starting_region:
                     spoiler.settings.RandomizeStartingLocation(spoiler)
                 if spoiler.settings.shuffle_loading_zones == ShuffleLoadingZones.levels:  # TODO: Reshuffling LZR doesn't work yet, but it might be nice? Not sure how necessary it is
                     ShuffleExits.ShuffleExits(spoiler)
                     spoiler.UpdateExits()
+                # The start and exits may lead somewhere new, so regroup the regions
+                GroupRegions(spoiler)
             else:
-                js.postMessage("Retrying fill. Tries: " + str(retries))
+                progress("Retrying fill. Tries: " + str(retries), phase="fill", tries=retries)
 
 
 def GetAccessibleKongLocations(levels: list, ownedKongs: list):
@@ -2600,7 +3043,7 @@ def SetNewProgressionRequirements(spoiler: Spoiler) -> None:
         if len(eligibleTypes) == 0:
             blocker_item_projection[0] = BarrierItems.GoldenBanana
         else:
-            blocker_item_projection[0] = choice(eligibleTypes)
+            blocker_item_projection[0] = fill_random.choice(eligibleTypes)
     blocker_value_projection[0] = min(1, accessibleItems[blocker_item_projection[0]])  # This should limit the first B. Locker to 1 item, no matter what it is
     if not settings.chaos_blockers:
         blocker_value_projection[0] = min(blocker_variable_mapping[0], blocker_value_projection[0])
@@ -2633,8 +3076,8 @@ def SetNewProgressionRequirements(spoiler: Spoiler) -> None:
                 if len(eligibleTypes) == 0:
                     blocker_item_projection[level] = BarrierItems.GoldenBanana
                 else:
-                    blocker_item_projection[level] = choice(eligibleTypes)
-            blocker_value_projection[level] = max(1, round(uniform(BLOCKER_MIN, BLOCKER_MAX) * accessibleItems[blocker_item_projection[level]]))
+                    blocker_item_projection[level] = fill_random.choice(eligibleTypes)
+            blocker_value_projection[level] = max(1, round(fill_random.uniform(BLOCKER_MIN, BLOCKER_MAX) * accessibleItems[blocker_item_projection[level]]))
             # If we're on Chaos B. Lockers, we need a random value to compare against so we don't only follow the item availability heuristic - if we did, we'd get really expensive B. Lockers
             if settings.chaos_blockers:
                 # Roll 8 random values and take the levelth one to get an approximation of what the levelth most expensive random B. Locker might be if all of them were of this item
@@ -2642,7 +3085,7 @@ def SetNewProgressionRequirements(spoiler: Spoiler) -> None:
                 # This also prevents the item availability-based values from overtaking the maximum value
                 assorted_random_values = []
                 for i in range(8):
-                    assorted_random_values.append(randint(1, ceil(settings.blocker_limits[blocker_item_projection[level]] * settings.chaos_ratio)))
+                    assorted_random_values.append(fill_random.randint(1, ceil(settings.blocker_limits[blocker_item_projection[level]] * settings.chaos_ratio)))
                 assorted_random_values.sort()
                 blocker_value_projection[level] = min(assorted_random_values[level], blocker_value_projection[level])
             # If we're not on Chaos B. Lockers we need to respect the UI input or the randomly generated value from earlier so the item availability calc doesn't overtake the max
@@ -2778,7 +3221,7 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
                 if len(openUnprogressedLevels) == 0:
                     raise Ex.FillException("E1: Hard level order shuffler failed to progress through levels.")
                 # Next level chosen randomly (possible room for improvement here?) from accessible levels
-                nextLevelToBeat = choice(openUnprogressedLevels)
+                nextLevelToBeat = fill_random.choice(openUnprogressedLevels)
                 # If the level still isn't accessible, we have to truncate the required amount
                 if settings.BLockerEntryCount[nextLevelToBeat] > maxEnterableBlocker:
                     # Each B. Locker must be greater than the previous one and at least a specified percentage of available GBs
@@ -2786,16 +3229,16 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
                     lowroll = min(maximumMinRoll, round(runningGBTotal * BLOCKER_MIN))  # Max min roll vs min progression roll
                     if lowroll > highroll:  # I think this impossible? It probably takes insane rng and very specific numbers
                         lowroll = highroll
-                    settings.BLockerEntryCount[nextLevelToBeat] = randint(lowroll, highroll)
+                    settings.BLockerEntryCount[nextLevelToBeat] = fill_random.randint(lowroll, highroll)
                 accessibleIncompleteLevels = [nextLevelToBeat]
             else:
-                nextLevelToBeat = choice(accessibleIncompleteLevels)
+                nextLevelToBeat = fill_random.choice(accessibleIncompleteLevels)
         # Chaos B. Lockers will always have to update the B. Locker
         else:
             accessibleIncompleteLevels = [level for level in openLevels if level not in levelsProgressed]
             if len(accessibleIncompleteLevels) == 0:
                 raise Ex.FillException("E1-C: Hard level order shuffler failed to progress through levels.")
-            nextLevelToBeat = choice(accessibleIncompleteLevels)
+            nextLevelToBeat = fill_random.choice(accessibleIncompleteLevels)
             # In CLO, we always recalculate the B. Locker items
             # Calculate the available quantity of the item for the B. Locker
             accessibleItems = spoiler.LogicVariables.ItemCounts()
@@ -2814,14 +3257,14 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
                 settings.BLockerEntryItems[nextLevelToBeat] = BarrierItems.GoldenBanana
                 progression_roll = 0
             else:
-                settings.BLockerEntryItems[nextLevelToBeat] = choice(eligibleTypes)
-                progression_roll = max(1, round(uniform(BLOCKER_MIN, BLOCKER_MAX) * accessibleItems[settings.BLockerEntryItems[nextLevelToBeat]]))
+                settings.BLockerEntryItems[nextLevelToBeat] = fill_random.choice(eligibleTypes)
+                progression_roll = max(1, round(fill_random.uniform(BLOCKER_MIN, BLOCKER_MAX) * accessibleItems[settings.BLockerEntryItems[nextLevelToBeat]]))
             # Roll 8 random values and take the nth one to get an approximation of what the nth most expensive random B. Locker might be if all of them were of this item
             # n in this scenario is the nth level to be entered
             # This also prevents the item availability-based values from overtaking the maximum value
             assorted_random_values = []
             for i in range(9):
-                assorted_random_values.append(randint(1, ceil(settings.blocker_limits[settings.BLockerEntryItems[nextLevelToBeat]] * settings.chaos_ratio)))
+                assorted_random_values.append(fill_random.randint(1, ceil(settings.blocker_limits[settings.BLockerEntryItems[nextLevelToBeat]] * settings.chaos_ratio)))
             assorted_random_values.sort()
             settings.BLockerEntryCount[nextLevelToBeat] = min(progression_roll, assorted_random_values[len(levelsProgressed)])
         levelsProgressed.append(nextLevelToBeat)
@@ -2848,7 +3291,7 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
         #         # If we haven't found all the levels and have progressed through all open levels, we need to lower the CB requirement of one or more bosses for progression
         #         if len(openLevels) < 7 and len(openLevels) == len(levelsProgressed):
         #             bossLocations = [location for id, location in spoiler.LocationList.items() if location.type == Types.Key and location.level in levelsProgressed]
-        #             shuffle(bossLocations)
+        #             fill_random.shuffle(bossLocations)
         #             priorityBossLocation = None
         #             priorityStrength = -1
         #             # Loop through the boss locations, looking for the most likely progression candidate
@@ -2939,7 +3382,7 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
                 eligibleProgressionKeyEvents.remove(Events.CastleKeyTurnedIn)
             # If we've progressed through all open levels, then we need to pick a progression key we've found to acquire and set that level's Troff n Scoff
             if len(openLevels) == len(levelsProgressed) and any(eligibleProgressionKeyEvents):
-                chosenKeyEvent = choice(eligibleProgressionKeyEvents)
+                chosenKeyEvent = fill_random.choice(eligibleProgressionKeyEvents)
                 foundProgressionKeyEvents.remove(chosenKeyEvent)
                 # Determine what levels need to be completed
                 levelsToCompleteBoss = []
@@ -3040,7 +3483,7 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
         # Because we might not have sorted the B. Lockers when they're randomly generated, Helm might be a surprisingly low number if it's not maximized
         elif settings.randomize_blocker_required_amounts and not settings.maximize_helm_blocker and settings.BLockerEntryCount[7] < mostExpensiveBLocker:
             # Ensure that Helm is the most expensive B. Locker
-            settings.BLockerEntryCount[7] = randint(mostExpensiveBLocker, settings.blocker_max)
+            settings.BLockerEntryCount[7] = fill_random.randint(mostExpensiveBLocker, settings.blocker_max)
     # Only if keys are shuffled off of bosses do we need to reshuffle the bosses
     if not isKeyItemRando:
         # Place boss locations based on kongs and moves found for each level
@@ -3108,6 +3551,13 @@ def BlockCompletionOfLevelSet(settings: Settings, lockedLevels):
 
 def Generate_Spoiler(spoiler: Spoiler) -> Tuple[bytes, Spoiler]:
     """Generate a complete spoiler based on input settings."""
+    Fill_Spoiler(spoiler)
+    return Patch_Spoiler(spoiler), spoiler
+
+
+def Fill_Spoiler(spoiler: Spoiler) -> None:
+    """Build and fill the world of a spoiler and write its spoiler log, without patching the ROM."""
+    spoiler.events.activate()
     # Check for settings incompatibilities
     CheckForIncompatibleSettings(spoiler.settings)
     if spoiler.settings.wrinkly_hints == WrinklyHints.fixed_racing:
@@ -3117,34 +3567,50 @@ def Generate_Spoiler(spoiler: Spoiler) -> Tuple[bytes, Spoiler]:
     # Initiate kasplat map with default
     spoiler.InitKasplatMap()
     # Handle misc randomizations
-    ShuffleMisc(spoiler)
+    with span("ShuffleMisc"):
+        ShuffleMisc(spoiler)
     # Handle Loading Zones - this will handle LO and LZR appropriately
     if spoiler.settings.shuffle_loading_zones != ShuffleLoadingZones.none:
-        ShuffleExits.ExitShuffle(spoiler)
-        spoiler.UpdateExits()
+        with span("ExitShuffle"):
+            ShuffleExits.ExitShuffle(spoiler)
+            spoiler.UpdateExits()
+    # Resolve the settings-dependent parts of the logic now that the world is built
+    with span("CompileLogic"):
+        CompileLogic(spoiler)
+        GroupRegions(spoiler)
     # Handle Item Fill
-    if spoiler.settings.move_rando != MoveRando.off or spoiler.settings.kong_rando or any(spoiler.settings.shuffled_location_types):
-        FillWorld(spoiler)
-    else:
-        # Just check if normal item locations are beatable with given settings
-        ItemPool.PlaceConstants(spoiler)
-        if not GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable):
-            raise Ex.VanillaItemsGameNotBeatableException("Game unbeatable.")
+    with span("FillWorld"):
+        if spoiler.settings.move_rando != MoveRando.off or spoiler.settings.kong_rando or any(spoiler.settings.shuffled_location_types):
+            FillWorld(spoiler)
+        else:
+            # Just check if normal item locations are beatable with given settings
+            ItemPool.PlaceConstants(spoiler)
+            if not GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable):
+                raise Ex.VanillaItemsGameNotBeatableException("Game unbeatable.")
     CorrectBossKongLocations(spoiler)
-    GeneratePlaythrough(spoiler)
-    compileMicrohints(spoiler)
-    if spoiler.settings.wrinkly_hints != WrinklyHints.off:
-        compileHints(spoiler)
-    if spoiler.settings.spoiler_hints != SpoilerHints.off:
-        compileSpoilerHints(spoiler)
+    with span("GeneratePlaythrough"):
+        GeneratePlaythrough(spoiler)
+    with span("Hints"):
+        # Index the placed items once, hints and patching look them up many times
+        spoiler.location_index = LocationIndex(spoiler)
+        compileMicrohints(spoiler)
+        if spoiler.settings.wrinkly_hints != WrinklyHints.off:
+            compileHints(spoiler)
+        if spoiler.settings.spoiler_hints != SpoilerHints.off:
+            compileSpoilerHints(spoiler)
     spoiler.Reset()
     ShuffleExits.Reset(spoiler)
     spoiler.createJson()
-    js.postMessage("Patching ROM...")
+
+
+def Patch_Spoiler(spoiler: Spoiler) -> bytes:
+    """Patch the ROM for a filled spoiler, returning the patch data."""
+    spoiler.events.activate()
+    progress("Patching ROM...")
     # print(spoiler)
     # print(spoiler.json)
-    patch_data = ApplyRandomizer.patching_response(spoiler)
-    return patch_data, spoiler
+    with span("Patching"):
+        return ApplyRandomizer.patching_response(spoiler)
 
 
 class ItemReference:
@@ -0,0 +1,196 @@
+"""Structured events emitted while a seed is generated.
+
+A generation records spans, which time a phase of the generation, counters and progress messages.
+Code records them through the functions below, which add them to the events of the generation
+running in the current thread or task, and do nothing but post progress messages outside of one.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List
+
+import js
+
+PROMETHEUS_PREFIX = "dk64r_"
+
+
+class GenerationEvents:
+    """Spans, counters and progress messages recorded during one generation."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing recorded."""
+        self.started = time.perf_counter()
+        self.events = []
+        # Totals of every span, by name
+        self.spans = {}
+        # Counter values, by name then by their sorted labels
+        self.counters = {}
+        self.depth = 0
+        self.listeners = []
+
+    def activate(self) -> None:
+        """Make these the events recorded to by the current thread or task."""
+        current_events.set(self)
+
+    def addListener(self, listener: Callable[[dict], None]) -> None:
+        """Call a function with every event as it is recorded."""
+        self.listeners.append(listener)
+
+    def emit(self, event: dict) -> None:
+        """Record an event, timed from the start of the generation."""
+        event["time"] = time.perf_counter() - self.started
+        self.events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the code run within this context as a span."""
+        depth = self.depth
+        self.emit({"type": "span_start", "name": name, "depth": depth})
+        self.depth += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            self.depth = depth
+            total = self.spans.setdefault(name, {"count": 0, "seconds": 0.0})
+            total["count"] += 1
+            total["seconds"] += duration
+            self.emit({"type": "span_end", "name": name, "depth": depth, "duration": duration})
+
+    def count(self, name: str, amount: int = 1, **labels) -> None:
+        """Add to a counter. Counters are only totalled, not recorded as events."""
+        key = tuple(sorted(labels.items()))
+        values = self.counters.setdefault(name, {})
+        values[key] = values.get(key, 0) + amount
+
+    def getCounter(self, name: str, **labels) -> int:
+        """Get the value of a counter, summed over every label not given."""
+        return sum(value for key, value in self.counters.get(name, {}).items() if all(dict(key).get(label) == wanted for label, wanted in labels.items()))
+
+    def getSummary(self) -> dict:
+        """Get everything recorded as plain data, which can be sent between processes or written as JSON."""
+        return {
+            "duration": time.perf_counter() - self.started,
+            "spans": {name: dict(total) for name, total in self.spans.items()},
+            "counters": [{"name": name, "labels": dict(key), "value": value} for name, values in self.counters.items() for key, value in values.items()],
+            "events": list(self.events),
+        }
+
+
+current_events = ContextVar("current_events", default=None)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the code run within this context as a span of the active generation."""
+    events = current_events.get()
+    if events is None:
+        yield
+        return
+    with events.span(name):
+        yield
+
+
+def count(name: str, amount: int = 1, **labels) -> None:
+    """Add to a counter of the active generation."""
+    events = current_events.get()
+    if events is not None:
+        events.count(name, amount, **labels)
+
+
+def getCounters() -> Dict[str, Dict[tuple, int]]:
+    """Copy the counters of the active generation, to later find what was counted since with getCountedSince."""
+    events = current_events.get()
+    if events is None:
+        return {}
+    return {name: dict(values) for name, values in events.counters.items()}
+
+
+def getCountedSince(counters: Dict[str, Dict[tuple, int]]) -> List[tuple]:
+    """Get what the active generation counted since its counters were copied, as (name, labels, amount)."""
+    events = current_events.get()
+    if events is None:
+        return []
+    counted = []
+    for name, values in events.counters.items():
+        for key, value in values.items():
+            amount = value - counters.get(name, {}).get(key, 0)
+            if amount != 0:
+                counted.append((name, dict(key), amount))
+    return counted
+
+
+def addCounted(counted: List[tuple]) -> None:
+    """Add counts made elsewhere, such as in a forked process, to the active generation."""
+    for name, labels, amount in counted:
+        count(name, amount, **labels)
+
+
+def isRecording() -> bool:
+    """Check whether a generation is recording events, to skip work only needed to record them."""
+    return current_events.get() is not None
+
+
+def progress(message: str, **fields) -> None:
+    """Post a progress message to the user, recording it and any fields describing it as an event."""
+    js.postMessage(message)
+    events = current_events.get()
+    if events is not None:
+        events.emit({"type": "progress", "message": message, **fields})
+
+
+def mergeSummaries(summaries: List[dict]) -> dict:
+    """Total the spans and counters of several generations, which can include totals made by this earlier."""
+    generations = 0
+    spans = {}
+    counters = {}
+    for summary in summaries:
+        generations += summary.get("generations", 1)
+        for name, total in summary["spans"].items():
+            merged = spans.setdefault(name, {"count": 0, "seconds": 0.0})
+            merged["count"] += total["count"]
+            merged["seconds"] += total["seconds"]
+        for counter in summary["counters"]:
+            key = (counter["name"], tuple(sorted(counter["labels"].items())))
+            counters[key] = counters.get(key, 0) + counter["value"]
+    return {
+        "generations": generations,
+        "spans": spans,
+        "counters": [{"name": name, "labels": dict(labels), "value": value} for (name, labels), value in counters.items()],
+    }
+
+
+def formatLabels(labels: Dict[str, object]) -> str:
+    """Format labels as Prometheus does."""
+    if not labels:
+        return ""
+    values = [(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for name, value in sorted(labels.items())]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in values) + "}"
+
+
+def formatPrometheus(totals: dict) -> str:
+    """Format totals made by mergeSummaries as Prometheus text."""
+    lines = [
+        f"# TYPE {PROMETHEUS_PREFIX}generations_total counter",
+        f"{PROMETHEUS_PREFIX}generations_total {totals['generations']}",
+        f"# TYPE {PROMETHEUS_PREFIX}span_seconds_total counter",
+    ]
+    for name, total in sorted(totals["spans"].items()):
+        lines.append(f"{PROMETHEUS_PREFIX}span_seconds_total{formatLabels({'span': name})} {total['seconds']}")
+    lines.append(f"# TYPE {PROMETHEUS_PREFIX}span_count_total counter")
+    for name, total in sorted(totals["spans"].items()):
+        lines.append(f"{PROMETHEUS_PREFIX}span_count_total{formatLabels({'span': name})} {total['count']}")
+    counters = {}
+    for counter in totals["counters"]:
+        counters.setdefault(counter["name"], []).append(counter)
+    for name, values in sorted(counters.items()):
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}{name}_total counter")
+        for counter in sorted(values, key=lambda counter: sorted(counter["labels"].items())):
+            lines.append(f"{PROMETHEUS_PREFIX}{name}_total{formatLabels(counter['labels'])} {counter['value']}")
+    return "\n".join(lines) + "\n"
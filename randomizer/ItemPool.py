@@ -1,7 +1,6 @@
 """Contains functions related to setting up the pool of shuffled items."""
 
 import itertools
-import random
 
 from randomizer.Enums.Events import Events
 import randomizer.Enums.Kongs as KongObject
@@ -15,6 +14,7 @@ from randomizer.Lists.Item import ItemFromKong
 from randomizer.Lists.LevelInfo import LevelInfoList
 from randomizer.Lists.ShufflableExit import ShufflableExits
 from randomizer.Patching.Lib import IsItemSelected, getIceTrapCount
+from randomizer.RandomStreams import fill_random
 
 
 def getHelmKey(settings) -> Items:
@@ -91,7 +91,7 @@ def PlaceConstants(spoiler):
                     for loc in spoiler.LocationList
                     if spoiler.LocationList[loc].level == last_level and spoiler.LocationList[loc].type in typesOfItemsShuffled and not spoiler.LocationList[loc].inaccessible
                 ]
-                selected_location = random.choice(potential_locations)
+                selected_location = fill_random.choice(potential_locations)
                 spoiler.LocationList[selected_location].PlaceItem(spoiler, Items.HideoutHelmKey)
     # If no CB rando in isles, clear these locations
     if settings.cb_rando != CBRando.on_with_isles:
@@ -134,10 +134,10 @@ def PlaceConstants(spoiler):
         blueprints_planned = []
         for location_id, plando_item in settings.plandomizer_dict["locations"].items():
             if plando_item in [PlandoItems.DonkeyBlueprint, PlandoItems.DiddyBlueprint, PlandoItems.LankyBlueprint, PlandoItems.TinyBlueprint, PlandoItems.ChunkyBlueprint]:
-                item = random.choice([x for x in GetItemsFromPlandoItem(plando_item) if x not in blueprints_planned])
+                item = fill_random.choice([x for x in GetItemsFromPlandoItem(plando_item) if x not in blueprints_planned])
                 blueprints_planned.append(item)
             else:
-                item = random.choice(GetItemsFromPlandoItem(plando_item))
+                item = fill_random.choice(GetItemsFromPlandoItem(plando_item))
             spoiler.LocationList[int(location_id)].PlaceItem(spoiler, item)
             settings.plandomizer_items_placed.append(item)
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from enum import IntEnum
 from typing import TYPE_CHECKING, Any, List, Union
 
@@ -11,6 +10,7 @@ from randomizer.Enums.EnemySubtypes import EnemySubtype
 from randomizer.Enums.Enemies import Enemies
 from randomizer.Enums.Kongs import Kongs
 from randomizer.Enums.Maps import Maps
+from randomizer.RandomStreams import enemy_random
 
 ENEMY_REPLACEMENT_PRIORITY = {
     EnemySubtype.GroundSimple: [EnemySubtype.GroundBeefy, EnemySubtype.Water, EnemySubtype.Air],
@@ -134,10 +134,10 @@ class EnemyLoc:
                 if len(permitted) == 0:
                     permitted = [enemy for enemy in self.allowed_enemies[x] if (enemy in enabled_enemies or len(enabled_enemies) == 0) and EnemyMetaData[enemy].selector_enabled]
             if len(permitted) > 0:
-                self.enemy = random.choice(permitted)
+                self.enemy = enemy_random.choice(permitted)
             if enable_speed and self.enemy in EnemyMetaData:
                 enemy_data = EnemyMetaData[self.enemy]
-                self.aggro_speed = random.randint(enemy_data.min_speed, enemy_data.max_speed)
+                self.aggro_speed = enemy_random.randint(enemy_data.min_speed, enemy_data.max_speed)
         return self.enemy
 
     def canKill(self, logic_variable) -> bool:
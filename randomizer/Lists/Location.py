@@ -1,5 +1,6 @@
 # fmt: off
 """Stores the Location class and a list of each location in the game."""
+from copy import copy
 
 from randomizer.Enums.Items import Items
 from randomizer.Enums.Kongs import Kongs
@@ -85,6 +86,22 @@ class Location:
         if self.default_mapid_data is not None and len(self.default_mapid_data) > 0 and type(self.default_mapid_data[0]) is MapIDCombo and self.default_mapid_data[0].id == -1 and self.type != Types.Kong:
             self.is_reward = True
 
+    def Copy(self):
+        """Get a copy of this location for a new world.
+
+        The map data is the copy's own, since shufflers move the locations of a seed to other maps.
+        """
+        location = copy(self)
+        if self.map_id_list is not None:
+            location.map_id_list = [copy(map_id) for map_id in self.map_id_list]
+        if self.default_mapid_data is self.map_id_list:
+            location.default_mapid_data = location.map_id_list
+        elif self.default_mapid_data is not None:
+            location.default_mapid_data = [copy(map_id) for map_id in self.default_mapid_data]
+        if self.placement_index is not None:
+            location.placement_index = self.placement_index.copy()
+        return location
+
     def PlaceItem(self, spoiler, item):
         """Place item at this location."""
         self.item = item
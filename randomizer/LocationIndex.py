@@ -0,0 +1,93 @@
+"""Index of where items and locations are in a filled world, for the code reading it after the fill.
+
+Hints and patching ask for the locations holding an item, of a type or in a level, and for the region of a location,
+many times over. The index is built once the world is filled, so each question is answered without scanning every
+location again. It must be rebuilt if items are moved afterwards.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from randomizer.Enums.Levels import Levels
+from randomizer.Enums.Regions import Regions
+from randomizer.Enums.Types import Types
+
+if TYPE_CHECKING:
+    from randomizer.Enums.Items import Items
+    from randomizer.Enums.Locations import Locations
+    from randomizer.Spoiler import Spoiler
+
+
+class LocationIndex:
+    """Locations of a filled world by the item they hold, their type and their level, and the region of each location.
+
+    Every list of locations is in the order of the location list, so code using the index finds locations in the
+    same order as it would looping over the location list.
+    """
+
+    def __init__(self, spoiler: Spoiler) -> None:
+        """Index the locations of a world as they are now."""
+        # Position of each location in the location list, to merge lists in that order
+        self.order: Dict[Locations, int] = {}
+        self.itemLocations: Dict[Items, List[Locations]] = {}
+        self.typeLocations: Dict[Types, List[Locations]] = {}
+        self.levelLocations: Dict[Levels, List[Locations]] = {}
+        for location_id, location in spoiler.LocationList.items():
+            self.order[location_id] = len(self.order)
+            self.itemLocations.setdefault(location.item, []).append(location_id)
+            self.typeLocations.setdefault(location.type, []).append(location_id)
+            self.levelLocations.setdefault(location.level, []).append(location_id)
+        self.regionOfLocation = self.getRegionsOfLocations(spoiler)
+
+    @staticmethod
+    def getRegionsOfLocations(spoiler: Spoiler) -> Dict[Locations, Regions]:
+        """Find the region each location belongs to, the first region listing it in its level, with shops tied to the shop regions first."""
+        regionOfLocation = {}
+        for region_id, region in spoiler.RegionList.items():
+            if region.level == Levels.Shops:
+                for location_logic in region.locations:
+                    location = spoiler.LocationList.get(location_logic.id)
+                    if location is not None and location.type == Types.Shop and not location_logic.isAuxiliaryLocation:
+                        regionOfLocation.setdefault(location_logic.id, region_id)
+        for region_id in Regions:
+            region = spoiler.RegionList.get(region_id)
+            if region is None:
+                continue
+            for location_logic in region.locations:
+                location = spoiler.LocationList.get(location_logic.id)
+                if location is not None and not location_logic.isAuxiliaryLocation and (region.level == location.level or location.type == Types.Hint):
+                    regionOfLocation.setdefault(location_logic.id, region_id)
+        return regionOfLocation
+
+    def merge(self, lists: Iterable[List[Locations]]) -> List[Locations]:
+        """Merge lists of locations into one list in the order of the location list."""
+        lists = [locations for locations in lists if len(locations) > 0]
+        if len(lists) == 1:
+            return list(lists[0])
+        return sorted({location_id for locations in lists for location_id in locations}, key=self.order.__getitem__)
+
+    def getLocationsWithItem(self, item: Items) -> List[Locations]:
+        """Get the locations holding an item."""
+        return list(self.itemLocations.get(item, []))
+
+    def getLocationsWithItems(self, items: Iterable[Items]) -> List[Locations]:
+        """Get the locations holding any of some items."""
+        return self.merge(self.itemLocations.get(item, []) for item in set(items))
+
+    def getLocationWithItem(self, items: Iterable[Items]) -> Locations:
+        """Get the first location holding any of some items, or None if none of them are placed."""
+        locations = self.getLocationsWithItems(items)
+        return locations[0] if len(locations) > 0 else None
+
+    def getLocationsOfType(self, type: Types) -> List[Locations]:
+        """Get the locations of a type."""
+        return list(self.typeLocations.get(type, []))
+
+    def getLocationsInLevel(self, level: Levels) -> List[Locations]:
+        """Get the locations in a level."""
+        return list(self.levelLocations.get(level, []))
+
+    def getRegionOfLocation(self, location_id: Locations) -> Regions:
+        """Get the region a location belongs to, or None if no region has it."""
+        return self.regionOfLocation.get(location_id)
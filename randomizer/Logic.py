@@ -60,6 +60,64 @@ from randomizer.Patching.Lib import IsItemSelected
 from randomizer.Prices import AnyKongCanBuy, CanBuy, GetPriceAtLocation
 
 STARTING_SLAM = 0  # Currently we're assuming you always start with 1 slam
+ITEM_COUNT = max(Items) + 1
+# Groups of flags Update works out from owned items, as bits, so only the groups of newly owned items are worked out again
+KONG_FLAGS = 1 << 0
+TRAINING_FLAGS = 1 << 1
+MISC_FLAGS = 1 << 2
+# The moves of each kong, which are only owned once the kong is
+KONG_MOVE_FLAGS = (1 << 3, 1 << 4, 1 << 5, 1 << 6, 1 << 7)
+ALL_FLAGS = (1 << 8) - 1
+# Flags each item affects, indexed by item
+ITEM_FLAGS = [0] * ITEM_COUNT
+for item, kong in ((Items.Donkey, Kongs.donkey), (Items.Diddy, Kongs.diddy), (Items.Lanky, Kongs.lanky), (Items.Tiny, Kongs.tiny), (Items.Chunky, Kongs.chunky)):
+    ITEM_FLAGS[item] = KONG_FLAGS | KONG_MOVE_FLAGS[kong]
+for item in (Items.Climbing, Items.Vines, Items.Swim, Items.Oranges, Items.Barrels):
+    ITEM_FLAGS[item] = TRAINING_FLAGS
+for kong, items in (
+    (Kongs.donkey, (Items.ProgressiveDonkeyPotion, Items.BaboonBlast, Items.StrongKong, Items.GorillaGrab, Items.Coconut, Items.Bongos)),
+    (Kongs.diddy, (Items.ProgressiveDiddyPotion, Items.ChimpyCharge, Items.RocketbarrelBoost, Items.SimianSpring, Items.Peanut, Items.Guitar)),
+    (Kongs.lanky, (Items.ProgressiveLankyPotion, Items.Orangstand, Items.BaboonBalloon, Items.OrangstandSprint, Items.Grape, Items.Trombone)),
+    (Kongs.tiny, (Items.ProgressiveTinyPotion, Items.MiniMonkey, Items.PonyTailTwirl, Items.Monkeyport, Items.Feather, Items.Saxophone)),
+    (Kongs.chunky, (Items.ProgressiveChunkyPotion, Items.HunkyChunky, Items.PrimatePunch, Items.GorillaGone, Items.Pineapple, Items.Triangle)),
+):
+    for item in items:
+        ITEM_FLAGS[item] = KONG_MOVE_FLAGS[kong]
+for item in (
+    Items.TestItem,
+    Items.Cranky,
+    Items.Funky,
+    Items.Candy,
+    Items.Snide,
+    Items.NintendoCoin,
+    Items.RarewareCoin,
+    Items.JungleJapesKey,
+    Items.AngryAztecKey,
+    Items.FranticFactoryKey,
+    Items.GloomyGalleonKey,
+    Items.FungiForestKey,
+    Items.CrystalCavesKey,
+    Items.CreepyCastleKey,
+    Items.HideoutHelmKey,
+    Items.HelmDonkey1,
+    Items.HelmDonkey2,
+    Items.HelmDiddy1,
+    Items.HelmDiddy2,
+    Items.HelmLanky1,
+    Items.HelmLanky2,
+    Items.HelmTiny1,
+    Items.HelmTiny2,
+    Items.HelmChunky1,
+    Items.HelmChunky2,
+    Items.CameraAndShockwave,
+    Items.Camera,
+    Items.Shockwave,
+    Items.SniperSight,
+    Items.BananaHoard,
+):
+    ITEM_FLAGS[item] = MISC_FLAGS
+# Kongs owned for every set of bits of owned kongs
+OWNED_KONGS = [[kong for kong in (Kongs.donkey, Kongs.diddy, Kongs.lanky, Kongs.tiny, Kongs.chunky) if bits & (1 << kong)] for bits in range(1 << 5)]
 
 
 def IsGlitchEnabled(settings, glitch_enum):
@@ -121,6 +179,7 @@ class LogicVarHolder:
         self.lanky = Kongs.lanky in self.settings.starting_kong_list
         self.tiny = Kongs.tiny in self.settings.starting_kong_list
         self.chunky = Kongs.chunky in self.settings.starting_kong_list
+        self.UpdateKongBits()
 
         # Right now assuming start with training barrels
         self.vines = self.settings.training_barrels == TrainingBarrels.normal
@@ -216,7 +275,14 @@ class LogicVarHolder:
         self.superSlam = False
         self.superDuperSlam = False
 
-        self.Blueprints = []
+        # Owned item counts indexed by item, kept up to date by Update
+        self.OwnedItemCounts = [0] * ITEM_COUNT
+        # The list of owned items Update counted last and how many of its items were counted
+        self.countedOwnedItems = None
+        self.countedLength = 0
+        self.countedBannedItems = []
+
+        self.Blueprints = set()
 
         self.Events = []
 
@@ -291,8 +357,34 @@ class LogicVarHolder:
 
         self.bananaHoard = False
 
+        # Number of times a kong was found too poor to buy something - if this is 0, the order of purchases in a search didn't matter
+        self.failedPriceChecks = 0
+
         self.UpdateKongs()
 
+    def Snapshot(self):
+        """Capture the current logic variables so a search can later be resumed from this point.
+
+        The snapshot isn't tied to the list of owned items counted, so unless it's given one that holds the counted items, the next update after it's restored counts every item.
+        """
+        state = self.__dict__.copy()
+        state["countedOwnedItems"] = None
+        for key, value in state.items():
+            if isinstance(value, list):
+                state[key] = [x.copy() if isinstance(x, list) else x for x in value]
+            elif isinstance(value, set):
+                state[key] = value.copy()
+        return state
+
+    def Restore(self, state):
+        """Restore logic variables captured by Snapshot, leaving the snapshot itself untouched."""
+        for key, value in state.items():
+            if isinstance(value, list):
+                value = [x.copy() if isinstance(x, list) else x for x in value]
+            elif isinstance(value, set):
+                value = value.copy()
+            self.__dict__[key] = value
+
     def isPriorHelmComplete(self, kong: Kongs):
         """Determine if there is access to the kong's helm room."""
         if self.settings.helm_setting == HelmSetting.skip_all or Events.HelmFinished in self.Events:
@@ -314,133 +406,185 @@ class LogicVarHolder:
             self.Coins[x] = (self.RegularCoins[x] + (5 * self.RainbowCoins)) - self.SpentCoins[x]
 
     def Update(self, ownedItems):
-        """Update logic variables based on owned items."""
-        # Except for banned items - these items aren't allowed to be used by the logic
-        ownedItems = [item for item in ownedItems if item not in self.banned_items]
-
-        self.latest_owned_items = ownedItems
-        self.found_test_item = self.found_test_item or Items.TestItem in ownedItems
-
-        self.donkey = self.donkey or Items.Donkey in ownedItems or self.startkong == Kongs.donkey
-        self.diddy = self.diddy or Items.Diddy in ownedItems or self.startkong == Kongs.diddy
-        self.lanky = self.lanky or Items.Lanky in ownedItems or self.startkong == Kongs.lanky
-        self.tiny = self.tiny or Items.Tiny in ownedItems or self.startkong == Kongs.tiny
-        self.chunky = self.chunky or Items.Chunky in ownedItems or self.startkong == Kongs.chunky
-
-        self.climbing = self.climbing or Items.Climbing in ownedItems
-        self.vines = self.vines or Items.Vines in ownedItems
-        self.swim = self.swim or Items.Swim in ownedItems
-        self.oranges = self.oranges or Items.Oranges in ownedItems
-        self.barrels = self.barrels or Items.Barrels in ownedItems
-        self.can_use_vines = self.vines  # and self.climbing to restore old behavior
+        """Update logic variables based on owned items.
 
-        self.progDonkey = sum(1 for x in ownedItems if x == Items.ProgressiveDonkeyPotion)
-        self.blast = self.blast or (Items.BaboonBlast in ownedItems or self.progDonkey >= 1) and self.donkey
-        self.strongKong = self.strongKong or (Items.StrongKong in ownedItems or self.progDonkey >= 2) and self.donkey
-        self.grab = self.grab or (Items.GorillaGrab in ownedItems or self.progDonkey >= 3) and self.donkey
-
-        self.progDiddy = sum(1 for x in ownedItems if x == Items.ProgressiveDiddyPotion)
-        self.charge = self.charge or (Items.ChimpyCharge in ownedItems or self.progDiddy >= 1) and self.diddy
-        self.jetpack = self.jetpack or (Items.RocketbarrelBoost in ownedItems or self.progDiddy >= 2) and self.diddy
-        self.spring = self.spring or (Items.SimianSpring in ownedItems or self.progDiddy >= 3) and self.diddy
-
-        self.progLanky = sum(1 for x in ownedItems if x == Items.ProgressiveLankyPotion)
-        self.handstand = self.handstand or (Items.Orangstand in ownedItems or self.progLanky >= 1) and self.lanky
-        self.balloon = self.balloon or (Items.BaboonBalloon in ownedItems or self.progLanky >= 2) and self.lanky
-        self.sprint = self.sprint or (Items.OrangstandSprint in ownedItems or self.progLanky >= 3) and self.lanky
-
-        self.progTiny = sum(1 for x in ownedItems if x == Items.ProgressiveTinyPotion)
-        self.mini = self.mini or (Items.MiniMonkey in ownedItems or self.progTiny >= 1) and self.tiny
-        self.twirl = self.twirl or (Items.PonyTailTwirl in ownedItems or self.progTiny >= 2) and self.tiny
-        self.monkeyport = self.monkeyport or (Items.Monkeyport in ownedItems or self.progTiny >= 3) and self.tiny
-
-        self.progChunky = sum(1 for x in ownedItems if x == Items.ProgressiveChunkyPotion)
-        self.hunkyChunky = self.hunkyChunky or (Items.HunkyChunky in ownedItems or self.progChunky >= 1) and self.chunky
-        self.punch = self.punch or (Items.PrimatePunch in ownedItems or self.progChunky >= 2) and self.chunky
-        self.gorillaGone = self.gorillaGone or (Items.GorillaGone in ownedItems or self.progChunky >= 3) and self.chunky
-
-        self.coconut = self.coconut or Items.Coconut in ownedItems and self.donkey
-        self.peanut = self.peanut or Items.Peanut in ownedItems and self.diddy
-        self.grape = self.grape or Items.Grape in ownedItems and self.lanky
-        self.feather = self.feather or Items.Feather in ownedItems and self.tiny
-        self.pineapple = self.pineapple or Items.Pineapple in ownedItems and self.chunky
-
-        self.bongos = self.bongos or Items.Bongos in ownedItems and self.donkey
-        self.guitar = self.guitar or Items.Guitar in ownedItems and self.diddy
-        self.trombone = self.trombone or Items.Trombone in ownedItems and self.lanky
-        self.saxophone = self.saxophone or Items.Saxophone in ownedItems and self.tiny
-        self.triangle = self.triangle or Items.Triangle in ownedItems and self.chunky
-
-        self.crankyAccess = self.crankyAccess or Items.Cranky in ownedItems
-        self.funkyAccess = self.funkyAccess or Items.Funky in ownedItems
-        self.candyAccess = self.candyAccess or Items.Candy in ownedItems
-        self.snideAccess = self.snideAccess or Items.Snide in ownedItems
-
-        self.nintendoCoin = self.nintendoCoin or Items.NintendoCoin in ownedItems
-        self.rarewareCoin = self.rarewareCoin or Items.RarewareCoin in ownedItems
-
-        self.JapesKey = self.JapesKey or Items.JungleJapesKey in ownedItems
-        self.AztecKey = self.AztecKey or Items.AngryAztecKey in ownedItems
-        self.FactoryKey = self.FactoryKey or Items.FranticFactoryKey in ownedItems
-        self.GalleonKey = self.GalleonKey or Items.GloomyGalleonKey in ownedItems
-        self.ForestKey = self.ForestKey or Items.FungiForestKey in ownedItems
-        self.CavesKey = self.CavesKey or Items.CrystalCavesKey in ownedItems
-        self.CastleKey = self.CastleKey or Items.CreepyCastleKey in ownedItems
-        self.HelmKey = self.HelmKey or Items.HideoutHelmKey in ownedItems
-
-        self.HelmDonkey1 = self.HelmDonkey1 or Items.HelmDonkey1 in ownedItems
-        self.HelmDonkey2 = self.HelmDonkey2 or Items.HelmDonkey2 in ownedItems
-        self.HelmDiddy1 = self.HelmDiddy1 or Items.HelmDiddy1 in ownedItems
-        self.HelmDiddy2 = self.HelmDiddy2 or Items.HelmDiddy2 in ownedItems
-        self.HelmLanky1 = self.HelmLanky1 or Items.HelmLanky1 in ownedItems
-        self.HelmLanky2 = self.HelmLanky2 or Items.HelmLanky2 in ownedItems
-        self.HelmTiny1 = self.HelmTiny1 or Items.HelmTiny1 in ownedItems
-        self.HelmTiny2 = self.HelmTiny2 or Items.HelmTiny2 in ownedItems
-        self.HelmChunky1 = self.HelmChunky1 or Items.HelmChunky1 in ownedItems
-        self.HelmChunky2 = self.HelmChunky2 or Items.HelmChunky2 in ownedItems
+        Searches only ever add to the list of owned items they pass, so when given the same list as last time only the items added to it since are counted,
+        and only the flags those items affect are worked out again. A list that had items removed or replaced has to be passed as a new list.
+        """
+        if ownedItems is self.countedOwnedItems and len(ownedItems) >= self.countedLength and self.banned_items == self.countedBannedItems:
+            newItems = ownedItems[self.countedLength :]
+            flags = 0
+        else:
+            # Any other list (or a change in banned items) means counting everything from scratch
+            newItems = ownedItems
+            flags = ALL_FLAGS
+            self.OwnedItemCounts = [0] * ITEM_COUNT
+            self.latest_owned_items = []
+            self.Blueprints = set()
+            self.Hints = []
+            self.countedBannedItems = self.banned_items.copy()
+        self.countedOwnedItems = ownedItems
+        self.countedLength = len(ownedItems)
+
+        owned = self.OwnedItemCounts
+        for item in newItems:
+            # Except for banned items - these items aren't allowed to be used by the logic
+            if item in self.banned_items:
+                continue
+            owned[item] += 1
+            flags |= ITEM_FLAGS[item]
+            self.latest_owned_items.append(item)
+            if item >= Items.JungleJapesDonkeyBlueprint and item <= Items.DKIslesChunkyBlueprint:
+                self.Blueprints.add(item)
+            elif item >= Items.JapesDonkeyHint and item <= Items.CastleChunkyHint:
+                self.Hints.append(item)
+
+        if flags & KONG_FLAGS:
+            self.UpdateKongFlags()
+        if flags & TRAINING_FLAGS:
+            self.UpdateTrainingFlags()
+        for kong in (Kongs.donkey, Kongs.diddy, Kongs.lanky, Kongs.tiny, Kongs.chunky):
+            if flags & KONG_MOVE_FLAGS[kong]:
+                self.UpdateKongMoveFlags(kong)
+        if flags & MISC_FLAGS:
+            self.UpdateMiscFlags()
 
         has_all = True
         if not self.settings.fast_start_beginning_of_game:
             for loc in (Locations.IslesSwimTrainingBarrel, Locations.IslesVinesTrainingBarrel, Locations.IslesBarrelsTrainingBarrel, Locations.IslesOrangesTrainingBarrel):
-                if self.spoiler.LocationList[loc].item not in ownedItems:
+                item = self.spoiler.LocationList[loc].item
+                if item is None or owned[item] == 0:
                     has_all = False
         self.allTrainingChecks = self.allTrainingChecks or has_all
 
-        self.Slam = sum(1 for x in ownedItems if x == Items.ProgressiveSlam) + STARTING_SLAM
+        self.Slam = owned[Items.ProgressiveSlam] + STARTING_SLAM
         if Items.ProgressiveSlam in self.banned_items:  # If slam is banned, prevent logic from owning a better slam
             self.Slam = STARTING_SLAM
-        self.AmmoBelts = sum(1 for x in ownedItems if x == Items.ProgressiveAmmoBelt)
-        self.InstUpgrades = sum(1 for x in ownedItems if x == Items.ProgressiveInstrumentUpgrade)
+        self.AmmoBelts = owned[Items.ProgressiveAmmoBelt]
+        self.InstUpgrades = owned[Items.ProgressiveInstrumentUpgrade]
         self.Melons = 1
         if self.bongos or self.guitar or self.trombone or self.saxophone or self.triangle or self.InstUpgrades > 0:
             self.Melons = 2
         if self.InstUpgrades >= 2:
             self.Melons = 3
 
-        self.GoldenBananas = sum(1 for x in ownedItems if x == Items.GoldenBanana)
-        self.BananaFairies = sum(1 for x in ownedItems if x == Items.BananaFairy)
-        self.BananaMedals = sum(1 for x in ownedItems if x == Items.BananaMedal)
-        self.BattleCrowns = sum(1 for x in ownedItems if x == Items.BattleCrown)
-        self.RainbowCoins = sum(1 for x in ownedItems if x == Items.RainbowCoin)
+        self.GoldenBananas = owned[Items.GoldenBanana]
+        self.BananaFairies = owned[Items.BananaFairy]
+        self.BananaMedals = owned[Items.BananaMedal]
+        self.BattleCrowns = owned[Items.BattleCrown]
+        self.RainbowCoins = owned[Items.RainbowCoin]
 
-        self.camera = self.camera or Items.CameraAndShockwave in ownedItems or Items.Camera in ownedItems
-        self.shockwave = self.shockwave or Items.CameraAndShockwave in ownedItems or Items.Shockwave in ownedItems
-
-        self.scope = self.scope or Items.SniperSight in ownedItems
         # Having the homing ammo ability also requires having reliable access to homing ammo. This is not a perfect fix, but should cover 99.9% of cases and won't show up in hint paths.
-        self.homing = self.homing or (Items.HomingAmmo in ownedItems and (Events.ForestEntered in self.Events or Events.CastleEntered in self.Events or self.assumeFillSuccess))
+        self.homing = self.homing or (owned[Items.HomingAmmo] > 0 and (Events.ForestEntered in self.Events or Events.CastleEntered in self.Events or self.assumeFillSuccess))
 
         self.superSlam = self.Slam >= 2
         self.superDuperSlam = self.Slam >= 3
 
-        self.Blueprints = [x for x in ownedItems if x >= Items.JungleJapesDonkeyBlueprint and x <= Items.DKIslesChunkyBlueprint]
-        self.Hints = [x for x in ownedItems if x >= Items.JapesDonkeyHint and x <= Items.CastleChunkyHint]
-        self.Beans = sum(1 for x in ownedItems if x == Items.Bean)
-        self.Pearls = sum(1 for x in ownedItems if x == Items.Pearl)
+        self.Beans = owned[Items.Bean]
+        self.Pearls = owned[Items.Pearl]
 
         self.UpdateCoins()
 
-        self.bananaHoard = self.bananaHoard or Items.BananaHoard in ownedItems
+    def UpdateKongBits(self):
+        """Set the bits of the kongs owned from the kong flags."""
+        self.KongBits = self.donkey | self.diddy << 1 | self.lanky << 2 | self.tiny << 3 | self.chunky << 4
+
+    def UpdateKongFlags(self):
+        """Update which kongs are owned."""
+        owned = self.OwnedItemCounts
+        self.donkey = self.donkey or owned[Items.Donkey] > 0 or self.startkong == Kongs.donkey
+        self.diddy = self.diddy or owned[Items.Diddy] > 0 or self.startkong == Kongs.diddy
+        self.lanky = self.lanky or owned[Items.Lanky] > 0 or self.startkong == Kongs.lanky
+        self.tiny = self.tiny or owned[Items.Tiny] > 0 or self.startkong == Kongs.tiny
+        self.chunky = self.chunky or owned[Items.Chunky] > 0 or self.startkong == Kongs.chunky
+        self.UpdateKongBits()
+
+    def UpdateTrainingFlags(self):
+        """Update which training moves are owned."""
+        owned = self.OwnedItemCounts
+        self.climbing = self.climbing or owned[Items.Climbing] > 0
+        self.vines = self.vines or owned[Items.Vines] > 0
+        self.swim = self.swim or owned[Items.Swim] > 0
+        self.oranges = self.oranges or owned[Items.Oranges] > 0
+        self.barrels = self.barrels or owned[Items.Barrels] > 0
+        self.can_use_vines = self.vines  # and self.climbing to restore old behavior
+
+    def UpdateKongMoveFlags(self, kong: Kongs):
+        """Update which moves of a kong are owned."""
+        owned = self.OwnedItemCounts
+        if kong == Kongs.donkey:
+            self.progDonkey = owned[Items.ProgressiveDonkeyPotion]
+            self.blast = self.blast or (owned[Items.BaboonBlast] > 0 or self.progDonkey >= 1) and self.donkey
+            self.strongKong = self.strongKong or (owned[Items.StrongKong] > 0 or self.progDonkey >= 2) and self.donkey
+            self.grab = self.grab or (owned[Items.GorillaGrab] > 0 or self.progDonkey >= 3) and self.donkey
+            self.coconut = self.coconut or owned[Items.Coconut] > 0 and self.donkey
+            self.bongos = self.bongos or owned[Items.Bongos] > 0 and self.donkey
+        elif kong == Kongs.diddy:
+            self.progDiddy = owned[Items.ProgressiveDiddyPotion]
+            self.charge = self.charge or (owned[Items.ChimpyCharge] > 0 or self.progDiddy >= 1) and self.diddy
+            self.jetpack = self.jetpack or (owned[Items.RocketbarrelBoost] > 0 or self.progDiddy >= 2) and self.diddy
+            self.spring = self.spring or (owned[Items.SimianSpring] > 0 or self.progDiddy >= 3) and self.diddy
+            self.peanut = self.peanut or owned[Items.Peanut] > 0 and self.diddy
+            self.guitar = self.guitar or owned[Items.Guitar] > 0 and self.diddy
+        elif kong == Kongs.lanky:
+            self.progLanky = owned[Items.ProgressiveLankyPotion]
+            self.handstand = self.handstand or (owned[Items.Orangstand] > 0 or self.progLanky >= 1) and self.lanky
+            self.balloon = self.balloon or (owned[Items.BaboonBalloon] > 0 or self.progLanky >= 2) and self.lanky
+            self.sprint = self.sprint or (owned[Items.OrangstandSprint] > 0 or self.progLanky >= 3) and self.lanky
+            self.grape = self.grape or owned[Items.Grape] > 0 and self.lanky
+            self.trombone = self.trombone or owned[Items.Trombone] > 0 and self.lanky
+        elif kong == Kongs.tiny:
+            self.progTiny = owned[Items.ProgressiveTinyPotion]
+            self.mini = self.mini or (owned[Items.MiniMonkey] > 0 or self.progTiny >= 1) and self.tiny
+            self.twirl = self.twirl or (owned[Items.PonyTailTwirl] > 0 or self.progTiny >= 2) and self.tiny
+            self.monkeyport = self.monkeyport or (owned[Items.Monkeyport] > 0 or self.progTiny >= 3) and self.tiny
+            self.feather = self.feather or owned[Items.Feather] > 0 and self.tiny
+            self.saxophone = self.saxophone or owned[Items.Saxophone] > 0 and self.tiny
+        elif kong == Kongs.chunky:
+            self.progChunky = owned[Items.ProgressiveChunkyPotion]
+            self.hunkyChunky = self.hunkyChunky or (owned[Items.HunkyChunky] > 0 or self.progChunky >= 1) and self.chunky
+            self.punch = self.punch or (owned[Items.PrimatePunch] > 0 or self.progChunky >= 2) and self.chunky
+            self.gorillaGone = self.gorillaGone or (owned[Items.GorillaGone] > 0 or self.progChunky >= 3) and self.chunky
+            self.pineapple = self.pineapple or owned[Items.Pineapple] > 0 and self.chunky
+            self.triangle = self.triangle or owned[Items.Triangle] > 0 and self.chunky
+
+    def UpdateMiscFlags(self):
+        """Update which shopkeepers, keys, company coins, Helm doors and other single items are owned."""
+        owned = self.OwnedItemCounts
+        self.found_test_item = self.found_test_item or owned[Items.TestItem] > 0
+
+        self.crankyAccess = self.crankyAccess or owned[Items.Cranky] > 0
+        self.funkyAccess = self.funkyAccess or owned[Items.Funky] > 0
+        self.candyAccess = self.candyAccess or owned[Items.Candy] > 0
+        self.snideAccess = self.snideAccess or owned[Items.Snide] > 0
+
+        self.nintendoCoin = self.nintendoCoin or owned[Items.NintendoCoin] > 0
+        self.rarewareCoin = self.rarewareCoin or owned[Items.RarewareCoin] > 0
+
+        self.JapesKey = self.JapesKey or owned[Items.JungleJapesKey] > 0
+        self.AztecKey = self.AztecKey or owned[Items.AngryAztecKey] > 0
+        self.FactoryKey = self.FactoryKey or owned[Items.FranticFactoryKey] > 0
+        self.GalleonKey = self.GalleonKey or owned[Items.GloomyGalleonKey] > 0
+        self.ForestKey = self.ForestKey or owned[Items.FungiForestKey] > 0
+        self.CavesKey = self.CavesKey or owned[Items.CrystalCavesKey] > 0
+        self.CastleKey = self.CastleKey or owned[Items.CreepyCastleKey] > 0
+        self.HelmKey = self.HelmKey or owned[Items.HideoutHelmKey] > 0
+
+        self.HelmDonkey1 = self.HelmDonkey1 or owned[Items.HelmDonkey1] > 0
+        self.HelmDonkey2 = self.HelmDonkey2 or owned[Items.HelmDonkey2] > 0
+        self.HelmDiddy1 = self.HelmDiddy1 or owned[Items.HelmDiddy1] > 0
+        self.HelmDiddy2 = self.HelmDiddy2 or owned[Items.HelmDiddy2] > 0
+        self.HelmLanky1 = self.HelmLanky1 or owned[Items.HelmLanky1] > 0
+        self.HelmLanky2 = self.HelmLanky2 or owned[Items.HelmLanky2] > 0
+        self.HelmTiny1 = self.HelmTiny1 or owned[Items.HelmTiny1] > 0
+        self.HelmTiny2 = self.HelmTiny2 or owned[Items.HelmTiny2] > 0
+        self.HelmChunky1 = self.HelmChunky1 or owned[Items.HelmChunky1] > 0
+        self.HelmChunky2 = self.HelmChunky2 or owned[Items.HelmChunky2] > 0
+
+        self.camera = self.camera or owned[Items.CameraAndShockwave] > 0 or owned[Items.Camera] > 0
+        self.shockwave = self.shockwave or owned[Items.CameraAndShockwave] > 0 or owned[Items.Shockwave] > 0
+        self.scope = self.scope or owned[Items.SniperSight] > 0
+        self.bananaHoard = self.bananaHoard or owned[Items.BananaHoard] > 0
 
     def GetCoins(self, kong):
         """Get Coin Total for a kong."""
@@ -578,18 +722,7 @@ class LogicVarHolder:
 
     def GetKongs(self):
         """Return all owned kongs."""
-        ownedKongs = []
-        if self.donkey:
-            ownedKongs.append(Kongs.donkey)
-        if self.diddy:
-            ownedKongs.append(Kongs.diddy)
-        if self.lanky:
-            ownedKongs.append(Kongs.lanky)
-        if self.tiny:
-            ownedKongs.append(Kongs.tiny)
-        if self.chunky:
-            ownedKongs.append(Kongs.chunky)
-        return ownedKongs
+        return OWNED_KONGS[self.KongBits].copy()
 
     def UpdateKongs(self):
         """Set variables for current kong based on self.kong."""
@@ -854,9 +987,11 @@ class LogicVarHolder:
                 if self.HasGun(collectible.kong):
                     self.ColoredBananas[level][collectible.kong] += collectible.amount * 10
                     collectible.added = True
+                    self.spoiler.addedCollectibles.append(collectible)
                 missingGun = True
             if not missingGun:
                 collectible.added = True
+                self.spoiler.addedCollectibles.append(collectible)
 
     def PurchaseShopItem(self, location_id):
         """Purchase from this location and subtract price from logical coin counts."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from copy import copy
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
 
 from randomizer.Enums.Kongs import Kongs
@@ -78,6 +79,12 @@ class Collectible:
         self.name = name
         self.locked = locked
 
+    def Copy(self) -> Collectible:
+        """Get a copy of this collectible for a new world, not yet added."""
+        collectible = copy(self)
+        collectible.added = False
+        return collectible
+
 
 class Region:
     """Region contains shufflable locations, events, and transitions to other regions."""
@@ -127,6 +134,19 @@ class Region:
 
         self.ResetAccess()
 
+    def Copy(self) -> Region:
+        """Get a copy of this region for a new world.
+
+        The location, event and exit lists are the region's own, but the logic objects in them are shared with the original.
+        Anything that needs to change one of those objects has to replace it in the list instead.
+        """
+        region = copy(self)
+        region.locations = self.locations.copy()
+        region.events = self.events.copy()
+        region.exits = self.exits.copy()
+        region.ResetAccess()
+        return region
+
     def ResetAccess(self) -> None:
         """Clear access variables set during search."""
         # Time access
@@ -5,7 +5,6 @@ import base64
 import io
 import json
 import math
-import random
 import zipfile
 import time
 import string
@@ -24,6 +23,7 @@ from randomizer.Patching.ASMPatcher import patchAssemblyCosmetic
 from randomizer.Lists.Songs import getSongIndexFromName
 
 # from randomizer.Spoiler import Spoiler
+from randomizer.RandomStreams import cosmetic_random
 from randomizer.Settings import Settings, ExcludedSongs, DPadDisplays, KongModels
 from ui.GenSpoiler import GenerateSpoiler
 from ui.GenTracker import generateTracker
@@ -104,7 +104,8 @@ async def patching_response(data, from_patch_gen=False, lanky_from_history=False
 
     curr_time = Datetime.now(UTC)
     unix = time.mktime(curr_time.timetuple())
-    random.seed(int(unix))
+    # Cosmetics differ every time a patch is applied
+    settings.random.seed(int(unix))
     split_version = version.split(".")
     patch_major = split_version[0]
     patch_minor = split_version[1]
@@ -199,7 +200,7 @@ async def patching_response(data, from_patch_gen=False, lanky_from_history=False
             for x in range(0xED):
                 value = setting_size.get(settings.big_head_mode, 0x00)
                 if settings.big_head_mode == BigHeadMode.random:
-                    value = random.choice([0x00, 0x2F, 0x2F, 0xFF, 0xFF])  # Make abnormal head sizes more likely than a normal head size
+                    value = cosmetic_random.choice([0x00, 0x2F, 0x2F, 0xFF, 0xFF])  # Make abnormal head sizes more likely than a normal head size
                     # Check if model chosen is part of a tied model
                     push_name = True
                     if x == 0 or (x - 1) in HeadResizeImmune:
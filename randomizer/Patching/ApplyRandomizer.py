@@ -5,7 +5,6 @@ import os
 from datetime import datetime as Datetime
 from datetime import UTC
 import time
-from tempfile import mktemp
 
 from randomizer.Enums.Settings import (
     BananaportRando,
@@ -54,7 +53,8 @@ from randomizer.Patching.KongRando import apply_kongrando_cosmetic
 from randomizer.Patching.Lib import setItemReferenceName, addNewScript, IsItemSelected, getIceTrapCount
 from randomizer.Patching.MiscSetupChanges import randomize_setup, updateKrushaMoveNames, updateRandomSwitches, updateSwitchsanity
 from randomizer.Patching.MoveLocationRando import place_pregiven_moves, randomize_moves, parseMoveBlock
-from randomizer.Patching.Patcher import LocalROM
+from randomizer.Patching.PatchDelta import createRomPatch
+from randomizer.Patching.Patcher import LocalROM, dirty_ranges
 from randomizer.Patching.PhaseRando import randomize_helm, randomize_krool
 from randomizer.Patching.PriceRando import randomize_prices
 from randomizer.Patching.PuzzleRando import randomize_puzzles, shortenCastleMinecart
@@ -648,6 +648,9 @@ def patching_response(spoiler):
 
         patchAssembly(ROM_COPY, spoiler)
 
+    # Write back every file changed during patching before anything reads the final ROM
+    ROM_COPY.flushFiles()
+
     # Apply Hash
     order = 0
     for count in spoiler.settings.seed_hash:
@@ -658,21 +661,8 @@ def patching_response(spoiler):
     # Create a dummy time to attach to the end of the file name non decimal
     str(time.time()).replace(".", "")
     if "PYTEST_CURRENT_TEST" not in os.environ:
-        created_tempfile = mktemp()
-        delta_tempfile = mktemp()
-        # Write the LocalROM.rom bytesIo to a file
-        with open(created_tempfile, "wb") as f:
-            f.write(ROM_COPY.rom.getvalue())
-
-        import pyxdelta
-
-        pyxdelta.run("dk64.z64", created_tempfile, delta_tempfile)
-        # Read the patch file
-        with open(delta_tempfile, "rb") as f:
-            patch = f.read()
-        # Delete the patch.z64 file
-        os.remove(created_tempfile)
-        os.remove(delta_tempfile)
+        # Only the ranges written during patching differ from the base ROM, so build the patch from those
+        patch = createRomPatch(ROM_COPY.getValue(), dirty_ranges)
     else:
         patch = None
     return patch
@@ -1,6 +1,7 @@
 """Apply CB Rando changes."""
 
-import js
+import struct
+
 import randomizer.Lists.CBLocations.AngryAztecCBLocations
 import randomizer.Lists.CBLocations.CreepyCastleCBLocations
 import randomizer.Lists.CBLocations.CrystalCavesCBLocations
@@ -11,7 +12,8 @@ import randomizer.Lists.CBLocations.JungleJapesCBLocations
 import randomizer.Lists.CBLocations.DKIslesCBLocations
 from randomizer.Enums.Levels import Levels
 from randomizer.Enums.Settings import CBRando
-from randomizer.Patching.Lib import float_to_hex, short_to_ushort
+from randomizer.Patching.Lib import TableNames, float_to_hex, short_to_ushort
+from randomizer.Patching.LibSetup import ActorRecord, ModelTwoRecord, readPadded, readSetupFile, readUnsigned, writeSetupFile
 from randomizer.Patching.Patcher import LocalROM
 
 level_data = {
@@ -65,78 +67,31 @@ def randomize_cbs(spoiler):
             # SETUP
             modeltwo_cbs = [0xA, 0xD, 0x16, 0x1E, 0x1F, 0x2B, 0x205, 0x206, 0x207, 0x208]
             actor_cbs = [91, 111, 112, 113, 114]
-            setup_table = js.pointer_addresses[9]["entries"][cont_map_id]["pointing_to"]
-            ROM_COPY.seek(setup_table)
-            model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
+            setup = readSetupFile(ROM_COPY, cont_map_id)
             # Model Two CBs
-            persisted_m2_data = []
-            used_m2_ids = []
-            for item in range(model2_count):
-                item_start = setup_table + 4 + (item * 0x30)
-                ROM_COPY.seek(item_start + 0x28)
-                item_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                if item_type not in modeltwo_cbs:  # Not CB
-                    ROM_COPY.seek(item_start + 0x2A)
-                    used_m2_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    ROM_COPY.seek(item_start)
-                    item_data = []
-                    for x in range(int(0x30 / 4)):
-                        item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                    persisted_m2_data.append(item_data)
-            ROM_COPY.seek(setup_table + 4 + (0x30 * model2_count))
-            mystery_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            # Mystery
-            persisted_mys_data = []
-            for item in range(mystery_count):
-                ROM_COPY.seek(setup_table + 4 + (model2_count * 0x30) + 4 + (item * 0x24))
-                item_data = []
-                for x in range(int(0x24 / 4)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                persisted_mys_data.append(item_data)
-            actor_block = setup_table + 4 + (0x30 * model2_count) + 4 + (0x24 * mystery_count)
-            ROM_COPY.seek(actor_block)
-            actor_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
+            setup.model_two = [item for item in setup.model_two if item.type not in modeltwo_cbs]
+            used_m2_ids = setup.getModelTwoIds()
             # Actors
-            persisted_act_data = []
-            used_actor_ids = []
             remove_paths = []
-            for item in range(actor_count):
-                actor_start = actor_block + 4 + (item * 0x38)
-                ROM_COPY.seek(actor_start + 0x32)
-                actor_type = int.from_bytes(ROM_COPY.readBytes(2), "big") + 0x10
-                if actor_type not in actor_cbs:
-                    ROM_COPY.seek(actor_start + 0x34)
-                    used_actor_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    ROM_COPY.seek(actor_start)
-                    item_data = []
-                    for x in range(int(0x38 / 4)):
-                        item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                    persisted_act_data.append(item_data)
-                else:
-                    ROM_COPY.seek(actor_start + 0x12)
-                    path_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    if path_id not in remove_paths:
-                        remove_paths.append(path_id)
+            for item in setup.actors:
+                if item.type in actor_cbs and item.path not in remove_paths:
+                    remove_paths.append(item.path)
+            setup.actors = [item for item in setup.actors if item.type not in actor_cbs]
+            used_actor_ids = setup.getActorIds()
             # PATHS
-            path_table = js.pointer_addresses[15]["entries"][cont_map_id]["pointing_to"]
-            ROM_COPY.seek(path_table)
-            path_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+            path_file = ROM_COPY.readFile(TableNames.Paths, cont_map_id, False) or b""
+            path_count = readUnsigned(path_file, 0, 2)
             persisted_paths = []
             used_path_ids = []
             path_offset = 2
             for path_index in range(path_count):
-                ROM_COPY.seek(path_table + path_offset)
-                path_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+                path_id = readUnsigned(path_file, path_offset, 2)
+                point_count = readUnsigned(path_file, path_offset + 2, 2)
+                path_size = 6 + (point_count * 10)
                 if path_id not in remove_paths:
-                    path_size = 6 + (point_count * 10)
-                    item_data = []
-                    ROM_COPY.seek(path_table + path_offset)
-                    for x in range(int(path_size / 2)):
-                        item_data.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    persisted_paths.append(item_data)
+                    persisted_paths.append(list(struct.unpack(f">{int(path_size / 2)}H", readPadded(path_file, path_offset, path_size))))
                     used_path_ids.append(path_id)
-                path_offset += 6 + (10 * point_count)
+                path_offset += path_size
             # Place all new colored bananas
             new_id = 0
             act_id = 0
@@ -172,7 +127,7 @@ def randomize_cbs(spoiler):
                                 new_id += 1
                             item_data.append((cb_item_type << 16) + found_id)
                             item_data.append((2 << 16) + 1)
-                            persisted_m2_data.append(item_data)
+                            setup.model_two.append(ModelTwoRecord.fromWords(item_data))
                     for list_item in associated_list:
                         if cb_type == "balloons" and list_item.id == new_cb["id"]:
                             # Found balloon
@@ -207,7 +162,7 @@ def randomize_cbs(spoiler):
                                 item_data.append(0)
                             item_data.append(balloons[new_cb["kong"]] - 16)
                             item_data.append((found_actor_id << 16) + 0x6E08)
-                            persisted_act_data.append(item_data)
+                            setup.actors.append(ActorRecord.fromWords(item_data))
                             # Path
                             if found_path_id < PATH_CAP:  # Crashing issues with more than PATH_CAP paths
                                 item_data = []
@@ -231,22 +186,10 @@ def randomize_cbs(spoiler):
                                 persisted_paths = new_paths.copy()
             # Recompile Tables
             # SETUP
-            ROM_COPY.seek(setup_table)
-            ROM_COPY.writeMultipleBytes(len(persisted_m2_data), 4)
-            for x in persisted_m2_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
-            ROM_COPY.writeMultipleBytes(len(persisted_mys_data), 4)
-            for x in persisted_mys_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
-            ROM_COPY.writeMultipleBytes(len(persisted_act_data), 4)
-            for x in persisted_act_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
-            # print(f"{hex(cont_map_id)}: {hex(path_table)}")
-            ROM_COPY.seek(path_table)
-            ROM_COPY.writeMultipleBytes(len(persisted_paths), 2)
+            writeSetupFile(ROM_COPY, cont_map_id, setup)
+            new_path_file = bytearray(struct.pack(">H", len(persisted_paths)))
             for x in persisted_paths:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 2)
+                new_path_file += struct.pack(f">{len(x)}H", *x)
+            if len(new_path_file) < len(path_file):
+                new_path_file += path_file[len(new_path_file) :]
+            ROM_COPY.writeFile(TableNames.Paths, cont_map_id, False, new_path_file)
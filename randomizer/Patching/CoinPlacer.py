@@ -1,7 +1,7 @@
 """Apply Coin Rando changes."""
 
-import js
 from randomizer.Patching.Lib import float_to_hex
+from randomizer.Patching.LibSetup import ModelTwoRecord, readSetupFile, writeSetupFile
 from randomizer.Patching.Patcher import LocalROM
 
 
@@ -13,49 +13,10 @@ def randomize_coins(spoiler):
             # Wipe setup and paths of Coin information
             # SETUP
             coin_items = [0x1D, 0x24, 0x23, 0x1C, 0x27]  # Has to remain in this order
-            setup_table = js.pointer_addresses[9]["entries"][cont_map_id]["pointing_to"]
-            ROM_COPY.seek(setup_table)
-            model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
+            setup = readSetupFile(ROM_COPY, cont_map_id)
             # Model Two Coins
-            persisted_m2_data = []
-            used_m2_ids = []
-            for item in range(model2_count):
-                item_start = setup_table + 4 + (item * 0x30)
-                ROM_COPY.seek(item_start + 0x28)
-                item_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                if item_type not in coin_items:  # Not Coin
-                    ROM_COPY.seek(item_start + 0x2A)
-                    used_m2_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    ROM_COPY.seek(item_start)
-                    item_data = []
-                    for x in range(int(0x30 / 4)):
-                        item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                    persisted_m2_data.append(item_data)
-            ROM_COPY.seek(setup_table + 4 + (0x30 * model2_count))
-            mystery_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            # Mystery
-            persisted_mys_data = []
-            for item in range(mystery_count):
-                ROM_COPY.seek(setup_table + 4 + (model2_count * 0x30) + 4 + (item * 0x24))
-                item_data = []
-                for x in range(int(0x24 / 4)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                persisted_mys_data.append(item_data)
-            actor_block = setup_table + 4 + (0x30 * model2_count) + 4 + (0x24 * mystery_count)
-            ROM_COPY.seek(actor_block)
-            actor_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            # Actors
-            persisted_act_data = []
-            used_actor_ids = []
-            for item in range(actor_count):
-                actor_start = actor_block + 4 + (item * 0x38)
-                ROM_COPY.seek(actor_start + 0x34)
-                used_actor_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                ROM_COPY.seek(actor_start)
-                item_data = []
-                for x in range(int(0x38 / 4)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                persisted_act_data.append(item_data)
+            setup.model_two = [item for item in setup.model_two if item.type not in coin_items]
+            used_m2_ids = setup.getModelTwoIds()
             # Place all new coins
             new_id = 0
             for new_coin in spoiler.coin_placements:
@@ -80,19 +41,6 @@ def randomize_coins(spoiler):
                             new_id += 1
                         item_data.append((coin_item_type << 16) + found_id)
                         item_data.append((2 << 16) + 1)
-                        persisted_m2_data.append(item_data)
+                        setup.model_two.append(ModelTwoRecord.fromWords(item_data))
             # Recompile Tables
-            # SETUP
-            ROM_COPY.seek(setup_table)
-            ROM_COPY.writeMultipleBytes(len(persisted_m2_data), 4)
-            for x in persisted_m2_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
-            ROM_COPY.writeMultipleBytes(len(persisted_mys_data), 4)
-            for x in persisted_mys_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
-            ROM_COPY.writeMultipleBytes(len(persisted_act_data), 4)
-            for x in persisted_act_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
+            writeSetupFile(ROM_COPY, cont_map_id, setup)
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import gzip
-import random
 import zlib
 import math
-from random import randint
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Callable, List, Tuple
 from enum import IntEnum, auto
 from io import BytesIO
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageEnhance
 
 import js
@@ -37,8 +36,24 @@ from randomizer.Patching.Lib import (
     Holidays,
     getHoliday,
 )
-from randomizer.Patching.LibImage import getImageFile, TextureFormat, getRandomHueShift, hueShift, ExtraTextures, imageToCI
+from randomizer.Patching.LibImage import (
+    getImageFile,
+    TextureFormat,
+    getRandomHueShift,
+    hueShift,
+    ExtraTextures,
+    imageToCI,
+    getTextureSize,
+    decodeTexture,
+    encodeTexture,
+    imageToArray,
+    arrayToImage,
+    getMaskedChannels,
+    applyColorMask,
+)
+from randomizer.Patching.TextureCache import getTextureSourceHash, getCachedTextureData
 from randomizer.Patching.Patcher import ROM, LocalROM
+from randomizer.RandomStreams import cosmetic_random
 from randomizer.Settings import Settings
 
 if TYPE_CHECKING:
@@ -482,7 +497,7 @@ RECOLOR_MEDAL_RIM = False
 
 def getRandomKlaptrapModel() -> Model:
     """Get random klaptrap model."""
-    return random.choice(KLAPTRAPS)
+    return cosmetic_random.choice(KLAPTRAPS)
 
 
 def changePatchFace(settings: Settings):
@@ -494,12 +509,9 @@ def changePatchFace(settings: Settings):
     letk_im = getImageFile(14, 0x76, True, 40, 51, TextureFormat.RGBA5551).resize((18, 32))
     letter_ims = (letd_im, letk_im)
     for letter in letter_ims:
-        imw, imh = letter.size
-        px = letter.load()
-        for x in range(imw):
-            for y in range(imh):
-                r, g, b, a = letter.getpixel((x, y))
-                px[x, y] = (r, g, b, 150 if a > 128 else 0)
+        pixels = imageToArray(letter)
+        pixels[:, :, 3] = np.where(pixels[:, :, 3] > 128, 150, 0)
+        letter.paste(arrayToImage(pixels))
     dirt_im.paste(letd_im, (0, 0), letd_im)
     dirt_im.paste(letk_im, (16, 0), letk_im)
     writeColorImageToROM(dirt_im, 25, 0x1379, 32, 32, False, TextureFormat.RGBA5551)
@@ -546,9 +558,9 @@ def apply_cosmetic_colors(settings: Settings):
     if model_setting == RandomModels.random:
         bother_model_index = getRandomKlaptrapModel()
     elif model_setting == RandomModels.extreme:
-        bother_model_index = random.choice(bother_models)
-        racer_beetle = random.choice([Model.Beetle, Model.Rabbit])
-        racer_rabbit = random.choice([Model.Beetle, Model.Rabbit])
+        bother_model_index = cosmetic_random.choice(bother_models)
+        racer_beetle = cosmetic_random.choice([Model.Beetle, Model.Rabbit])
+        racer_rabbit = cosmetic_random.choice([Model.Beetle, Model.Rabbit])
         if racer_rabbit == Model.Beetle:
             spawner_changes = []
             # Fungi
@@ -563,22 +575,22 @@ def apply_cosmetic_colors(settings: Settings):
             spawner_changes.append(rabbit_caves_change)
             applyCharacterSpawnerChanges(spawner_changes)
     if model_setting != RandomModels.off:
-        panic_fairy_model_index = random.choice(panic_models)
-        turtle_model_index = random.choice(turtle_models)
+        panic_fairy_model_index = cosmetic_random.choice(panic_models)
+        turtle_model_index = cosmetic_random.choice(turtle_models)
         panic_klap_model_index = getRandomKlaptrapModel()
         sseek_klap_model_index = getRandomKlaptrapModel()
-        fungi_tomato_model_index = random.choice([Model.Tomato, Model.IceTomato])
-        caves_tomato_model_index = random.choice([Model.Tomato, Model.IceTomato])
+        fungi_tomato_model_index = cosmetic_random.choice([Model.Tomato, Model.IceTomato])
+        caves_tomato_model_index = cosmetic_random.choice([Model.Tomato, Model.IceTomato])
         referenced_piano_models = piano_models.copy()
         referenced_funky_models = funky_cutscene_models.copy()
         if model_setting == RandomModels.extreme:
             referenced_piano_models.extend(piano_extreme_model)
-            spotlight_fish_model_index = random.choice(spotlight_fish_models)
+            spotlight_fish_model_index = cosmetic_random.choice(spotlight_fish_models)
             referenced_funky_models.extend(funky_cutscene_models_extreme)
-            boot_model_index = random.choice(boot_cutscene_models)
-        piano_burper = random.choice(referenced_piano_models)
-        candy_model_index = random.choice(candy_cutscene_models)
-        funky_model_index = random.choice(funky_cutscene_models)
+            boot_model_index = cosmetic_random.choice(boot_cutscene_models)
+        piano_burper = cosmetic_random.choice(referenced_piano_models)
+        candy_model_index = cosmetic_random.choice(candy_cutscene_models)
+        funky_model_index = cosmetic_random.choice(funky_cutscene_models)
     settings.bother_klaptrap_model = bother_model_index
     settings.beetle_model = racer_beetle
     settings.rabbit_model = racer_rabbit
@@ -611,7 +623,7 @@ def apply_cosmetic_colors(settings: Settings):
         # Menu Background
         textures = list(compatible_background_textures.keys())
         weights = [compatible_background_textures[x].weight for x in textures]
-        selected_texture = random.choices(textures, weights=weights, k=1)[0]
+        selected_texture = cosmetic_random.choices(textures, weights=weights, k=1)[0]
         settings.menu_texture_index = selected_texture
         settings.menu_texture_name = compatible_background_textures[selected_texture].name
         # Jetman
@@ -619,15 +631,15 @@ def apply_cosmetic_colors(settings: Settings):
         sufficiently_bright = False
         brightness_threshold = 80
         for channel in range(3):
-            jetman_color[channel] = random.randint(0, 0xFF)
+            jetman_color[channel] = cosmetic_random.randint(0, 0xFF)
             if jetman_color[channel] >= brightness_threshold:
                 sufficiently_bright = True
         if not sufficiently_bright:
-            channel = random.randint(0, 2)
-            value = random.randint(brightness_threshold, 0xFF)
+            channel = cosmetic_random.randint(0, 2)
+            value = cosmetic_random.randint(brightness_threshold, 0xFF)
             jetman_color[channel] = value
         settings.jetman_color = jetman_color.copy()
-        melon_sprite = random.choice(melon_random_sprites)
+        melon_sprite = cosmetic_random.choice(melon_random_sprites)
     settings.minigame_melon_sprite = melon_sprite
     color_palettes = []
     color_obj = {}
@@ -768,7 +780,7 @@ def apply_cosmetic_colors(settings: Settings):
                         if base_setting in zone_to_colors:
                             color = zone_to_colors[base_setting]
                         else:
-                            color = f"#{format(randint(0, 0xFFFFFF), '06x')}"
+                            color = f"#{format(cosmetic_random.randint(0, 0xFFFFFF), '06x')}"
                             zone_to_colors[base_setting] = color
                     # if this palette color is not randomized (but might be a custom color) and isn't krusha's kong indicator:
                     elif palette.fill_type != PaletteFillType.kong:
@@ -796,7 +808,7 @@ def apply_cosmetic_colors(settings: Settings):
         channels = []
         if settings.gb_colors == CharacterColors.randomized:
             for x in range(3):
-                channels.append(random.randint(0, 255))
+                channels.append(cosmetic_random.randint(0, 255))
         elif settings.gb_colors == CharacterColors.custom:
             for x in range(3):
                 start = (2 * x) + 1
@@ -856,23 +868,15 @@ def getRGBFromHash(hash: str):
 
 def maskImageWithColor(im_f: Image, mask: tuple):
     """Apply rgb mask to image using a rgb color tuple."""
-    w, h = im_f.size
     converter = ImageEnhance.Color(im_f)
     im_f = converter.enhance(0)
     im_dupe = im_f.copy()
     brightener = ImageEnhance.Brightness(im_dupe)
     im_dupe = brightener.enhance(2)
     im_f.paste(im_dupe, (0, 0), im_dupe)
-    pix = im_f.load()
-    w, h = im_f.size
-    for x in range(w):
-        for y in range(h):
-            base = list(pix[x, y])
-            if base[3] > 0:
-                for channel in range(3):
-                    base[channel] = int(mask[channel] * (base[channel] / 255))
-                pix[x, y] = (base[0], base[1], base[2], base[3])
-    return im_f
+    pixels = imageToArray(im_f)
+    applyColorMask(pixels, mask)
+    return arrayToImage(pixels)
 
 
 def maskImage(im_f, base_index, min_y, keep_dark=False):
@@ -885,49 +889,34 @@ def maskImage(im_f, base_index, min_y, keep_dark=False):
         brightener = ImageEnhance.Brightness(im_dupe)
         im_dupe = brightener.enhance(2)
     im_f.paste(im_dupe, (0, min_y), im_dupe)
-    pix = im_f.load()
+    pixels = imageToArray(im_f)
     mask = getRGBFromHash(color_bases[base_index])
-    w, h = im_f.size
-    for x in range(w):
-        for y in range(min_y, h):
-            base = list(pix[x, y])
-            if base[3] > 0:
-                for channel in range(3):
-                    base[channel] = int(mask[channel] * (base[channel] / 255))
-                pix[x, y] = (base[0], base[1], base[2], base[3])
-    return im_f
+    applyColorMask(pixels[min_y:], mask)
+    return arrayToImage(pixels)
 
 
 def maskMushroomImage(im_f, reference_image, color, side_2=False):
     """Apply RGB mask to mushroom image."""
     w, h = im_f.size
-    pixels_to_mask = []
-    pix_ref = reference_image.load()
-    for x in range(w):
-        for y in range(h):
-            base_ref = list(pix_ref[x, y])
-            # Filter out the white dots that won't get filtered out correctly with the below conditions
-            if not (max(abs(base_ref[0] - base_ref[2]), abs(base_ref[1] - base_ref[2])) < 41 and abs(base_ref[0] - base_ref[1]) < 11):
-                # Filter out that one lone pixel that is technically blue AND gets through the above filter, but should REALLY not be blue
-                if not (side_2 is True and x == 51 and y == 21):
-                    # Select the exact pixels to mask, which is all the "blue" pixels, filtering out the white spots
-                    if base_ref[2] > base_ref[0] and base_ref[2] > base_ref[1] and int(base_ref[0] + base_ref[1]) < 200:
-                        pixels_to_mask.append([x, y])
-                    # Select the darker blue pixels as well
-                    elif base_ref[2] > int(base_ref[0] + base_ref[1]):
-                        pixels_to_mask.append([x, y])
-    pix = im_f.load()
+    ref = imageToArray(reference_image)[:h, :w].astype(np.int32)
+    red, green, blue = ref[:, :, 0], ref[:, :, 1], ref[:, :, 2]
+    # Filter out the white dots that won't get filtered out correctly with the below conditions
+    white_dots = (np.maximum(abs(red - blue), abs(green - blue)) < 41) & (abs(red - green) < 11)
+    # Select the exact pixels to mask, which is all the "blue" pixels, filtering out the white spots
+    blue_pixels = (blue > red) & (blue > green) & ((red + green) < 200)
+    # Select the darker blue pixels as well
+    dark_blue_pixels = blue > (red + green)
+    pixels_to_mask = ~white_dots & (blue_pixels | dark_blue_pixels)
+    if side_2 is True:
+        # Filter out that one lone pixel that is technically blue AND gets through the above filter, but should REALLY not be blue
+        pixels_to_mask[21, 51] = False
+    pixels = imageToArray(im_f)
     mask = getRGBFromHash(color)
     for channel in range(3):
         mask[channel] = max(1, mask[channel])  # Absolute black is bad
-    for x in range(w):
-        for y in range(h):
-            base = list(pix[x, y])
-            if base[3] > 0 and [x, y] in pixels_to_mask:
-                average_light = int((base[0] + base[1] + base[2]) / 3)
-                for channel in range(3):
-                    base[channel] = int(mask[channel] * (average_light / 255))
-                pix[x, y] = (base[0], base[1], base[2], base[3])
+    average_light = pixels[:, :, :3].astype(np.int32).sum(axis=2) // 3
+    applyColorMask(pixels, mask, pixels_to_mask & (pixels[:, :, 3] > 0), np.repeat(average_light[:, :, np.newaxis], 3, axis=2))
+    im_f.paste(arrayToImage(pixels))
     return im_f
 
 
@@ -1040,36 +1029,30 @@ def maskImageGBSpin(im_f, color: tuple, image_index: int):
     spin_pixels = getSpinPixels()
     if image_index not in spin_pixels:
         return masked_im
-    px = im_f.load()
-    px_0 = masked_im.load()
-    for point in spin_pixels[image_index]:
-        px_0[point[0], point[1]] = px[point[0], point[1]]
-    return masked_im
+    pixels = imageToArray(im_f)
+    masked_pixels = imageToArray(masked_im)
+    xs, ys = zip(*spin_pixels[image_index])
+    masked_pixels[ys, xs] = pixels[ys, xs]
+    return arrayToImage(masked_pixels)
 
 
 def maskImageRotatingRoomTile(im_f, im_mask, paste_coords, image_color_index, tile_side):
     """Apply RGB mask to image of a Rotating Room Memory Tile."""
     w, h = im_f.size
-    im_original = im_f
-    pix_original = im_original.load()
-    pixels_original = []
-    for x in range(w):
-        pixels_original.append([])
-        for y in range(h):
-            pixels_original[x].append(list(pix_original[x, y]).copy())
+    pixels_original = imageToArray(im_f)
     converter = ImageEnhance.Color(im_f)
     im_f = converter.enhance(0)
     brightener = ImageEnhance.Brightness(im_f)
     im_f = brightener.enhance(2)
-    pix = im_f.load()
-    pix_mask = im_mask.load()
-    w2, h2 = im_mask.size
-    mask_coords = []
-    for x in range(w2):
-        for y in range(h2):
-            coord = list(pix_mask[x, y])
-            if coord[3] > 0:
-                mask_coords.append([(x + paste_coords[0]), (y + paste_coords[1])])
+    pixels = imageToArray(im_f)
+    # Pixels covered by the mask image keep their original color
+    kept = np.zeros((h, w), dtype=bool)
+    mask_alpha = imageToArray(im_mask)[:, :, 3] > 0
+    mask_ys, mask_xs = np.nonzero(mask_alpha)
+    mask_xs = mask_xs + paste_coords[0]
+    mask_ys = mask_ys + paste_coords[1]
+    in_bounds = (mask_xs >= 0) & (mask_xs < w) & (mask_ys >= 0) & (mask_ys < h)
+    kept[mask_ys[in_bounds], mask_xs[in_bounds]] = True
     if image_color_index < 5:
         mask = getRGBFromHash(color_bases[image_color_index])
         for channel in range(3):
@@ -1079,36 +1062,21 @@ def maskImageRotatingRoomTile(im_f, im_mask, paste_coords, image_color_index, ti
     mask2 = getRGBFromHash("#000000")
     if image_color_index == 0:
         mask2 = getRGBFromHash("#FFFFFF")
-    for x in range(w):
-        for y in range(h):
-            base = list(pix[x, y])
-            base_original = list(pixels_original[x][y])
-            if [x, y] not in mask_coords:
-                if image_color_index in [1, 2, 4]:  # Diddy, Lanky and Chunky don't get any special features
-                    for channel in range(3):
-                        base[channel] = int(mask[channel] * (base[channel] / 255))
-                elif image_color_index in [0, 3]:  # Donkey and Tiny get a diamond-shape frame
-                    side = w
-                    if tile_side == 1:
-                        side = 0
-                    if abs(abs(side - x) - y) < 2 or abs(abs(side - x) - abs(h - y)) < 2:
-                        for channel in range(3):
-                            base[channel] = int(mask2[channel] * (base[channel] / 255))
-                    else:
-                        for channel in range(3):
-                            base[channel] = int(mask[channel] * (base[channel] / 255))
-                else:  # Golden Banana gets a block-pattern
-                    if (int(x / 8) + int(y / 8)) % 2 == 0:
-                        for channel in range(3):
-                            base[channel] = int(mask[channel] * (base[channel] / 255))
-                    else:
-                        for channel in range(3):
-                            base[channel] = int(mask2[channel] * (base[channel] / 255))
-            else:
-                for channel in range(3):
-                    base[channel] = base_original[channel]
-            pix[x, y] = (base[0], base[1], base[2], base[3])
-    return im_f
+    y, x = np.mgrid[0:h, 0:w]
+    if image_color_index in [1, 2, 4]:  # Diddy, Lanky and Chunky don't get any special features
+        secondary = np.zeros((h, w), dtype=bool)
+    elif image_color_index in [0, 3]:  # Donkey and Tiny get a diamond-shape frame
+        side = w
+        if tile_side == 1:
+            side = 0
+        secondary = (abs(abs(side - x) - y) < 2) | (abs(abs(side - x) - abs(h - y)) < 2)
+    else:  # Golden Banana gets a block-pattern
+        secondary = ((x // 8) + (y // 8)) % 2 != 0
+    source = pixels.copy()
+    applyColorMask(pixels, mask, ~kept & ~secondary, source)
+    applyColorMask(pixels, mask2, ~kept & secondary, source)
+    pixels[:, :, :3] = np.where(kept[:, :, np.newaxis], pixels_original[:, :, :3], pixels[:, :, :3])
+    return arrayToImage(pixels)
 
 
 def hueShiftColor(color: tuple, amount: int, head_ratio: int = None) -> tuple:
@@ -1175,367 +1143,233 @@ def maskImageWithOutline(im_f, base_index, min_y, colorblind_mode, type=""):
         brightener = ImageEnhance.Brightness(im_dupe)
         im_dupe = brightener.enhance(2)
     im_f.paste(im_dupe, (0, min_y), im_dupe)
-    pix = im_f.load()
+    pixels = imageToArray(im_f)
     mask = getRGBFromHash(color_bases[base_index])
     if base_index == 2 or (base_index == 0 and colorblind_mode == ColorblindMode.trit):  # lanky or (DK in tritanopia mode)
         border_color = color_bases[4]
     else:
         border_color = color_bases[1]
     mask2 = getRGBFromHash(border_color)
-    contrast = False
-    if base_index == 0:
-        contrast = True
     for channel in range(3):
         mask[channel] = max(39, mask[channel])  # Too black is bad for these items
         if base_index == 0 and type == "single":  # Donkey's single
             mask[channel] += 20
-    w, h = im_f.size
-    for x in range(w):
-        for y in range(min_y, h):
-            base = list(pix[x, y])
-            if base[3] > 0:
-                for channel in range(3):
-                    base[channel] = int(mask[channel] * (base[channel] / 255))
-                    if contrast is True:
-                        if base[channel] > 30:
-                            base[channel] = int(base[channel] / 2)
-                        else:
-                            base[channel] = int(base[channel] / 4)
-                pix[x, y] = (base[0], base[1], base[2], base[3])
-    for t in range(3):
-        for x in range(w):
-            for y in range(min_y, h):
-                base = list(pix[x, y])
-                if base[3] > 0:
-                    if (
-                        (x + t < w and list(pix[x + t, y])[3] == 0)
-                        or (y + t < h and list(pix[x, y + t])[3] == 0)
-                        or (x - t > -1 and list(pix[x - t, y])[3] == 0)
-                        or (y - t > min_y - 1 and list(pix[x, y - t])[3] == 0)
-                    ):
-                        pix[x, y] = (mask2[0], mask2[1], mask2[2], base[3])
-    return im_f
-
-
-def writeColorImageToROM(im_f: PIL.Image.Image, table_index: int, file_index: int, width: int, height: int, transparent_border: bool, format: TextureFormat) -> None:
-    """Write texture to ROM."""
+    masked_area = pixels[min_y:]
+    opaque = masked_area[:, :, 3] > 0
+    masked = getMaskedChannels(masked_area, mask)
+    if base_index == 0:
+        masked = np.where(masked > 30, masked // 2, masked // 4)
+    masked_area[:, :, :3] = np.where(opaque[:, :, np.newaxis], np.clip(masked, 0, 255), masked_area[:, :, :3])
+    # Outline every opaque pixel within 2 pixels of a transparent one, horizontally or vertically
+    transparent = ~opaque
+    outline = np.zeros_like(opaque)
+    for t in range(1, 3):
+        outline[:, :-t] |= transparent[:, t:]
+        outline[:, t:] |= transparent[:, :-t]
+        outline[:-t] |= transparent[t:]
+        outline[t:] |= transparent[:-t]
+    masked_area[:, :, :3] = np.where((outline & opaque)[:, :, np.newaxis], np.clip(mask2, 0, 255), masked_area[:, :, :3])
+    return arrayToImage(pixels)
+
+
+def getColorImageData(im_f: PIL.Image.Image, table_index: int, file_index: int, transparent_border: bool, format: TextureFormat) -> bytes:
+    """Get the data to write to ROM for a texture."""
     file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
     file_end = js.pointer_addresses[table_index]["entries"][file_index + 1]["pointing_to"]
     file_size = file_end - file_start
-    try:
-        LocalROM().seek(file_start)
-    except Exception:
-        ROM().seek(file_start)
-    pix = im_f.load()
-    width, height = im_f.size
-    bytes_array = []
-    border = 1
-    right_border = 3
-    for y in range(height):
-        for x in range(width):
-            if transparent_border:
-                if ((x < border) or (y < border) or (x >= (width - border)) or (y >= (height - border))) or (x == (width - right_border)):
-                    pix_data = [0, 0, 0, 0]
-                else:
-                    pix_data = list(pix[x, y])
-            else:
-                pix_data = list(pix[x, y])
-            if format == TextureFormat.RGBA32:
-                bytes_array.extend(pix_data)
-            elif format == TextureFormat.RGBA5551:
-                red = int((pix_data[0] >> 3) << 11)
-                green = int((pix_data[1] >> 3) << 6)
-                blue = int((pix_data[2] >> 3) << 1)
-                alpha = int(pix_data[3] != 0)
-                value = red | green | blue | alpha
-                bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-            elif format == TextureFormat.IA4:
-                intensity = pix_data[0] >> 5
-                alpha = 0 if pix_data[3] == 0 else 1
-                data = ((intensity << 1) | alpha) & 0xF
-                bytes_array.append(data)
-    bytes_per_px = 2
-    if format == TextureFormat.IA4:
-        temp_ba = bytes_array.copy()
-        bytes_array = []
-        value_storage = 0
-        bytes_per_px = 0.5
-        for idx, val in enumerate(temp_ba):
-            polarity = idx % 2
-            if polarity == 0:
-                value_storage = val << 4
-            else:
-                value_storage |= val
-                bytes_array.append(value_storage)
-    data = bytearray(bytes_array)
-    if format == TextureFormat.RGBA32:
-        bytes_per_px = 4
-    if len(data) > (bytes_per_px * width * height):
+    pixels = imageToArray(im_f)
+    height, width = pixels.shape[:2]
+    if transparent_border:
+        border = 1
+        right_border = 3
+        pixels[:border] = 0
+        pixels[height - border :] = 0
+        pixels[:, :border] = 0
+        pixels[:, width - border :] = 0
+        pixels[:, width - right_border] = 0
+    data = encodeTexture(pixels, format)
+    if len(data) > getTextureSize(width, height, format):
         print(f"Image too big error: {table_index} > {file_index}")
     if table_index in (14, 25):
         data = gzip.compress(data, compresslevel=9)
     if len(data) > file_size:
         print(f"File too big error: {table_index} > {file_index}")
+    return data
+
+
+def writeTextureData(table_index: int, file_index: int, data: bytes) -> None:
+    """Write texture data to ROM."""
+    file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
     try:
+        LocalROM().seek(file_start)
         LocalROM().writeBytes(data)
     except Exception:
+        ROM().seek(file_start)
         ROM().writeBytes(data)
 
 
-def writeKasplatHairColorToROM(color, table_index, file_index, format: str):
-    """Write color to ROM for kasplats."""
-    file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
-    mask = getRGBFromHash(color)
-    if format == TextureFormat.RGBA32:
-        color_lst = mask.copy()
-        color_lst.append(255)  # Alpha
-        null_color = [0] * 4
-    else:
-        val_r = int((mask[0] >> 3) << 11)
-        val_g = int((mask[1] >> 3) << 6)
-        val_b = int((mask[2] >> 3) << 1)
-        rgba_val = val_r | val_g | val_b | 1
-        color_lst = [(rgba_val >> 8) & 0xFF, rgba_val & 0xFF]
-        null_color = [0, 0]
-    bytes_array = []
-    for y in range(42):
-        for x in range(32):
-            bytes_array.extend(color_lst)
-    for i in range(18):
-        bytes_array.extend(color_lst)
-    for i in range(4):
-        bytes_array.extend(null_color)
-    for i in range(3):
-        bytes_array.extend(color_lst)
-    data = bytearray(bytes_array)
+def writeColorImageToROM(im_f: PIL.Image.Image, table_index: int, file_index: int, width: int, height: int, transparent_border: bool, format: TextureFormat) -> None:
+    """Write texture to ROM."""
+    writeTextureData(table_index, file_index, getColorImageData(im_f, table_index, file_index, transparent_border, format))
+
+
+def writeCachedColorImageToROM(
+    build_image: Callable[[], PIL.Image.Image], table_index: int, file_index: int, transparent_border: bool, format: TextureFormat, transform: str, params: tuple, sources: List[str] = None
+) -> None:
+    """Write texture to ROM, reusing the data from the texture cache if the same texture has been built before.
+
+    Sources default to the file being replaced, and params must include everything else the image depends on.
+    """
+    if sources is None:
+        sources = [getTextureSourceHash(table_index, file_index)]
+    data = getCachedTextureData(
+        sources,
+        transform,
+        (table_index, transparent_border, format) + params,
+        lambda: getColorImageData(build_image(), table_index, file_index, transparent_border, format),
+    )
+    writeTextureData(table_index, file_index, data)
+
+
+def getKasplatTextureData(pixels: np.ndarray, table_index: int, format: TextureFormat) -> bytes:
+    """Get the data to write to ROM for a 32x43 kasplat or klaptrap texture.
+
+    Only the first 25 pixels of the last row are stored, and 4 of them are left blank.
+    """
+    pixels = pixels.copy()
+    pixels[42, 18:22] = 0
+    data = encodeTexture(pixels.reshape(-1, 4)[: (42 * 32) + 25], format)
     if table_index == 25:
         data = gzip.compress(data, compresslevel=9)
-    ROM().seek(file_start)
+    return data
+
+
+def writeCachedKasplatTexture(build_pixels: Callable[[], np.ndarray], table_index: int, file_index: int, format: TextureFormat, transform: str, params: tuple, sources: List[str]) -> None:
+    """Write a 32x43 kasplat or klaptrap texture to ROM, reusing the data from the texture cache if possible."""
+    data = getCachedTextureData(sources, transform, (table_index, format) + params, lambda: getKasplatTextureData(build_pixels(), table_index, format))
+    ROM().seek(js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"])
     ROM().writeBytes(data)
 
 
+def writeKasplatHairColorToROM(color, table_index, file_index, format: str):
+    """Write color to ROM for kasplats."""
+
+    def build():
+        return np.full((43, 32, 4), getRGBFromHash(color) + [255], dtype=np.uint8)
+
+    writeCachedKasplatTexture(build, table_index, file_index, format, "kasplat_hair", (color,), [])
+
+
 def writeWhiteKasplatHairColorToROM(color1, color2, table_index, file_index, format: str):
     """Write color to ROM for white kasplats, giving them a black-white block pattern."""
-    file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
-    mask = getRGBFromHash(color1)
-    mask2 = getRGBFromHash(color2)
-    if format == TextureFormat.RGBA32:
-        color_lst_0 = mask.copy()
-        color_lst_0.append(255)
-        color_lst_1 = mask2.copy()
-        color_lst_1.append(255)
-        null_color = [0] * 4
-    else:
-        val_r = int((mask[0] >> 3) << 11)
-        val_g = int((mask[1] >> 3) << 6)
-        val_b = int((mask[2] >> 3) << 1)
-        rgba_val = val_r | val_g | val_b | 1
-        val_r2 = int((mask2[0] >> 3) << 11)
-        val_g2 = int((mask2[1] >> 3) << 6)
-        val_b2 = int((mask2[2] >> 3) << 1)
-        rgba_val2 = val_r2 | val_g2 | val_b2 | 1
-        color_lst_0 = [(rgba_val >> 8) & 0xFF, rgba_val & 0xFF]
-        color_lst_1 = [(rgba_val2 >> 8) & 0xFF, rgba_val2 & 0xFF]
-        null_color = [0] * 2
-    bytes_array = []
-    for y in range(42):
-        for x in range(32):
-            if (int(y / 7) + int(x / 8)) % 2 == 0:
-                bytes_array.extend(color_lst_0)
-            else:
-                bytes_array.extend(color_lst_1)
-    for i in range(18):
-        bytes_array.extend(color_lst_0)
-    for i in range(4):
-        bytes_array.extend(null_color)
-    for i in range(3):
-        bytes_array.extend(color_lst_0)
-    data = bytearray(bytes_array)
-    if table_index == 25:
-        data = gzip.compress(data, compresslevel=9)
-    ROM().seek(file_start)
-    ROM().writeBytes(data)
+
+    def build():
+        y, x = np.mgrid[0:43, 0:32]
+        # The partial last row is always the first color
+        second_color = (((y // 7) + (x // 8)) % 2 != 0) & (y < 42)
+        return np.where(second_color[:, :, np.newaxis], getRGBFromHash(color2) + [255], getRGBFromHash(color1) + [255]).astype(np.uint8)
+
+    writeCachedKasplatTexture(build, table_index, file_index, format, "white_kasplat_hair", (color1, color2), [])
 
 
 def writeKlaptrapSkinColorToROM(color_index, table_index, file_index, format: str):
     """Write color to ROM for klaptraps."""
-    im_f = getImageFile(table_index, file_index, True, 32, 43, format)
-    im_f = maskImage(im_f, color_index, 0, (color_index != 3))
-    pix = im_f.load()
-    file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
-    if format == TextureFormat.RGBA32:
-        null_color = [0] * 4
-    else:
-        null_color = [0, 0]
-    bytes_array = []
-    for y in range(42):
-        for x in range(32):
-            color_lst = calculateKlaptrapPixel(list(pix[x, y]), format)
-            bytes_array.extend(color_lst)
-    for i in range(18):
-        color_lst = calculateKlaptrapPixel(list(pix[i, 42]), format)
-        bytes_array.extend(color_lst)
-    for i in range(4):
-        bytes_array.extend(null_color)
-    for i in range(3):
-        color_lst = calculateKlaptrapPixel(list(pix[(22 + i), 42]), format)
-        bytes_array.extend(color_lst)
-    data = bytearray(bytes_array)
-    if table_index == 25:
-        data = gzip.compress(data, compresslevel=9)
-    ROM().seek(file_start)
-    ROM().writeBytes(data)
+
+    def build():
+        im_f = getImageFile(table_index, file_index, True, 32, 43, format)
+        pixels = imageToArray(maskImage(im_f, color_index, 0, (color_index != 3)))
+        # Klaptrap skins are always opaque
+        pixels[:, :, 3] = 255
+        return pixels
+
+    params = (color_bases[color_index], color_index != 3)
+    writeCachedKasplatTexture(build, table_index, file_index, format, "klaptrap_skin", params, [getTextureSourceHash(table_index, file_index)])
 
 
 def writeSpecialKlaptrapTextureToROM(color_index, table_index, file_index, format: str, pixels_to_ignore: list):
     """Write color to ROM for klaptraps special texture(s)."""
-    im_f = getImageFile(table_index, file_index, True, 32, 43, format)
-    pix_original = im_f.load()
-    pixels_original = []
-    for x in range(32):
-        pixels_original.append([])
-        for y in range(43):
-            pixels_original[x].append(list(pix_original[x, y]).copy())
-    im_f_masked = maskImage(im_f, color_index, 0, (color_index != 3))
-    pix = im_f_masked.load()
-    file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
-    if format == TextureFormat.RGBA32:
-        null_color = [0] * 4
-    else:
-        null_color = [0, 0]
-    bytes_array = []
-    for y in range(42):
-        for x in range(32):
-            if [x, y] not in pixels_to_ignore:
-                color_lst = calculateKlaptrapPixel(list(pix[x, y]), format)
-            else:
-                color_lst = calculateKlaptrapPixel(list(pixels_original[x][y]), format)
-            bytes_array.extend(color_lst)
-    for i in range(18):
-        if [i, 42] not in pixels_to_ignore:
-            color_lst = calculateKlaptrapPixel(list(pix[i, 42]), format)
-        else:
-            color_lst = calculateKlaptrapPixel(list(pixels_original[i][42]), format)
-        bytes_array.extend(color_lst)
-    for i in range(4):
-        bytes_array.extend(null_color)
-    for i in range(3):
-        if [(22 + i), 42] not in pixels_to_ignore:
-            color_lst = calculateKlaptrapPixel(list(pix[(22 + i), 42]), format)
-        else:
-            color_lst = calculateKlaptrapPixel(list(pixels_original[(22 + i)][42]), format)
-        bytes_array.extend(color_lst)
-    data = bytearray(bytes_array)
-    if table_index == 25:
-        data = gzip.compress(data, compresslevel=9)
-    ROM().seek(file_start)
-    ROM().writeBytes(data)
 
+    def build():
+        im_f = getImageFile(table_index, file_index, True, 32, 43, format)
+        pixels_original = imageToArray(im_f)
+        pixels = imageToArray(maskImage(im_f, color_index, 0, (color_index != 3)))
+        if len(pixels_to_ignore) > 0:
+            xs, ys = zip(*pixels_to_ignore)
+            pixels[ys, xs] = pixels_original[ys, xs]
+        # Klaptrap skins are always opaque
+        pixels[:, :, 3] = 255
+        return pixels
 
-def calculateKlaptrapPixel(mask: list, format: str):
-    """Calculate the new color for the given pixel."""
-    if format == TextureFormat.RGBA32:
-        color_lst = mask.copy()
-        color_lst.append(255)  # Alpha
-    else:
-        val_r = int((mask[0] >> 3) << 11)
-        val_g = int((mask[1] >> 3) << 6)
-        val_b = int((mask[2] >> 3) << 1)
-        rgba_val = val_r | val_g | val_b | 1
-        color_lst = [(rgba_val >> 8) & 0xFF, rgba_val & 0xFF]
-    return color_lst
+    params = (color_bases[color_index], color_index != 3, tuple(tuple(pixel) for pixel in pixels_to_ignore))
+    writeCachedKasplatTexture(build, table_index, file_index, format, "special_klaptrap_skin", params, [getTextureSourceHash(table_index, file_index)])
 
 
 def maskBlueprintImage(im_f, base_index):
     """Apply RGB mask to blueprint image."""
     w, h = im_f.size
-    im_f_original = im_f
+    pixels_original = imageToArray(im_f)
     converter = ImageEnhance.Color(im_f)
     im_f = converter.enhance(0)
     im_dupe = im_f.crop((0, 0, w, h))
     brightener = ImageEnhance.Brightness(im_dupe)
     im_dupe = brightener.enhance(2)
     im_f.paste(im_dupe, (0, 0), im_dupe)
-    pix = im_f.load()
-    pix2 = im_f_original.load()
+    pixels = imageToArray(im_f)
     mask = getRGBFromHash(color_bases[base_index])
     if max(mask[0], max(mask[1], mask[2])) < 39:
         for channel in range(3):
             mask[channel] = max(39, mask[channel])  # Too black is bad for these items
-    w, h = im_f.size
-    for x in range(w):
-        for y in range(h):
-            base = list(pix[x, y])
-            base2 = list(pix2[x, y])
-            if base[3] > 0:
-                # Filter out the wooden frame
-                # brown is orange, is red and (red+green), is very little blue
-                # but, if the color is light, we can't rely on the blue value alone.
-                if base2[2] > 20 and (base2[2] > base2[1] or base2[1] - base2[2] < 20):
-                    for channel in range(3):
-                        base[channel] = int(mask[channel] * (base[channel] / 255))
-                    pix[x, y] = (base[0], base[1], base[2], base[3])
-                else:
-                    pix[x, y] = (base2[0], base2[1], base2[2], base2[3])
-    return im_f
+    opaque = pixels[:, :, 3] > 0
+    green = pixels_original[:, :, 1].astype(np.int32)
+    blue = pixels_original[:, :, 2].astype(np.int32)
+    # Filter out the wooden frame
+    # brown is orange, is red and (red+green), is very little blue
+    # but, if the color is light, we can't rely on the blue value alone.
+    not_frame = (blue > 20) & ((blue > green) | ((green - blue) < 20))
+    applyColorMask(pixels, mask, opaque & not_frame)
+    pixels = np.where((opaque & ~not_frame)[:, :, np.newaxis], pixels_original, pixels)
+    return arrayToImage(pixels)
 
 
 def maskLaserImage(im_f, base_index):
     """Apply RGB mask to laser texture."""
     w, h = im_f.size
-    im_f_original = im_f
+    pixels_original = imageToArray(im_f)
     converter = ImageEnhance.Color(im_f)
     im_f = converter.enhance(0)
     im_dupe = im_f.crop((0, 0, w, h))
     brightener = ImageEnhance.Brightness(im_dupe)
     im_dupe = brightener.enhance(2)
     im_f.paste(im_dupe, (0, 0), im_dupe)
-    pix = im_f.load()
-    pix2 = im_f_original.load()
+    pixels = imageToArray(im_f)
     mask = getRGBFromHash(color_bases[base_index])
-    w, h = im_f.size
-    for x in range(w):
-        for y in range(h):
-            base = list(pix[x, y])
-            base2 = list(pix2[x, y])
-            if base[3] > 0:
-                # Filter out the white center of the laser
-                if min(base2[0], min(base2[1], base2[2])) <= 210:
-                    for channel in range(3):
-                        base[channel] = int(mask[channel] * (base[channel] / 255))
-                    pix[x, y] = (base[0], base[1], base[2], base[3])
-                else:
-                    pix[x, y] = (base2[0], base2[1], base2[2], base2[3])
-    return im_f
+    opaque = pixels[:, :, 3] > 0
+    # Filter out the white center of the laser
+    not_center = pixels_original[:, :, :3].min(axis=2) <= 210
+    applyColorMask(pixels, mask, opaque & not_center)
+    pixels = np.where((opaque & ~not_center)[:, :, np.newaxis], pixels_original, pixels)
+    return arrayToImage(pixels)
 
 
 def maskPotionImage(im_f, primary_color, secondary_color=None):
     """Apply RGB mask to DK arcade potion reward preview texture."""
-    w, h = im_f.size
-    pix = im_f.load()
+    pixels = imageToArray(im_f)
     mask = getRGBFromHash(primary_color)
-    if secondary_color is not None:
-        mask2 = secondary_color
     for channel in range(3):
         mask[channel] = max(1, mask[channel])
-    w, h = im_f.size
-    for x in range(w):
-        for y in range(h):
-            base = list(pix[x, y])
-            # Filter out transparent pixels and the cork
-            if base[3] > 0 and y > 2 and [x, y] not in [[9, 4], [10, 4]]:
-                # Filter out the bottle's contents
-                if base[0] == base[1] and base[1] == base[2]:
-                    if secondary_color is not None:
-                        # Color the bottle itself
-                        for channel in range(3):
-                            base[channel] = int(mask2[channel] * (base[channel] / 255))
-                else:
-                    # Color the bottle's contents
-                    average_light = int((base[0] + base[1] + base[2]) / 3)
-                    for channel in range(3):
-                        base[channel] = int(mask[channel] * (average_light / 255))
-            pix[x, y] = (base[0], base[1], base[2], base[3])
+    # Filter out transparent pixels and the cork
+    selected = pixels[:, :, 3] > 0
+    selected[:3] = False
+    selected[4, 9:11] = False
+    # Filter out the bottle's contents
+    bottle = (pixels[:, :, 0] == pixels[:, :, 1]) & (pixels[:, :, 1] == pixels[:, :, 2])
+    if secondary_color is not None:
+        # Color the bottle itself
+        applyColorMask(pixels, secondary_color, selected & bottle)
+    # Color the bottle's contents
+    average_light = pixels[:, :, :3].astype(np.int32).sum(axis=2) // 3
+    applyColorMask(pixels, mask, selected & ~bottle, np.repeat(average_light[:, :, np.newaxis], 3, axis=2))
+    im_f.paste(arrayToImage(pixels))
     return im_f
 
 
@@ -1911,9 +1745,15 @@ def recolorPotions(colorblind_mode):
             color = color_bases[index]
         else:
             color = "#FFFFFF"
-        potion_image = getImageFile(6, file, False, 20, 20, TextureFormat.RGBA5551)
-        potion_image = maskPotionImage(potion_image, color, secondary_color[index])
-        writeColorImageToROM(potion_image, 6, file, 20, 20, False, TextureFormat.RGBA5551)
+        writeCachedColorImageToROM(
+            lambda: maskPotionImage(getImageFile(6, file, False, 20, 20, TextureFormat.RGBA5551), color, secondary_color[index]),
+            6,
+            file,
+            False,
+            TextureFormat.RGBA5551,
+            "potion",
+            (color, secondary_color[index]),
+        )
 
 
 def recolorMushrooms():
@@ -1921,21 +1761,27 @@ def recolorMushrooms():
     reference_mushroom_image = getImageFile(7, 297, False, 32, 32, TextureFormat.RGBA5551)
     reference_mushroom_image_side1 = getImageFile(25, 0xD64, True, 64, 32, TextureFormat.RGBA5551)
     reference_mushroom_image_side2 = getImageFile(25, 0xD65, True, 64, 32, TextureFormat.RGBA5551)
+    # The reference images are among the recolored files, so hash them before they're overwritten
+    reference_hashes = [getTextureSourceHash(7, 297), getTextureSourceHash(25, 0xD64), getTextureSourceHash(25, 0xD65)]
     files_table_7 = [296, 295, 297, 299, 298]
     files_table_25_side_1 = [0xD60, getBonusSkinOffset(ExtraTextures.MushTop0), 0xD64, 0xD62, 0xD66]
     files_table_25_side_2 = [0xD61, getBonusSkinOffset(ExtraTextures.MushTop1), 0xD65, 0xD63, 0xD67]
-    for file in range(5):
+    mushrooms = [
         # Mushroom on the ceiling inside Fungi Forest Lobby
-        mushroom_image = getImageFile(7, files_table_7[file], False, 32, 32, TextureFormat.RGBA5551)
-        mushroom_image = maskMushroomImage(mushroom_image, reference_mushroom_image, color_bases[file])
-        writeColorImageToROM(mushroom_image, 7, files_table_7[file], 32, 32, False, TextureFormat.RGBA5551)
+        (7, files_table_7, False, 32, reference_mushroom_image, reference_hashes[0], False),
         # Mushrooms in Lanky's colored mushroom puzzle (and possibly also the bouncy mushrooms)
-        mushroom_image_side_1 = getImageFile(25, files_table_25_side_1[file], True, 64, 32, TextureFormat.RGBA5551)
-        mushroom_image_side_1 = maskMushroomImage(mushroom_image_side_1, reference_mushroom_image_side1, color_bases[file])
-        writeColorImageToROM(mushroom_image_side_1, 25, files_table_25_side_1[file], 64, 32, False, TextureFormat.RGBA5551)
-        mushroom_image_side_2 = getImageFile(25, files_table_25_side_2[file], True, 64, 32, TextureFormat.RGBA5551)
-        mushroom_image_side_2 = maskMushroomImage(mushroom_image_side_2, reference_mushroom_image_side2, color_bases[file], True)
-        writeColorImageToROM(mushroom_image_side_2, 25, files_table_25_side_2[file], 64, 32, False, TextureFormat.RGBA5551)
+        (25, files_table_25_side_1, True, 64, reference_mushroom_image_side1, reference_hashes[1], False),
+        (25, files_table_25_side_2, True, 64, reference_mushroom_image_side2, reference_hashes[2], True),
+    ]
+    for file in range(5):
+        for table, files, compressed, width, reference_image, reference_hash, side_2 in mushrooms:
+
+            def build():
+                mushroom_image = getImageFile(table, files[file], compressed, width, 32, TextureFormat.RGBA5551)
+                return maskMushroomImage(mushroom_image, reference_image, color_bases[file], side_2)
+
+            sources = [getTextureSourceHash(table, files[file]), reference_hash]
+            writeCachedColorImageToROM(build, table, files[file], False, TextureFormat.RGBA5551, "mushroom", (color_bases[file], side_2), sources)
 
 
 BALLOON_START = [5835, 5827, 5843, 5851, 5819]
@@ -1965,10 +1811,14 @@ def overwrite_object_colors(settings, ROM_COPY: ROM):
         file = 175
         dk_single = getImageFile(7, file, False, 44, 44, TextureFormat.RGBA5551)
         dk_single = dk_single.resize((21, 21))
+        # Preloaded images are among the recolored files, so hash them before they're overwritten
+        dk_single_hash = getTextureSourceHash(7, file)
         blueprint_lanky = []
+        blueprint_hashes = []
         # Preload blueprint images. Lanky's blueprint image is so much easier to mask, because it is blue, and the frame is brown
         for file in range(8):
             blueprint_lanky.append(getImageFile(25, 5519 + (file), True, 48, 42, TextureFormat.RGBA5551))
+            blueprint_hashes.append(getTextureSourceHash(25, 5519 + (file)))
         writeWhiteKasplatHairColorToROM("#FFFFFF", "#000000", 25, 4125, TextureFormat.RGBA5551)
         recolorWrinklyDoors()
         recolorSlamSwitches(galleon_switch_value, ROM_COPY)
@@ -1977,6 +1827,8 @@ def overwrite_object_colors(settings, ROM_COPY: ROM):
         recolorKlaptraps()
         recolorPotions(mode)
         recolorMushrooms()
+        # Every sprite below depends on the kong and the colorblind palette
+        palette = (tuple(color_bases), mode)
         for kong_index in range(5):
             # file = 4120
             # # Kasplat Hair
@@ -1984,74 +1836,92 @@ def overwrite_object_colors(settings, ROM_COPY: ROM):
             # hair_im = maskImage(hair_im, kong_index, 0)
             # writeColorImageToROM(hair_im, 25, [4124, 4122, 4123, 4120, 4121][kong_index], 32, 44, False)
             writeKasplatHairColorToROM(color_bases[kong_index], 25, [4124, 4122, 4123, 4120, 4121][kong_index], TextureFormat.RGBA5551)
+            params = (kong_index,) + palette
             for file in range(5519, 5527):
                 # Blueprint sprite
                 blueprint_start = [5624, 5608, 5519, 5632, 5616]
-                blueprint_im = blueprint_lanky[(file - 5519)]
-                blueprint_im = maskBlueprintImage(blueprint_im, kong_index)
-                writeColorImageToROM(blueprint_im, 25, blueprint_start[kong_index] + (file - 5519), 48, 42, False, TextureFormat.RGBA5551)
+                writeCachedColorImageToROM(
+                    lambda: maskBlueprintImage(blueprint_lanky[(file - 5519)], kong_index),
+                    25,
+                    blueprint_start[kong_index] + (file - 5519),
+                    False,
+                    TextureFormat.RGBA5551,
+                    "blueprint",
+                    params,
+                    [blueprint_hashes[(file - 5519)]],
+                )
             for file in range(4925, 4931):
                 # Shockwave
                 shockwave_start = [4897, 4903, 4712, 4950, 4925]
-                shockwave_im = getImageFile(25, shockwave_start[kong_index] + (file - 4925), True, 32, 32, TextureFormat.RGBA32)
-                shockwave_im = maskImage(shockwave_im, kong_index, 0)
-                writeColorImageToROM(shockwave_im, 25, shockwave_start[kong_index] + (file - 4925), 32, 32, False, TextureFormat.RGBA32)
+                shockwave_file = shockwave_start[kong_index] + (file - 4925)
+                writeCachedColorImageToROM(
+                    lambda: maskImage(getImageFile(25, shockwave_file, True, 32, 32, TextureFormat.RGBA32), kong_index, 0),
+                    25,
+                    shockwave_file,
+                    False,
+                    TextureFormat.RGBA32,
+                    "shockwave",
+                    params,
+                )
             for file in range(784, 796):
                 # Helm Laser (will probably also affect the Pufftoss laser and the Game Over laser)
                 laser_start = [784, 748, 363, 760, 772]
-                laser_im = getImageFile(7, laser_start[kong_index] + (file - 784), False, 32, 32, TextureFormat.RGBA32)
-                laser_im = maskLaserImage(laser_im, kong_index)
-                writeColorImageToROM(laser_im, 7, laser_start[kong_index] + (file - 784), 32, 32, False, TextureFormat.RGBA32)
-            if kong_index == 0 or kong_index == 3 or (kong_index == 2 and mode != ColorblindMode.trit):  # Lanky (prot, deut only) or DK or Tiny
-                for file in range(152, 160):
-                    # Single
-                    single_start = [168, 152, 232, 208, 240]
-                    single_im = getImageFile(7, single_start[kong_index] + (file - 152), False, 44, 44, TextureFormat.RGBA5551)
-                    single_im = maskImageWithOutline(single_im, kong_index, 0, mode, "single")
-                    writeColorImageToROM(single_im, 7, single_start[kong_index] + (file - 152), 44, 44, False, TextureFormat.RGBA5551)
-                for file in range(216, 224):
-                    # Coin
-                    coin_start = [224, 256, 248, 216, 264]
-                    coin_im = getImageFile(7, coin_start[kong_index] + (file - 216), False, 48, 42, TextureFormat.RGBA5551)
-                    coin_im = maskImageWithOutline(coin_im, kong_index, 0, mode)
-                    writeColorImageToROM(coin_im, 7, coin_start[kong_index] + (file - 216), 48, 42, False, TextureFormat.RGBA5551)
-                for file in range(274, 286):
-                    # Bunch
-                    bunch_start = [274, 854, 818, 842, 830]
-                    bunch_im = getImageFile(7, bunch_start[kong_index] + (file - 274), False, 44, 44, TextureFormat.RGBA5551)
-                    bunch_im = maskImageWithOutline(bunch_im, kong_index, 0, mode, "bunch")
-                    writeColorImageToROM(bunch_im, 7, bunch_start[kong_index] + (file - 274), 44, 44, False, TextureFormat.RGBA5551)
-                for file in range(5819, 5827):
-                    # Balloon
-                    balloon_im = getImageFile(25, BALLOON_START[kong_index] + (file - 5819), True, 32, 64, TextureFormat.RGBA5551)
-                    balloon_im = maskImageWithOutline(balloon_im, kong_index, 33, mode)
-                    balloon_im.paste(dk_single, balloon_single_frames[file - 5819], dk_single)
-                    writeColorImageToROM(balloon_im, 25, BALLOON_START[kong_index] + (file - 5819), 32, 64, False, TextureFormat.RGBA5551)
-            else:
-                for file in range(152, 160):
-                    # Single
-                    single_start = [168, 152, 232, 208, 240]
-                    single_im = getImageFile(7, single_start[kong_index] + (file - 152), False, 44, 44, TextureFormat.RGBA5551)
-                    single_im = maskImage(single_im, kong_index, 0)
-                    writeColorImageToROM(single_im, 7, single_start[kong_index] + (file - 152), 44, 44, False, TextureFormat.RGBA5551)
-                for file in range(216, 224):
-                    # Coin
-                    coin_start = [224, 256, 248, 216, 264]
-                    coin_im = getImageFile(7, coin_start[kong_index] + (file - 216), False, 48, 42, TextureFormat.RGBA5551)
-                    coin_im = maskImage(coin_im, kong_index, 0)
-                    writeColorImageToROM(coin_im, 7, coin_start[kong_index] + (file - 216), 48, 42, False, TextureFormat.RGBA5551)
-                for file in range(274, 286):
-                    # Bunch
-                    bunch_start = [274, 854, 818, 842, 830]
-                    bunch_im = getImageFile(7, bunch_start[kong_index] + (file - 274), False, 44, 44, TextureFormat.RGBA5551)
-                    bunch_im = maskImage(bunch_im, kong_index, 0, True)
-                    writeColorImageToROM(bunch_im, 7, bunch_start[kong_index] + (file - 274), 44, 44, False, TextureFormat.RGBA5551)
-                for file in range(5819, 5827):
-                    # Balloon
-                    balloon_im = getImageFile(25, BALLOON_START[kong_index] + (file - 5819), True, 32, 64, TextureFormat.RGBA5551)
-                    balloon_im = maskImage(balloon_im, kong_index, 33)
+                laser_file = laser_start[kong_index] + (file - 784)
+                writeCachedColorImageToROM(
+                    lambda: maskLaserImage(getImageFile(7, laser_file, False, 32, 32, TextureFormat.RGBA32), kong_index), 7, laser_file, False, TextureFormat.RGBA32, "laser", params
+                )
+            outlined = kong_index == 0 or kong_index == 3 or (kong_index == 2 and mode != ColorblindMode.trit)  # Lanky (prot, deut only) or DK or Tiny
+            for file in range(152, 160):
+                # Single
+                single_start = [168, 152, 232, 208, 240]
+                single_file = single_start[kong_index] + (file - 152)
+
+                def build():
+                    single_im = getImageFile(7, single_file, False, 44, 44, TextureFormat.RGBA5551)
+                    if outlined:
+                        return maskImageWithOutline(single_im, kong_index, 0, mode, "single")
+                    return maskImage(single_im, kong_index, 0)
+
+                writeCachedColorImageToROM(build, 7, single_file, False, TextureFormat.RGBA5551, "single", params)
+            for file in range(216, 224):
+                # Coin
+                coin_start = [224, 256, 248, 216, 264]
+                coin_file = coin_start[kong_index] + (file - 216)
+
+                def build():
+                    coin_im = getImageFile(7, coin_file, False, 48, 42, TextureFormat.RGBA5551)
+                    if outlined:
+                        return maskImageWithOutline(coin_im, kong_index, 0, mode)
+                    return maskImage(coin_im, kong_index, 0)
+
+                writeCachedColorImageToROM(build, 7, coin_file, False, TextureFormat.RGBA5551, "coin", params)
+            for file in range(274, 286):
+                # Bunch
+                bunch_start = [274, 854, 818, 842, 830]
+                bunch_file = bunch_start[kong_index] + (file - 274)
+
+                def build():
+                    bunch_im = getImageFile(7, bunch_file, False, 44, 44, TextureFormat.RGBA5551)
+                    if outlined:
+                        return maskImageWithOutline(bunch_im, kong_index, 0, mode, "bunch")
+                    return maskImage(bunch_im, kong_index, 0, True)
+
+                writeCachedColorImageToROM(build, 7, bunch_file, False, TextureFormat.RGBA5551, "bunch", params)
+            for file in range(5819, 5827):
+                # Balloon
+                balloon_file = BALLOON_START[kong_index] + (file - 5819)
+
+                def build():
+                    balloon_im = getImageFile(25, balloon_file, True, 32, 64, TextureFormat.RGBA5551)
+                    if outlined:
+                        balloon_im = maskImageWithOutline(balloon_im, kong_index, 33, mode)
+                    else:
+                        balloon_im = maskImage(balloon_im, kong_index, 33)
                     balloon_im.paste(dk_single, balloon_single_frames[file - 5819], dk_single)
-                    writeColorImageToROM(balloon_im, 25, BALLOON_START[kong_index] + (file - 5819), 32, 64, False, TextureFormat.RGBA5551)
+                    return balloon_im
+
+                sources = [getTextureSourceHash(25, balloon_file), dk_single_hash]
+                writeCachedColorImageToROM(build, 25, balloon_file, False, TextureFormat.RGBA5551, "balloon", params + (balloon_single_frames[file - 5819],), sources)
     else:
         # Recolor slam switch if colorblind mode is off
         if galleon_switch_value is not None:
@@ -2305,26 +2175,15 @@ def fixBaboonBlasts():
 def darkenDPad():
     """Change the DPad cross texture for the DPad HUD."""
     img = getImageFile(14, 187, True, 32, 32, TextureFormat.RGBA5551)
-    px = img.load()
-    bytes_array = []
-    for y in range(32):
-        for x in range(32):
-            pix_data = list(px[x, y])
-            if pix_data[0] > 245 and pix_data[1] > 245 and pix_data[2] > 245:
-                # Main white bit
-                pix_data[0] = 0
-                pix_data[1] = 0
-                pix_data[2] = 0
-            elif pix_data[0] == 0 and pix_data[1] == 0 and pix_data[2] == 0:
-                # Arrow impressions
-                pix_data[0] = 0xAB
-                pix_data[1] = 0xAB
-                pix_data[2] = 0xAB
-            value = 1 if pix_data[3] > 128 else 0
-            for v in range(3):
-                value |= (pix_data[v] >> 3) << 1 + (5 * (2 - v))
-            bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-    px_data = bytearray(bytes_array)
+    pixels = imageToArray(img)
+    colors = pixels[:, :, :3]
+    # Main white bit
+    white = (colors > 245).all(axis=2)
+    # Arrow impressions
+    black = (colors == 0).all(axis=2)
+    colors[white] = 0
+    colors[black] = 0xAB
+    px_data = encodeTexture(pixels, TextureFormat.RGBA5551, 128)
     px_data = gzip.compress(px_data, compresslevel=9)
     ROM().seek(js.pointer_addresses[14]["entries"][187]["pointing_to"])
     ROM().writeBytes(px_data)
@@ -2438,25 +2297,16 @@ def getValueFromByteArray(ba: bytearray, offset: int, size: int) -> int:
 
 def hueShiftImageContainer(table: int, image: int, width: int, height: int, format: TextureFormat, shift: int):
     """Load an image, shift the hue and rewrite it back to ROM."""
-    loaded_im = getImageFile(table, image, table != 7, width, height, format)
-    loaded_im = hueShift(loaded_im, shift)
-    loaded_px = loaded_im.load()
-    bytes_array = []
-    for y in range(height):
-        for x in range(width):
-            pix_data = list(loaded_px[x, y])
-            if format == TextureFormat.RGBA32:
-                bytes_array.extend(pix_data)
-            elif format == TextureFormat.RGBA5551:
-                red = int((pix_data[0] >> 3) << 11)
-                green = int((pix_data[1] >> 3) << 6)
-                blue = int((pix_data[2] >> 3) << 1)
-                alpha = int(pix_data[3] != 0)
-                value = red | green | blue | alpha
-                bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-    px_data = bytearray(bytes_array)
-    if table != 7:
-        px_data = gzip.compress(px_data, compresslevel=9)
+
+    def build():
+        loaded_im = getImageFile(table, image, table != 7, width, height, format)
+        loaded_im = hueShift(loaded_im, shift)
+        px_data = encodeTexture(imageToArray(loaded_im), format)
+        if table != 7:
+            px_data = gzip.compress(px_data, compresslevel=9)
+        return px_data
+
+    px_data = getCachedTextureData([getTextureSourceHash(table, image)], "hue_shift", (table, width, height, format, shift), build)
     ROM().seek(js.pointer_addresses[table]["entries"][image]["pointing_to"])
     ROM().writeBytes(px_data)
 
@@ -2465,7 +2315,7 @@ def getEnemySwapColor(channel_min: int = 0, channel_max: int = 255, min_channel_
     """Get an RGB color compatible with enemy swaps."""
     channels = []
     for _ in range(2):
-        channels.append(random.randint(channel_min, channel_max))
+        channels.append(cosmetic_random.randint(channel_min, channel_max))
     min_channel = min(channels[0], channels[1])
     max_channel = max(channels[0], channels[1])
     bounds = []
@@ -2475,11 +2325,11 @@ def getEnemySwapColor(channel_min: int = 0, channel_max: int = 255, min_channel_
         bounds.append([max_channel, channel_max])
     if (len(bounds) == 0) or ((max_channel - min_channel) >= min_channel_variance):
         # Default to random number pick
-        channels.append(random.randint(channel_min, channel_max))
+        channels.append(cosmetic_random.randint(channel_min, channel_max))
     else:
-        selected_bound = random.choice(bounds)
-        channels.append(random.randint(selected_bound[0], selected_bound[1]))
-    random.shuffle(channels)
+        selected_bound = cosmetic_random.choice(bounds)
+        channels.append(cosmetic_random.randint(selected_bound[0], selected_bound[1]))
+    cosmetic_random.shuffle(channels)
     value = 0
     for x in range(3):
         value <<= 8
@@ -2612,18 +2462,7 @@ def writeMiscCosmeticChanges(settings):
                         dims = (48, 42)
                     melon_im = getImageFile(table, img, table != 7, dims[0], dims[1], TextureFormat.RGBA5551)
                     melon_im = hueShift(melon_im, shift)
-                    melon_px = melon_im.load()
-                    bytes_array = []
-                    for y in range(dims[1]):
-                        for x in range(dims[0]):
-                            pix_data = list(melon_px[x, y])
-                            red = int((pix_data[0] >> 3) << 11)
-                            green = int((pix_data[1] >> 3) << 6)
-                            blue = int((pix_data[2] >> 3) << 1)
-                            alpha = int(pix_data[3] != 0)
-                            value = red | green | blue | alpha
-                            bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-                    px_data = bytearray(bytes_array)
+                    px_data = encodeTexture(imageToArray(melon_im), TextureFormat.RGBA5551)
                     if table != 7:
                         px_data = gzip.compress(px_data, compresslevel=9)
                     ROM().seek(js.pointer_addresses[table]["entries"][img]["pointing_to"])
@@ -3225,14 +3064,20 @@ def applyHelmDoorCosmetics(settings: Settings) -> None:
                     pearl_mask_im = Image.new("RGBA", (44, 44), (0, 0, 0, 255))
                     draw = ImageDraw.Draw(pearl_mask_im)
                     draw.ellipse((0, 0, 43, 43), fill=(0, 0, 0, 0), outline=(0, 0, 0, 0))
-                    pix_pearl = base.load()
-                    for y in range(44):
-                        for x in range(44):
-                            r, g, b, a = pearl_mask_im.getpixel((x, y))
-                            if a > 128:
-                                pix_pearl[x, y] = (0, 0, 0, 0)
+                    pearl_pixels = imageToArray(base)
+                    pearl_pixels[imageToArray(pearl_mask_im)[:, :, 3] > 128] = 0
+                    base.paste(arrayToImage(pearl_pixels))
                 writeColorImageToROM(base, 25, door.item_image, 44, 44, True, TextureFormat.RGBA5551)
-                writeColorImageToROM(numberToImage(door.count, (44, 44)).transpose(Image.FLIP_TOP_BOTTOM), 25, door.number_image, 44, 44, True, TextureFormat.RGBA5551)
+                writeCachedColorImageToROM(
+                    lambda: numberToImage(door.count, (44, 44)).transpose(Image.FLIP_TOP_BOTTOM),
+                    25,
+                    door.number_image,
+                    True,
+                    TextureFormat.RGBA5551,
+                    "helm_door_number",
+                    (door.count,),
+                    [getTextureSourceHash(14, 15), getTextureSourceHash(14, 16)],
+                )
 
 
 def changeBarrelColor(barrel_color: tuple = None, metal_color: tuple = None):
@@ -3310,30 +3155,13 @@ def applyHolidayMode(settings):
         ROM().writeMultipleBytes(2, 1)
         # Grab Snow texture, transplant it
         ROM().seek(0x1FF8000)
-        snow_im = Image.new(mode="RGBA", size=((32, 32)))
-        snow_px = snow_im.load()
-        snow_by = []
-        for y in range(32):
-            for x in range(32):
-                rgba_px = int.from_bytes(ROM().readBytes(2), "big")
-                red = ((rgba_px >> 11) & 31) << 3
-                green = ((rgba_px >> 6) & 31) << 3
-                blue = ((rgba_px >> 1) & 31) << 3
-                alpha = (rgba_px & 1) * 255
-                snow_px[x, y] = (red, green, blue, alpha)
+        snow_im = arrayToImage(decodeTexture(ROM().readBytes(32 * 32 * 2), 32, 32, TextureFormat.RGBA5551))
+        snow_by = bytearray()
         for dim in (32, 16, 8, 4):
             snow_im = snow_im.resize((dim, dim))
-            px = snow_im.load()
-            for y in range(dim):
-                for x in range(dim):
-                    rgba_data = list(px[x, y])
-                    data = 0
-                    for c in range(3):
-                        data |= (rgba_data[c] >> 3) << (1 + (5 * c))
-                    if rgba_data[3] != 0:
-                        data |= 1
-                    snow_by.extend([(data >> 8), (data & 0xFF)])
-        byte_data = gzip.compress(bytearray(snow_by), compresslevel=9)
+            # The snow mipmaps are written with the red and blue channels swapped
+            snow_by.extend(encodeTexture(imageToArray(snow_im)[:, :, [2, 1, 0, 3]], TextureFormat.RGBA5551))
+        byte_data = gzip.compress(snow_by, compresslevel=9)
         for img in (0x4DD, 0x4E4, 0x6B, 0xF0, 0x8B2, 0x5C2, 0x66E, 0x66F, 0x685, 0x6A1, 0xF8, 0x136):
             start = js.pointer_addresses[25]["entries"][img]["pointing_to"]
             ROM().seek(start)
@@ -3366,17 +3194,7 @@ def applyHolidayMode(settings):
                     b_x = banana_placement[bi][1]
                     b_y = banana_placement[bi][2]
                     side_im.paste(banana, (b_x, b_y), banana)
-            side_by = []
-            side_px = side_im.load()
-            for y in range(16):
-                for x in range(32):
-                    red_short = (side_px[x, y][0] >> 3) & 31
-                    green_short = (side_px[x, y][1] >> 3) & 31
-                    blue_short = (side_px[x, y][2] >> 3) & 31
-                    alpha_short = 1 if side_px[x, y][3] > 128 else 0
-                    value = (red_short << 11) | (green_short << 6) | (blue_short << 1) | alpha_short
-                    side_by.extend([(value >> 8) & 0xFF, value & 0xFF])
-            px_data = bytearray(side_by)
+            px_data = encodeTexture(imageToArray(side_im), TextureFormat.RGBA5551, 128)
             px_data = gzip.compress(px_data, compresslevel=9)
             ROM().seek(js.pointer_addresses[25]["entries"][img]["pointing_to"])
             ROM().writeBytes(px_data)
@@ -3406,17 +3224,7 @@ def applyHolidayMode(settings):
         for img in (0xBB2, 0xBB3):
             side_im = getImageFile(25, img, True, 32, 16, TextureFormat.RGBA5551)
             hueShift(side_im, -12)
-            side_by = []
-            side_px = side_im.load()
-            for y in range(16):
-                for x in range(32):
-                    red_short = (side_px[x, y][0] >> 3) & 31
-                    green_short = (side_px[x, y][1] >> 3) & 31
-                    blue_short = (side_px[x, y][2] >> 3) & 31
-                    alpha_short = 1 if side_px[x, y][3] > 128 else 0
-                    value = (red_short << 11) | (green_short << 6) | (blue_short << 1) | alpha_short
-                    side_by.extend([(value >> 8) & 0xFF, value & 0xFF])
-            px_data = bytearray(side_by)
+            px_data = encodeTexture(imageToArray(side_im), TextureFormat.RGBA5551, 128)
             px_data = gzip.compress(px_data, compresslevel=9)
             ROM().seek(js.pointer_addresses[25]["entries"][img]["pointing_to"])
             ROM().writeBytes(px_data)
@@ -3563,21 +3371,13 @@ def darkenPauseBubble(settings: Settings):
     if not settings.dark_mode_textboxes:
         return
     img = getImageFile(14, 107, True, 48, 32, TextureFormat.RGBA5551)
-    px = img.load()
-    canary_px = list(px[24, 16])
+    pixels = imageToArray(img)
+    canary_px = pixels[16, 24]
     if canary_px[0] < 128 and canary_px[1] < 128 and canary_px[2] < 128:
         # Already darkened, cancel
         return
-    bytes_array = []
-    for y in range(32):
-        for x in range(48):
-            pix_data = list(px[x, y])
-            value = 1 if pix_data[3] > 128 else 0
-            for v in range(3):
-                pix_data[v] = 0xFF - pix_data[v]
-                value |= (pix_data[v] >> 3) << 1 + (5 * (2 - v))
-            bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-    px_data = bytearray(bytes_array)
+    pixels[:, :, :3] = 0xFF - pixels[:, :, :3]
+    px_data = encodeTexture(pixels, TextureFormat.RGBA5551, 128)
     px_data = gzip.compress(px_data, compresslevel=9)
     ROM().seek(js.pointer_addresses[14]["entries"][107]["pointing_to"])
     ROM().writeBytes(px_data)
@@ -3926,8 +3726,8 @@ crown_tails = (
 def getCrownNames() -> list:
     """Get crown names from head and tail pools."""
     # Get 10 names for heads just in case "Forest" and "Fracas" show up
-    heads = random.sample(crown_heads, 10)
-    tails = random.sample(crown_tails, 9)
+    heads = cosmetic_random.sample(crown_heads, 10)
+    tails = cosmetic_random.sample(crown_tails, 9)
     # Remove "Forest" if both "Forest" and "Fracas" show up
     if "Forest" in heads and "Fracas" in tails:
         heads.remove("Forest")
@@ -3957,7 +3757,7 @@ def writeCrownNames():
 def writeBootMessages() -> None:
     """Write boot messages into ROM."""
     ROM_COPY = LocalROM()
-    placed_messages = random.sample(boot_phrases, 4)
+    placed_messages = cosmetic_random.sample(boot_phrases, 4)
     for message_index, message in enumerate(placed_messages):
         ROM_COPY.seek(0x1FFD000 + (0x40 * message_index))
         ROM_COPY.writeBytes(message.upper().encode("ascii"))
@@ -3975,7 +3775,7 @@ def writeTransition(settings: Settings) -> None:
     settings.custom_transition = None
     if len(file_data) == 0:
         return
-    selected_transition = random.choice(file_data)
+    selected_transition = cosmetic_random.choice(file_data)
     settings.custom_transition = selected_transition[1].split("/")[-1]  # File Name
     im_f = Image.open(BytesIO(bytes(selected_transition[0])))
     writeColorImageToROM(im_f, 14, 95, 64, 64, False, TextureFormat.IA4)
@@ -4018,7 +3818,7 @@ def writeCustomPortal(settings: Settings) -> None:
     settings.custom_troff_portal = None
     if len(file_data) == 0:
         return
-    selected_portal = random.choice(file_data)
+    selected_portal = cosmetic_random.choice(file_data)
     settings.custom_troff_portal = selected_portal[1].split("/")[-1]  # File Name
     im_f = Image.open(BytesIO(bytes(selected_portal[0])))
     im_f = getImageChunk(im_f, 63, 63)
@@ -4101,7 +3901,7 @@ def writeCustomPaintings(settings: Settings) -> None:
         mult = math.ceil(PAINTING_COUNT / len(list_pool)) - 1
         for _ in range(mult):
             list_pool.extend(file_data.copy())
-    random.shuffle(list_pool)
+    cosmetic_random.shuffle(list_pool)
     for painting in PAINTING_INFO:
         painting.name = None
         selected_painting = list_pool.pop(0)
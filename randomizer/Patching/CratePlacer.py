@@ -1,10 +1,10 @@
 """Melon crate Randomizer Code."""
 
-import js
 from randomizer.Enums.ScriptTypes import ScriptTypes
 from randomizer.Lists.CustomLocations import CustomLocations
 from randomizer.Enums.Maps import Maps
 from randomizer.Patching.Lib import addNewScript, float_to_hex, getNextFreeID
+from randomizer.Patching.LibSetup import ModelTwoRecord, readSetupFile, writeSetupFile
 from randomizer.Patching.Patcher import LocalROM
 
 
@@ -50,23 +50,9 @@ def randomize_melon_crate(spoiler):
                         keep_galleon_crate = True
 
         for cont_map_id in action_maps:
-            setup_table = js.pointer_addresses[9]["entries"][cont_map_id]["pointing_to"]
-            ROM_COPY.seek(setup_table)
-            model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            persisted_m2 = []
-            for model2_item in range(model2_count):
-                accept = True
-                item_start = setup_table + 4 + (model2_item * 0x30)
-                ROM_COPY.seek(item_start + 0x28)
-                item_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                if (not (cont_map_id == Maps.GloomyGalleon and keep_galleon_crate)) and item_type == 0xB5:
-                    accept = False  # crate is being removed
-                if accept:
-                    ROM_COPY.seek(item_start)
-                    data = []
-                    for int_index in range(int(0x30 / 4)):
-                        data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                    persisted_m2.append(data)
+            setup = readSetupFile(ROM_COPY, cont_map_id)
+            if not (cont_map_id == Maps.GloomyGalleon and keep_galleon_crate):
+                setup.model_two = [item for item in setup.model_two if item.type != 0xB5]  # crate is being removed
             crate_ids = []
             for crate in placements:
                 if crate.map == cont_map_id and not crate.is_galleon_floating_crate:
@@ -78,38 +64,23 @@ def randomize_melon_crate(spoiler):
                         ignore_ids.append(9)  # Ban crate being placed on ID 9 in Greenhouse
                     selected_id = getNextFreeID(cont_map_id, ignore_ids)
                     crate_ids.append(selected_id)
-                    persisted_m2.append(
-                        [
-                            int(float_to_hex(crate.coords[0]), 16),
-                            int(float_to_hex(crate.coords[1]), 16),
-                            int(float_to_hex(crate.coords[2]), 16),
-                            int(float_to_hex(crate_scale), 16),
-                            0x027B0002,
-                            0x05800640,
-                            int(float_to_hex(crate.rot_x), 16),
-                            int(float_to_hex(rotation), 16),
-                            int(float_to_hex(crate.rot_z), 16),
-                            0,
-                            (0xB5 << 16) | selected_id,
-                            1 << 16,
-                        ]
+                    setup.model_two.append(
+                        ModelTwoRecord.fromWords(
+                            [
+                                int(float_to_hex(crate.coords[0]), 16),
+                                int(float_to_hex(crate.coords[1]), 16),
+                                int(float_to_hex(crate.coords[2]), 16),
+                                int(float_to_hex(crate_scale), 16),
+                                0x027B0002,
+                                0x05800640,
+                                int(float_to_hex(crate.rot_x), 16),
+                                int(float_to_hex(rotation), 16),
+                                int(float_to_hex(crate.rot_z), 16),
+                                0,
+                                (0xB5 << 16) | selected_id,
+                                1 << 16,
+                            ]
+                        )
                     )
                     addNewScript(cont_map_id, [selected_id], ScriptTypes.MelonCrate)
-            ROM_COPY.seek(setup_table + 4 + (model2_count * 0x30))
-            mystery_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            extra_data = [mystery_count]
-            for mys_item in range(mystery_count):
-                for int_index in range(int(0x24 / 4)):
-                    extra_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-            actor_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            extra_data.append(actor_count)
-            for act_item in range(actor_count):
-                for int_index in range(int(0x38 / 4)):
-                    extra_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-            ROM_COPY.seek(setup_table)
-            ROM_COPY.writeMultipleBytes(len(persisted_m2), 4)
-            for model2 in persisted_m2:
-                for int_val in model2:
-                    ROM_COPY.writeMultipleBytes(int_val, 4)
-            for int_val in extra_data:
-                ROM_COPY.writeMultipleBytes(int_val, 4)
+            writeSetupFile(ROM_COPY, cont_map_id, setup)
@@ -1,15 +1,14 @@
 """Apply Boss Locations."""
 
-import random
-
-import js
 from randomizer.Enums.EnemySubtypes import EnemySubtype
 from randomizer.Enums.Settings import CrownEnemyRando, DamageAmount, WinConditionComplex
 from randomizer.Lists.EnemyTypes import EnemyMetaData, enemy_location_list
 from randomizer.Enums.Enemies import Enemies
 from randomizer.Enums.Locations import Locations
 from randomizer.Enums.Maps import Maps
+from randomizer.Patching.LibSetup import SpawnerRecord, readSpawnerFile, writeSpawnerFile
 from randomizer.Patching.Patcher import LocalROM
+from randomizer.RandomStreams import enemy_random
 
 
 class PkmnSnapEnemy:
@@ -37,10 +36,10 @@ class PkmnSnapEnemy:
 class Spawner:
     """Class which stores information pertaining to a spawner."""
 
-    def __init__(self, enemy_id: int, offset: int, index: int):
+    def __init__(self, enemy_id: int, record: SpawnerRecord, index: int):
         """Initialize with given parameters."""
         self.enemy_id = enemy_id
-        self.offset = offset
+        self.record = record
         self.index = index
 
 
@@ -299,14 +298,14 @@ def getBalancedCrownEnemyRando(spoiler, crown_setting, damage_ohko_setting):
         # picking enemies to put in the crown battles
         if crown_setting == CrownEnemyRando.easy:
             for map_id in enemy_swaps_library:
-                enemy_swaps_library[map_id].append(random.choice(disruptive_max_1))
+                enemy_swaps_library[map_id].append(enemy_random.choice(disruptive_max_1))
                 if oops_all_get_out is True:
                     enemy_swaps_library[map_id].append(Enemies.GetOut)
                 else:
-                    enemy_swaps_library[map_id].append(random.choice(disruptive_0))
-                enemy_swaps_library[map_id].append(random.choice(disruptive_0))
+                    enemy_swaps_library[map_id].append(enemy_random.choice(disruptive_0))
+                enemy_swaps_library[map_id].append(enemy_random.choice(disruptive_0))
                 if map_id == Maps.GalleonCrown or map_id == Maps.LobbyCrown or map_id == Maps.HelmCrown:
-                    enemy_swaps_library[map_id].append(random.choice(disruptive_0))
+                    enemy_swaps_library[map_id].append(enemy_random.choice(disruptive_0))
         elif crown_setting == CrownEnemyRando.medium:
             new_enemy = 0
             for map_id in enemy_swaps_library:
@@ -320,21 +319,21 @@ def getBalancedCrownEnemyRando(spoiler, crown_setting, damage_ohko_setting):
                         new_enemy = Enemies.GetOut
                     elif count_disruptive == 0:
                         if count_kasplats < 2:
-                            new_enemy = random.choice(every_enemy)
+                            new_enemy = enemy_random.choice(every_enemy)
                         elif count_kasplats == 2:
-                            new_enemy = random.choice(disruptive_max_1)
+                            new_enemy = enemy_random.choice(disruptive_max_1)
                         elif count_kasplats == 3:
-                            new_enemy = random.choice(disruptive_0)
+                            new_enemy = enemy_random.choice(disruptive_0)
                     elif count_disruptive == 1:
                         if count_kasplats < 2:
-                            new_enemy = random.choice(disruptive_max_1)
+                            new_enemy = enemy_random.choice(disruptive_max_1)
                         elif count_kasplats == 2:
-                            new_enemy = random.choice(disruptive_0)
+                            new_enemy = enemy_random.choice(disruptive_0)
                     elif count_disruptive == 2:
                         if count_kasplats == 0:
-                            new_enemy = random.choice(disruptive_at_most_kasplat)
+                            new_enemy = enemy_random.choice(disruptive_at_most_kasplat)
                         elif count_kasplats == 1:
-                            new_enemy = random.choice(disruptive_0)
+                            new_enemy = enemy_random.choice(disruptive_0)
                     if count_kasplats > 3 or (count_kasplats > 2 and count_disruptive > 1) or (count_kasplats == 2 and count_disruptive == 2):
                         print("This is a mistake in the crown enemy algorithm. Report this to the devs.")
                         new_enemy = Enemies.BeaverGold
@@ -354,127 +353,94 @@ def getBalancedCrownEnemyRando(spoiler, crown_setting, damage_ohko_setting):
                         enemy_to_place = Enemies.GetOut
                         get_out_spawned_this_hard_map = True
                     elif get_out_spawned_this_hard_map:
-                        enemy_to_place = random.choice([possible_enemy for possible_enemy in legacy_hard_mode if possible_enemy != Enemies.GetOut])
+                        enemy_to_place = enemy_random.choice([possible_enemy for possible_enemy in legacy_hard_mode if possible_enemy != Enemies.GetOut])
                     else:
-                        enemy_to_place = random.choice(legacy_hard_mode)
+                        enemy_to_place = enemy_random.choice(legacy_hard_mode)
                         if enemy_to_place == Enemies.GetOut:
                             get_out_spawned_this_hard_map = True
                     enemy_swaps_library[map_id].append(enemy_to_place)
         # one last shuffle, to make sure any enemy can spawn in any spot
         for map_id in enemy_swaps_library:
             if len(enemy_swaps_library[map_id]) > 0:
-                random.shuffle(enemy_swaps_library[map_id])
+                enemy_random.shuffle(enemy_swaps_library[map_id])
     return enemy_swaps_library
 
 
-def writeEnemy(spoiler, cont_map_spawner_address: int, new_enemy_id: int, spawner: Spawner, cont_map_id: Maps, crown_timer: int = 0):
-    """Write enemy to ROM."""
-    ROM_COPY = LocalROM()
-    ROM_COPY.seek(cont_map_spawner_address + spawner.offset)
-    ROM_COPY.writeMultipleBytes(new_enemy_id, 1)
+def writeEnemy(spoiler, new_enemy_id: int, spawner: Spawner, cont_map_id: Maps, crown_timer: int = 0):
+    """Write enemy to its spawner."""
+    record = spawner.record
+    record.enemy_id = new_enemy_id
     # Enemy fixes
     if new_enemy_id in EnemyMetaData.keys():
-        ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x10)
-        ROM_COPY.writeMultipleBytes(EnemyMetaData[new_enemy_id].aggro, 1)
+        record.data[0x10] = EnemyMetaData[new_enemy_id].aggro
         if new_enemy_id == Enemies.RoboKremling:
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xB)
-            ROM_COPY.writeMultipleBytes(0xC8, 1)
+            record.data[0xB] = 0xC8
         elif new_enemy_id == Enemies.SpiderSmall:
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x1)
-            ROM_COPY.writeMultipleBytes(0, 1)
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xB)
-            ROM_COPY.writeMultipleBytes(0, 1)
+            record.data[0x1] = 0
+            record.data[0xB] = 0
             # Spawning fixes
             # Prevent respawn anim if that's how they initially appear
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x12)
-            init_respawn_state = int.from_bytes(ROM_COPY.readBytes(1), "big")
-            if init_respawn_state == 3:
-                ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x12)
-                ROM_COPY.writeMultipleBytes(0, 1)
+            if record.data[0x12] == 3:
+                record.data[0x12] = 0
             # Prevent them respawning
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x14)
-            ROM_COPY.writeMultipleBytes(0, 1)
+            record.data[0x14] = 0
         elif new_enemy_id == Enemies.Kaboom:
             # Fix their time to uh-oh timer
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xA)
-            ROM_COPY.writeMultipleBytes(140, 2)
+            record.setShort(0xA, 140)
 
         if (cont_map_id in crown_maps or cont_map_id in minigame_maps_total) and EnemyMetaData[new_enemy_id].air:
             height = 300
             if cont_map_id in crown_maps:
-                height = int(random.uniform(250, 300))
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x6)
-            ROM_COPY.writeMultipleBytes(height, 2)
+                height = int(enemy_random.uniform(250, 300))
+            record.setShort(0x6, height)
         if cont_map_id in crown_maps and new_enemy_id == Enemies.GetOut:
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xA)
             get_out_timer = 20
             if crown_timer > 20:
                 damage_mult = 1
                 damage_amts = {DamageAmount.double: 2, DamageAmount.quad: 4, DamageAmount.ohko: 12}
                 if spoiler.settings.damage_amount in damage_amts:
                     damage_mult = damage_amts[spoiler.settings.damage_amount]
-                get_out_timer = random.randint(int(crown_timer / (12 / damage_mult)) + 1, crown_timer - 1)
+                get_out_timer = enemy_random.randint(int(crown_timer / (12 / damage_mult)) + 1, crown_timer - 1)
             if get_out_timer == 0:
                 get_out_timer = 1
-            ROM_COPY.writeMultipleBytes(get_out_timer, 1)
-            ROM_COPY.writeMultipleBytes(get_out_timer, 1)
+            record.data[0xA] = get_out_timer
+            record.data[0xB] = get_out_timer
         # Scale Adjustment
         if (EnemyMetaData[new_enemy_id].default_size is not None) and (cont_map_id not in banned_size_maps):
             scale = EnemyMetaData[new_enemy_id].default_size
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
             if cont_map_id == Maps.JapesTinyHive:
                 # Is a mini monkey map, where we'd expect to see enemy sizes to be bigger to fit thematically
                 scale = min(255, int(2.5 * scale))
             if spoiler.settings.randomize_enemy_sizes:
                 lower_b = int(scale * 0.3)
                 upper_b = min(255, int(1.5 * scale))
-                chosen_scale = random.randint(lower_b, upper_b)
-                ROM_COPY.writeMultipleBytes(chosen_scale, 1)
+                chosen_scale = enemy_random.randint(lower_b, upper_b)
+                record.scale = chosen_scale
             elif spoiler.settings.normalize_enemy_sizes:
-                ROM_COPY.writeMultipleBytes(scale, 1)
-        ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-        default_scale = int.from_bytes(ROM_COPY.readBytes(1), "big")
+                record.scale = scale
         if EnemyMetaData[new_enemy_id].size_cap > 0:
-            if default_scale > EnemyMetaData[new_enemy_id].size_cap:
-                ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-                ROM_COPY.writeMultipleBytes(EnemyMetaData[new_enemy_id].size_cap, 1)
-        ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-        pre_size = int.from_bytes(ROM_COPY.readBytes(1), "big")
-        if pre_size < EnemyMetaData[new_enemy_id].bbbarrage_min_scale and cont_map_id in bbbarrage_maps and ENABLE_BBBARRAGE_ENEMY_RANDO:
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-            ROM_COPY.writeMultipleBytes(EnemyMetaData[new_enemy_id].bbbarrage_min_scale, 1)
+            if record.scale > EnemyMetaData[new_enemy_id].size_cap:
+                record.scale = EnemyMetaData[new_enemy_id].size_cap
+        if record.scale < EnemyMetaData[new_enemy_id].bbbarrage_min_scale and cont_map_id in bbbarrage_maps and ENABLE_BBBARRAGE_ENEMY_RANDO:
+            record.scale = EnemyMetaData[new_enemy_id].bbbarrage_min_scale
         if new_enemy_id in (Enemies.KlaptrapPurple, Enemies.KlaptrapRed) and cont_map_id == Maps.CavesDiddyLowerCabin:
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-            ROM_COPY.write(75)
+            record.scale = 75
         # Speed Adjustment
         if spoiler.settings.enemy_speed_rando:
             if cont_map_id not in banned_speed_maps:
                 min_speed = EnemyMetaData[new_enemy_id].min_speed
                 max_speed = EnemyMetaData[new_enemy_id].max_speed
                 if min_speed > 0 and max_speed > 0:
-                    ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xD)
-                    agg_speed = random.randint(min_speed, max_speed)
-                    ROM_COPY.writeMultipleBytes(agg_speed, 1)
-                    ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xC)
-                    ROM_COPY.writeMultipleBytes(random.randint(min_speed, agg_speed), 1)
+                    agg_speed = enemy_random.randint(min_speed, max_speed)
+                    record.aggro_speed = agg_speed
+                    record.idle_speed = enemy_random.randint(min_speed, agg_speed)
         if cont_map_id in bbbarrage_maps and ENABLE_BBBARRAGE_ENEMY_RANDO:
             # Reduce Speeds
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xC)
-            speeds = []
-            for x in range(2):
-                speeds.append(int.from_bytes(ROM_COPY.readBytes(1), "big"))
-            ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xC)
-            for x in speeds:
-                ROM_COPY.writeMultipleBytes(int(x * 0.75), 1)
+            record.idle_speed = int(record.idle_speed * 0.75)
+            record.aggro_speed = int(record.aggro_speed * 0.75)
         elif cont_map_id in minigame_maps_beavers and new_enemy_id == Enemies.BeaverGold:
-            for speed_offset in [0xC, 0xD]:
-                ROM_COPY.seek(cont_map_spawner_address + spawner.offset + speed_offset)
-                default_speed = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                new_speed = int(default_speed * 1.1)
-                if new_speed > 255:
-                    new_speed = 255
-                ROM_COPY.seek(cont_map_spawner_address + spawner.offset + speed_offset)
-                ROM_COPY.writeMultipleBytes(new_speed, 1)
+            record.idle_speed = min(int(record.idle_speed * 1.1), 255)
+            record.aggro_speed = min(int(record.aggro_speed * 1.1), 255)
 
 
 def randomize_enemies_0(spoiler):
@@ -555,39 +521,16 @@ def randomize_enemies(spoiler):
                         minigame_enemies_simple.append(enemy)
         ROM_COPY = LocalROM()
         for cont_map_id in range(216):
-            cont_map_spawner_address = js.pointer_addresses[16]["entries"][cont_map_id]["pointing_to"]
-            vanilla_spawners = []
-            ROM_COPY.seek(cont_map_spawner_address)
-            fence_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset = 2
-            if fence_count > 0:
-                for x in range(fence_count):
-                    ROM_COPY.seek(cont_map_spawner_address + offset)
-                    point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    offset += (point_count * 6) + 2
-                    ROM_COPY.seek(cont_map_spawner_address + offset)
-                    point0_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    offset += (point0_count * 10) + 6
-            ROM_COPY.seek(cont_map_spawner_address + offset)
-            spawner_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+            spawner_file = readSpawnerFile(ROM_COPY, cont_map_id)
+            spawner_count = len(spawner_file.spawners)
             # Generate Enemy Swaps lists
             enemy_swaps = {}
             for enemy_class in enemy_classes:
                 arr = []
                 for x in range(spawner_count):
-                    arr.append(random.choice(enemy_placement_classes[enemy_class]))
+                    arr.append(enemy_random.choice(enemy_placement_classes[enemy_class]))
                 enemy_swaps[enemy_class] = arr
-            offset += 2
-            for _ in range(spawner_count):
-                ROM_COPY.seek(cont_map_spawner_address + offset)
-                enemy_id = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                ROM_COPY.seek(cont_map_spawner_address + offset + 0x13)
-                enemy_index = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                init_offset = offset
-                ROM_COPY.seek(cont_map_spawner_address + offset + 0x11)
-                extra_count = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                offset += 0x16 + (extra_count * 2)
-                vanilla_spawners.append(Spawner(enemy_id, init_offset, enemy_index))
+            vanilla_spawners = [Spawner(record.enemy_id, record, record.index) for record in spawner_file.spawners]
             if spoiler.settings.enemy_rando and cont_map_id in spoiler.enemy_rando_data:
                 referenced_spawner = None
                 for enemy in spoiler.enemy_rando_data[cont_map_id]:
@@ -596,7 +539,7 @@ def randomize_enemies(spoiler):
                             referenced_spawner = spawner
                             break
                     if referenced_spawner is not None:
-                        writeEnemy(spoiler, cont_map_spawner_address, enemy["enemy"], referenced_spawner, cont_map_id, 0)
+                        writeEnemy(spoiler, enemy["enemy"], referenced_spawner, cont_map_id, 0)
             if spoiler.settings.enemy_rando and cont_map_id in minigame_maps_total:
                 tied_enemy_list = []
                 if cont_map_id in minigame_maps_easy:
@@ -612,17 +555,17 @@ def randomize_enemies(spoiler):
                     tied_enemy_list = minigame_enemies_beavers.copy()
                 for spawner in vanilla_spawners:
                     if spawner.enemy_id in tied_enemy_list:
-                        new_enemy_id = random.choice(tied_enemy_list)
+                        new_enemy_id = enemy_random.choice(tied_enemy_list)
                         # Balance beaver bother so it's a 4:1 ratio of blue to gold beavers, guarantee 1 gold
                         if cont_map_id in minigame_maps_beavers:
                             if spawner.index == 1:
                                 new_enemy_id = Enemies.BeaverGold
                             else:
-                                selection = random.uniform(0, 1)
+                                selection = enemy_random.uniform(0, 1)
                                 new_enemy_id = Enemies.BeaverBlue
                                 if selection < 0.2:
                                     new_enemy_id = Enemies.BeaverGold
-                        writeEnemy(spoiler, cont_map_spawner_address, new_enemy_id, spawner, cont_map_id, 0)
+                        writeEnemy(spoiler, new_enemy_id, spawner, cont_map_id, 0)
             if spoiler.settings.crown_enemy_rando != CrownEnemyRando.off and cont_map_id in crown_maps:
                 # Determine Crown Timer
                 limits = {
@@ -631,15 +574,15 @@ def randomize_enemies(spoiler):
                     CrownEnemyRando.hard: 30,
                 }
                 low_limit = limits.get(spoiler.settings.crown_enemy_rando, 5)
-                crown_timer = random.randint(low_limit, 60)
+                crown_timer = enemy_random.randint(low_limit, 60)
                 # Place Enemies
                 for spawner in vanilla_spawners:
                     if spawner.enemy_id in crown_enemies:
                         new_enemy_id = crown_enemies_library[cont_map_id].pop()
-                        writeEnemy(spoiler, cont_map_spawner_address, new_enemy_id, spawner, cont_map_id, crown_timer)
+                        writeEnemy(spoiler, new_enemy_id, spawner, cont_map_id, crown_timer)
                     elif spawner.enemy_id == Enemies.BattleCrownController:
-                        ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xB)
-                        ROM_COPY.writeMultipleBytes(crown_timer, 1)  # Determine Crown length. DK64 caps at 255 seconds
+                        spawner.record.data[0xB] = crown_timer  # Determine Crown length. DK64 caps at 255 seconds
+            writeSpawnerFile(ROM_COPY, cont_map_id, spawner_file)
         if spoiler.settings.win_condition_item == WinConditionComplex.krem_kapture:
             # Pkmn snap handler
             values = [0, 0, 0, 0, 0]
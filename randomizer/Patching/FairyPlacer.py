@@ -1,68 +1,25 @@
 """Place fairies into the world."""
 
-import js
+import struct
+
 from randomizer.Enums.Enemies import Enemies
 from randomizer.Lists.FairyLocations import fairy_locations, relocated_5ds_fairy
 from randomizer.Enums.Maps import Maps
+from randomizer.Patching.LibSetup import SpawnerRecord, readSpawnerFile, writeSpawnerFile
 from randomizer.Patching.Patcher import LocalROM
 
 
 def ReplaceShipFairy(spoiler):
     """Replace the fairy inside 5DS with an easier to get fairy."""
     ROM_COPY = LocalROM()
-    file_start = js.pointer_addresses[16]["entries"][Maps.Galleon5DShipDKTiny]["pointing_to"]
-    ROM_COPY.seek(file_start)
-    fence_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-    offset = 2
-    fence_bytes = []
-    used_fence_ids = []
-    if fence_count > 0:
-        for x in range(fence_count):
-            fence = []
-            fence_start = file_start + offset
-            ROM_COPY.seek(file_start + offset)
-            point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset += (point_count * 6) + 2
-            ROM_COPY.seek(file_start + offset)
-            point0_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset += (point0_count * 10) + 6
-            fence_finish = file_start + offset
-            fence_size = fence_finish - fence_start
-            ROM_COPY.seek(fence_finish - 4)
-            used_fence_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-            ROM_COPY.seek(fence_start)
-            for y in range(int(fence_size / 2)):
-                fence.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-            fence_bytes.append(fence)
-            ROM_COPY.seek(fence_finish)
-    spawner_count_location = file_start + offset
-    ROM_COPY.seek(spawner_count_location)
-    spawner_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-    offset += 2
-    spawner_bytes = []
+    spawner_file = readSpawnerFile(ROM_COPY, Maps.Galleon5DShipDKTiny)
+    used_fence_ids = spawner_file.getFenceIds()
     fairy_spawner_id = None
-    for x in range(spawner_count):
-        # Parse spawners
-        ROM_COPY.seek(file_start + offset)
-        enemy_id = int.from_bytes(ROM_COPY.readBytes(1), "big")
-        ROM_COPY.seek(file_start + offset + 0x13)
-        enemy_index = int.from_bytes(ROM_COPY.readBytes(1), "big")
-        init_offset = offset
-        ROM_COPY.seek(file_start + offset + 0x11)
-        extra_count = int.from_bytes(ROM_COPY.readBytes(1), "big")
-        offset += 0x16 + (extra_count * 2)
-        end_offset = offset
-        if enemy_id != Enemies.Fairy:
-            # Keep enemy if not fairy
-            data_bytes = []
-            spawner_size = end_offset - init_offset
-            ROM_COPY.seek(file_start + init_offset)
-            for x in range(spawner_size):
-                data_bytes.append(int.from_bytes(ROM_COPY.readBytes(1), "big"))
-            spawner_bytes.append(data_bytes)
-        else:
-            # Is fairy
-            fairy_spawner_id = enemy_index
+    for spawner in spawner_file.spawners:
+        if spawner.enemy_id == Enemies.Fairy:
+            fairy_spawner_id = spawner.index
+    # Keep enemy if not fairy
+    spawner_file.spawners = [spawner for spawner in spawner_file.spawners if spawner.enemy_id != Enemies.Fairy]
     fence_index = 1
     if fence_index in used_fence_ids:
         while fence_index in used_fence_ids:
@@ -88,10 +45,10 @@ def ReplaceShipFairy(spoiler):
     data_bytes.append(1)  # Init Control State
     data_bytes.append(0)  # Extra Data Count
     data_bytes.append(2)  # Init Spawn State
-    data_bytes.append(fairy_spawner_id)  # Spawn Index
+    data_bytes.append(0 if fairy_spawner_id is None else fairy_spawner_id)  # Spawn Index
     data_bytes.append(0)  # Init Respawn Timer
     data_bytes.append(0)
-    spawner_bytes.append(data_bytes)
+    spawner_file.spawners.append(SpawnerRecord(data_bytes))
     # Fence
     new_fence_bytes = []
     a_0 = [relocated_5ds_fairy.fence.min_x, 0, relocated_5ds_fairy.fence.min_z]
@@ -117,17 +74,9 @@ def ReplaceShipFairy(spoiler):
     new_fence_bytes.append(0)
     new_fence_bytes.append(fence_index)
     new_fence_bytes.append(1)
-    fence_bytes.append(new_fence_bytes)
+    spawner_file.fences.append(struct.pack(f">{len(new_fence_bytes)}H", *new_fence_bytes))
     # Repack
-    ROM_COPY.seek(file_start)
-    ROM_COPY.writeMultipleBytes(len(fence_bytes), 2)
-    for x in fence_bytes:
-        for y in x:
-            ROM_COPY.writeMultipleBytes(y, 2)
-    ROM_COPY.writeMultipleBytes(len(spawner_bytes), 2)
-    for x in spawner_bytes:
-        for y in x:
-            ROM_COPY.writeMultipleBytes(y, 1)
+    writeSpawnerFile(ROM_COPY, Maps.Galleon5DShipDKTiny, spawner_file)
 
 
 def PlaceFairies(spoiler):
@@ -164,56 +113,13 @@ def PlaceFairies(spoiler):
                     action_maps.append(fairy_locations[level][item].map)
         # Pull all character spawner files that are part of the action map list
         for map in action_maps:
-            file_start = js.pointer_addresses[16]["entries"][map]["pointing_to"]
-            ROM_COPY.seek(file_start)
-            fence_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset = 2
-            fence_bytes = []
-            used_fence_ids = []
-            if fence_count > 0:
-                for x in range(fence_count):
-                    fence = []
-                    fence_start = file_start + offset
-                    ROM_COPY.seek(file_start + offset)
-                    point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    offset += (point_count * 6) + 2
-                    ROM_COPY.seek(file_start + offset)
-                    point0_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    offset += (point0_count * 10) + 6
-                    fence_finish = file_start + offset
-                    fence_size = fence_finish - fence_start
-                    ROM_COPY.seek(fence_finish - 4)
-                    used_fence_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    ROM_COPY.seek(fence_start)
-                    for y in range(int(fence_size / 2)):
-                        fence.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    fence_bytes.append(fence)
-                    ROM_COPY.seek(fence_finish)
-            spawner_count_location = file_start + offset
-            ROM_COPY.seek(spawner_count_location)
-            spawner_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset += 2
-            spawner_bytes = []
+            spawner_file = readSpawnerFile(ROM_COPY, map)
+            used_fence_ids = spawner_file.getFenceIds()
             used_enemy_indexes = []
-            for x in range(spawner_count):
-                # Parse spawners
-                ROM_COPY.seek(file_start + offset)
-                enemy_id = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                ROM_COPY.seek(file_start + offset + 0x4)
-                enemy_coords = []
-                for y in range(3):
-                    coord = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    if coord > 32767:
-                        coord -= 65536
-                    enemy_coords.append(coord)
-                ROM_COPY.seek(file_start + offset + 0x13)
-                enemy_index = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                used_enemy_indexes.append(enemy_index)
-                init_offset = offset
-                ROM_COPY.seek(file_start + offset + 0x11)
-                extra_count = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                offset += 0x16 + (extra_count * 2)
-                end_offset = offset
+            kept_spawners = []
+            for spawner in spawner_file.spawners:
+                used_enemy_indexes.append(spawner.index)
+                enemy_coords = spawner.getCoords()
                 is_vanilla = False
                 # Check if fairy is a vanilla fairy
                 for level in spoiler.fairy_locations:
@@ -226,14 +132,10 @@ def PlaceFairies(spoiler):
                                     coord_match_count += 1
                             if coord_match_count == 3:
                                 is_vanilla = True
-                if enemy_id != Enemies.Fairy or is_vanilla:
+                if spawner.enemy_id != Enemies.Fairy or is_vanilla:
                     # Keep enemy if not fairy or is a vanilla fairy that's going to be kept
-                    data_bytes = []
-                    spawner_size = end_offset - init_offset
-                    ROM_COPY.seek(file_start + init_offset)
-                    for x in range(spawner_size):
-                        data_bytes.append(int.from_bytes(ROM_COPY.readBytes(1), "big"))
-                    spawner_bytes.append(data_bytes)
+                    kept_spawners.append(spawner)
+            spawner_file.spawners = kept_spawners
             spawn_index = 1
             fence_index = 1
             for level in spoiler.fairy_locations:
@@ -273,7 +175,7 @@ def PlaceFairies(spoiler):
                         data_bytes.append(spawn_index)  # Spawn Index
                         data_bytes.append(0)  # Init Respawn Timer
                         data_bytes.append(0)
-                        spawner_bytes.append(data_bytes)
+                        spawner_file.spawners.append(SpawnerRecord(data_bytes))
                         # Set ID for array
                         for item in spoiler.fairy_data_table:
                             if item["level"] == level and spoiler.fairy_locations[level][sub_index] == item["fairy_index"]:
@@ -303,17 +205,9 @@ def PlaceFairies(spoiler):
                         new_fence_bytes.append(0)
                         new_fence_bytes.append(fence_index)
                         new_fence_bytes.append(1)
-                        fence_bytes.append(new_fence_bytes)
+                        spawner_file.fences.append(struct.pack(f">{len(new_fence_bytes)}H", *new_fence_bytes))
             # Repack
-            ROM_COPY.seek(file_start)
-            ROM_COPY.writeMultipleBytes(len(fence_bytes), 2)
-            for x in fence_bytes:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 2)
-            ROM_COPY.writeMultipleBytes(len(spawner_bytes), 2)
-            for x in spawner_bytes:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 1)
+            writeSpawnerFile(ROM_COPY, map, spawner_file)
         # Non-Spawner files
         # Setting Enable
         ROM_COPY.seek(sav + 0x100)
@@ -7,16 +7,17 @@ from enum import IntEnum, auto
 from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
 import js
-import random
 import zlib
 import gzip
 from randomizer.Enums.ScriptTypes import ScriptTypes
 from randomizer.Patching.Patcher import ROM, LocalROM
+from randomizer.Patching.LibSetup import readSetupFile
 from randomizer.Enums.Items import Items
 from randomizer.Enums.Enemies import Enemies
 from randomizer.Enums.Maps import Maps
 from randomizer.Enums.Types import BarrierItems, Types
 from randomizer.Enums.Settings import HardModeSelected, MiscChangesSelected, HelmDoorItem, IceTrapFrequency
+from randomizer.RandomStreams import general_random
 
 if TYPE_CHECKING:
     from randomizer.Lists.MapsAndExits import Maps
@@ -368,7 +369,7 @@ class HelmDoorRandomInfo:
 
     def chooseAmount(self) -> int:
         """Choose amount for the helm door."""
-        raw_float = random.triangular(self.min_bound, self.max_bound)
+        raw_float = general_random.triangular(self.min_bound, self.max_bound)
         self.selected_amount = round(raw_float)
         return self.selected_amount
 
@@ -463,25 +464,12 @@ def int_to_list(num: int, size: int):
 
 def getNextFreeID(cont_map_id: Union[Maps, int], ignore: List[Union[Any, int]] = []) -> int:
     """Get next available Model 2 ID."""
-    ROM_COPY = LocalROM()
-    setup_table = js.pointer_addresses[9]["entries"][cont_map_id]["pointing_to"]
-    ROM_COPY.seek(setup_table)
-    model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-    vacant_ids = list(range(0, 600))
-    for item in range(model2_count):
-        item_start = setup_table + 4 + (item * 0x30)
-        ROM_COPY.seek(item_start + 0x2A)
-        item_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
-        if item_id in vacant_ids:
-            vacant_ids.remove(item_id)
-    for id in range(0x220, 0x225):
-        if id in vacant_ids:
-            vacant_ids.remove(id)
-    for id in ignore:
-        if id in vacant_ids:
-            vacant_ids.remove(id)
-    if len(vacant_ids) > 0:
-        return min(vacant_ids)
+    used_ids = set(readSetupFile(LocalROM(), cont_map_id).getModelTwoIds())
+    used_ids.update(range(0x220, 0x225))
+    used_ids.update(ignore)
+    for id in range(0, 600):
+        if id not in used_ids:
+            return id
     return 0  # Shouldn't ever hit this. This is a case if there's no vacant IDs in range [0,599]
 
 
@@ -988,15 +976,18 @@ def DoorItemToBarrierItem(item: HelmDoorItem, is_coin_door: bool = False, is_cro
 
 def getRawFile(table_index: int, file_index: int, compressed: bool):
     """Get raw file from ROM."""
+    try:
+        local_rom = LocalROM()
+    except Exception:
+        local_rom = None
+    if local_rom is not None:
+        # Local ROMs cache decoded files until they're flushed
+        return local_rom.readFile(table_index, file_index, compressed)
     file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
     file_end = js.pointer_addresses[table_index]["entries"][file_index + 1]["pointing_to"]
     file_size = file_end - file_start
-    try:
-        LocalROM().seek(file_start)
-        data = LocalROM().readBytes(file_size)
-    except Exception:
-        ROM().seek(file_start)
-        data = ROM().readBytes(file_size)
+    ROM().seek(file_start)
+    data = ROM().readBytes(file_size)
     if compressed:
         data = zlib.decompress(data, (15 + 32))
     return data
@@ -1004,6 +995,9 @@ def getRawFile(table_index: int, file_index: int, compressed: bool):
 
 def writeRawFile(table_index: int, file_index: int, compressed: bool, data: bytearray, ROM_COPY):
     """Write raw file from ROM."""
+    if isinstance(ROM_COPY, LocalROM):
+        ROM_COPY.writeFile(table_index, file_index, compressed, data)
+        return
     file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
     file_end = js.pointer_addresses[table_index]["entries"][file_index + 1]["pointing_to"]
     file_size = file_end - file_start
@@ -2,11 +2,12 @@
 
 import js
 import zlib
-import random
 import gzip
 from enum import IntEnum, auto
+import numpy as np
 from PIL import Image
 from randomizer.Patching.Patcher import ROM, LocalROM
+from randomizer.RandomStreams import cosmetic_random
 
 
 class TextureFormat(IntEnum):
@@ -69,6 +70,119 @@ class ExtraTextures(IntEnum):
     BlastTop = auto()
 
 
+# Bits per pixel of each texture format
+TEXTURE_BITS_PER_PIXEL = {
+    TextureFormat.RGBA5551: 16,
+    TextureFormat.RGBA32: 32,
+    TextureFormat.I8: 8,
+    TextureFormat.I4: 4,
+    TextureFormat.IA8: 8,
+    TextureFormat.IA4: 4,
+}
+
+
+def getTextureSize(width: int, height: int, format: TextureFormat) -> int:
+    """Get the size in bytes of an uncompressed texture."""
+    return (width * height * TEXTURE_BITS_PER_PIXEL[format]) // 8
+
+
+def unpackNibbles(values: np.ndarray) -> np.ndarray:
+    """Split every byte into its upper and lower 4 bits, upper first."""
+    return np.stack(((values >> 4) & 0xF, values & 0xF), axis=-1).reshape(-1)
+
+
+def packNibbles(values: np.ndarray) -> np.ndarray:
+    """Pack pairs of 4 bit values into bytes, the first of each pair in the upper bits. An unpaired last value is dropped."""
+    values = values[: values.size & ~1]
+    return ((values[0::2] << 4) | (values[1::2] & 0xF)).astype(np.uint8)
+
+
+def decodeTexture(data: bytes, width: int, height: int, format: TextureFormat) -> np.ndarray:
+    """Decode texture data to an array of RGBA pixels with a shape of (height, width, 4).
+
+    Missing data at the end of the texture is treated as zeros.
+    """
+    size = getTextureSize(width, height, format)
+    raw = np.zeros(size, dtype=np.uint8)
+    data = np.frombuffer(data, dtype=np.uint8, count=min(len(data), size))
+    raw[: data.size] = data
+    if format == TextureFormat.RGBA32:
+        return raw.reshape(height, width, 4).copy()
+    pixels = np.zeros((height * width, 4), dtype=np.uint8)
+    if format == TextureFormat.RGBA5551:
+        value = raw.view(">u2").astype(np.uint32)
+        pixels[:, 0] = ((value >> 11) & 31) << 3
+        pixels[:, 1] = ((value >> 6) & 31) << 3
+        pixels[:, 2] = ((value >> 1) & 31) << 3
+        pixels[:, 3] = (value & 1) * 255
+    elif format in (TextureFormat.I8, TextureFormat.I4):
+        intensity = raw if format == TextureFormat.I8 else unpackNibbles(raw) << 4
+        pixels[:] = intensity[:, np.newaxis]
+    elif format == TextureFormat.IA8:
+        pixels[:, :3] = ((raw >> 4) << 4)[:, np.newaxis]
+        pixels[:, 3] = (raw & 0xF) * 17
+    elif format == TextureFormat.IA4:
+        nibbles = unpackNibbles(raw)
+        pixels[:, :3] = ((nibbles >> 1) << 5)[:, np.newaxis]
+        pixels[:, 3] = (nibbles & 1) * 255
+    return pixels.reshape(height, width, 4)
+
+
+def encodeTexture(pixels: np.ndarray, format: TextureFormat, alpha_threshold: int = 0) -> bytes:
+    """Encode an array of RGBA pixels to texture data, in row order.
+
+    Formats with a 1 bit alpha treat pixels with an alpha above the threshold as opaque.
+    Intensity formats take the intensity from the red channel.
+    """
+    pixels = np.asarray(pixels, dtype=np.uint8).reshape(-1, 4)
+    if format == TextureFormat.RGBA32:
+        return pixels.tobytes()
+    channels = pixels.astype(np.uint16)
+    opaque = (channels[:, 3] > alpha_threshold).astype(np.uint16)
+    if format == TextureFormat.RGBA5551:
+        value = ((channels[:, 0] >> 3) << 11) | ((channels[:, 1] >> 3) << 6) | ((channels[:, 2] >> 3) << 1) | opaque
+        return value.astype(">u2").tobytes()
+    if format == TextureFormat.I8:
+        return pixels[:, 0].tobytes()
+    if format == TextureFormat.I4:
+        return packNibbles(channels[:, 0] >> 4).tobytes()
+    if format == TextureFormat.IA8:
+        return (((channels[:, 0] >> 4) << 4) | (channels[:, 3] >> 4)).astype(np.uint8).tobytes()
+    if format == TextureFormat.IA4:
+        return packNibbles(((channels[:, 0] >> 5) << 1) | opaque).tobytes()
+    return b""
+
+
+def imageToArray(im: Image) -> np.ndarray:
+    """Get a writeable array of the RGBA pixels of an image, with a shape of (height, width, 4)."""
+    return np.array(im.convert("RGBA"), dtype=np.uint8)
+
+
+def arrayToImage(pixels: np.ndarray) -> Image:
+    """Create an RGBA image from an array of pixels with a shape of (height, width, 4)."""
+    height, width = pixels.shape[:2]
+    return Image.frombytes("RGBA", (width, height), np.ascontiguousarray(pixels, dtype=np.uint8).tobytes())
+
+
+def getMaskedChannels(source: np.ndarray, color: tuple) -> np.ndarray:
+    """Scale the RGB channels of pixels by a color, without clipping the result to a byte."""
+    return (np.asarray(color[:3], dtype=np.float64) * (source[..., :3] / 255)).astype(np.int32)
+
+
+def applyColorMask(pixels: np.ndarray, color: tuple, selection: np.ndarray = None, source: np.ndarray = None) -> None:
+    """Scale the RGB channels of the selected pixels by a color, in place.
+
+    Pixels are selected if they aren't fully transparent when no selection is given.
+    The channels are taken from the source pixels if given, which defaults to the pixels themselves.
+    """
+    if selection is None:
+        selection = pixels[:, :, 3] > 0
+    if source is None:
+        source = pixels
+    masked = np.clip(getMaskedChannels(source, color), 0, 255)
+    pixels[:, :, :3] = np.where(selection[:, :, np.newaxis], masked, pixels[:, :, :3])
+
+
 def getImageFromAddress(rom_address: int, width: int, height: int, compressed: bool, file_size: int, format: TextureFormat):
     """Get image from a ROM address."""
     try:
@@ -79,26 +193,7 @@ def getImageFromAddress(rom_address: int, width: int, height: int, compressed: b
         data = ROM().readBytes(file_size)
     if compressed:
         data = zlib.decompress(data, (15 + 32))
-    im_f = Image.new(mode="RGBA", size=(width, height))
-    pix = im_f.load()
-    for y in range(height):
-        for x in range(width):
-            if format == TextureFormat.RGBA32:
-                offset = ((y * width) + x) * 4
-                pix_data = int.from_bytes(data[offset : offset + 4], "big")
-                red = (pix_data >> 24) & 0xFF
-                green = (pix_data >> 16) & 0xFF
-                blue = (pix_data >> 8) & 0xFF
-                alpha = pix_data & 0xFF
-            else:
-                offset = ((y * width) + x) * 2
-                pix_data = int.from_bytes(data[offset : offset + 2], "big")
-                red = ((pix_data >> 11) & 31) << 3
-                green = ((pix_data >> 6) & 31) << 3
-                blue = ((pix_data >> 1) & 31) << 3
-                alpha = (pix_data & 1) * 255
-            pix[x, y] = (red, green, blue, alpha)
-    return im_f
+    return arrayToImage(decodeTexture(data, width, height, format))
 
 
 def getImageFile(table_index: int, file_index: int, compressed: bool, width: int, height: int, format: TextureFormat):
@@ -111,27 +206,18 @@ def getImageFile(table_index: int, file_index: int, compressed: bool, width: int
 
 def getRandomHueShift(min: int = -359, max: int = 359) -> int:
     """Get random hue shift."""
-    return random.randint(min, max)
+    return cosmetic_random.randint(min, max)
 
 
 def hueShift(im, amount):
     """Apply a hue shift on an image."""
-    hsv_im = im.convert("HSV")
-    im_px = im.load()
-    w, h = hsv_im.size
-    hsv_px = hsv_im.load()
-    for y in range(h):
-        for x in range(w):
-            old = list(hsv_px[x, y]).copy()
-            old[0] = (old[0] + amount) % 360
-            hsv_px[x, y] = (old[0], old[1], old[2])
-    rgb_im = hsv_im.convert("RGB")
-    rgb_px = rgb_im.load()
-    for y in range(h):
-        for x in range(w):
-            new = list(rgb_px[x, y])
-            new.append(list(im_px[x, y])[3])
-            im_px[x, y] = (new[0], new[1], new[2], new[3])
+    hsv = np.array(im.convert("HSV"), dtype=np.int32)
+    # Hues are stored in a byte, so shifted hues above 255 are clipped
+    hsv[:, :, 0] = np.clip((hsv[:, :, 0] + amount) % 360, 0, 255)
+    hsv_im = Image.frombytes("HSV", im.size, hsv.astype(np.uint8).tobytes())
+    pixels = imageToArray(im)
+    pixels[:, :, :3] = np.array(hsv_im.convert("RGB"), dtype=np.uint8)
+    im.paste(arrayToImage(pixels))
     return im
 
 
@@ -86,6 +86,8 @@ def getPointerFile(table: TableNames, file_index: int, is_compressed: bool = Non
 
 def getPointerData(ROM_COPY: LocalROM | ROM, table: TableNames, file_index: int) -> bytes:
     """Get the data inside a pointer table file."""
+    if isinstance(ROM_COPY, LocalROM):
+        return ROM_COPY.readFile(table, file_index, table_functions[table].rando_compressed)
     ref_data = getPointerFile(table, file_index)
     ROM_COPY.seek(ref_data.start)
     data = ROM_COPY.readBytes(ref_data.size)
@@ -96,6 +98,9 @@ def getPointerData(ROM_COPY: LocalROM | ROM, table: TableNames, file_index: int)
 
 def writePointerFile(ROM_COPY: LocalROM | ROM, table: TableNames, file_index: int, data: bytes, is_compressed: bool = False):
     """Write data to a pointer file."""
+    if isinstance(ROM_COPY, LocalROM):
+        ROM_COPY.writeFile(table, file_index, is_compressed, data)
+        return
     ref_file = getPointerFile(table, file_index)
     if is_compressed:
         data = gzip.compress(data, compresslevel=9)
@@ -0,0 +1,376 @@
+"""Library functions for map setup and character spawner files."""
+
+from __future__ import annotations
+
+import struct
+from typing import List, Union
+
+from randomizer.Patching.Patcher import LocalROM
+
+SETUP_TABLE = 9
+SPAWNER_TABLE = 16
+# Actor types are stored 0x10 lower than the types used by the rest of the randomizer
+ACTOR_TYPE_OFFSET = 0x10
+
+
+def float_to_word(value: Union[float, int]) -> int:
+    """Convert a float to the word holding it, writing 0 for both zeros."""
+    if value == 0:
+        return 0
+    return struct.unpack(">I", struct.pack(">f", value))[0]
+
+
+class RawRecord:
+    """Record of a map file, kept as raw bytes with typed accessors."""
+
+    size = 0
+
+    def __init__(self, data: Union[bytes, bytearray, None] = None) -> None:
+        """Initialize with the raw bytes of the record, or zeros.
+
+        A record cut short by the end of its file is padded with zeros, as reading past the end of a file gives zeros.
+        """
+        if data is None:
+            data = b""
+        self.data = bytearray(data)
+        if len(self.data) < self.size:
+            self.data += bytes(self.size - len(self.data))
+
+    @classmethod
+    def fromWords(cls, words: List[int]) -> RawRecord:
+        """Create a record from a list of 32-bit big endian words."""
+        return cls(struct.pack(f">{len(words)}I", *words))
+
+    def getWord(self, offset: int) -> int:
+        """Get the unsigned word at an offset."""
+        return struct.unpack_from(">I", self.data, offset)[0]
+
+    def setWord(self, offset: int, value: int) -> None:
+        """Set the unsigned word at an offset."""
+        struct.pack_into(">I", self.data, offset, value)
+
+    def getShort(self, offset: int) -> int:
+        """Get the unsigned short at an offset."""
+        return struct.unpack_from(">H", self.data, offset)[0]
+
+    def setShort(self, offset: int, value: int) -> None:
+        """Set the unsigned short at an offset."""
+        struct.pack_into(">H", self.data, offset, value)
+
+    def getFloat(self, offset: int) -> float:
+        """Get the float at an offset."""
+        return struct.unpack_from(">f", self.data, offset)[0]
+
+    def setFloat(self, offset: int, value: Union[float, int]) -> None:
+        """Set the float at an offset."""
+        self.setWord(offset, float_to_word(value))
+
+
+class SetupRecord(RawRecord):
+    """Fixed size record of a setup file, which starts with a position and scale."""
+
+    @property
+    def x(self) -> float:
+        """X position of the object."""
+        return self.getFloat(0x0)
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self.setFloat(0x0, value)
+
+    @property
+    def y(self) -> float:
+        """Y position of the object."""
+        return self.getFloat(0x4)
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self.setFloat(0x4, value)
+
+    @property
+    def z(self) -> float:
+        """Z position of the object."""
+        return self.getFloat(0x8)
+
+    @z.setter
+    def z(self, value: float) -> None:
+        self.setFloat(0x8, value)
+
+    @property
+    def scale(self) -> float:
+        """Scale of the object."""
+        return self.getFloat(0xC)
+
+    @scale.setter
+    def scale(self, value: float) -> None:
+        self.setFloat(0xC, value)
+
+    def setPosition(self, coords: List[Union[float, int]]) -> None:
+        """Set the X, Y and Z position of the object."""
+        for index, coord in enumerate(coords):
+            self.setFloat(index * 4, coord)
+
+
+class ModelTwoRecord(SetupRecord):
+    """Model two object in a setup file."""
+
+    size = 0x30
+
+    @property
+    def rotation_y(self) -> float:
+        """Y rotation of the object in degrees."""
+        return self.getFloat(0x1C)
+
+    @rotation_y.setter
+    def rotation_y(self, value: float) -> None:
+        self.setFloat(0x1C, value)
+
+    @property
+    def type(self) -> int:
+        """Model two type of the object."""
+        return self.getShort(0x28)
+
+    @type.setter
+    def type(self, value: int) -> None:
+        self.setShort(0x28, value)
+
+    @property
+    def id(self) -> int:
+        """ID of the object within the map."""
+        return self.getShort(0x2A)
+
+    @id.setter
+    def id(self, value: int) -> None:
+        self.setShort(0x2A, value)
+
+
+class MysteryRecord(RawRecord):
+    """Record of the unidentified section of a setup file, which is kept as is."""
+
+    size = 0x24
+
+
+class ActorRecord(SetupRecord):
+    """Actor spawner in a setup file."""
+
+    size = 0x38
+
+    @property
+    def path(self) -> int:
+        """ID of the path the actor follows."""
+        return self.getShort(0x12)
+
+    @path.setter
+    def path(self, value: int) -> None:
+        self.setShort(0x12, value)
+
+    @property
+    def type(self) -> int:
+        """Actor type, as used by the rest of the randomizer."""
+        return self.getShort(0x32) + ACTOR_TYPE_OFFSET
+
+    @type.setter
+    def type(self, value: int) -> None:
+        self.setShort(0x32, value - ACTOR_TYPE_OFFSET)
+
+    @property
+    def id(self) -> int:
+        """ID of the actor within the map."""
+        return self.getShort(0x34)
+
+    @id.setter
+    def id(self, value: int) -> None:
+        self.setShort(0x34, value)
+
+
+def readPadded(data: bytes, offset: int, size: int) -> bytes:
+    """Read bytes of a file, reading bytes past the end of a short file as zero."""
+    return bytes(data[offset : offset + size]).ljust(size, b"\x00")
+
+
+def readUnsigned(data: bytes, offset: int, size: int) -> int:
+    """Read a big endian unsigned value, reading bytes past the end of a short file as zero."""
+    return int.from_bytes(readPadded(data, offset, size), "big")
+
+
+def decodeRecords(data: bytes, offset: int, record_class: type) -> tuple:
+    """Decode a count followed by fixed size records, returning the records and the offset after them."""
+    count = readUnsigned(data, offset, 4)
+    offset += 4
+    size = record_class.size
+    records = [record_class(data[offset + (index * size) : offset + ((index + 1) * size)]) for index in range(count)]
+    return records, offset + (count * size)
+
+
+class SetupFile:
+    """Decoded setup file of a map.
+
+    Only the model two, mystery and actor sections are understood. Anything after them is kept,
+    and when the file shrinks the bytes it used to cover are left as they were.
+    """
+
+    def __init__(self, model_two: List[ModelTwoRecord], mystery: List[MysteryRecord], actors: List[ActorRecord], original: bytes = b"") -> None:
+        """Initialize with given parameters."""
+        self.model_two = model_two
+        self.mystery = mystery
+        self.actors = actors
+        self.original = original
+
+    @classmethod
+    def decode(cls, data: Union[bytes, None]) -> SetupFile:
+        """Decode a setup file, where a missing or empty file has no records."""
+        if data is None:
+            data = b""
+        model_two, offset = decodeRecords(data, 0, ModelTwoRecord)
+        mystery, offset = decodeRecords(data, offset, MysteryRecord)
+        actors, offset = decodeRecords(data, offset, ActorRecord)
+        return cls(model_two, mystery, actors, bytes(data))
+
+    def encode(self) -> bytes:
+        """Encode the setup file."""
+        output = bytearray()
+        for records in (self.model_two, self.mystery, self.actors):
+            output += struct.pack(">I", len(records))
+            for record in records:
+                output += record.data
+        if len(output) < len(self.original):
+            output += self.original[len(output) :]
+        return bytes(output)
+
+    def getModelTwoIds(self) -> List[int]:
+        """Get the ID of every model two object."""
+        return [record.id for record in self.model_two]
+
+    def getActorIds(self) -> List[int]:
+        """Get the ID of every actor."""
+        return [record.id for record in self.actors]
+
+
+def readSetupFile(ROM_COPY: LocalROM, map_id: int) -> SetupFile:
+    """Read and decode the setup file of a map."""
+    return SetupFile.decode(ROM_COPY.readFile(SETUP_TABLE, map_id, False))
+
+
+def writeSetupFile(ROM_COPY: LocalROM, map_id: int, setup: SetupFile) -> None:
+    """Encode and write the setup file of a map, which reaches the ROM when the file cache is flushed."""
+    ROM_COPY.writeFile(SETUP_TABLE, map_id, False, setup.encode())
+
+
+class SpawnerRecord(RawRecord):
+    """Character spawner in a spawner file, which is followed by a variable amount of extra data."""
+
+    size = 0x16
+
+    @property
+    def enemy_id(self) -> int:
+        """Enemy spawned."""
+        return self.data[0x0]
+
+    @enemy_id.setter
+    def enemy_id(self, value: int) -> None:
+        self.data[0x0] = value
+
+    def getCoords(self) -> List[int]:
+        """Get the X, Y and Z position of the spawner."""
+        return list(struct.unpack_from(">3h", self.data, 0x4))
+
+    @property
+    def idle_speed(self) -> int:
+        """Speed of the enemy when idle."""
+        return self.data[0xC]
+
+    @idle_speed.setter
+    def idle_speed(self, value: int) -> None:
+        self.data[0xC] = value
+
+    @property
+    def aggro_speed(self) -> int:
+        """Speed of the enemy when chasing the player."""
+        return self.data[0xD]
+
+    @aggro_speed.setter
+    def aggro_speed(self, value: int) -> None:
+        self.data[0xD] = value
+
+    @property
+    def scale(self) -> int:
+        """Scale of the enemy."""
+        return self.data[0xF]
+
+    @scale.setter
+    def scale(self, value: int) -> None:
+        self.data[0xF] = value
+
+    @property
+    def index(self) -> int:
+        """Spawn index of the spawner within the map."""
+        return self.data[0x13]
+
+    @index.setter
+    def index(self, value: int) -> None:
+        self.data[0x13] = value
+
+
+class SpawnerFile:
+    """Decoded character spawner file of a map.
+
+    Fences are kept as raw bytes. Anything after the spawners is kept, and when the file shrinks
+    the bytes it used to cover are left as they were.
+    """
+
+    def __init__(self, fences: List[bytes], spawners: List[SpawnerRecord], original: bytes = b"") -> None:
+        """Initialize with given parameters."""
+        self.fences = fences
+        self.spawners = spawners
+        self.original = original
+
+    @classmethod
+    def decode(cls, data: Union[bytes, None]) -> SpawnerFile:
+        """Decode a spawner file, where a missing or empty file has no fences or spawners."""
+        if data is None:
+            data = b""
+        fence_count = readUnsigned(data, 0, 2)
+        offset = 2
+        fences = []
+        for _ in range(fence_count):
+            fence_start = offset
+            point_count = readUnsigned(data, offset, 2)
+            offset += (point_count * 6) + 2
+            point0_count = readUnsigned(data, offset, 2)
+            offset += (point0_count * 10) + 6
+            fences.append(readPadded(data, fence_start, offset - fence_start))
+        spawner_count = readUnsigned(data, offset, 2)
+        offset += 2
+        spawners = []
+        for _ in range(spawner_count):
+            extra_count = readUnsigned(data, offset + 0x11, 1)
+            end = offset + SpawnerRecord.size + (extra_count * 2)
+            spawners.append(SpawnerRecord(readPadded(data, offset, end - offset)))
+            offset = end
+        return cls(fences, spawners, bytes(data))
+
+    def encode(self) -> bytes:
+        """Encode the spawner file."""
+        output = bytearray(struct.pack(">H", len(self.fences)))
+        for fence in self.fences:
+            output += fence
+        output += struct.pack(">H", len(self.spawners))
+        for spawner in self.spawners:
+            output += spawner.data
+        if len(output) < len(self.original):
+            output += self.original[len(output) :]
+        return bytes(output)
+
+    def getFenceIds(self) -> List[int]:
+        """Get the ID of every fence."""
+        return [struct.unpack_from(">H", fence, len(fence) - 4)[0] for fence in self.fences]
+
+
+def readSpawnerFile(ROM_COPY: LocalROM, map_id: int) -> SpawnerFile:
+    """Read and decode the character spawner file of a map."""
+    return SpawnerFile.decode(ROM_COPY.readFile(SPAWNER_TABLE, map_id, False))
+
+
+def writeSpawnerFile(ROM_COPY: LocalROM, map_id: int, spawners: SpawnerFile) -> None:
+    """Encode and write the character spawner file of a map, which reaches the ROM when the file cache is flushed."""
+    ROM_COPY.writeFile(SPAWNER_TABLE, map_id, False, spawners.encode())
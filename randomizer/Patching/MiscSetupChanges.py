@@ -1,9 +1,7 @@
 """Apply misc setup changes."""
 
 import math
-import random
 
-import js
 from randomizer.Enums.Enemies import Enemies
 from randomizer.Enums.Kongs import Kongs
 from randomizer.Enums.Levels import Levels
@@ -24,13 +22,15 @@ from randomizer.Lists.CustomLocations import CustomLocations
 from randomizer.Enums.Maps import Maps
 from randomizer.Lists.MapsAndExits import LevelMapTable
 from randomizer.Patching.Lib import IsItemSelected, float_to_hex, intf_to_float
+from randomizer.Patching.LibSetup import ActorRecord, readSetupFile, readSpawnerFile, writeSetupFile, writeSpawnerFile
 from randomizer.Patching.Patcher import LocalROM
+from randomizer.RandomStreams import general_random
 
 
 def pickRandomPositionCircle(center_x, center_z, min_radius, max_radius):
     """Pick a random position within a torus where the center and radius boundaries are specified."""
-    radius = min_radius + (math.sqrt(random.random()) * (max_radius - min_radius))
-    angle = random.uniform(0, math.pi * 2)
+    radius = min_radius + (math.sqrt(general_random.random()) * (max_radius - min_radius))
+    angle = general_random.uniform(0, math.pi * 2)
     if angle == math.pi * 2:
         angle = 0
     item_dx = radius * math.sin(angle)
@@ -91,7 +91,7 @@ def pickChunkyCabinPadPositions():
                         suggested_z = suggested_z + 70
                     else:
                         suggested_z = suggested_z - 70
-                    pad = random.choice([[suggested_x, pad[1]], [pad[0], suggested_z]])
+                    pad = general_random.choice([[suggested_x, pad[1]], [pad[0], suggested_z]])
             # check if the pad is far inside and near the lamp radius (not in it, as that's what we fixed above)
             # top right has a Low X and Low Z coordinate, bottom left has a high X and High Z coordinate
             is_far_inside_top_right = lamp_halfway_points[0][0] < pad[0] < center_of_room[0] and lamp_halfway_points[0][1] < pad[1] < center_of_room[1]
@@ -120,53 +120,13 @@ def pickChunkyCabinPadPositions():
 def SpeedUpFungiRabbit():
     """Change the speed of the Fungi Rabbit."""
     ROM_COPY = LocalROM()
-    file_start = js.pointer_addresses[16]["entries"][Maps.FungiForest]["pointing_to"]
-    ROM_COPY.seek(file_start)
-    fence_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-    offset = 2
-    fence_bytes = []
-    used_fence_ids = []
-    if fence_count > 0:
-        for x in range(fence_count):
-            fence = []
-            fence_start = file_start + offset
-            ROM_COPY.seek(file_start + offset)
-            point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset += (point_count * 6) + 2
-            ROM_COPY.seek(file_start + offset)
-            point0_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset += (point0_count * 10) + 6
-            fence_finish = file_start + offset
-            fence_size = fence_finish - fence_start
-            ROM_COPY.seek(fence_finish - 4)
-            used_fence_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-            ROM_COPY.seek(fence_start)
-            for y in range(int(fence_size / 2)):
-                fence.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-            fence_bytes.append(fence)
-            ROM_COPY.seek(fence_finish)
-    spawner_count_location = file_start + offset
-    ROM_COPY.seek(spawner_count_location)
-    spawner_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-    offset += 2
-    spawner_bytes = []
-    fairy_spawner_id = None
-    for x in range(spawner_count):
-        # Parse spawners
-        ROM_COPY.seek(file_start + offset)
-        enemy_id = int.from_bytes(ROM_COPY.readBytes(1), "big")
-        ROM_COPY.seek(file_start + offset + 0x13)
-        enemy_index = int.from_bytes(ROM_COPY.readBytes(1), "big")
-        init_offset = offset
-        ROM_COPY.seek(file_start + offset + 0x11)
-        extra_count = int.from_bytes(ROM_COPY.readBytes(1), "big")
-        offset += 0x16 + (extra_count * 2)
-        end_offset = offset
-        if enemy_index == 2:
+    spawner_file = readSpawnerFile(ROM_COPY, Maps.FungiForest)
+    for spawner in spawner_file.spawners:
+        if spawner.index == 2:
             # If enemy is the rabbit, adjust stats
             speed_buff = 0.7
-            ROM_COPY.seek(file_start + init_offset + 0xD)
-            ROM_COPY.write(int(136 * speed_buff))
+            spawner.aggro_speed = int(136 * speed_buff)
+    writeSpawnerFile(ROM_COPY, Maps.FungiForest, spawner_file)
 
 
 def getRandomGalleonStarLocation() -> tuple:
@@ -179,10 +139,10 @@ def getRandomGalleonStarLocation() -> tuple:
         [(3388, 594, 1834), (3441, STAR_MAX_Y, 2044)],
         [(3731, 515, 1514), (3769, STAR_MAX_Y, 1833)],
     ]
-    bound = random.choice(boxes)
+    bound = general_random.choice(boxes)
     coord = [0, 0, 0]
     for x in range(3):
-        coord[x] = random.randint(bound[0][x], bound[1][x])
+        coord[x] = general_random.randint(bound[0][x], bound[1][x])
     return tuple(coord)
 
 
@@ -271,55 +231,41 @@ def randomize_setup(spoiler):
     diddy_5di_pads = pickRandomPositionsMult(287.94, 312.119, 0, 140, 6, 40)
     lanky_fungi_mush = pickRandomPositionsMult(274.9, 316.505, 40, 160, 5, 40)
     chunky_5dc_pads = pickChunkyCabinPadPositions()
-    random.shuffle(vase_puzzle_positions)
+    general_random.shuffle(vase_puzzle_positions)
     vase_puzzle_rando_progress = 0
     raise_patch = IsItemSelected(spoiler.settings.quality_of_life, spoiler.settings.misc_changes_selected, MiscChangesSelected.raise_fungi_dirt_patch)
     random_pufftoss_stars = IsItemSelected(spoiler.settings.hard_mode, spoiler.settings.hard_mode_selected, HardBossesSelected.pufftoss_star_rando)
     higher_pufftoss_stars = IsItemSelected(spoiler.settings.hard_mode, spoiler.settings.hard_mode_selected, HardBossesSelected.pufftoss_star_raised)
     removed_crypt_doors = IsItemSelected(spoiler.settings.remove_barriers_enabled, spoiler.settings.remove_barriers_selected, RemovedBarriersSelected.castle_crypt_doors)
     for cont_map_id in range(216):
-        cont_map_setup_address = js.pointer_addresses[9]["entries"][cont_map_id]["pointing_to"]
-        ROM_COPY.seek(cont_map_setup_address)
-        model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
+        setup = readSetupFile(ROM_COPY, cont_map_id)
         # Puzzle Stuff
         offsets = []
         positions = []
         if cont_map_id == Maps.FranticFactory:
             number_replacement_data = {"corner": {"offsets": [], "positions": []}, "edge": {"offsets": [], "positions": []}, "center": {"offsets": [], "positions": []}}
-        for model2_item in range(model2_count):
-            item_start = cont_map_setup_address + 4 + (model2_item * 0x30)
-            ROM_COPY.seek(item_start + 0x28)
-            item_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            ROM_COPY.seek(item_start + 0x2A)
-            item_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
+        for item in setup.model_two:
+            item_type = item.type
+            item_id = item.id
             is_swap = False
             for swap in swap_list:
                 if swap["map"] == cont_map_id and item_type in swap["item_list"]:
                     is_swap = True
             if item_type == 0x196 and arcade_r1_shortened and cont_map_id == Maps.FactoryBaboonBlast:
-                ROM_COPY.seek(item_start + 0x28)
-                ROM_COPY.writeMultipleBytes(0x74, 2)
-                ROM_COPY.seek(item_start + 0xC)
-                ROM_COPY.writeMultipleBytes(0x3F000000, 4)  # Scale: 0.5
+                item.type = 0x74
+                item.scale = 0.5
             elif item_type in pickup_list and spoiler.settings.randomize_pickups:
                 if cont_map_id != Maps.OrangeBarrel:
-                    ROM_COPY.seek(item_start + 0x28)
-                    ROM_COPY.writeMultipleBytes(random.choice(pickup_list), 2)
+                    item.type = general_random.choice(pickup_list)
             elif is_swap:
                 if spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off:
-                    offsets.append(item_start)
-                    ROM_COPY.seek(item_start)
-                    x = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                    y = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                    z = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                    ROM_COPY.seek(item_start + 0x1C)
-                    ry = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                    positions.append([x, y, z, ry])
+                    offsets.append(item)
+                    positions.append([item.getWord(0x0), item.getWord(0x4), item.getWord(0x8), item.getWord(0x1C)])
             elif item_type == 0x235 and (
                 (cont_map_id == Maps.GalleonBoss and random_pufftoss_stars) or (cont_map_id == Maps.HideoutHelm and spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off)
             ):
                 if cont_map_id == Maps.HideoutHelm:
-                    y_position = random.uniform(-131, 500)
+                    y_position = general_random.uniform(-131, 500)
                     star_donut_center = [1055.704, 3446.966]
                     if y_position < 0:
                         star_donut_boundaries = [230, 300.971]
@@ -331,84 +277,56 @@ def randomize_setup(spoiler):
                     star_donut_boundaries = [200, 460]
                     star_height_boundaries = []
                 star_pos = pickRandomPositionCircle(star_donut_center[0], star_donut_center[1], star_donut_boundaries[0], star_donut_boundaries[1])
-                star_a = random.uniform(0, 360)
+                star_a = general_random.uniform(0, 360)
                 if star_a == 360:
                     star_a = 0
-                star_x = star_pos[0]
-                star_z = star_pos[1]
-                ROM_COPY.seek(item_start)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(star_x), 16), 4)
-                ROM_COPY.seek(item_start + 8)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(star_z), 16), 4)
-                ROM_COPY.seek(item_start + 0x1C)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(star_a), 16), 4)
+                item.x = star_pos[0]
+                item.z = star_pos[1]
+                item.rotation_y = star_a
                 if len(star_height_boundaries) > 0:
-                    star_y = random.uniform(star_height_boundaries[0], star_height_boundaries[1])
-                    ROM_COPY.seek(item_start + 4)
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(star_y), 16), 4)
+                    item.y = general_random.uniform(star_height_boundaries[0], star_height_boundaries[1])
             elif item_type == 0x74 and cont_map_id == Maps.GalleonLighthouse and lighthouse_on:
-                new_gb_coords = [407.107, 720, 501.02]
-                for coord_i, coord in enumerate(new_gb_coords):
-                    ROM_COPY.seek(item_start + (coord_i * 4))
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(coord), 16), 4)
+                item.setPosition([407.107, 720, 501.02])
             elif cont_map_id == Maps.FranticFactory and spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off and item_type >= 0xF4 and item_type <= 0x103:
                 for subtype_item in number_gb_data:
                     for num_item in subtype_item["numbers"]:
                         if num_item["number"] == (item_type - 0xF3):
                             subtype_name = subtype_item["subtype"]
-                            ROM_COPY.seek(item_start)
-                            x = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                            y = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                            z = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                            number_replacement_data[subtype_name]["offsets"].append({"offset": item_start, "rotation": num_item["rot"], "number": item_type - 0xF3})
-                            number_replacement_data[subtype_name]["positions"].append({"coords": [x, y, z], "rotation": num_item["rot"]})
+                            number_replacement_data[subtype_name]["offsets"].append({"offset": item, "rotation": num_item["rot"], "number": item_type - 0xF3})
+                            number_replacement_data[subtype_name]["positions"].append({"coords": [item.getWord(0x0), item.getWord(0x4), item.getWord(0x8)], "rotation": num_item["rot"]})
             elif cont_map_id == Maps.ForestLankyMushroomsRoom and spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off:
                 if item_type >= 0x1BA and item_type <= 0x1BE:  # Mushrooms
                     spawner_pos = lanky_fungi_mush["picked"][lanky_fungi_mush["index"]]
-                    ROM_COPY.seek(item_start)
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[0]), 16), 4)
-                    ROM_COPY.seek(item_start + 8)
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[1]), 16), 4)
+                    item.x = spawner_pos[0]
+                    item.z = spawner_pos[1]
                     lanky_fungi_mush["index"] += 1
                 elif item_type == 0x205:  # Lanky Bunch
                     spawner_pos = lanky_fungi_mush["picked"][0]
-                    ROM_COPY.seek(item_start)
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[0]), 16), 4)
-                    ROM_COPY.seek(item_start + 8)
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[1]), 16), 4)
+                    item.x = spawner_pos[0]
+                    item.z = spawner_pos[1]
             elif cont_map_id == Maps.AngryAztec and spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off and (item_type == 0x121 or (item_type >= 0x226 and item_type <= 0x228)):
                 # Is Vase Pad
-                ROM_COPY.seek(item_start)
-                for coord in range(3):
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(vase_puzzle_positions[vase_puzzle_rando_progress][coord]), 16), 4)
+                item.setPosition(vase_puzzle_positions[vase_puzzle_rando_progress])
                 vase_puzzle_rando_progress += 1
             elif cont_map_id == Maps.CavesChunkyCabin and spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off and item_type == 0x203:
                 spawner_pos = chunky_5dc_pads["picked"][chunky_5dc_pads["index"]]
-                ROM_COPY.seek(item_start)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[0]), 16), 4)
-                ROM_COPY.seek(item_start + 8)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[1]), 16), 4)
+                item.x = spawner_pos[0]
+                item.z = spawner_pos[1]
                 chunky_5dc_pads["index"] += 1
             elif cont_map_id == Maps.GloomyGalleon and item_id == 0xC and spoiler.settings.puzzle_rando_difficulty in (PuzzleRando.hard, PuzzleRando.chaos):
-                coords = list(getRandomGalleonStarLocation())
-                ROM_COPY.seek(item_start)
-                for x in coords:
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(x), 16), 4)
+                item.setPosition(list(getRandomGalleonStarLocation()))
             # Regular if because it can be combined with regular hard bosses
             if item_type == 0x235 and cont_map_id == Maps.GalleonBoss and higher_pufftoss_stars:
-                ROM_COPY.seek(item_start + 4)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(345), 16), 4)
+                item.y = 345
             elif item_type == 0xCE and cont_map_id == Maps.HelmBarrelLankyMaze and spoiler.settings.sprint_barrel_requires_sprint:
-                ROM_COPY.seek(item_start + 0x28)
-                ROM_COPY.writeMultipleBytes(611, 2)  # Overwrite type of obj to custom "Sprint Switch"
+                item.type = 611  # Overwrite type of obj to custom "Sprint Switch"
             if spoiler.settings.chunky_phase_slam_req_internal and cont_map_id == Maps.KroolChunkyPhase and item_type == 0x16A:
                 slam_pads = {
                     SlamRequirement.green: 0x92,
                     SlamRequirement.blue: 0x16A,
                     SlamRequirement.red: 0x165,
                 }
-                ROM_COPY.seek(item_start + 0x28)
-                ROM_COPY.writeMultipleBytes(slam_pads[spoiler.settings.chunky_phase_slam_req_internal], 2)
+                item.type = slam_pads[spoiler.settings.chunky_phase_slam_req_internal]
             # Delete crypt doors
             if removed_crypt_doors:
                 size_down = False
@@ -417,62 +335,40 @@ def randomize_setup(spoiler):
                 elif cont_map_id == Maps.CastleCrypt:
                     size_down = item_id in (0xF, 0xE, 0xD)
                 if size_down:
-                    ROM_COPY.seek(item_start + 0xC)
-                    ROM_COPY.writeMultipleBytes(0, 4)
+                    item.scale = 0
 
         if spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off:
             if len(positions) > 0 and len(offsets) > 0:
-                random.shuffle(positions)
-                for index, offset in enumerate(offsets):
-                    ROM_COPY.seek(offset)
+                general_random.shuffle(positions)
+                for index, item in enumerate(offsets):
                     for coord in range(3):
-                        ROM_COPY.writeMultipleBytes(positions[index][coord], 4)
-                    ROM_COPY.seek(offset + 0x1C)
-                    ROM_COPY.writeMultipleBytes(positions[index][3], 4)
+                        item.setWord(coord * 4, positions[index][coord])
+                    item.setWord(0x1C, positions[index][3])
             if cont_map_id == Maps.FranticFactory:
                 rotation_hexes = ["0x00000000", "0x42B40000", "0x43340000", "0x43870000"]  # 0  # 90  # 180  # 270
                 for subtype in number_replacement_data:
                     subtype_name = subtype
                     subtype = number_replacement_data[subtype]
-                    random.shuffle(subtype["positions"])
+                    general_random.shuffle(subtype["positions"])
                     for index, offset in enumerate(subtype["offsets"]):
-                        ROM_COPY.seek(offset["offset"])
+                        item = offset["offset"]
                         base_rot = offset["rotation"]
                         for coord in range(3):
                             coord_val = subtype["positions"][index]["coords"][coord]
                             if coord == 1:
                                 coord_val = int(float_to_hex(1002), 16)
-                            ROM_COPY.writeMultipleBytes(coord_val, 4)
+                            item.setWord(coord * 4, coord_val)
                         new_rot = subtype["positions"][index]["rotation"]
                         rot_diff = ((base_rot - new_rot) + 4) % 4
                         if subtype_name == "center":
-                            rot_diff = random.randint(0, 3)
-                        ROM_COPY.seek(offset["offset"] + 0x1C)
+                            rot_diff = general_random.randint(0, 3)
                         new_rot = (2 + rot_diff) % 4
-                        ROM_COPY.writeMultipleBytes(int(rotation_hexes[new_rot], 16), 4)
+                        item.setWord(0x1C, int(rotation_hexes[new_rot], 16))
 
-        # Mystery
-        ROM_COPY.seek(cont_map_setup_address + 4 + (model2_count * 0x30))
-        mystery_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-        actor_block_start = cont_map_setup_address + 4 + (model2_count * 0x30) + 4 + (mystery_count * 0x24)
-        ROM_COPY.seek(cont_map_setup_address + 4 + (model2_count * 0x30) + 4 + (mystery_count * 0x24))
-        actor_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-        actor_bytes = []
-        used_actor_ids = []
-        for actor_item in range(actor_count):
-            actor_start = actor_block_start + 4 + (actor_item * 0x38)
-            ROM_COPY.seek(actor_start + 0x32)
-            actor_type = int.from_bytes(ROM_COPY.readBytes(2), "big") + 0x10
-            if spoiler.settings.random_patches:
-                if not actor_type == 139:
-                    byte_list = []
-                    ROM_COPY.seek(actor_start + 0x34)
-                    used_actor_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    ROM_COPY.seek(actor_start)
-                    for x in range(int(0x38 / 4)):
-                        byte_list.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                    actor_bytes.append(byte_list.copy())
+        # Actors
         if spoiler.settings.random_patches:
+            actors = [actor for actor in setup.actors if actor.type != 139]
+            used_actor_ids = [actor.id for actor in actors]
             new_actor_id = 0x20
             for dirt_item in spoiler.dirt_patch_placement:
                 for patch in CustomLocations[dirt_item["level"]]:
@@ -497,41 +393,27 @@ def randomize_setup(spoiler):
                         used_actor_ids.append(new_actor_id)
                         new_actor_id += 1
                         dirt_bytes.append(int(id_something_hex, 16))
-                        actor_bytes.append(dirt_bytes)
-                ROM_COPY.seek(actor_block_start)
-                ROM_COPY.writeMultipleBytes(len(actor_bytes), 4)
-                for actor in actor_bytes:
-                    for byte_list in actor:
-                        ROM_COPY.writeMultipleBytes(byte_list, 4)
+                        actors.append(ActorRecord.fromWords(dirt_bytes))
+                setup.actors = actors
         # Re-run through actor stuff for changes
-        ROM_COPY.seek(cont_map_setup_address + 4 + (model2_count * 0x30) + 4 + (mystery_count * 0x24))
-        actor_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-        for actor_item in range(actor_count):
-            actor_start = actor_block_start + 4 + (actor_item * 0x38)
-            ROM_COPY.seek(actor_start + 0x32)
-            actor_type = int.from_bytes(ROM_COPY.readBytes(2), "big") + 0x10
-            ROM_COPY.seek(actor_start + 0x34)
-            actor_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
+        for actor in setup.actors:
+            actor_type = actor.type
+            actor_id = actor.id
             if actor_type >= 100 and actor_type <= 105 and spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off and cont_map_id == Maps.CavesDiddyIgloo:  # 5DI Spawner
                 spawner_pos = diddy_5di_pads["picked"][diddy_5di_pads["index"]]
-                ROM_COPY.seek(actor_start)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[0]), 16), 4)
-                ROM_COPY.seek(actor_start + 8)
-                ROM_COPY.writeMultipleBytes(int(float_to_hex(spawner_pos[1]), 16), 4)
+                actor.x = spawner_pos[0]
+                actor.z = spawner_pos[1]
                 diddy_5di_pads["index"] += 1
             elif actor_type >= 64 and actor_type <= 66 and spoiler.settings.puzzle_rando_difficulty != PuzzleRando.off and cont_map_id == Maps.AngryAztec:  # Exclude O Vase to force it to be vanilla
                 # Vase
-                ROM_COPY.seek(actor_start)
-                for coord in range(3):
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(vase_puzzle_positions[vase_puzzle_rando_progress][coord]), 16), 4)
+                actor.setPosition(vase_puzzle_positions[vase_puzzle_rando_progress])
                 vase_puzzle_rando_progress += 1
             elif actor_type == 0x1C and actor_id == 16 and spoiler.settings.fix_lanky_tiny_prod and cont_map_id == Maps.FranticFactory:
-                ROM_COPY.seek(actor_start + 0x14)
-                ROM_COPY.writeMultipleBytes(1, 4)
+                actor.setWord(0x14, 1)
             elif actor_type == 139 and raise_patch and not spoiler.settings.random_patches:
                 if cont_map_id == Maps.FungiForest and actor_id == 47:
-                    ROM_COPY.seek(actor_start + 4)
-                    ROM_COPY.writeMultipleBytes(int(float_to_hex(155), 16), 4)
+                    actor.y = 155
+        writeSetupFile(ROM_COPY, cont_map_id, setup)
 
 
 def updateRandomSwitches(spoiler):
@@ -557,18 +439,14 @@ def updateRandomSwitches(spoiler):
                 if level == Levels.GloomyGalleon:
                     acceptable_maps.append(Maps.GloomyGalleonLobby)  # Galleon lobby internally in the game is galleon, but isn't in rando files. Quick fix for this
                 for map in acceptable_maps:
-                    file_start = js.pointer_addresses[9]["entries"][map]["pointing_to"]
-                    ROM_COPY.seek(file_start)
-                    model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-                    for model2_item in range(model2_count):
-                        item_start = file_start + 4 + (model2_item * 0x30)
-                        ROM_COPY.seek(item_start + 0x28)
-                        item_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
+                    setup = readSetupFile(ROM_COPY, map)
+                    for item in setup.model_two:
+                        item_type = item.type
                         if item_type in all_switches:
                             for kong in switches:
                                 if item_type in switches[kong]:
-                                    ROM_COPY.seek(item_start + 0x28)
-                                    ROM_COPY.writeMultipleBytes(switches[kong][switch_level], 2)
+                                    item.type = switches[kong][switch_level]
+                    writeSetupFile(ROM_COPY, map, setup)
 
 
 def updateSwitchsanity(spoiler):
@@ -612,13 +490,9 @@ def updateSwitchsanity(spoiler):
                     obj_ids = spoiler.settings.switchsanity_data[slot].ids
                     ids_in_map.extend(obj_ids)
             # Handle setup
-            file_start = js.pointer_addresses[9]["entries"][map_id]["pointing_to"]
-            ROM_COPY.seek(file_start)
-            model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            for model2_item in range(model2_count):
-                item_start = file_start + 4 + (model2_item * 0x30)
-                ROM_COPY.seek(item_start + 0x2A)
-                item_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
+            setup = readSetupFile(ROM_COPY, map_id)
+            for item in setup.model_two:
+                item_id = item.id
                 if item_id in ids_in_map:
                     switch_kong = None
                     switch_type = None
@@ -632,21 +506,16 @@ def updateSwitchsanity(spoiler):
                                 switch_offset = int(switch_kong)
                                 switch_slot = slot
                                 if switch_type == SwitchType.SlamSwitch:
-                                    ROM_COPY.seek(item_start + 0x28)
-                                    old_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                                    old_level = switches[SwitchType.SlamSwitch].index(old_type) % 3
+                                    old_level = switches[SwitchType.SlamSwitch].index(item.type) % 3
                                     switch_offset = (3 * int(switch_kong)) + old_level
                     if switch_kong is not None and switch_type is not None and switch_offset is not None:
-                        new_obj = switches[switch_type][switch_offset]
-                        ROM_COPY.seek(item_start + 0x28)
-                        ROM_COPY.writeMultipleBytes(new_obj, 2)
+                        item.type = switches[switch_type][switch_offset]
                         if switch_slot == Switches.IslesHelmLobbyGone and switch_type == SwitchType.MiscActivator:
                             if switch_kong == Kongs.diddy:
-                                ROM_COPY.seek(item_start + 0xC)
-                                ROM_COPY.writeMultipleBytes(0x3F400000, 4)
+                                item.scale = 0.75
                             # elif switch_kong == Kongs.donkey:
-                            #     ROM_COPY.seek(item_start + 0x1C)
-                            #     ROM_COPY.writeMultipleBytes(0, 4)
+                            #     item.rotation_y = 0
+            writeSetupFile(ROM_COPY, map_id, setup)
 
 
 def updateKrushaMoveNames(spoiler):
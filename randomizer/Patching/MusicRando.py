@@ -1,7 +1,6 @@
 """Randomize Music passed from Misc options."""
 
 import gzip
-import random
 import unicodedata
 
 import js
@@ -14,6 +13,7 @@ from randomizer.Enums.SongGroups import SongGroup
 from randomizer.Enums.Settings import MusicFilters, WinConditionComplex
 from randomizer.Lists.Songs import song_data, song_idx_list
 from randomizer.Patching.Patcher import ROM
+from randomizer.RandomStreams import cosmetic_random
 from randomizer.Settings import Settings
 from randomizer.Patching.Lib import IsItemSelected, Overlay
 from randomizer.Patching.ASMPatcher import writeValue, populateOverlayOffsets, getROMAddress
@@ -286,7 +286,7 @@ def requestNewSong(file_data_array: list, location_tags: list, location_length:
     if check_tag:
         # Tag-Based Search
         loc_tag_copy = location_tags.copy()
-        random.shuffle(loc_tag_copy)
+        cosmetic_random.shuffle(loc_tag_copy)
         for tag in loc_tag_copy:
             if tag in list(UNPLACED_SONGS.keys()):
                 if len(UNPLACED_SONGS[tag]) > 0:
@@ -346,7 +346,7 @@ def insertUploaded(settings: Settings, uploaded_songs: list, uploaded_song_names
     GLOBAL_SEARCH_INDEX = 0
     USED_INDEXES = []
     file_data = list(zip(uploaded_songs, uploaded_song_names, uploaded_song_extensions))
-    random.shuffle(file_data)
+    cosmetic_random.shuffle(file_data)
     # Initial temporary variables
     all_target_songs = [song_enum for song_enum, song in song_data.items() if song.type == target_type]
 
@@ -393,7 +393,7 @@ def insertUploaded(settings: Settings, uploaded_songs: list, uploaded_song_names
     songs_to_be_replaced = []
     if swap_amount > 0:
         try:
-            songs_to_be_replaced = random.sample(available_target_songs, swap_amount)
+            songs_to_be_replaced = cosmetic_random.sample(available_target_songs, swap_amount)
         except ValueError:
             # Too many vanilla songs have been placed to hit the requested
             # proportion. Just fill all possible locations.
@@ -586,7 +586,7 @@ def randomize_music(settings: Settings):
                 # shuffle this list.
                 if settings.music_bgm_randomized and not settings.music_vanilla_locations:
                     shuffled_music = song_list[channel_index].copy()
-                    random.shuffle(shuffled_music)
+                    cosmetic_random.shuffle(shuffled_music)
                     # Move assigned songs to the back of the list, and shorten
                     # to match open_locations.
                     pre_assigned_songs = [x for x in shuffled_music if x in assigned_songs[channel_index]]
@@ -673,7 +673,7 @@ def randomize_music(settings: Settings):
             if type_data.setting and not settings.music_vanilla_locations:
                 # Shuffle the group list
                 shuffled_music = group_items.copy()
-                random.shuffle(shuffled_music)
+                cosmetic_random.shuffle(shuffled_music)
                 # Move assigned songs to the back of the list, and shorten
                 # to match open_locations.
                 pre_assigned_songs = [x for x in shuffled_music if x in assigned_items]
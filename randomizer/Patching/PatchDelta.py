@@ -0,0 +1,199 @@
+"""Create VCDIFF patches straight from the patched ROM in memory."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+# VCDIFF (RFC 3284) header: magic bytes, version 0 and no header indicator flags
+VCDIFF_HEADER = bytes([0xD6, 0xC3, 0xC4, 0x00, 0x00])
+VCD_SOURCE = 0x01
+# Instructions from the default code table with an explicit size
+VCD_ADD = 1
+VCD_COPY_SELF = 19
+
+# How the base ROM is built by the shrink patch, as (target offset, length, address) segments
+# Addresses follow VCDIFF, where dk64.z64 is followed by the target, and an address of None means the bytes are new
+base_segments = None
+base_source_size = None
+
+
+def readBPSNumber(data: bytes, offset: int) -> Tuple[int, int]:
+    """Read a variable length number from a BPS patch, returning the number and the offset after it."""
+    value = 0
+    shift = 1
+    while True:
+        byte = data[offset]
+        offset += 1
+        value += (byte & 0x7F) * shift
+        if byte & 0x80:
+            return value, offset
+        shift <<= 7
+        value += shift
+
+
+def getBPSSegments(bps: bytes) -> Tuple[int, List[Tuple[int, int, Optional[int]]]]:
+    """Get the source size of a BPS patch and where each part of its target is copied from."""
+    if bps[:4] != b"BPS1":
+        raise Exception("Base ROM patch is not a BPS patch.")
+    source_size, offset = readBPSNumber(bps, 4)
+    _, offset = readBPSNumber(bps, offset)
+    metadata_size, offset = readBPSNumber(bps, offset)
+    offset += metadata_size
+    end = len(bps) - 12
+    segments = []
+    output_offset = 0
+    source_relative_offset = 0
+    target_relative_offset = 0
+    while offset < end:
+        data, offset = readBPSNumber(bps, offset)
+        command = data & 3
+        length = (data >> 2) + 1
+        address = None
+        if command == 0:
+            # SourceRead
+            address = output_offset
+        elif command == 1:
+            # TargetRead
+            offset += length
+        else:
+            relative, offset = readBPSNumber(bps, offset)
+            relative = -(relative >> 1) if relative & 1 else relative >> 1
+            if command == 2:
+                # SourceCopy
+                source_relative_offset += relative
+                address = source_relative_offset
+                source_relative_offset += length
+            else:
+                # TargetCopy
+                target_relative_offset += relative
+                address = source_size + target_relative_offset
+                target_relative_offset += length
+        # Merge with the previous segment where possible to keep the list short
+        if segments:
+            last_start, last_length, last_address = segments[-1]
+            if (last_address is None and address is None) or (last_address is not None and address == last_address + last_length):
+                segments[-1] = (last_start, last_length + length, last_address)
+                output_offset += length
+                continue
+        segments.append((output_offset, length, address))
+        output_offset += length
+    return source_size, segments
+
+
+def loadBaseSegments() -> Tuple[int, List[Tuple[int, int, Optional[int]]]]:
+    """Load how the base ROM was built from dk64.z64, reading the shrink patch the first time it's needed."""
+    global base_segments, base_source_size
+    if base_segments is None:
+        with open("./static/patches/shrink-dk64.bps", "rb") as file:
+            base_source_size, base_segments = getBPSSegments(file.read())
+    return base_source_size, base_segments
+
+
+def mergeRanges(ranges: List[List[int]]) -> List[List[int]]:
+    """Sort [start, end) ranges and merge any which overlap or touch."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def getPatchOperations(source_size: int, segments: List[Tuple[int, int, Optional[int]]], dirty_ranges: List[List[int]], target_size: int) -> List[Tuple[int, int, Optional[int]]]:
+    """Split the base segments around the ranges written during patching.
+
+    Returns (target offset, length, address) operations, where an address of None means the bytes have to be added from the patched ROM.
+    """
+    dirty = mergeRanges(dirty_ranges)
+    dirty_starts = [x[0] for x in dirty]
+    operations = []
+
+    def isClean(start, end):
+        index = bisect_right(dirty_starts, start) - 1
+        if index >= 0 and dirty[index][1] > start:
+            return False
+        return index + 1 >= len(dirty) or dirty[index + 1][0] >= end
+
+    def addOperation(start, length, address):
+        if length <= 0:
+            return
+        if address is not None and address >= source_size:
+            # Copies from earlier in the target only hold if those bytes weren't written to either
+            target_offset = address - source_size
+            if not isClean(target_offset, target_offset + length):
+                address = None
+        if operations:
+            last_start, last_length, last_address = operations[-1]
+            if last_address is None and address is None:
+                operations[-1] = (last_start, last_length + length, None)
+                return
+        operations.append((start, length, address))
+
+    dirty_index = 0
+    for start, length, address in segments:
+        end = min(start + length, target_size)
+        position = start
+        while position < end:
+            # Skip dirty ranges that end before this point
+            while dirty_index < len(dirty) and dirty[dirty_index][1] <= position:
+                dirty_index += 1
+            if dirty_index < len(dirty) and dirty[dirty_index][0] <= position:
+                # Inside a written range, add the patched bytes
+                piece_end = min(dirty[dirty_index][1], end)
+                addOperation(position, piece_end - position, None)
+            else:
+                piece_end = end
+                if dirty_index < len(dirty):
+                    piece_end = min(dirty[dirty_index][0], end)
+                addOperation(position, piece_end - position, None if address is None else address + (position - start))
+            position = piece_end
+    # Anything past the end of the base ROM only exists in the patched ROM
+    covered = segments[-1][0] + segments[-1][1] if segments else 0
+    addOperation(covered, target_size - covered, None)
+    return operations
+
+
+def encodeNumber(value: int) -> bytes:
+    """Encode a number as a VCDIFF variable length integer."""
+    encoded = [value & 0x7F]
+    value >>= 7
+    while value > 0:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(encoded))
+
+
+def createVCDiff(target: bytes, source_size: int, operations: List[Tuple[int, int, Optional[int]]]) -> bytes:
+    """Encode patch operations as a VCDIFF patch against a source file of the given size.
+
+    Everything goes in a single window so that copies can reach anywhere earlier in the target.
+    """
+    data = bytearray()
+    instructions = bytearray()
+    addresses = bytearray()
+    for start, length, address in operations:
+        if address is None:
+            data += target[start : start + length]
+            instructions.append(VCD_ADD)
+        else:
+            instructions.append(VCD_COPY_SELF)
+            addresses += encodeNumber(address)
+        instructions += encodeNumber(length)
+    delta = bytearray(encodeNumber(len(target)))
+    delta.append(0)
+    delta += encodeNumber(len(data)) + encodeNumber(len(instructions)) + encodeNumber(len(addresses))
+    delta += data + instructions + addresses
+    patch = bytearray(VCDIFF_HEADER)
+    patch.append(VCD_SOURCE)
+    patch += encodeNumber(source_size) + encodeNumber(0)
+    patch += encodeNumber(len(delta))
+    patch += delta
+    return bytes(patch)
+
+
+def createRomPatch(patched_rom: bytes, dirty_ranges: List[List[int]]) -> bytes:
+    """Create a VCDIFF patch from dk64.z64 to the patched ROM, using the ranges written during patching instead of diffing the whole ROM."""
+    source_size, segments = loadBaseSegments()
+    return createVCDiff(patched_rom, source_size, getPatchOperations(source_size, segments, dirty_ranges, len(patched_rom)))
@@ -0,0 +1,179 @@
+"""Plans of writes to the ROM, recorded while patching and applied in one pass."""
+
+from __future__ import annotations
+
+import ast
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Functions which only pass writes on, so a traced write is attributed to the code calling them
+WRITE_HELPERS = ("writeValue", "writeFloat", "writeFloatUpper", "writeFunction", "writeHook", "writeLabelValue", "expandSaveFile")
+ALWAYS = "always"
+
+
+@lru_cache(maxsize=None)
+def getSourceTree(file_name: str) -> Optional[ast.Module]:
+    """Parse a source file, or return None if it can't be read."""
+    try:
+        with open(file_name, "r", encoding="utf-8") as file:
+            source = file.read()
+    except OSError:
+        return None
+    return ast.parse(source)
+
+
+@lru_cache(maxsize=None)
+def getConditions(file_name: str, line: int) -> str:
+    """Get the conditions of every if statement a line of a source file is run under."""
+    tree = getSourceTree(file_name)
+    if tree is None:
+        return f"{file_name}:{line}"
+    conditions = []
+    node = tree
+    while True:
+        inner = None
+        for child in ast.iter_child_nodes(node):
+            if getattr(child, "lineno", None) is not None and child.lineno <= line <= child.end_lineno:
+                inner = child
+                break
+        if inner is None:
+            break
+        if isinstance(inner, ast.If):
+            condition = ast.unparse(inner.test)
+            if any(child.lineno <= line <= child.end_lineno for child in inner.orelse):
+                condition = f"not ({condition})"
+            conditions.append(condition)
+        node = inner
+    if len(conditions) == 0:
+        return ALWAYS
+    return " and ".join(conditions)
+
+
+class PatchPlan:
+    """Writes to the ROM, recorded by position and applied later in one sorted pass.
+
+    A plan stands in for the ROM while patching. Writes made through it are recorded instead of
+    written, and reads see the recorded writes over the ROM the plan was made for.
+    """
+
+    def __init__(self, rom=None, trace: bool = False) -> None:
+        """Initialize with no writes.
+
+        Args:
+            rom (LocalROM, optional): ROM read through the plan, if any.
+            trace (bool, optional): Whether to record the conditions each write was made under, for describe.
+        """
+        self.rom = rom
+        self.position = 0
+        # New value of every byte written, by position
+        self.values: Dict[int, int] = {}
+        # Conditions every byte was written under, by position, if traced
+        self.groups: Optional[Dict[int, str]] = {} if trace else None
+        # Runs of consecutive bytes written, kept until the next write
+        self.runs: Optional[List[Tuple[int, bytes]]] = None
+
+    def seek(self, val: int) -> None:
+        """Seek to a position in the ROM."""
+        self.position = val
+
+    def tell(self) -> int:
+        """Get the current position."""
+        return self.position
+
+    def write(self, val: int) -> None:
+        """Record a single byte written to the current position."""
+        self.writeBytes(bytes([int(val)]))
+
+    def writeMultipleBytes(self, value: int, size: int) -> None:
+        """Record a big endian value of a size written to the current position, keeping its lowest bytes if it doesn't fit."""
+        if value is None:
+            value = 0
+        self.writeBytes((int(value) % (1 << (8 * size))).to_bytes(size, "big"))
+
+    def writeBytes(self, byte_data: bytes) -> None:
+        """Record bytes written to the current position."""
+        start = self.position
+        self.runs = None
+        for offset, byte in enumerate(byte_data):
+            self.values[start + offset] = byte
+        if self.groups is not None:
+            group = self.getCallerConditions()
+            for offset in range(len(byte_data)):
+                self.groups[start + offset] = group
+        self.position += len(byte_data)
+
+    def getCallerConditions(self) -> str:
+        """Get the conditions the code making the current write ran under."""
+        frame = sys._getframe(1)
+        while frame is not None and (frame.f_code.co_name in WRITE_HELPERS or frame.f_globals.get("__name__") == __name__):
+            frame = frame.f_back
+        if frame is None:
+            return ALWAYS
+        return getConditions(frame.f_code.co_filename, frame.f_lineno)
+
+    def readBytes(self, len: int) -> bytes:
+        """Read bytes from the current position, as they will be once the plan is applied."""
+        start = self.position
+        data = bytearray(len)
+        if self.rom is not None:
+            self.rom.seek(start)
+            data[:] = self.rom.readBytes(len)
+        for offset in range(len):
+            if start + offset in self.values:
+                data[offset] = self.values[start + offset]
+        self.position += len
+        return bytes(data)
+
+    def update(self, other: PatchPlan) -> None:
+        """Add the writes of another plan, which are made after the writes of this one."""
+        self.values.update(other.values)
+        self.runs = None
+        if self.groups is not None:
+            self.groups.update(other.groups if other.groups is not None else {position: ALWAYS for position in other.values})
+
+    def getRuns(self) -> List[Tuple[int, bytes]]:
+        """Get the writes as runs of consecutive bytes, sorted by position."""
+        if self.runs is not None:
+            return self.runs
+        runs = []
+        start = None
+        run = bytearray()
+        for position in sorted(self.values):
+            if start is not None and position != start + len(run):
+                runs.append((start, bytes(run)))
+                start = None
+            if start is None:
+                start = position
+                run = bytearray()
+            run.append(self.values[position])
+        if start is not None:
+            runs.append((start, bytes(run)))
+        self.runs = runs
+        return runs
+
+    def apply(self, rom=None) -> None:
+        """Write the plan to a ROM, the one it was made for by default, with one write per run of consecutive bytes."""
+        if rom is None:
+            rom = self.rom
+        for start, data in self.getRuns():
+            rom.seek(start)
+            rom.writeBytes(data)
+
+    def describe(self) -> str:
+        """Describe every write as a line of its position, bytes and the conditions it was made under, sorted by position.
+
+        Descriptions of two seeds can be diffed to see what their settings change in the ROM.
+        """
+        lines = []
+        for start, data in self.getRuns():
+            # Split runs where the conditions writing them change
+            offset = 0
+            while offset < len(data):
+                group = ALWAYS if self.groups is None else self.groups.get(start + offset, ALWAYS)
+                end = offset + 1
+                while end < len(data) and (self.groups is None or self.groups.get(start + end, ALWAYS) == group):
+                    end += 1
+                lines.append(f"{start + offset:08X} {data[offset:end].hex().upper()} {group}")
+                offset = end
+        return "\n".join(lines) + "\n"
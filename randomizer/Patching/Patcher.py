@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import copy
+import gzip
+import mmap
 import os
+import sys
+import zlib
+from bisect import bisect_left, insort
 from io import BytesIO
 from typing import TYPE_CHECKING, Union
 
 import js
+from randomizer.Instrumentation import count, isRecording
 
 if TYPE_CHECKING:
     from randomizer.Enums.Kongs import Kongs
@@ -17,6 +23,30 @@ if TYPE_CHECKING:
 
 patchedRom = None
 og_patched_rom = None
+# File holding the base ROM, mapped into memory by each generation instead of copied
+BASE_ROM_FILE = "dk64-base.z64"
+base_rom_path = None
+# [start, end) ranges of the patched ROM written to since it was copied from the base ROM
+dirty_ranges = []
+# Decoded pointer table files by (table index, file index), only written back to the ROM when flushed
+file_cache = {}
+# (start, end, key) of each cached file, sorted by start
+file_cache_ranges = []
+# Size of the blocks compared when writing back uncompressed files
+WRITE_COMPARE_BLOCK = 64
+# Modules of helpers used by every patcher, whose writes are counted against the patcher calling them
+PATCHER_LIBRARIES = ("randomizer.Patching.Patcher", "randomizer.Patching.Lib")
+
+
+def count_bytes_written(size: int) -> None:
+    """Count bytes written to the ROM against the patcher writing them."""
+    if not isRecording():
+        return
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_globals.get("__name__", "").startswith(PATCHER_LIBRARIES):
+        frame = frame.f_back
+    patcher = "unknown" if frame is None else frame.f_globals.get("__name__", "unknown").rsplit(".", 1)[-1]
+    count("rom_bytes_written", size, patcher=patcher)
 
 
 class ROM:
@@ -126,30 +156,93 @@ class ROM:
         self.fixChecksum()
 
 
+def create_base_rom_file(file_path: str = BASE_ROM_FILE) -> str:
+    """Apply the shrink patch to dk64.z64 once and save the base ROM to a file, returning its path.
+
+    The file is rebuilt if dk64.z64 or the shrink patch have changed since it was written.
+    """
+    patch_path = "./static/patches/shrink-dk64.bps"
+    if os.path.exists(file_path):
+        built_time = os.path.getmtime(file_path)
+        if built_time >= os.path.getmtime("dk64.z64") and built_time >= os.path.getmtime(patch_path):
+            return file_path
+    print("Building base rom")
+    from vidua import bps
+
+    with open(patch_path, "rb") as patch, open("dk64.z64", "rb") as original:
+        data = bps.patch(original, patch).read()
+    # Write to a temporary file first so a process never maps a partially written ROM
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, file_path)
+    return file_path
+
+
+def map_base_rom(file_path: str) -> mmap.mmap:
+    """Map the base ROM file into memory as a private copy.
+
+    Pages are shared with every other process mapping the file until they're written to,
+    and writes never reach the file itself.
+    """
+    with open(file_path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+
 # Try except for when the browser is trying to load this file
-def load_base_rom(default_file: None = None) -> None:
-    """Load the base ROM file for patching."""
+def load_base_rom(default_file: Union[BytesIO, str, None] = None) -> None:
+    """Load the base ROM file for patching.
+
+    default_file can either be the base ROM itself or the path of a file holding it.
+    """
     try:
         global patchedRom
         global og_patched_rom
-        if patchedRom is None and default_file is None:
+        global base_rom_path
+        dirty_ranges.clear()
+        file_cache.clear()
+        file_cache_ranges.clear()
+        if isinstance(default_file, str):
+            base_rom_path = default_file
+        elif patchedRom is None and default_file is None and og_patched_rom is None and base_rom_path is None:
             print("Loading base rom")
-            from vidua import bps
-
-            patch = open("./static/patches/shrink-dk64.bps", "rb")
-            original = open("dk64.z64", "rb")
-            og_patched_rom = BytesIO(bps.patch(original, patch).read())
-            patchedRom = copy.deepcopy(og_patched_rom)
+            base_rom_path = create_base_rom_file()
         elif default_file is not None and patchedRom is None:
             print("Using default file")
             og_patched_rom = default_file
-            patchedRom = copy.deepcopy(og_patched_rom)
+        if base_rom_path is not None and not isinstance(default_file, BytesIO):
+            patchedRom = map_base_rom(base_rom_path)
         else:
             patchedRom = copy.deepcopy(og_patched_rom)
     except Exception as e:
         pass
 
 
+class CachedFile:
+    """Decoded contents of a pointer table file held in memory."""
+
+    def __init__(self, table_index: int, file_index: int, compressed: bool, data: bytes, dirty: bool) -> None:
+        """Initialize with given parameters."""
+        self.table_index = table_index
+        self.file_index = file_index
+        self.start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
+        self.size = js.pointer_addresses[table_index]["entries"][file_index + 1]["pointing_to"] - self.start
+        self.compressed = compressed
+        self.data = data
+        self.dirty = dirty
+
+    def encode(self) -> bytes:
+        """Get the data to write to the file's slot in the ROM."""
+        data = self.data
+        if self.compressed:
+            data = gzip.compress(data, compresslevel=9)
+        if len(data) > self.size:
+            raise Exception(
+                f"Attempted to write data to a file slot which isn't big enough.\n- Table: {self.table_index}\n- File {self.file_index}\n- Attempt size {hex(len(data))}\n- Capacity: {hex(self.size)}"
+            )
+        return data
+
+
 class LocalROM:
     """Patcher for ROM files loaded via Rompatcherjs."""
 
@@ -169,6 +262,9 @@ class LocalROM:
             data = bytes(range(256)) * (data_size // 256)  # Repeat values from 0 to 255 to fill 32KB
             # Create a BytesIO object
             patchedRom = BytesIO(data)
+            dirty_ranges.clear()
+            file_cache.clear()
+            file_cache_ranges.clear()
         else:
             if not os.path.exists("dk64.z64"):
                 raise Exception("No ROM was loaded, please make sure you have dk64.z64 in the root directory of the project.")
@@ -185,6 +281,8 @@ class LocalROM:
         Args:
             val (int): Int value to write.
         """
+        count_bytes_written(1)
+        self.markDirty(1)
         self.rom.write((val).to_bytes(1, byteorder="big", signed=False))
 
     def writeBytes(self, byte_data: Union[bytearray, bytes]) -> None:
@@ -195,7 +293,34 @@ class LocalROM:
         Args:
             byte_data (bytes): Bytes object to write to current position.
         """
-        self.rom.write(bytes(byte_data))
+        byte_data = bytes(byte_data)
+        count_bytes_written(len(byte_data))
+        self.writeDirtyBytes(byte_data)
+
+    def writeDirtyBytes(self, byte_data: bytes) -> None:
+        """Write bytes to the current position without counting them, for writing back cached files which were counted when written."""
+        self.markDirty(len(byte_data))
+        self.rom.write(byte_data)
+
+    def markDirty(self, size: int) -> None:
+        """Record that the bytes about to be written at the current position differ from the base ROM.
+
+        Args:
+            size (int): Amount of bytes being written.
+        """
+        if size <= 0:
+            return
+        start = self.rom.tell()
+        end = start + size
+        self.syncCachedFiles(start, end, True)
+        if len(dirty_ranges) > 0:
+            last = dirty_ranges[-1]
+            # Most writes are sequential, so extend the last range where possible
+            if last[0] <= start <= last[1]:
+                if end > last[1]:
+                    last[1] = end
+                return
+        dirty_ranges.append([start, end])
 
     def writeMultipleBytes(self, value: Union[int, Enemies, Maps, Kongs, CustomActors], size: int) -> None:
         """Write multiple bytes of a size to the current position.
@@ -221,8 +346,7 @@ class LocalROM:
             if idx == 0 or temp == 0:
                 will_pass = False
             idx -= 1
-        for x in arr:
-            self.write(x)
+        self.writeBytes(bytes(arr))
 
     def seek(self, val: int) -> None:
         """Seek to position in current file.
@@ -243,4 +367,129 @@ class LocalROM:
         Returns:
             bytes: List of bytes read from current position.
         """
+        start = self.rom.tell()
+        self.syncCachedFiles(start, start + len, False)
         return bytes(self.rom.read(len))
+
+    def readFile(self, table_index: int, file_index: int, compressed: bool) -> bytes:
+        """Read a pointer table file, decompressing it if needed.
+
+        The decoded file is cached, so later reads and writes of it don't touch the ROM until the cache is flushed.
+
+        Args:
+            table_index (int): Pointer table of the file.
+            file_index (int): Index of the file in the table.
+            compressed (bool): Whether the file is compressed.
+
+        Returns:
+            bytes: Decoded contents of the file.
+        """
+        key = (table_index, file_index)
+        cached = file_cache.get(key)
+        if cached is not None:
+            if cached.compressed == compressed:
+                return cached.data
+            self.dropCachedFile(key, True)
+        entry = CachedFile(table_index, file_index, compressed, b"", False)
+        self.seek(entry.start)
+        data = self.readBytes(entry.size)
+        if compressed:
+            data = zlib.decompress(data, (15 + 32))
+        entry.data = data
+        self.addCachedFile(key, entry)
+        return data
+
+    def writeFile(self, table_index: int, file_index: int, compressed: bool, data: Union[bytearray, bytes]) -> None:
+        """Replace the contents of a pointer table file.
+
+        The file is only compressed and written to the ROM when the cache is flushed.
+
+        Args:
+            table_index (int): Pointer table of the file.
+            file_index (int): Index of the file in the table.
+            compressed (bool): Whether the file should be compressed.
+            data (bytes): New decoded contents of the file.
+        """
+        count_bytes_written(len(data))
+        key = (table_index, file_index)
+        if key in file_cache:
+            # The whole file is being replaced, so there's nothing to write back
+            self.dropCachedFile(key, False)
+        self.addCachedFile(key, CachedFile(table_index, file_index, compressed, bytes(data), True))
+
+    def addCachedFile(self, key: tuple, entry: CachedFile) -> None:
+        """Add a file to the cache, writing back any cached file sharing its slot first."""
+        self.syncCachedFiles(entry.start, entry.start + entry.size, True)
+        file_cache[key] = entry
+        insort(file_cache_ranges, (entry.start, entry.start + entry.size, key))
+
+    def dropCachedFile(self, key: tuple, flush: bool) -> None:
+        """Remove a file from the cache, writing it to the ROM first if it has changed."""
+        entry = file_cache.pop(key)
+        file_cache_ranges.remove((entry.start, entry.start + entry.size, key))
+        if flush and entry.dirty:
+            position = self.rom.tell()
+            if entry.compressed:
+                self.seek(entry.start)
+                self.writeDirtyBytes(entry.encode())
+            else:
+                self.writeChangedBytes(entry.start, entry.encode())
+            self.seek(position)
+
+    def writeChangedBytes(self, start: int, data: bytes) -> None:
+        """Write data to the ROM, skipping any part which already matches so those bytes stay out of the patch.
+
+        Args:
+            start (int): Position to write the data to.
+            data (bytes): Data to write.
+        """
+        self.rom.seek(start)
+        current = self.rom.read(len(data))
+        block = WRITE_COMPARE_BLOCK
+        offset = 0
+        while offset < len(data):
+            end = min(offset + block, len(data))
+            if data[offset:end] != current[offset:end]:
+                # Only write from the first to the last byte which differs in this block
+                first = offset
+                while data[first] == current[first]:
+                    first += 1
+                last = end
+                while data[last - 1] == current[last - 1]:
+                    last -= 1
+                self.seek(start + first)
+                self.writeDirtyBytes(data[first:last])
+            offset = end
+
+    def syncCachedFiles(self, start: int, end: int, writing: bool) -> None:
+        """Keep cached files consistent with the ROM before it's accessed directly.
+
+        Changed files overlapping the range are written back, and any overlapping file is dropped if the range is being written to.
+        """
+        if len(file_cache_ranges) == 0:
+            return
+        overlapping = []
+        index = bisect_left(file_cache_ranges, (end,)) - 1
+        while index >= 0 and file_cache_ranges[index][1] > start:
+            overlapping.append(file_cache_ranges[index][2])
+            index -= 1
+        for key in overlapping:
+            # Writing one file back can drop others sharing its slot
+            if key in file_cache and (writing or file_cache[key].dirty):
+                self.dropCachedFile(key, True)
+
+    def flushFiles(self) -> None:
+        """Write every changed file in the cache back to the ROM."""
+        for key in list(file_cache.keys()):
+            self.dropCachedFile(key, True)
+
+    def getValue(self) -> bytes:
+        """Get the full contents of the ROM.
+
+        Returns:
+            bytes: Every byte of the ROM.
+        """
+        self.flushFiles()
+        if isinstance(self.rom, BytesIO):
+            return self.rom.getvalue()
+        return self.rom[:]
@@ -1,6 +1,5 @@
 """Randomize puzzles."""
 
-import random
 import math
 import js
 import gzip
@@ -9,13 +8,14 @@ from randomizer.Enums.Maps import Maps
 from randomizer.Patching.Patcher import LocalROM
 from randomizer.Patching.Lib import IsItemSelected, float_to_hex
 from randomizer.Enums.Settings import FasterChecksSelected, PuzzleRando
+from randomizer.RandomStreams import general_random
 
 
 def chooseSFX():
     """Choose random SFX from bank of acceptable SFX."""
     banks = [[98, 138], [166, 252], [398, 411], [471, 476], [519, 535], [547, 575], [614, 631], [644, 650]]
-    bank = random.choice(banks)
-    return random.randint(bank[0], bank[1])
+    bank = general_random.choice(banks)
+    return general_random.randint(bank[0], bank[1])
 
 
 def shiftCastleMinecartRewardZones():
@@ -83,8 +83,8 @@ class RaceBound:
             lower_z = min(self.start_z, self.end_z)
             upper_z = max(self.start_z, self.end_z)
             while i < self.checkpoint_count:
-                x = random.randint(lower_x, upper_x)
-                z = random.randint(lower_z, upper_z)
+                x = general_random.randint(lower_x, upper_x)
+                z = general_random.randint(lower_z, upper_z)
                 allowed = True
                 for bubble in placement_bubbles:
                     dx = bubble[0] - x
@@ -120,7 +120,7 @@ class RaceBound:
         """Get angle for a checkpoint."""
         if self.area == CarRaceArea.castle_car_start_finish:
             return 0
-        angle_offset = random.randint(-300, 300)
+        angle_offset = general_random.randint(-300, 300)
         if self.direction_is_x:
             if self.start_x > self.end_x:
                 return angle_offset + 3072
@@ -198,7 +198,7 @@ def writeRandomCastleCarRace(ROM_COPY: LocalROM, spoiler):
                 local_bytes.extend([0, check_type])  # Seen values of 26,39,42,43,44,47,48,49,50,53,55,65,89,90,110,124
                 checkpoint_bytes_order.append(local_bytes)
         enemy_car_checkpoints.extend(new_points)
-    will_reverse = random.randint(0, 3) == 0
+    will_reverse = general_random.randint(0, 3) == 0
     if will_reverse and False:
         temp_checkpoints = enemy_car_checkpoints[:-1]
         temp_check_bytes = checkpoint_bytes_order[:-1]
@@ -389,7 +389,7 @@ class PuzzleRandoBound:
         elif puzzle_setting == PuzzleRando.hard:
             selected_lower = upper_mid
             selected_upper = upper
-        self.selected = random.randint(selected_lower, selected_upper)
+        self.selected = general_random.randint(selected_lower, selected_upper)
         return self.selected
 
 
@@ -446,18 +446,18 @@ def randomize_puzzles(spoiler):
             ROM_COPY.writeMultipleBytes(sfx, 2)
         for piano_item in range(7):
             ROM_COPY.seek(sav + 0x16C + piano_item)
-            key = random.randint(0, 5)
+            key = general_random.randint(0, 5)
             ROM_COPY.writeMultipleBytes(key, 1)
         spoiler.dk_face_puzzle = [None] * 9
         spoiler.chunky_face_puzzle = [None] * 9
         for face_puzzle_square in range(9):
-            value = random.randint(0, 3)
+            value = general_random.randint(0, 3)
             if face_puzzle_square == 8:
-                value = random.choice([0, 1, 3])  # Lanky for this square glitches out the puzzle. Nice going Loser kong
+                value = general_random.choice([0, 1, 3])  # Lanky for this square glitches out the puzzle. Nice going Loser kong
             spoiler.dk_face_puzzle[face_puzzle_square] = value
-            value = random.randint(0, 3)
+            value = general_random.randint(0, 3)
             if face_puzzle_square == 2:
-                value = random.choice([0, 1, 3])  # Lanky for this square glitches out the puzzle. Nice going Loser kong again
+                value = general_random.choice([0, 1, 3])  # Lanky for this square glitches out the puzzle. Nice going Loser kong again
             spoiler.chunky_face_puzzle[face_puzzle_square] = value
         # Arcade Level Order Rando
         arcade_levels = ["25m", "50m", "75m", "100m"]
@@ -467,7 +467,7 @@ def randomize_puzzles(spoiler):
             "75m": 3,
             "100m": 2,
         }
-        random.shuffle(arcade_levels)
+        general_random.shuffle(arcade_levels)
         # Make sure 75m isn't in the first 2 levels if faster arcade is enabled because 75m is hard
         if IsItemSelected(spoiler.settings.faster_checks_enabled, spoiler.settings.faster_checks_selected, FasterChecksSelected.arcade):
             for x in range(2):
@@ -506,29 +506,29 @@ def randomize_puzzles(spoiler):
             map_spawners = js.pointer_addresses[16]["entries"][map_index]["pointing_to"]
             map_data = race_data[map_index]
             if map_data["start_angle"] is None:
-                initial_angle = random.randint(0, 359)
+                initial_angle = general_random.randint(0, 359)
             else:
                 initial_angle = map_data["start_angle"]
             previous_offset = None
             for point in range(map_data["count"]):
                 ROM_COPY.seek(map_spawners + map_data["offset"] + (point * 0xA))
                 if previous_offset is None:
-                    angle_offset = random.randint(-90, 90)
+                    angle_offset = general_random.randint(-90, 90)
                 else:
-                    angle_magnitude = random.randint(0, 90)
+                    angle_magnitude = general_random.randint(0, 90)
                     direction = -1
                     if previous_offset > 0:
                         direction = 1
-                    change_direction = random.randint(0, 3) == 0
+                    change_direction = general_random.randint(0, 3) == 0
                     if change_direction:
                         direction *= -1
                     angle_offset = direction * angle_magnitude
                 previous_offset = angle_offset
                 initial_angle += angle_offset
-                radius = random.randint(map_data["radius"][0], map_data["radius"][1])
+                radius = general_random.randint(map_data["radius"][0], map_data["radius"][1])
                 angle_rad = (initial_angle / 180) * math.pi
                 x = int(map_data["center_x"] + (radius * math.sin(angle_rad)))
-                y = random.randint(map_data["y"][0], map_data["y"][1])
+                y = general_random.randint(map_data["y"][0], map_data["y"][1])
                 z = int(map_data["center_z"] + (radius * math.cos(angle_rad)))
                 ROM_COPY.writeMultipleBytes(x, 2)
                 ROM_COPY.writeMultipleBytes(y, 2)
@@ -0,0 +1,167 @@
+"""On-disk cache of generated cosmetic textures, shared between seeds.
+
+Entries hold the final bytes written to the ROM, keyed by a hash of the files the texture is built from,
+the transform applied and its parameters, the randomizer version and the code of the modules that build them. The least recently used entries are removed once the cache
+grows past its size cap.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Callable, List
+
+import js
+from randomizer.Patching.Patcher import ROM, LocalROM
+from version import version
+
+# Modules next to this one whose code builds cached textures, so changing any of them stops old entries being used
+BUILDER_FILES = ("CosmeticColors.py", "LibImage.py", "generate_kong_color_images.py", "TextureCache.py")
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "dk64r_texture_cache")
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+ENTRY_EXTENSION = ".bin"
+
+
+class TextureCache:
+    """Directory of cached textures with a size cap, evicting the least recently used entries.
+
+    Entries are touched when read, so their modification time is when they were last used.
+    Failing to read or write the cache is never an error, the texture is just built again.
+    """
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        """Initialize with given parameters. A max size of 0 disables the cache."""
+        self.directory = directory
+        self.max_size = max_size
+        # Total size of the entries, counted when first needed
+        self.size = None
+
+    def getPath(self, key: str) -> str:
+        """Get the path of the entry for a key."""
+        return os.path.join(self.directory, key + ENTRY_EXTENSION)
+
+    def get(self, key: str) -> bytes:
+        """Get the data stored for a key, or None if there's no entry for it."""
+        if self.max_size <= 0:
+            return None
+        path = self.getPath(key)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store data for a key, then evict old entries if the cache is too big."""
+        if self.max_size <= 0 or len(data) > self.max_size:
+            return
+        path = self.getPath(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.size is None:
+                self.size = self.getSize()
+            # Write to a file of our own first, so other processes never read a partial entry
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            return
+        self.size += len(data)
+        if self.size > self.max_size:
+            self.evict()
+
+    def getEntries(self) -> List[os.DirEntry]:
+        """Get every entry in the cache directory."""
+        try:
+            return [entry for entry in os.scandir(self.directory) if entry.name.endswith(ENTRY_EXTENSION)]
+        except OSError:
+            return []
+
+    def getSize(self) -> int:
+        """Get the total size of the entries in the cache directory."""
+        size = 0
+        for entry in self.getEntries():
+            try:
+                size += entry.stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in its size cap."""
+        entries = []
+        for entry in self.getEntries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        # Other processes may have added entries too, so start from what is actually there
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= size
+
+
+texture_cache = TextureCache(os.environ.get("TEXTURE_CACHE_DIR", DEFAULT_CACHE_DIR), int(os.environ.get("TEXTURE_CACHE_SIZE", DEFAULT_CACHE_SIZE)))
+# Hash of the version and the builder code, worked out when first needed
+builder_hash = None
+
+
+def getBuilderHash() -> str:
+    """Get a hash of the randomizer version and the code of the modules that build cached textures."""
+    global builder_hash
+    if builder_hash is None:
+        digest = hashlib.sha256(version.encode())
+        for name in BUILDER_FILES:
+            try:
+                with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as fh:
+                    digest.update(b"|" + fh.read())
+            except OSError:
+                digest.update(b"|missing " + name.encode())
+        builder_hash = digest.hexdigest()
+    return builder_hash
+
+
+def getTextureSourceHash(table_index: int, file_index: int) -> str:
+    """Get a hash of a file as it currently is in the ROM."""
+    file_start = js.pointer_addresses[table_index]["entries"][file_index]["pointing_to"]
+    file_end = js.pointer_addresses[table_index]["entries"][file_index + 1]["pointing_to"]
+    try:
+        LocalROM().seek(file_start)
+        data = LocalROM().readBytes(file_end - file_start)
+    except Exception:
+        ROM().seek(file_start)
+        data = ROM().readBytes(file_end - file_start)
+    return hashlib.sha256(bytes(data)).hexdigest()
+
+
+def getTextureCacheKey(sources: List[str], transform: str, params: tuple) -> str:
+    """Get the cache key of a texture built by a transform from the given source hashes."""
+    key = hashlib.sha256()
+    key.update(f"{getBuilderHash()}|{transform}|{params!r}".encode())
+    for source in sources:
+        key.update(b"|" + source.encode())
+    return key.hexdigest()
+
+
+def getCachedTextureData(sources: List[str], transform: str, params: tuple, build: Callable[[], bytes]) -> bytes:
+    """Get the data of a texture from the cache, building and storing it if it isn't cached.
+
+    Sources are hashes of every file the texture is built from, and params must include everything
+    else the build depends on.
+    """
+    key = getTextureCacheKey(sources, transform, params)
+    data = texture_cache.get(key)
+    if data is None:
+        data = build()
+        texture_cache.put(key, data)
+    return data
@@ -1,12 +1,11 @@
 """Update wrinkly hints compressed file."""
 
-import random
-
 import js
 from randomizer.Enums.Kongs import Kongs
 from randomizer.Lists.WrinklyHints import HintLocation, hints
 from randomizer.Patching.Lib import grabText, writeText
 from randomizer.Patching.Patcher import LocalROM
+from randomizer.RandomStreams import hint_random
 
 
 def writeWrinklyHints(file_start_offset, text):
@@ -80,7 +79,7 @@ def updateRandomHint(message: str, kongs_req=[], keywords=[], levels=[]):
             if not is_banned:
                 hint_pool.append(x)
     if len(hint_pool) > 0:
-        selected = random.choice(hint_pool)
+        selected = hint_random.choice(hint_pool)
         return UpdateHint(hints[selected], message)
     return False
 
@@ -1,7 +1,5 @@
 """Functions and data for setting and calculating prices."""
 
-import random
-
 from randomizer.Enums.Items import Items
 from randomizer.Enums.Kongs import Kongs
 from randomizer.Enums.Locations import Locations
@@ -9,6 +7,7 @@ from randomizer.Enums.Settings import RandomPrices
 from randomizer.Enums.Types import Types
 from randomizer.Lists.Item import ItemList
 from randomizer.Lists.Location import ChunkyMoveLocations, DiddyMoveLocations, DonkeyMoveLocations, LankyMoveLocations, SharedMoveLocations, TinyMoveLocations, TrainingBarrelLocations
+from randomizer.RandomStreams import fill_random
 
 VanillaPrices = {
     Items.Vines: 0,
@@ -109,7 +108,7 @@ def GenerateRandomPrice(weight, avg, stddev, upperLimit):
     if weight == RandomPrices.free:
         newPrice = 0
     else:
-        newPrice = round(random.normalvariate(avg, stddev))
+        newPrice = round(fill_random.normalvariate(avg, stddev))
         if newPrice < lowerLimit:
             newPrice = lowerLimit
         elif newPrice > upperLimit:
@@ -266,7 +265,11 @@ def KongCanBuy(spoiler, location_id, logic, kong, buy_empty=False):
         # print("KongCanBuy checking item: " + str(LocationList[location].item))
         # print("for kong: " + kong.name + " with " + str(coins[kong]) + " coins")
         # print("has price: " + str(price))
-        return logic.GetCoins(kong) >= price
+        if logic.GetCoins(kong) >= price:
+            return True
+        # Note that coins ran short - incremental searches can't assume the purchase order didn't matter
+        logic.failedPriceChecks += 1
+        return False
     else:
         return False
 
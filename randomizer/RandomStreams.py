@@ -0,0 +1,146 @@
+"""Random number streams of a seed generation.
+
+Every generation owns a RandomStreams object, carried on its settings. Each phase of the generation
+draws from its own named stream, so extra draws in one phase don't change any other phase, and
+a phase such as cosmetics can be run again on its own by resetting its stream.
+
+Code draws through the stream proxies below, which use the streams of the generation running in
+the current thread or task. Several generations can therefore run in the same interpreter.
+Drawing with no streams active raises NoActiveStreams rather than drawing from an unseeded
+stream, so a draw that escaped its generation can't go unnoticed. Tests and tools which draw
+outside of a generation activate streams of their own, with RandomStreams(seed).activate().
+"""
+
+from __future__ import annotations
+
+import random
+from contextvars import ContextVar
+from typing import Any, List, Sequence
+
+GENERAL = "general"
+FILL = "fill"
+HINTS = "hints"
+CB_SHUFFLE = "cb_shuffle"
+ENEMIES = "enemies"
+COSMETICS = "cosmetics"
+
+
+class NoActiveStreams(Exception):
+    """Raised when random numbers are drawn with no streams active in the current thread or task."""
+
+
+class RandomStreams:
+    """Named random number streams, each seeded from the seed of the generation and its name."""
+
+    def __init__(self, seed: Any = None) -> None:
+        """Initialize with the seed of the generation. Streams without a seed are seeded from the system."""
+        self.seed(seed)
+
+    def seed(self, seed: Any) -> None:
+        """Seed every stream again from a new seed."""
+        self.root_seed = seed
+        self.seeds = {}
+        self.streams = {}
+
+    def getStream(self, name: str) -> random.Random:
+        """Get a stream, creating it if it hasn't been used yet."""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = random.Random(self.getSeed(name))
+            self.streams[name] = stream
+        return stream
+
+    def getSeed(self, name: str) -> Any:
+        """Get the seed a stream starts from."""
+        if name in self.seeds:
+            return self.seeds[name]
+        if self.root_seed is None:
+            return None
+        return f"{self.root_seed}-{name}"
+
+    def reseed(self, name: str, seed: Any) -> None:
+        """Restart a stream from a seed of its own."""
+        self.seeds[name] = seed
+        self.streams.pop(name, None)
+
+    def reset(self, name: str) -> None:
+        """Restart a stream from its seed, so a phase can be run again and draw the same values."""
+        self.streams.pop(name, None)
+
+    def activate(self) -> None:
+        """Make these the streams drawn from by the current thread or task."""
+        current_streams.set(self)
+
+
+current_streams = ContextVar("current_streams", default=None)
+
+
+class StreamProxy:
+    """Draws from a named stream of the active generation."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize with the name of the stream."""
+        self.name = name
+
+    def getStream(self) -> random.Random:
+        """Get the stream of the active generation."""
+        streams = current_streams.get()
+        if streams is None:
+            raise NoActiveStreams(f"Drew from the {self.name} stream with no random streams active. Create the Settings of a generation, or activate RandomStreams of a seed, first.")
+        return streams.getStream(self.name)
+
+    def random(self) -> float:
+        """Get a float in the range [0.0, 1.0)."""
+        return self.getStream().random()
+
+    def uniform(self, a: float, b: float) -> float:
+        """Get a float between a and b."""
+        return self.getStream().uniform(a, b)
+
+    def triangular(self, low: float = 0.0, high: float = 1.0, mode: float = None) -> float:
+        """Get a float between low and high from a triangular distribution."""
+        return self.getStream().triangular(low, high, mode)
+
+    def normalvariate(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        """Get a float from a normal distribution."""
+        return self.getStream().normalvariate(mu, sigma)
+
+    def randint(self, a: int, b: int) -> int:
+        """Get an integer in the range [a, b]."""
+        return self.getStream().randint(a, b)
+
+    def randrange(self, *args) -> int:
+        """Get an integer from a range."""
+        return self.getStream().randrange(*args)
+
+    def choice(self, seq: Sequence) -> Any:
+        """Get a random element of a sequence."""
+        return self.getStream().choice(seq)
+
+    def choices(self, population: Sequence, weights: Sequence = None, *, cum_weights: Sequence = None, k: int = 1) -> List:
+        """Get k elements of a population, with replacement."""
+        return self.getStream().choices(population, weights, cum_weights=cum_weights, k=k)
+
+    def sample(self, population: Sequence, k: int, *, counts: Sequence = None) -> List:
+        """Get k unique elements of a population."""
+        return self.getStream().sample(population, k, counts=counts)
+
+    def shuffle(self, x: List) -> None:
+        """Shuffle a list in place."""
+        self.getStream().shuffle(x)
+
+    def getstate(self) -> tuple:
+        """Get the state of the stream."""
+        return self.getStream().getstate()
+
+    def setstate(self, state: tuple) -> None:
+        """Restore the state of the stream."""
+        self.getStream().setstate(state)
+
+
+general_random = StreamProxy(GENERAL)
+fill_random = StreamProxy(FILL)
+hint_random = StreamProxy(HINTS)
+cb_random = StreamProxy(CB_SHUFFLE)
+enemy_random = StreamProxy(ENEMIES)
+cosmetic_random = StreamProxy(COSMETICS)
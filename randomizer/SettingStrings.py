@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, Tuple
 
 from randomizer.Enums.Settings import (
@@ -16,6 +17,9 @@ from randomizer.Enums.Settings import (
     SpoilerHints,
 )
 
+# Number of decrypted settings strings kept
+SETTINGS_STRING_CACHE_SIZE = 64
+
 letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
 index_to_letter = {i: letters[i] for i in range(64)}
 letter_to_index = {letters[i]: i for i in range(len(letters))}
@@ -40,6 +44,19 @@ def bin_string_to_int(bin_str: str, bytesize: int) -> int:
         return int(bin_str, 2)
 
 
+@lru_cache(maxsize=None)
+def get_key_size() -> int:
+    """Return the number of bits used to encode a setting key."""
+    return get_enum_bit_length(SettingsStringEnum)
+
+
+@lru_cache(maxsize=None)
+def get_enum_bit_length(enum_type) -> int:
+    """Return the number of bits used to encode a value of an enum."""
+    return max([member.value for member in enum_type]).bit_length()
+
+
+@lru_cache(maxsize=None)
 def get_var_int_encode_details(settingEnum: SettingsStringEnum) -> Tuple[int, bool]:
     """Return key information needed to encode/decode a given var_int setting.
 
@@ -169,6 +186,7 @@ def encrypt_settings_string_enum(dict_data: dict):
         "download_patch_file",
         "load_patch_file",
         "seed",
+        "fill_attempt",
         "settings_string",
         "chunky_main_colors",
         "chunky_main_custom_color",
@@ -248,8 +266,7 @@ def encrypt_settings_string_enum(dict_data: dict):
         key_enum = SettingsStringEnum[key]
         key_data_type = SettingsStringTypeMap[key_enum]
         # Encode the key.
-        key_size = max([member.value for member in SettingsStringEnum]).bit_length()
-        bitstring += bin(key_enum)[2:].zfill(key_size)
+        bitstring += bin(key_enum)[2:].zfill(get_key_size())
         if key_data_type == SettingsStringDataType.bool:
             bitstring += "1" if value else "0"
         elif key_data_type == SettingsStringDataType.int4:
@@ -278,12 +295,10 @@ def encrypt_settings_string_enum(dict_data: dict):
                     bitstring += encode_var_int(key_enum, item)
                 else:
                     # The value is an enum.
-                    max_value = max([member.value for member in key_list_data_type])
-                    bitstring += format(item.value, f"0{max_value.bit_length()}b")
+                    bitstring += format(item.value, f"0{get_enum_bit_length(key_list_data_type)}b")
         else:
             # The value is an enum.
-            max_value = max([member.value for member in key_data_type])
-            bitstring += format(value.value, f"0{max_value.bit_length()}b")
+            bitstring += format(value.value, f"0{get_enum_bit_length(key_data_type)}b")
 
     # Pad the bitstring with zeroes until the length is divisible by 6.
     remainder = len(bitstring) % 6
@@ -303,12 +318,22 @@ def encrypt_settings_string_enum(dict_data: dict):
 def decrypt_settings_string_enum(encrypted_string: str) -> Dict[str, Any]:
     """Take an enum-based encrypted string and return a dictionary.
 
+    Decrypted strings are cached, as a handful of strings are used for most seeds. Every call
+    returns its own copy, which can be changed freely.
+
     Args:
         encrypted_string (str): Passed settings string.
 
     Returns:
         dict: Returns the decrypted set of data.
     """
+    settings_dict = decode_settings_string(encrypted_string)
+    return {key: (val.copy() if isinstance(val, list) else val) for key, val in settings_dict.items()}
+
+
+@lru_cache(maxsize=SETTINGS_STRING_CACHE_SIZE)
+def decode_settings_string(encrypted_string: str) -> Dict[str, Any]:
+    """Decrypt a settings string. The result is cached, so it must not be changed."""
     # Take each letter of the encrypted_string and convert it to a 6-bit binary
     # number, then use the embedded keys to get the value from the settings
     # string.
@@ -319,7 +344,7 @@ def decrypt_settings_string_enum(encrypted_string: str) -> Dict[str, Any]:
     bitstring_length = len(bitstring)
     settings_dict = {}
     bit_index = 0
-    key_size = max([member.value for member in SettingsStringEnum]).bit_length()
+    key_size = get_key_size()
     # If there are fewer than (key_size + 1) characters left in our bitstring,
     # we have hit the padding. (key_size + 1 characters is the minimum needed
     # for a key and a value.)
@@ -376,17 +401,17 @@ def decrypt_settings_string_enum(encrypted_string: str) -> Dict[str, Any]:
                     bit_index += bit_len
                 else:
                     # The value is an enum.
-                    max_value = max([member.value for member in key_list_data_type])
-                    int_val = int(bitstring[bit_index : bit_index + max_value.bit_length()], 2)
+                    bit_length = get_enum_bit_length(key_list_data_type)
+                    int_val = int(bitstring[bit_index : bit_index + bit_length], 2)
                     list_val = key_list_data_type(int_val)
-                    bit_index += max_value.bit_length()
+                    bit_index += bit_length
                 val.append(list_val)
         else:
             # The value is an enum.
-            max_value = max([member.value for member in key_data_type])
-            int_val = int(bitstring[bit_index : bit_index + max_value.bit_length()], 2)
+            bit_length = get_enum_bit_length(key_data_type)
+            int_val = int(bitstring[bit_index : bit_index + bit_length], 2)
             val = key_data_type(int_val)
-            bit_index += max_value.bit_length()
+            bit_index += bit_length
         # If this setting is not deprecated, add it.
         # The plando setting needs to be encoded in settings strings but not applied when decoding for logging purposes.
         if key_enum not in DeprecatedSettings and key_enum != SettingsStringEnum.enable_plandomizer:
@@ -2,9 +2,8 @@
 
 import json
 import math
-import random
-from copy import deepcopy
-from random import randint
+from collections import OrderedDict
+from copy import copy, deepcopy
 
 from randomizer.Enums.Transitions import Transitions
 import randomizer.ItemPool as ItemPool
@@ -50,10 +49,29 @@ from randomizer.Lists.Songs import song_data
 from randomizer.Lists.Switches import SwitchData
 from randomizer.Patching.Lib import IsItemSelected, HelmDoorInfo, HelmDoorRandomInfo, DoorItemToBarrierItem
 from randomizer.Prices import CompleteVanillaPrices, RandomizePrices, VanillaPrices
+from randomizer.RandomStreams import FILL, RandomStreams, general_random
 from randomizer.SettingStrings import encrypt_settings_string_enum
 from randomizer.ShuffleBosses import ShuffleBosses, ShuffleBossKongs, ShuffleKKOPhaseOrder, ShuffleKutoutKongs, ShuffleTinyPhaseToes
 from version import version as randomizer_version
 
+# Settings the valid location tables are compiled from
+VALID_LOCATION_SETTINGS = (
+    "move_rando",
+    "training_barrels",
+    "shockwave_status",
+    "starting_moves_count",
+    "shuffle_items",
+    "random_fairies",
+    "crown_door_item",
+    "coin_door_item",
+    "ice_traps_damage",
+    "damage_amount",
+    "perma_death",
+)
+# Number of compiled valid location tables kept, shared between the seeds generated in this process
+VALID_LOCATIONS_CACHE_SIZE = 32
+ValidLocationsCache = OrderedDict()
+
 
 class Settings:
     """Class used to store settings for seed generation."""
@@ -67,6 +85,8 @@ class Settings:
         self.__hash = randomizer_version
         self.public_hash = randomizer_version
         self.algorithm = FillAlgorithm.forward
+        # Index of this attempt when several fills of the same seed are run in parallel - attempt 0 is the normal fill
+        self.fill_attempt = 0
         self.generate_main()
         self.generate_progression()
         self.generate_misc()
@@ -80,7 +100,7 @@ class Settings:
             self.generate_spoilerlog = False
         self.seed = str(self.seed) + self.__hash + str(json.dumps(form_data))
         self.set_seed()
-        self.seed_hash = [random.randint(0, 9) for i in range(5)]
+        self.seed_hash = [general_random.randint(0, 9) for i in range(5)]
         self.krool_keys_required = []
         self.starting_key_list = []
         # Settings which are not yet implemented on the web page
@@ -249,7 +269,7 @@ class Settings:
         if self.randomize_cb_required_amounts:
             randomlist = []
             for min_percentage in self.troff_min:
-                randomlist.append(random.randint(round(self.troff_max * min_percentage), self.troff_max))
+                randomlist.append(general_random.randint(round(self.troff_max * min_percentage), self.troff_max))
             cbs = randomlist
             self.troff_0 = round(min(cbs[0] * self.troff_weight_0, 500))
             self.troff_1 = round(min(cbs[1] * self.troff_weight_1, 500))
@@ -287,8 +307,8 @@ class Settings:
             }
             locked_blocker_items = []
             for slot in range(8):
-                item = random.choice([key for key in self.blocker_limits.keys() if key not in locked_blocker_items])
-                count = random.randint(1, math.ceil(self.blocker_limits[item] * self.chaos_ratio))
+                item = general_random.choice([key for key in self.blocker_limits.keys() if key not in locked_blocker_items])
+                count = general_random.randint(1, math.ceil(self.blocker_limits[item] * self.chaos_ratio))
                 self.BLockerEntryItems[slot] = item
                 self.BLockerEntryCount[slot] = count
                 # Some barriers can only show up once
@@ -300,11 +320,11 @@ class Settings:
                 if self.blocker_max < 7:
                     # Can't create a random list with purely the range. Too small of a list
                     choice_list = [int(x / 10) for x in range(10, (self.blocker_max * 10) + 9)]
-                randomlist = random.choices(choice_list, k=7)
+                randomlist = general_random.choices(choice_list, k=7)
                 b_lockers = randomlist
                 if self.shuffle_loading_zones == ShuffleLoadingZones.all or self.hard_level_progression:
-                    b_lockers.append(random.randint(1, self.blocker_max))
-                    random.shuffle(b_lockers)
+                    b_lockers.append(general_random.randint(1, self.blocker_max))
+                    general_random.shuffle(b_lockers)
                 else:
                     b_lockers.append(1)
                     b_lockers.sort()
@@ -361,8 +381,14 @@ class Settings:
         self.free_trade_setting = FreeTradeSetting.none
 
     def set_seed(self):
-        """Forcibly re-set the random seed to the seed set in the config."""
-        random.seed(self.seed)
+        """Forcibly re-set the random streams to the seed set in the config, and draw from them in this thread."""
+        self.random = RandomStreams(self.seed)
+        self.random.activate()
+
+    def set_fill_attempt_seed(self):
+        """Re-set the fill stream for a parallel fill attempt, so each attempt fills differently but can be reproduced on its own."""
+        if self.fill_attempt > 0:
+            self.random.reseed(FILL, self.seed + "-fill-" + str(self.fill_attempt))
 
     def generate_progression(self):
         """Set default items on progression page."""
@@ -821,7 +847,7 @@ class Settings:
                         continue
                 if slot == Switches.IslesMonkeyport:
                     # Monkeyport is restricted to things which can help get the kong up high enough
-                    self.switchsanity_data[slot].kong = random.choice([Kongs.donkey, Kongs.lanky, Kongs.tiny])
+                    self.switchsanity_data[slot].kong = general_random.choice([Kongs.donkey, Kongs.lanky, Kongs.tiny])
                 else:
                     bad_kongs = [self.switchsanity_data[x].kong for x in self.switchsanity_data[slot].tied_settings]
                     if self.enable_plandomizer:
@@ -829,12 +855,12 @@ class Settings:
                             if str(switch.value) in self.plandomizer_dict["plando_switchsanity"].keys():
                                 bad_kongs.append(self.plandomizer_dict["plando_switchsanity"][str(switch.value)]["kong"])
                     slot_choices_kong = [x for x in kongs if x not in bad_kongs]
-                    self.switchsanity_data[slot].kong = random.choice(slot_choices_kong)
+                    self.switchsanity_data[slot].kong = general_random.choice(slot_choices_kong)
                     if slot == Switches.IslesHelmLobbyGone:
                         if self.switchsanity_data[slot].kong == Kongs.chunky:
-                            self.switchsanity_data[slot].switch_type = random.choice([SwitchType.PadMove, SwitchType.InstrumentPad])  # Choose between gone and triangle
+                            self.switchsanity_data[slot].switch_type = general_random.choice([SwitchType.PadMove, SwitchType.InstrumentPad])  # Choose between gone and triangle
                         elif self.switchsanity_data[slot].kong in (Kongs.donkey, Kongs.diddy):
-                            self.switchsanity_data[slot].switch_type = random.choice([SwitchType.MiscActivator, SwitchType.InstrumentPad])  # Choose between grab and bongos
+                            self.switchsanity_data[slot].switch_type = general_random.choice([SwitchType.MiscActivator, SwitchType.InstrumentPad])  # Choose between grab and bongos
                         else:
                             self.switchsanity_data[slot].switch_type = SwitchType.InstrumentPad
 
@@ -886,7 +912,7 @@ class Settings:
         # Krusha Kong
         # if self.krusha_ui == KrushaUi.random:
         #     slots = [x for x in range(5) if x != Kongs.chunky or not self.disco_chunky]  # Only add Chunky if Disco not on (People with disco on probably don't want Krusha as Chunky)
-        #     self.krusha_kong = random.choice(slots)
+        #     self.krusha_kong = general_random.choice(slots)
         # else:
         #     self.krusha_kong = None
         #     krusha_conversion = {
@@ -902,19 +928,19 @@ class Settings:
 
         # Fungi Time of Day
         if self.fungi_time == FungiTimeSetting.random:
-            self.fungi_time_internal = random.choice([FungiTimeSetting.day, FungiTimeSetting.night])
+            self.fungi_time_internal = general_random.choice([FungiTimeSetting.day, FungiTimeSetting.night])
         else:
             self.fungi_time_internal = self.fungi_time
 
         # Galleon Water Level
         if self.galleon_water == GalleonWaterSetting.random:
-            self.galleon_water_internal = random.choice([GalleonWaterSetting.lowered, GalleonWaterSetting.raised])
+            self.galleon_water_internal = general_random.choice([GalleonWaterSetting.lowered, GalleonWaterSetting.raised])
         else:
             self.galleon_water_internal = self.galleon_water
 
         # Chunky Phase Slam Requirement
         if self.chunky_phase_slam_req == SlamRequirement.random:
-            self.chunky_phase_slam_req_internal = random.choice([SlamRequirement.green, SlamRequirement.blue, SlamRequirement.red])
+            self.chunky_phase_slam_req_internal = general_random.choice([SlamRequirement.green, SlamRequirement.blue, SlamRequirement.red])
         else:
             self.chunky_phase_slam_req_internal = self.chunky_phase_slam_req
 
@@ -997,7 +1023,7 @@ class Settings:
                 data = helmdoor_items[x].getDifficultyInfo(crown_diff)
                 weight = 0 if data is None else data.selection_weight
                 potential_item_weights.append(weight)
-            selected_item = random.choices(potential_items, weights=potential_item_weights, k=1)[0]
+            selected_item = general_random.choices(potential_items, weights=potential_item_weights, k=1)[0]
             self.crown_door_item = selected_item
             self.crown_door_item_count = crown_door_pool[selected_item]
         if self.coin_door_random:
@@ -1007,7 +1033,7 @@ class Settings:
                 data = helmdoor_items[x].getDifficultyInfo(coin_diff)
                 weight = 0 if data is None else data.selection_weight
                 potential_item_weights.append(weight)
-            selected_item = random.choices(potential_items, weights=potential_item_weights, k=1)[0]
+            selected_item = general_random.choices(potential_items, weights=potential_item_weights, k=1)[0]
             self.coin_door_item = selected_item
             self.coin_door_item_count = coin_door_pool[selected_item]
         if self.crown_door_item in helmdoor_items.keys():
@@ -1019,7 +1045,7 @@ class Settings:
 
         if self.has_password:
             for x in range(8):
-                self.password[x] = random.randint(1, 6)
+                self.password[x] = general_random.randint(1, 6)
 
         # Win Condition
         wincon_items = {
@@ -1115,7 +1141,7 @@ class Settings:
                 data = wincon_items[x].getDifficultyInfo(wc_diff)
                 weight = 0 if data is None else data.selection_weight
                 potential_item_weights.append(weight)
-            selected_item = random.choices(potential_items, weights=potential_item_weights, k=1)[0]
+            selected_item = general_random.choices(potential_items, weights=potential_item_weights, k=1)[0]
             self.win_condition_item = selected_item
             self.win_condition_count = win_con_pool[selected_item]
         if self.win_condition_item in helmdoor_items.keys():
@@ -1200,13 +1226,13 @@ class Settings:
             phases.extend([Maps.JapesBoss, Maps.AztecBoss, Maps.FactoryBoss, Maps.GalleonBoss, Maps.FungiBoss, Maps.CavesBoss, Maps.CastleBoss])
         possible_phases = phases.copy()
         if self.krool_phase_order_rando:
-            random.shuffle(phases)
+            general_random.shuffle(phases)
         if self.krool_random:
-            self.krool_phase_count = randint(1, 5)
+            self.krool_phase_count = general_random.randint(1, 5)
         if isinstance(self.krool_phase_count, str) is True:
             self.krool_phase_count = 5
         if self.krool_phase_count < len(phases):
-            phases = random.sample(phases, self.krool_phase_count)
+            phases = general_random.sample(phases, self.krool_phase_count)
         # Plandomized K. Rool algorithm
         if self.enable_plandomizer:
             planned_phases = []
@@ -1221,7 +1247,7 @@ class Settings:
             for i in range(len(phases)):
                 if phases[i] is None:
                     available_phases = [map_id for map_id in possible_phases if map_id not in planned_phases]
-                    phases[i] = random.choice(available_phases)
+                    phases[i] = general_random.choice(available_phases)
                     planned_phases.append(phases[i])
             for i in range(len(phases)):
                 phases[i] = int(phases[i])
@@ -1265,13 +1291,13 @@ class Settings:
 
         rooms = [Kongs.donkey, Kongs.chunky, Kongs.tiny, Kongs.lanky, Kongs.diddy]
         if self.helm_phase_order_rando:
-            random.shuffle(rooms)
+            general_random.shuffle(rooms)
         if self.helm_random:
-            self.helm_phase_count = randint(1, 5)
+            self.helm_phase_count = general_random.randint(1, 5)
         if isinstance(self.helm_phase_count, str) is True:
             self.helm_phase_count = 5
         if self.helm_phase_count < 5:
-            rooms = random.sample(rooms, self.helm_phase_count)
+            rooms = general_random.sample(rooms, self.helm_phase_count)
         # Plandomized Helm room algorithm - only applies when we're already shuffling Helm Order!
         if self.enable_plandomizer and self.helm_phase_order_rando:
             planned_rooms = []
@@ -1286,7 +1312,7 @@ class Settings:
             for i in range(len(rooms)):
                 if rooms[i] == Kongs.any:
                     available_rooms = [kong for kong in [Kongs.donkey, Kongs.diddy, Kongs.lanky, Kongs.tiny, Kongs.chunky] if kong not in planned_rooms]
-                    rooms[i] = random.choice(available_rooms)
+                    rooms[i] = general_random.choice(available_rooms)
                     planned_rooms.append(rooms[i])
         orderedRooms = []
         for kong in rooms:
@@ -1316,10 +1342,10 @@ class Settings:
             if self.level_randomization in (LevelRandomization.level_order, LevelRandomization.level_order_complex):
                 # Add an extra 3 into the calculation
                 allocation.append(3)
-                random.shuffle(allocation)
+                general_random.shuffle(allocation)
             else:
                 # If LZR, always make Helm SDSS
-                random.shuffle(allocation)
+                general_random.shuffle(allocation)
                 allocation.append(3)
             self.switch_allocation = allocation.copy()
 
@@ -1331,27 +1357,27 @@ class Settings:
             mill_lever_cap = 3 if mill_shortened else 5
             self.mill_levers = [0] * 5
             for slot in range(mill_lever_cap):
-                self.mill_levers[slot] = random.randint(1, 3)
+                self.mill_levers[slot] = general_random.randint(1, 3)
 
         if IsItemSelected(self.hard_mode, self.hard_mode_selected, HardModeSelected.shuffled_jetpac_enemies):
             jetpac_levels = list(range(8))
-            random.shuffle(jetpac_levels)
+            general_random.shuffle(jetpac_levels)
             self.jetpac_enemy_order = jetpac_levels
 
         if self.puzzle_rando_difficulty != PuzzleRando.off:
             # Crypt Levers
-            self.crypt_levers = random.sample([x + 1 for x in range(6)], 3)
+            self.crypt_levers = general_random.sample([x + 1 for x in range(6)], 3)
             # Diddy R&D Doors
             self.diddy_rnd_doors = []
             start = list(range(4))
-            random.shuffle(start)
+            general_random.shuffle(start)
             for id in range(3):
                 code = [start[id]]
                 selected_all_zeros = start[id] == 0
                 for subindex in range(1, 4):
-                    perm = random.randint(0, 3)
+                    perm = general_random.randint(0, 3)
                     if subindex == 3 and selected_all_zeros:
-                        perm = random.randint(1, 3)
+                        perm = general_random.randint(1, 3)
                     if perm != 0:
                         selected_all_zeros = False
                     code.append(perm)
@@ -1374,7 +1400,7 @@ class Settings:
         self.krool_keys_required = KeyEvents.copy()
         # Determine how many keys we need - this can be random or selected
         if self.keys_random:
-            required_key_count = randint(0, 8)
+            required_key_count = general_random.randint(0, 8)
         else:
             required_key_count = self.krool_key_count
         key_8_required = self.krool_access or self.win_condition_item == WinConditionComplex.get_key8
@@ -1404,7 +1430,7 @@ class Settings:
                 removable_keys = [event for event in self.krool_keys_required if event != Events.HelmKeyTurnedIn or not key_8_required]
                 if len(removable_keys) == 0:  # Key 8 being required is stronger than a need for 0 Keys - this will trigger if Key 8 is your last key to require but Key 8 is always required
                     break
-                key_to_remove = random.choice(removable_keys)
+                key_to_remove = general_random.choice(removable_keys)
                 self.krool_keys_required.remove(key_to_remove)
         self.starting_key_list = []
         if Events.JapesKeyTurnedIn not in self.krool_keys_required:
@@ -1435,7 +1461,7 @@ class Settings:
         # Banana medals
         if self.random_medal_requirement:
             # Range roughly from 4 to 15, average around 10
-            self.medal_requirement = round(random.normalvariate(10, 1.5))
+            self.medal_requirement = round(general_random.normalvariate(10, 1.5))
         self.original_medal_requirement = self.medal_requirement
         self.logical_medal_requirement = min(40, max(self.medal_requirement + 1, math.floor(self.medal_requirement * 1.2)))
         self.original_fairy_requirement = self.rareware_gb_fairies
@@ -1481,7 +1507,7 @@ class Settings:
         # Kong rando
         # Temp until Slider UI binding gets fixed
         if self.starting_random:
-            self.starting_kongs_count = randint(1, 5)
+            self.starting_kongs_count = general_random.randint(1, 5)
         if self.starting_kongs_count == 5:
             self.kong_rando = False
         if self.kong_rando:
@@ -1491,27 +1517,27 @@ class Settings:
                 # If we chose to start with a random number of Kongs, we might have too many selected, remove any that aren't the starting Kong
                 while len(self.starting_kong_list) > self.starting_kongs_count:
                     eligible_kongs_to_be_removed = [kong for kong in self.starting_kong_list if kong != self.starting_kong]
-                    self.starting_kong_list.remove(random.choice(eligible_kongs_to_be_removed))
+                    self.starting_kong_list.remove(general_random.choice(eligible_kongs_to_be_removed))
                 # If we don't have enough Kongs selected by now, the plando validation means we'll always have "Random" as an option so we can fill with anything
                 # That said, prioritize putting the chosen starting Kong
                 if len(self.starting_kong_list) < self.starting_kongs_count and self.starting_kong != Kongs.any and self.starting_kong not in self.starting_kong_list:
                     self.starting_kong_list.append(self.starting_kong)
                 # Otherwise fill with randoms until we have enough
                 while len(self.starting_kong_list) < self.starting_kongs_count:
-                    self.starting_kong_list.append(random.choice([kong for kong in kongs.copy() if kong not in self.starting_kong_list]))
+                    self.starting_kong_list.append(general_random.choice([kong for kong in kongs.copy() if kong not in self.starting_kong_list]))
                 # If we don't care who is the starting Kong or if the starting Kong choice was invalid, pick a random starting Kong
                 if self.starting_kong == Kongs.any or self.starting_kong not in self.starting_kong_list:
-                    self.starting_kong = random.choice(self.starting_kong_list)
+                    self.starting_kong = general_random.choice(self.starting_kong_list)
             else:
                 # Randomly pick starting kong list and starting kong
                 if self.starting_kong == Kongs.any:
-                    self.starting_kong_list = random.sample(kongs, self.starting_kongs_count)
-                    self.starting_kong = random.choice(self.starting_kong_list)
+                    self.starting_kong_list = general_random.sample(kongs, self.starting_kongs_count)
+                    self.starting_kong = general_random.choice(self.starting_kong_list)
                 # Randomly pick starting kongs but include chosen starting kong
                 else:
                     possible_kong_list = kongs.copy()
                     possible_kong_list.remove(self.starting_kong)
-                    self.starting_kong_list = random.sample(possible_kong_list, self.starting_kongs_count - 1)
+                    self.starting_kong_list = general_random.sample(possible_kong_list, self.starting_kongs_count - 1)
                     self.starting_kong_list.append(self.starting_kong)
             # Kong freers are decided in the fill, set as any kong for now
             self.diddy_freeing_kong = Kongs.any
@@ -1525,7 +1551,7 @@ class Settings:
         else:
             possible_kong_list = kongs.copy()
             possible_kong_list.remove(0)
-            self.starting_kong_list = random.sample(possible_kong_list, self.starting_kongs_count - 1)
+            self.starting_kong_list = general_random.sample(possible_kong_list, self.starting_kongs_count - 1)
             self.starting_kong_list.append(Kongs.donkey)
             self.starting_kong = Kongs.donkey
             self.diddy_freeing_kong = Kongs.donkey
@@ -1715,7 +1741,7 @@ class Settings:
                 (Kongs.tiny, Kongs.chunky),
                 (Kongs.tiny, Kongs.chunky),
             ]
-            random.shuffle(kongPairs)  # Shuffle this list so we don't block the same locations every time
+            general_random.shuffle(kongPairs)  # Shuffle this list so we don't block the same locations every time
 
             # First we identify the locations we need to remove and make them inaccessible
             for level in ShopLocationReference:
@@ -1748,7 +1774,39 @@ class Settings:
             spoiler.LocationList[Locations.FactoryDonkeyDKArcade].name = "Factory Donkey Blast Course"
 
     def update_valid_locations(self, spoiler):
-        """Calculate (or recalculate) valid locations for items by type."""
+        """Calculate (or recalculate) valid locations for items by type.
+
+        The tables are cached by everything they're compiled from, and stored as frozensets. Tables
+        for a single kong are held in a new dict every time, so fill can rig them for one seed.
+        """
+        key = self.valid_locations_key(spoiler)
+        tables = ValidLocationsCache.get(key)
+        if tables is None:
+            self.compile_valid_locations(spoiler)
+            tables = {}
+            for typ, locations in self.valid_locations.items():
+                if type(locations) is dict:
+                    tables[typ] = {kong: frozenset(kong_locations) for kong, kong_locations in locations.items()}
+                else:
+                    tables[typ] = frozenset(locations)
+            ValidLocationsCache[key] = tables
+            if len(ValidLocationsCache) > VALID_LOCATIONS_CACHE_SIZE:
+                ValidLocationsCache.popitem(last=False)
+        else:
+            ValidLocationsCache.move_to_end(key)
+        self.valid_locations = {typ: (dict(locations) if type(locations) is dict else locations) for typ, locations in tables.items()}
+
+    def valid_locations_key(self, spoiler):
+        """Get everything the valid location tables depend on, including the type, kong and level of every location as shuffled in this seed."""
+        return (
+            tuple(getattr(self, setting) for setting in VALID_LOCATION_SETTINGS),
+            tuple(self.kong_locations),
+            tuple(self.shuffled_location_types),
+            tuple((id, location.type, location.kong, location.level) for id, location in spoiler.LocationList.items()),
+        )
+
+    def compile_valid_locations(self, spoiler):
+        """Calculate valid locations for items by type as lists and sets."""
         self.valid_locations = {}
         self.valid_locations[Types.Kong] = self.kong_locations.copy()
         # If shops are not shuffled into the larger pool, calculate shop locations for shop-bound moves
@@ -1957,7 +2015,7 @@ class Settings:
         kongCageLocations = [Locations.DiddyKong, Locations.LankyKong, Locations.TinyKong, Locations.ChunkyKong]
         # Randomly decide which kong cages will not have kongs in them
         for i in range(0, self.starting_kongs_count - 1):
-            kongLocation = random.choice(kongCageLocations)
+            kongLocation = general_random.choice(kongCageLocations)
             kongCageLocations.remove(kongLocation)
 
         # The following cases do not apply if you could bypass the Guitar door without Diddy
@@ -1976,12 +2034,12 @@ class Settings:
         ):
             # Move a random location to a non-Aztec location
             kongCageLocations.pop()
-            kongCageLocations.append(random.choice([Locations.DiddyKong, Locations.ChunkyKong]))
+            kongCageLocations.append(general_random.choice([Locations.DiddyKong, Locations.ChunkyKong]))
         # In case Diddy is the only kong to free, he can't be in the Llama Temple since it's behind the Guitar door
         if not bypass_guitar_door and self.starting_kongs_count == 4 and Kongs.diddy not in self.starting_kong_list and Locations.LankyKong in kongCageLocations:
             # Move diddy kong from llama temple to another cage randomly chosen
             kongCageLocations.remove(Locations.LankyKong)
-            kongCageLocations.append(random.choice([Locations.DiddyKong, Locations.TinyKong, Locations.ChunkyKong]))
+            kongCageLocations.append(general_random.choice([Locations.DiddyKong, Locations.TinyKong, Locations.ChunkyKong]))
         return kongCageLocations
 
     def RandomizeStartingLocation(self, spoiler):
@@ -1996,7 +2054,7 @@ class Settings:
             randomizer.LogicFiles.CrystalCaves.LogicRegions,
             randomizer.LogicFiles.CreepyCastle.LogicRegions,
         ]
-        selected_region_world = random.choice(region_data)
+        selected_region_world = general_random.choice(region_data)
         valid_starting_regions = []
         if self.enable_plandomizer and self.plandomizer_dict["plando_starting_exit"] != -1:
             # Plandomizer code for random starting location
@@ -2032,9 +2090,13 @@ class Settings:
                         valid_starting_regions.append(
                             {"region": region, "map": tied_map, "exit": tied_exit, "region_name": region_data.name, "exit_name": ShufflableExits[relevant_transition].back.name}
                         )
-        self.starting_region = random.choice(valid_starting_regions)
+        self.starting_region = general_random.choice(valid_starting_regions)
+        # Exits are shared between worlds, so replace them rather than changing the originals
+        game_start_exits = spoiler.RegionList[Regions.GameStart].exits
         for x in range(2):
-            spoiler.RegionList[Regions.GameStart].exits[x + 1].dest = self.starting_region["region"]
+            starting_exit = copy(game_start_exits[x + 1])
+            starting_exit.dest = self.starting_region["region"]
+            game_start_exits[x + 1] = starting_exit
 
     def ApplyPlandomizerSettings(self):
         """Apply settings specified by the plandomizer."""
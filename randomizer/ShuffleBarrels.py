@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING, List
 
 import randomizer.Lists.Exceptions as Ex
@@ -12,6 +11,7 @@ from randomizer.Enums.Settings import MinigameBarrels, MinigamesListSelected
 from randomizer.Enums.Kongs import Kongs
 from randomizer.Enums.Maps import Maps
 from randomizer.Lists.Minigame import BarrelMetaData, MinigameRequirements
+from randomizer.RandomStreams import general_random
 from randomizer.Settings import Settings
 
 
@@ -41,7 +41,7 @@ def PreplacePlandoMinigames(settings: Settings, barrelLocations: List[Locations]
 
 def ShuffleBarrels(settings: Settings, barrelLocations: List[Locations], minigamePool: List[Minigames]) -> None:
     """Shuffle minigames to different barrels."""
-    random.shuffle(barrelLocations)
+    general_random.shuffle(barrelLocations)
     helm_minigame_available = False
     for minigame in minigamePool:
         # Check if any minigames can be placed in helm
@@ -54,7 +54,7 @@ def ShuffleBarrels(settings: Settings, barrelLocations: List[Locations], minigam
     # Apply randomized minigame placement
     while len(barrelLocations) > 0:
         location = barrelLocations.pop()
-        random.shuffle(minigamePool)
+        general_random.shuffle(minigamePool)
         # Don't bother shuffling or validating barrel locations which are skipped
         if BarrelMetaData[location].map == Maps.HideoutHelm and settings.helm_barrels == MinigameBarrels.skip:
             continue
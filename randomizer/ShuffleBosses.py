@@ -1,6 +1,5 @@
 """Randomize Boss Locations."""
 
-import random
 from array import array
 
 from randomizer.Enums.Items import Items
@@ -11,6 +10,7 @@ from randomizer.Enums.Settings import HardModeSelected, KongModels, SlamRequirem
 from randomizer.Lists.Exceptions import BossOutOfLocationsException, FillException, ItemPlacementException
 from randomizer.Enums.Maps import Maps
 from randomizer.Patching.Lib import IsItemSelected
+from randomizer.RandomStreams import general_random
 
 BossMapList = [Maps.JapesBoss, Maps.AztecBoss, Maps.FactoryBoss, Maps.GalleonBoss, Maps.FungiBoss, Maps.CavesBoss, Maps.CastleBoss]
 KRoolMaps = [Maps.KroolDonkeyPhase, Maps.KroolDiddyPhase, Maps.KroolLankyPhase, Maps.KroolTinyPhase, Maps.KroolChunkyPhase]
@@ -28,7 +28,7 @@ def ShuffleBosses(boss_location_rando: bool, settings):
     """Shuffle boss locations."""
     boss_maps = getBosses(settings)
     if boss_location_rando:
-        random.shuffle(boss_maps)
+        general_random.shuffle(boss_maps)
     return boss_maps
 
 
@@ -58,7 +58,7 @@ def ShuffleBossKongs(settings):
     for level in range(7):
         boss_map = settings.boss_maps[level]
         if settings.boss_kong_rando:
-            kong = random.choice(GetKongOptionsForBoss(boss_map, HardBossesEnabled(settings, HardBossesSelected.alternative_mad_jack_kongs)))
+            kong = general_random.choice(GetKongOptionsForBoss(boss_map, HardBossesEnabled(settings, HardBossesSelected.alternative_mad_jack_kongs)))
         else:
             kong = vanillaBossKongs[boss_map]
         boss_kongs.append(kong)
@@ -102,14 +102,14 @@ def ShuffleKutoutKongs(boss_maps: array, boss_kongs: array, boss_kong_rando: boo
         if Maps.CastleBoss in boss_maps:
             kutoutLocation = boss_maps.index(Maps.CastleBoss)
             if kutoutLocation < 0 or kutoutLocation >= len(boss_kongs):
-                starting_kong = random.choice(vanillaKutoutKongs)
+                starting_kong = general_random.choice(vanillaKutoutKongs)
             else:
                 starting_kong = boss_kongs[kutoutLocation]
         else:
-            starting_kong = random.choice(vanillaKutoutKongs)
+            starting_kong = general_random.choice(vanillaKutoutKongs)
         kongPool = vanillaKutoutKongs.copy()
         kongPool.remove(starting_kong)
-        random.shuffle(kongPool)
+        general_random.shuffle(kongPool)
 
         kutout_kongs.append(starting_kong)
         kutout_kongs.extend(kongPool)
@@ -121,7 +121,7 @@ def ShuffleKutoutKongs(boss_maps: array, boss_kongs: array, boss_kong_rando: boo
 def ShuffleKKOPhaseOrder(settings):
     """Shuffle the phase order in King Kut Out."""
     kko_phases = [0, 1, 2, 3]
-    random.shuffle(kko_phases)
+    general_random.shuffle(kko_phases)
     kko_phase_subset = []
     for phase_slot in range(3):
         kko_phase_subset.append(kko_phases[phase_slot])
@@ -156,14 +156,14 @@ def ShuffleKKOPhaseOrder(settings):
 #         forestBossKong = None
 #         bossTryingToBePlaced = "Dogadon 2"
 #         if len(forestBossOptions) < len(factoryBossOptions):
-#             forestBossIndex = random.choice(forestBossOptions)
+#             forestBossIndex = general_random.choice(forestBossOptions)
 #             forestBossKong = Kongs.chunky
 #             if forestBossIndex in factoryBossOptions:
 #                 factoryBossOptions.remove(forestBossIndex)
 #         # Otherwise place Factory first
 #         bossTryingToBePlaced = "Mad Jack"
 #         if HardBossesEnabled(settings, HardBossesSelected.alternative_mad_jack_kongs):
-#             factoryBossIndex = random.choice(factoryBossOptions)
+#             factoryBossIndex = general_random.choice(factoryBossOptions)
 #             factoryBossKongOptions = []
 #             if factoryBossIndex in tinyFactoryBossOptions:
 #                 factoryBossKongOptions.append(Kongs.tiny)
@@ -171,16 +171,16 @@ def ShuffleKKOPhaseOrder(settings):
 #                 factoryBossKongOptions.append(Kongs.donkey)
 #             if factoryBossIndex in chunkyFactoryBossOptions:
 #                 factoryBossKongOptions.append(Kongs.chunky)
-#             factoryBossKong = random.choice(factoryBossKongOptions)
+#             factoryBossKong = general_random.choice(factoryBossKongOptions)
 #         else:
-#             factoryBossIndex = random.choice(factoryBossOptions)
+#             factoryBossIndex = general_random.choice(factoryBossOptions)
 #             factoryBossKong = Kongs.tiny
 #         if factoryBossIndex in forestBossOptions:
 #             forestBossOptions.remove(factoryBossIndex)
 #         # Then place Dogadon 2 (if Mad Jack was placed first)
 #         if forestBossKong is None:
 #             bossTryingToBePlaced = "Dogadon 2 (second)"
-#             forestBossIndex = random.choice(forestBossOptions)
+#             forestBossIndex = general_random.choice(forestBossOptions)
 #             forestBossKong = Kongs.chunky
 
 #         bossLevelOptions.remove(forestBossIndex)
@@ -189,25 +189,25 @@ def ShuffleKKOPhaseOrder(settings):
 #         # Place the barrels-required bosses
 #         bossTryingToBePlaced = "barrels-locked bosses"
 #         barrelsBossOptions = [x for x in bossLevelOptions if Items.Barrels in ownedMoves[x]]
-#         random.shuffle(barrelsBossOptions)
+#         general_random.shuffle(barrelsBossOptions)
 #         cavesBossIndex = barrelsBossOptions.pop()
-#         cavesBossKong = random.choice(ownedKongs[cavesBossIndex])
+#         cavesBossKong = general_random.choice(ownedKongs[cavesBossIndex])
 #         bossLevelOptions.remove(cavesBossIndex)
 #         japesBossIndex = barrelsBossOptions.pop()
-#         japesBossKong = random.choice(ownedKongs[japesBossIndex])
+#         japesBossKong = general_random.choice(ownedKongs[japesBossIndex])
 #         bossLevelOptions.remove(japesBossIndex)
 #         aztecBossIndex = barrelsBossOptions.pop()
-#         aztecBossKong = random.choice(ownedKongs[aztecBossIndex])
+#         aztecBossKong = general_random.choice(ownedKongs[aztecBossIndex])
 #         bossLevelOptions.remove(aztecBossIndex)
 
 #         # Place the last 2 freely
 #         bossTryingToBePlaced = "the easy bosses to place (if this breaks here something REALLY strange happened)"
 #         remainingBosses = list(bossLevelOptions)
-#         random.shuffle(remainingBosses)
+#         general_random.shuffle(remainingBosses)
 #         galleonBossIndex = remainingBosses.pop()
-#         galleonBossKong = random.choice(ownedKongs[galleonBossIndex])
+#         galleonBossKong = general_random.choice(ownedKongs[galleonBossIndex])
 #         castleBossIndex = remainingBosses.pop()
-#         castleBossKong = random.choice(ownedKongs[castleBossIndex])
+#         castleBossKong = general_random.choice(ownedKongs[castleBossIndex])
 #         newBossMaps = []
 #         newBossKongs = []
 #         for level in range(0, 7):
@@ -331,7 +331,7 @@ def ShuffleBossesBasedOnOwnedItems(spoiler, ownedKongs: dict, ownedMoves: dict):
         # This can include endgame phases, and this is intentional. If you have to squeeze in every boss/phase into this, you need every inch of leeway you can get.
         # By sorting by the raw amount of available boss space, you won't ever place bosses in a bad order (outside of utterly egregious circumstances).
         levelsSortedByNumberOfOptions.sort(
-            key=lambda x: len([map for map in bossOptions[x] if map not in placedBossMaps]) + random.random()
+            key=lambda x: len([map for map in bossOptions[x] if map not in placedBossMaps]) + general_random.random()
         )  # The random factor here is so there's randomness among tied counts (but never greater than 1)
         # Always pick the level with the least options - this guarantees we never orphan a level with no options (unless it was forced anyway)
         mostRestrictiveLevel = levelsSortedByNumberOfOptions[0]
@@ -350,7 +350,7 @@ def ShuffleBossesBasedOnOwnedItems(spoiler, ownedKongs: dict, ownedMoves: dict):
                     # I *really* hope this is infrequent or limited to lava water shenanigans
                     raise BossOutOfLocationsException("Fill has no valid boss/phase placement combinations.")
                 expandedBossOptions = notTakenBossOptions + possibleEndgameBossSwaps
-                chosenBoss = random.choice(expandedBossOptions)
+                chosenBoss = general_random.choice(expandedBossOptions)
                 if chosenBoss in possibleEndgameBossSwaps:
                     spoiler.settings.krool_order.remove(chosenBoss)
                     updateKRoolSettings(spoiler, chosenBoss)
@@ -358,7 +358,7 @@ def ShuffleBossesBasedOnOwnedItems(spoiler, ownedKongs: dict, ownedMoves: dict):
                 # This is likely limited to lava water shenanigans
                 raise BossOutOfLocationsException("Fill has no valid boss placement combinations.")
         else:
-            chosenBoss = random.choice(notTakenBossOptions)
+            chosenBoss = general_random.choice(notTakenBossOptions)
         kongOptions = [
             kong for kong in GetKongOptionsForBoss(chosenBoss, HardBossesEnabled(spoiler.settings, HardBossesSelected.alternative_mad_jack_kongs)) if kong in ownedKongs[mostRestrictiveLevel]
         ]
@@ -371,15 +371,15 @@ def ShuffleBossesBasedOnOwnedItems(spoiler, ownedKongs: dict, ownedMoves: dict):
         # These will be the same index which will be convenient later
         placedLevels.append(mostRestrictiveLevel)
         placedBossMaps.append(chosenBoss)
-        placedBossKongs.append(Kongs(random.choice(kongOptions)))
+        placedBossKongs.append(Kongs(general_random.choice(kongOptions)))
     # If we did steal a boss from the endgame, we need to put one back in.
     # Note that this has zero impact on logic: you should have all items by the time you reach the endgame
     while len(spoiler.settings.krool_order) < spoiler.settings.krool_phase_count:
         possibleBosses = [map for map in getBosses(spoiler.settings) if map not in placedBossMaps and map not in spoiler.settings.krool_order]
-        newEndgameBoss = random.choice(possibleBosses)
+        newEndgameBoss = general_random.choice(possibleBosses)
         spoiler.settings.krool_order.append(newEndgameBoss)
         updateKRoolSettings(spoiler, newEndgameBoss)
-        random.shuffle(spoiler.settings.krool_order)
+        general_random.shuffle(spoiler.settings.krool_order)
         # UHHHH does this fuck with kongs assigned to phases? SURE HOPE NOT!
     newBossMaps = [None, None, None, None, None, None, None]
     newBossKongs = [None, None, None, None, None, None, None]
@@ -399,19 +399,19 @@ def ShuffleBossesBasedOnOwnedItems(spoiler, ownedKongs: dict, ownedMoves: dict):
         if not spoiler.settings.boss_location_rando:
             # This is outrageously niche, I sure hope it doesn't break
             spoiler.settings.boss_kongs = [
-                random.choice([kong for kong in GetKongOptionsForBoss(Maps.JapesBoss, False) if kong in bossOptions[Levels.JungleJapes]]),
-                random.choice([kong for kong in GetKongOptionsForBoss(Maps.AztecBoss, False) if kong in bossOptions[Levels.AngryAztec]]),
-                random.choice(
+                general_random.choice([kong for kong in GetKongOptionsForBoss(Maps.JapesBoss, False) if kong in bossOptions[Levels.JungleJapes]]),
+                general_random.choice([kong for kong in GetKongOptionsForBoss(Maps.AztecBoss, False) if kong in bossOptions[Levels.AngryAztec]]),
+                general_random.choice(
                     [
                         kong
                         for kong in GetKongOptionsForBoss(Maps.FactoryBoss, HardBossesEnabled(spoiler.settings, HardBossesSelected.alternative_mad_jack_kongs))
                         if kong in bossOptions[Levels.FranticFactory]
                     ]
                 ),
-                random.choice([kong for kong in GetKongOptionsForBoss(Maps.GalleonBoss, False) if kong in bossOptions[Levels.GloomyGalleon]]),
-                random.choice([kong for kong in GetKongOptionsForBoss(Maps.FungiBoss, False) if kong in bossOptions[Levels.FungiForest]]),
-                random.choice([kong for kong in GetKongOptionsForBoss(Maps.CavesBoss, False) if kong in bossOptions[Levels.CrystalCaves]]),
-                random.choice([kong for kong in GetKongOptionsForBoss(Maps.CastleBoss, False) if kong in bossOptions[Levels.CreepyCastle]]),
+                general_random.choice([kong for kong in GetKongOptionsForBoss(Maps.GalleonBoss, False) if kong in bossOptions[Levels.GloomyGalleon]]),
+                general_random.choice([kong for kong in GetKongOptionsForBoss(Maps.FungiBoss, False) if kong in bossOptions[Levels.FungiForest]]),
+                general_random.choice([kong for kong in GetKongOptionsForBoss(Maps.CavesBoss, False) if kong in bossOptions[Levels.CrystalCaves]]),
+                general_random.choice([kong for kong in GetKongOptionsForBoss(Maps.CastleBoss, False) if kong in bossOptions[Levels.CreepyCastle]]),
             ]
         else:
             spoiler.settings.boss_kongs = newBossKongs
@@ -425,7 +425,7 @@ def ShuffleTinyPhaseToes():
     toe_sequence = []
     previous_toe = 1  # Use 1 as the index as it's within distance of all toes, so all toes for the first in the sequence will be valid
     for toe in range(10):
-        mode = random.randint(0, 10)
+        mode = general_random.randint(0, 10)
         if (toe % 5) == 0:
             # Prevent player position mode on the first toe
             mode += 1
@@ -440,11 +440,11 @@ def ShuffleTinyPhaseToes():
                 # First toe
                 toe_list = [0, 2, 3]
             toe_list = [x for x in toe_list if abs(x - previous_toe) < 3]  # Prevent toes being selected that
-            toe_count = random.randint(1, min(3, len(toe_list) - 1))
+            toe_count = general_random.randint(1, min(3, len(toe_list) - 1))
             if len(toe_list) <= 1:
                 toe_bitfield = 0
             else:
-                activated_toes = random.sample(toe_list, toe_count)
+                activated_toes = general_random.sample(toe_list, toe_count)
                 unactivated_toes = [x for x in list(range(4)) if x not in activated_toes]
                 picked_toe = False
                 for t in (1, 2):
@@ -452,7 +452,7 @@ def ShuffleTinyPhaseToes():
                         previous_toe = t
                         picked_toe = True
                 if not picked_toe:
-                    previous_toe = random.choice(unactivated_toes)
+                    previous_toe = general_random.choice(unactivated_toes)
                 toe_bitfield = 0
                 for toe in activated_toes:
                     toe_bitfield |= 1 << toe
@@ -1,8 +1,8 @@
 """Select CB Location selection."""
 
-import random
+from math import gcd
+from typing import List, Optional, Tuple
 
-import js
 import randomizer.CollectibleLogicFiles.AngryAztec
 import randomizer.CollectibleLogicFiles.CreepyCastle
 import randomizer.CollectibleLogicFiles.CrystalCaves
@@ -21,10 +21,12 @@ import randomizer.Lists.CBLocations.GloomyGalleonCBLocations
 import randomizer.Lists.CBLocations.JungleJapesCBLocations
 import randomizer.Lists.CBLocations.DKIslesCBLocations
 import randomizer.Lists.Exceptions as Ex
-from randomizer.Enums.Kongs import Kongs
+from randomizer.Enums.Kongs import GetKongs, Kongs
 from randomizer.Enums.Levels import Levels
 from randomizer.Enums.Settings import CBRando
-from randomizer.LogicClasses import Collectible
+from randomizer.Instrumentation import count, progress
+from randomizer.LogicClasses import Collectible, ColoredBananaGroup
+from randomizer.RandomStreams import cb_random
 
 from .Enums.Collectibles import Collectibles
 
@@ -64,20 +66,97 @@ level_data = {
 }
 
 
+class CBGroup:
+    """A group of colored bananas placed as one, made of every lesser group sharing its group number."""
+
+    def __init__(self, group: int, lesser_groups: List[ColoredBananaGroup]) -> None:
+        """Total the bananas of the lesser groups and find the kongs all of them can be assigned to."""
+        self.group = group
+        self.lesser_groups = lesser_groups
+        kongs = set(lesser_groups[0].kongs)
+        for lesser_group in lesser_groups:
+            kongs &= set(lesser_group.kongs)
+        self.kongs = [kong for kong in GetKongs() if kong in kongs]
+        self.bunches = sum(int(loc[0] == 5) for lesser_group in lesser_groups for loc in lesser_group.locations)
+        self.singles = sum(int(loc[0] == 1) for lesser_group in lesser_groups for loc in lesser_group.locations)
+        self.weight = sum(loc[0] for lesser_group in lesser_groups for loc in lesser_group.locations)
+
+
+# The groups of each level, and the largest amount every group's bananas and singles are a multiple of, built once per process
+level_cb_groups = {}
+
+
+def GetLevelCBGroups(level: Levels) -> Tuple[List[CBGroup], int]:
+    """Get the colored banana groups of a level in group number order, and the unit their bananas and singles come in."""
+    if level not in level_cb_groups:
+        lesser_groups = {}
+        for lesser_group in level_data[level]["cb"]:
+            lesser_groups.setdefault(lesser_group.group, []).append(lesser_group)
+        groups = [CBGroup(group, lesser_groups[group]) for group in sorted(lesser_groups)]
+        # Balloons are worth 10 and every kong needs 100, so those are multiples of the unit too
+        unit = gcd(10, 100, *[group.weight for group in groups], *[group.singles for group in groups])
+        level_cb_groups[level] = (groups, unit)
+    return level_cb_groups[level]
+
+
+def SelectCBGroups(groups: List[CBGroup], amount: int, singles_target: int, singles_cap: int, unit: int) -> Optional[List[CBGroup]]:
+    """Pick groups holding exactly an amount of bananas, with as close to a target number of singles as the groups allow.
+
+    A table of which (bananas, singles) totals each tail of the list of groups can reach is built backwards as bitsets,
+    then walked forwards taking or leaving each group at random while the rest of the totals stays reachable. Returns None
+    if no groups add up to the amount without going over the cap of singles.
+    """
+    target = amount // unit
+    cap = max(singles_cap, 0) // unit
+    # Each row of the bitset holds the singles totals reachable with that many bananas, with room to overflow before being masked off
+    stride = 2 * (cap + 1)
+    row = (1 << (cap + 1)) - 1
+    mask = sum(row << (bananas * stride) for bananas in range(target + 1))
+    reachable = [1]
+    for group in reversed(groups):
+        later = reachable[-1]
+        if group.weight // unit > target or group.singles // unit > cap:
+            reachable.append(later)
+        else:
+            reachable.append(later | ((later << ((group.weight // unit) * stride + group.singles // unit)) & mask))
+    reachable.reverse()
+    totals = (reachable[0] >> (target * stride)) & row
+    if totals == 0:
+        return None
+    options = [singles for singles in range(cap + 1) if (totals >> singles) & 1]
+    closest = min(abs(singles * unit - singles_target) for singles in options)
+    singles = cb_random.choice([option for option in options if abs(option * unit - singles_target) == closest])
+    bananas = target
+    selected = []
+    for index, group in enumerate(groups):
+        group_bananas = group.weight // unit
+        group_singles = group.singles // unit
+        later = reachable[index + 1]
+        can_leave = (later >> (bananas * stride + singles)) & 1
+        can_take = group_bananas <= bananas and group_singles <= singles and (later >> ((bananas - group_bananas) * stride + singles - group_singles)) & 1
+        if can_take and (not can_leave or cb_random.random() < 0.5):
+            selected.append(group)
+            bananas -= group_bananas
+            singles -= group_singles
+    return selected
+
+
 def ShuffleCBs(spoiler):
-    """Shuffle CBs selected from location files."""
+    """Shuffle CBs selected from location files.
+
+    Each level gets a random share of the balloons, then the groups of every kong are picked in one pass to add up to
+    exactly 100 bananas with that kong's share of the singles, keeping the banana objects placed under PLACEMENT_LIMIT.
+    """
     retries = 0
     levels_to_populate = 7
     MAX_BALLOONS = 105
     MAX_SINGLES = 780  # 793 Singles in Vanilla, under-representing this to help with the calculation formula
-    MAX_BUNCHES = 790 - MAX_BALLOONS * 2 - round(MAX_SINGLES / 5)  # 334 bunches in vanilla, biasing this for now to help with calculation formula
     PLACEMENT_LIMIT = 1127
     add_isles_cbs = spoiler.settings.cb_rando == CBRando.on_with_isles
     if add_isles_cbs:
         levels_to_populate = 8
         INCREASE_FACTOR = 8 / 7
         MAX_SINGLES = int(MAX_SINGLES * INCREASE_FACTOR)
-        MAX_BUNCHES = int(MAX_BUNCHES * INCREASE_FACTOR)
         PLACEMENT_LIMIT = 1400
 
     while True:
@@ -109,9 +188,9 @@ def ShuffleCBs(spoiler):
                 else:
                     balloon_upper = min(int(balloons_left / (levels_to_populate - level_index)) + 3, int(balloons_left / global_divisor))
                 balloon_lst = level_data[level]["balloons"].copy()
-                selected_balloon_count = min(random.randint(min(balloon_lower, balloon_upper), max(balloon_lower, balloon_upper)), len(balloon_lst))
+                selected_balloon_count = min(cb_random.randint(min(balloon_lower, balloon_upper), max(balloon_lower, balloon_upper)), len(balloon_lst))
                 # selected_balloon_count = 22 # Test all balloon locations
-                random.shuffle(balloon_lst)  # TODO: Maybe make this more advanced?
+                cb_random.shuffle(balloon_lst)  # TODO: Maybe make this more advanced?
                 # selects all balloons
                 placed_balloons = 0
                 for balloon in balloon_lst:
@@ -121,7 +200,7 @@ def ShuffleCBs(spoiler):
                             if kong_specific_left[kong] < 10 and kong in balloon_kongs:  # Not enough Colored Bananas to place a balloon:
                                 balloon_kongs.remove(kong)  # Remove kong from permitted list
                         if len(balloon_kongs) > 0:  # Has a kong who can be assigned to this balloon
-                            selected_kong = random.choice(balloon_kongs)
+                            selected_kong = cb_random.choice(balloon_kongs)
                             kong_specific_left[selected_kong] -= 10  # Remove CBs for Balloon
                             level_placement.append({"id": balloon.id, "name": balloon.name, "kong": selected_kong, "level": level, "type": "balloons", "map": balloon.map})
                             placed_balloons += 1
@@ -129,48 +208,39 @@ def ShuffleCBs(spoiler):
                                 spoiler.CollectibleRegions[balloon.region] = []
                             spoiler.CollectibleRegions[balloon.region].append(Collectible(Collectibles.balloon, selected_kong, balloon.logic, None, 1, name=balloon.name))
                 # Model Two CBs
-                bunches_left = MAX_BUNCHES - total_bunches
+                # Bananas not in balloons are all placed as bunches or singles, so the singles placed decide how many objects the level uses
+                level_bananas = sum(kong_specific_left.values())
                 singles_left = MAX_SINGLES - total_singles
-                bunches_lower = max(int(bunches_left / (levels_to_populate - level_index)) - 5, 0)
                 singles_lower = max(int(singles_left / (levels_to_populate - level_index)) - 10, 0)
                 if global_divisor == 0:
-                    bunches_upper = bunches_left
-                    singles_upper = min(
-                        singles_left, int((5 * (PLACEMENT_LIMIT - total_bunches - total_singles) - sum(kong_specific_left)) / 4)
-                    )  # Places a hard cap of PLACEMENT_LIMIT total singles+bunches
+                    singles_upper = singles_left
                 else:
-                    bunches_upper = min(int(bunches_left / (levels_to_populate - level_index)) + 15, int(bunches_left / global_divisor))
                     singles_upper = min(int(singles_left / (levels_to_populate - level_index)) + 10, int(singles_left / global_divisor))
-                groupIds = list(range(1, len(level_data[level]["cb"]) + 1))
-                random.shuffle(groupIds)
-                selected_bunch_count = random.randint(min(bunches_lower, bunches_upper), max(bunches_lower, bunches_upper))
-                selected_single_count = random.randint(min(singles_lower, singles_upper), max(singles_lower, singles_upper))
+                singles_target = cb_random.randint(min(singles_lower, singles_upper), max(singles_lower, singles_upper))
+                # Leave every later level room for 100 objects, enough to place all of its bananas as bunches
+                objects_allowed = PLACEMENT_LIMIT - total_bunches - total_singles - 100 * global_divisor
+                singles_cap = int((5 * objects_allowed - level_bananas) / 4)
+                groups, unit = GetLevelCBGroups(level)
+                groups = groups.copy()
+                cb_random.shuffle(groups)
+                # Kongs with the fewest groups to pick from go first
+                kongs = list(kong_specific_left.keys())
+                cb_random.shuffle(kongs)
+                kongs.sort(key=lambda kong: len([group for group in groups if kong in group.kongs]))
+                used_groups = set()
                 placed_bunches = 0
                 placed_singles = 0
-                for groupId in groupIds:
-                    group_weight = 0
-                    bunches_in_group = 0
-                    singles_in_group = 0
-                    colored_banana_groups = [group for group in level_data[level]["cb"] if group.group == groupId]
-                    cb_kongs = list(kong_specific_left.keys())
-                    for group in colored_banana_groups:
-                        cb_kongs = list(set(cb_kongs) & set(group.kongs.copy()))
-                        for loc in group.locations:
-                            group_weight += loc[0]
-                            bunches_in_group += int(loc[0] == 5)
-                            singles_in_group += int(loc[0] == 1)
-                    for kong in kong_specific_left:
-                        if kong in cb_kongs:
-                            # If this kong doesn't have space for this group, remove it. Also if this kong is close to cap, don't use this kong unless it's the last one.
-                            if kong_specific_left[kong] < group_weight or (len(cb_kongs) > 1 and kong_specific_left[kong] <= 10 and (kong_specific_left[kong] - group_weight) > 0):
-                                cb_kongs.remove(kong)
-                    if len(cb_kongs) > 0 and selected_single_count >= placed_singles + singles_in_group and selected_bunch_count >= placed_bunches + bunches_in_group:
-                        selected_kong = random.choice(cb_kongs)
-                        kong_specific_left[selected_kong] -= group_weight  # Remove CBs for kong
-                        # When a kong hits 0 remaining in this level, we no longer need to consider it
-                        if kong_specific_left[selected_kong] == 0:
-                            del kong_specific_left[selected_kong]
-                        for group in colored_banana_groups:
+                for kong_index, kong in enumerate(kongs):
+                    available_groups = [group for group in groups if group.group not in used_groups and kong in group.kongs]
+                    kong_singles_target = (singles_target - placed_singles) / (len(kongs) - kong_index)
+                    selected_groups = SelectCBGroups(available_groups, kong_specific_left[kong], kong_singles_target, singles_cap - placed_singles, unit)
+                    if selected_groups is None:
+                        print(f"WARNING: {kong_specific_left[kong]} bananas unassigned for {kong.name} in {level.name}")
+                        raise Ex.CBFillFailureException
+                    for selected_group in selected_groups:
+                        used_groups.add(selected_group.group)
+                        kong_specific_left[kong] -= selected_group.weight  # Remove CBs for kong
+                        for group in selected_group.lesser_groups:
                             # Calculate the number of bananas we have to place by lesser group so different bananas in the same group can have different logic
                             bunches_in_lesser_group = 0
                             singles_in_lesser_group = 0
@@ -180,39 +250,28 @@ def ShuffleCBs(spoiler):
                             if group.region not in spoiler.CollectibleRegions:
                                 spoiler.CollectibleRegions[group.region] = []
                             if bunches_in_lesser_group > 0:
-                                spoiler.CollectibleRegions[group.region].append(Collectible(Collectibles.bunch, selected_kong, group.logic, None, bunches_in_lesser_group, name=group.name))
+                                spoiler.CollectibleRegions[group.region].append(Collectible(Collectibles.bunch, kong, group.logic, None, bunches_in_lesser_group, name=group.name))
                             if singles_in_lesser_group > 0:
-                                spoiler.CollectibleRegions[group.region].append(Collectible(Collectibles.banana, selected_kong, group.logic, None, singles_in_lesser_group, name=group.name))
-                            level_placement.append({"group": group.group, "name": group.name, "kong": selected_kong, "level": level, "type": "cb", "map": group.map, "locations": group.locations})
-                        placed_bunches += bunches_in_group
-                        placed_singles += singles_in_group
-                    # If all kongs have 0 unplaced, we're done here
-                    if len(kong_specific_left.keys()) == 0:
-                        break
+                                spoiler.CollectibleRegions[group.region].append(Collectible(Collectibles.banana, kong, group.logic, None, singles_in_lesser_group, name=group.name))
+                            level_placement.append({"group": group.group, "name": group.name, "kong": kong, "level": level, "type": "cb", "map": group.map, "locations": group.locations})
+                        placed_bunches += selected_group.bunches
+                        placed_singles += selected_group.singles
 
                 # Placement is valid
                 total_balloons += placed_balloons
                 total_bunches += placed_bunches
                 total_singles += placed_singles
                 cb_data.extend(level_placement.copy())
-                for x in kong_specific_left:
-                    if kong_specific_left[x] > 0:
-                        print(f"WARNING: {kong_specific_left[x]} bananas unassigned for {x.name} in {level.name}")
-                        raise Ex.CBFillFailureException
-                    elif kong_specific_left[x] < 0:
-                        print(f"WARNING: {-kong_specific_left[x]} too many bananas assigned for {x.name} in {level.name}")
-                        raise Ex.CBFillFailureException
-            if total_bunches + total_singles > PLACEMENT_LIMIT:
-                print(f"WARNING: {total_bunches + total_singles} banana objects placed, exceeding cap of {PLACEMENT_LIMIT}")
-                raise Ex.CBFillFailureException
             spoiler.Reset()
+            # Every level gets exactly 100 bananas per kong under the placement limit in one pass, so only the logic can fail
             if not Fill.VerifyWorld(spoiler):
                 raise Ex.CBFillFailureException
             spoiler.cb_placements = cb_data
             return
         except Ex.CBFillFailureException:
             if retries >= 10:
-                js.postMessage("CB Randomizer failed to fill. REPORT THIS TO THE DEVS!!")
+                progress("CB Randomizer failed to fill. REPORT THIS TO THE DEVS!!", phase="cb_shuffle", tries=retries)
                 raise Ex.CBFillFailureException
             retries += 1
-            js.postMessage("CB Randomizer failed to fill. Tries: " + str(retries))
+            count("retries", phase="cb_shuffle")
+            progress("CB Randomizer failed to fill. Tries: " + str(retries), phase="cb_shuffle", tries=retries)
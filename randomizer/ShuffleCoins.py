@@ -1,8 +1,5 @@
 """Select Coin Location selection."""
 
-import random
-
-import js
 import randomizer.CollectibleLogicFiles.AngryAztec
 import randomizer.CollectibleLogicFiles.CreepyCastle
 import randomizer.CollectibleLogicFiles.CrystalCaves
@@ -16,8 +13,10 @@ import randomizer.Lists.Exceptions as Ex
 from randomizer.Enums.Collectibles import Collectibles
 from randomizer.Enums.Kongs import Kongs
 from randomizer.Enums.Levels import Levels
+from randomizer.Instrumentation import count, progress
 from randomizer.Lists.BananaCoinLocations import BananaCoinGroupList
 from randomizer.LogicClasses import Collectible
+from randomizer.RandomStreams import general_random
 
 KONG_COIN_REQUIREMENT = 100
 KONG_COIN_CAP = 125  # Can never exceed 175 due to overflow if you collect over 255 coins
@@ -37,7 +36,7 @@ level_data = {
 
 def getCoinRequirement() -> int:
     """Get requirement for a kong's coin amount."""
-    return int(random.randint(KONG_COIN_REQUIREMENT, KONG_COIN_CAP) / 8)
+    return int(general_random.randint(KONG_COIN_REQUIREMENT, KONG_COIN_CAP) / 8)
 
 
 def ShuffleCoins(spoiler):
@@ -67,8 +66,8 @@ def ShuffleCoins(spoiler):
                 else:
                     coins_upper = min(int(coins_left / (8 - level_index)) + 10, int(coins_left / global_divisor))
                 groupIds = list(range(1, len(BananaCoinGroupList[level]) + 1))
-                random.shuffle(groupIds)
-                selected_coin_count = random.randint(min(coins_lower, coins_upper), max(coins_lower, coins_upper))
+                general_random.shuffle(groupIds)
+                selected_coin_count = general_random.randint(min(coins_lower, coins_upper), max(coins_lower, coins_upper))
                 placed_coins = 0
                 for groupId in groupIds:
                     group_weight = 0
@@ -78,7 +77,7 @@ def ShuffleCoins(spoiler):
                         coin_kongs = list(set(coin_kongs) & set(group.kongs.copy()))
                         group_weight = len(group.locations)
                     if len(coin_kongs) > 0 and (selected_coin_count >= placed_coins + group_weight):
-                        selected_kong = random.choice(coin_kongs)
+                        selected_kong = general_random.choice(coin_kongs)
                         kong_specific_left[selected_kong] -= group_weight  # Remove Coins for kong
                         # When a kong goes under/equal to 0 remaining in this level, we no longer need to consider it
                         if kong_specific_left[selected_kong] <= 0:
@@ -105,7 +104,8 @@ def ShuffleCoins(spoiler):
             return
         except Ex.CoinFillFailureException:
             if retries >= 10:
-                js.postMessage("Coin Randomizer failed to fill. REPORT THIS TO THE DEVS!!")
+                progress("Coin Randomizer failed to fill. REPORT THIS TO THE DEVS!!", phase="coins", tries=retries)
                 raise Ex.CoinFillFailureException
             retries += 1
-            js.postMessage("Coin Randomizer failed to fill. Tries: " + str(retries))
+            count("retries", phase="coins")
+            progress("Coin Randomizer failed to fill. Tries: " + str(retries), phase="coins", tries=retries)
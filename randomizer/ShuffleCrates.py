@@ -1,6 +1,5 @@
 """Shuffle Melon Crate Locations."""
 
-import random
 from randomizer.Enums.Plandomizer import PlandoItems
 from randomizer.Lists import Exceptions
 
@@ -17,6 +16,7 @@ from randomizer.Enums.Levels import Levels
 from randomizer.Enums.Locations import Locations
 from randomizer.Lists.CustomLocations import CustomLocation, CustomLocations, LocationTypes
 from randomizer.LogicClasses import LocationLogic
+from randomizer.RandomStreams import general_random
 
 
 def addCrate(spoiler, MelonCrate: CustomLocation, enum_val: int, name: str, level: Levels):
@@ -81,7 +81,7 @@ def getPlandoCrateDistribution(plando_dict: dict):
     if running_total < 13:
         # Make sure as many levels as possible have 2 melon crates
         level_priority = list(range(0, 9))
-        random.shuffle(level_priority)
+        general_random.shuffle(level_priority)
         amount_of_levels = 4
         for level in range(len(distribution)):
             if distribution[level_priority[level]] < 2:
@@ -143,7 +143,7 @@ def ShuffleMelonCrates(spoiler, human_spoiler):
             count += 1
     else:
         for SingleMelonCrateLocation in range(4):
-            area_key = random.choice(list(total_MelonCrate_list.keys()))
+            area_key = general_random.choice(list(total_MelonCrate_list.keys()))
             area_meloncrate = total_MelonCrate_list[area_key]
             select_random_meloncrate_from_area(area_meloncrate, 2, area_key, spoiler, human_spoiler, plando_dict)
             del total_MelonCrate_list[area_key]
@@ -173,7 +173,7 @@ def select_random_meloncrate_from_area(area_meloncrate, amount, level, spoiler,
     human_spoiler[level.name] = []
     for iterations in range(amount):
         allow_same_group_crate = False
-        selected_crate = random.choice(area_meloncrate)  # selects a random crate from the list
+        selected_crate = general_random.choice(area_meloncrate)  # selects a random crate from the list
         selected_crate_name = selected_crate.name
         # Give plandomizer an opportunity to get the final say
         if spoiler.settings.enable_plandomizer and spoiler.settings.plandomizer_dict["plando_melon_crates"] != []:
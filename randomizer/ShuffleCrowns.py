@@ -1,12 +1,11 @@
 """Shuffle Crown picks, excluding helm."""
 
-import random
-
 from randomizer.Enums.Levels import Levels
 from randomizer.Enums.Locations import Locations
 from randomizer.Lists import Exceptions
 from randomizer.Lists.CustomLocations import CustomLocations, LocationTypes
 from randomizer.LogicClasses import LocationLogic
+from randomizer.RandomStreams import general_random
 
 
 def ShuffleCrowns(spoiler, crown_selection, human_crowns):
@@ -47,7 +46,7 @@ def ShuffleCrowns(spoiler, crown_selection, human_crowns):
         pick_count = 1
         if level == Levels.DKIsles:
             pick_count = 2
-        crowns = random.sample(index_lst, pick_count)
+        crowns = general_random.sample(index_lst, pick_count)
         # Give plandomizer an opportunity to have the final say
         if spoiler.settings.enable_plandomizer and spoiler.settings.plandomizer_dict["plando_battle_arenas"] != {}:
             for i in range(pick_count):
@@ -1,8 +1,5 @@
 """File that shuffles loading zone exits."""
 
-import random
-
-import js
 import randomizer.Fill as Fill
 import randomizer.Lists.Exceptions as Ex
 from randomizer.Enums.Kongs import Kongs
@@ -12,8 +9,10 @@ from randomizer.Enums.Regions import Regions
 from randomizer.Enums.Settings import ActivateAllBananaports, RandomPrices, ShuffleLoadingZones, RemovedBarriersSelected
 from randomizer.Enums.Transitions import Transitions
 from randomizer.Enums.Types import Types
+from randomizer.Instrumentation import count, progress
 from randomizer.Lists.ShufflableExit import ShufflableExits
 from randomizer.LogicClasses import TransitionFront
+from randomizer.RandomStreams import general_random
 from randomizer.Settings import Settings
 from randomizer.Patching.Lib import IsItemSelected
 
@@ -53,6 +52,7 @@ def Reset(spoiler):
     for exit in ShufflableExits.values():
         exit.shuffledId = None
         exit.shuffled = False
+        exit.toBeShuffled = False
     assumedExits = []
     for exit in [x for x in spoiler.RegionList[root].exits if x.assumed]:
         assumedExits.append(exit)
@@ -99,15 +99,15 @@ def ShuffleExitsInPool(spoiler, frontpool, backpool):
     settings = spoiler.settings
     NonTagRegions = [x for x in backpool if not spoiler.RegionList[ShufflableExits[x].back.regionId].tagbarrel]
     NonTagLeaves = [x for x in NonTagRegions if len(spoiler.RegionList[ShufflableExits[x].back.regionId].exits) == 1]
-    random.shuffle(NonTagLeaves)
+    general_random.shuffle(NonTagLeaves)
     NonTagNonLeaves = [x for x in NonTagRegions if x not in NonTagLeaves]
-    random.shuffle(NonTagNonLeaves)
+    general_random.shuffle(NonTagNonLeaves)
 
     TagRegions = [x for x in backpool if x not in NonTagRegions]
     TagLeaves = [x for x in TagRegions if len(spoiler.RegionList[ShufflableExits[x].back.regionId].exits) == 1]
-    random.shuffle(TagLeaves)
+    general_random.shuffle(TagLeaves)
     TagNonLeaves = [x for x in TagRegions if x not in TagLeaves]
-    random.shuffle(TagNonLeaves)
+    general_random.shuffle(TagNonLeaves)
 
     backpool = NonTagLeaves
     backpool.extend(NonTagNonLeaves)
@@ -118,22 +118,22 @@ def ShuffleExitsInPool(spoiler, frontpool, backpool):
     if not settings.decoupled_loading_zones:
         NonTagRegions = [x for x in frontpool if not spoiler.RegionList[ShufflableExits[x].back.regionId].tagbarrel]
         NonTagLeaves = [x for x in NonTagRegions if len(spoiler.RegionList[ShufflableExits[x].back.regionId].exits) == 1]
-        random.shuffle(NonTagLeaves)
+        general_random.shuffle(NonTagLeaves)
         NonTagNonLeaves = [x for x in NonTagRegions if x not in NonTagLeaves]
-        random.shuffle(NonTagNonLeaves)
+        general_random.shuffle(NonTagNonLeaves)
 
         TagRegions = [x for x in frontpool if x not in NonTagRegions]
         TagLeaves = [x for x in TagRegions if len(spoiler.RegionList[ShufflableExits[x].back.regionId].exits) == 1]
-        random.shuffle(TagLeaves)
+        general_random.shuffle(TagLeaves)
         TagNonLeaves = [x for x in TagRegions if x not in TagLeaves]
-        random.shuffle(TagNonLeaves)
+        general_random.shuffle(TagNonLeaves)
 
         frontpool = NonTagLeaves
         frontpool.extend(NonTagNonLeaves)
         frontpool.extend(TagLeaves)
         frontpool.extend(TagNonLeaves)
     else:
-        random.shuffle(frontpool)
+        general_random.shuffle(frontpool)
 
     # For each back exit, select a random valid front entrance to attach to it
     while len(backpool) > 0:
@@ -246,10 +246,11 @@ def ExitShuffle(spoiler):
             return
         except Ex.EntrancePlacementException:
             if retries == 20:
-                js.postMessage("Entrance placement failed, out of retries.")
+                progress("Entrance placement failed, out of retries.", phase="exits", tries=retries)
                 raise Ex.EntranceAttemptCountExceeded
             retries += 1
-            js.postMessage("Entrance placement failed. Retrying. Tries: " + str(retries))
+            count("retries", phase="exits")
+            progress("Entrance placement failed. Retrying. Tries: " + str(retries), phase="exits", tries=retries)
             Reset(spoiler)
 
 
@@ -292,7 +293,7 @@ def ShuffleLevelExits(settings: Settings, newLevelOrder: dict = None):
         for index, level in newLevelOrder.items():
             backpool[index - 1] = LobbyEntrancePool[level]
     else:
-        random.shuffle(frontpool)
+        general_random.shuffle(frontpool)
 
     # Initialize reference variables
     lobby_entrance_map = {
@@ -375,7 +376,7 @@ def GenerateLevelOrderUnrestricted(settings):
                 validLevels = [x for x in unplacedLevels if x != Levels.HideoutHelm]
             else:
                 validLevels = unplacedLevels
-            newLevelOrder[i + 1] = random.choice(validLevels)
+            newLevelOrder[i + 1] = general_random.choice(validLevels)
             unplacedLevels.remove(newLevelOrder[i + 1])
     return newLevelOrder
 
@@ -390,9 +391,9 @@ def GenerateLevelOrderForOneStartingKong(settings):
     # Decide where Aztec will go
     # Diddy can reasonably make progress if Aztec is first level
     if settings.starting_kong == Kongs.diddy:
-        aztecIndex = random.randint(1, 4)
+        aztecIndex = general_random.randint(1, 4)
     else:
-        aztecIndex = random.randint(2, 4)
+        aztecIndex = general_random.randint(2, 4)
     levelIndexChoices.remove(aztecIndex)
 
     # Decide where Japes will go
@@ -410,7 +411,7 @@ def GenerateLevelOrderForOneStartingKong(settings):
             japesOptions = list(levelIndexChoices.intersection({2, 3, 4, 5}))
         else:
             japesOptions = list(levelIndexChoices.intersection({1, 2, 3, 4, 5}))
-    japesIndex = random.choice(japesOptions)
+    japesIndex = general_random.choice(japesOptions)
     levelIndexChoices.remove(japesIndex)
 
     # Decide where Factory will go
@@ -442,18 +443,18 @@ def GenerateLevelOrderForOneStartingKong(settings):
             factoryOptions = list(levelIndexChoices.intersection({1, 2, 3, 4, 5}))
         else:
             factoryOptions = list(levelIndexChoices.intersection({1, 2, 3, 4}))
-    factoryIndex = random.choice(factoryOptions)
+    factoryIndex = general_random.choice(factoryOptions)
     levelIndexChoices.remove(factoryIndex)
 
     # Helm can't be in levels 1 or 2
     if settings.shuffle_helm_location:
         helmOptions = list(levelIndexChoices.intersection({3, 4, 5, 6, 7, 8}))
-        helmIndex = random.choice(helmOptions)
+        helmIndex = general_random.choice(helmOptions)
         levelIndexChoices.remove(helmIndex)
 
     # Decide the remaining level order randomly
     remainingLevels = list(levelIndexChoices)
-    random.shuffle(remainingLevels)
+    general_random.shuffle(remainingLevels)
     cavesIndex = remainingLevels.pop()
     galleonIndex = remainingLevels.pop()
     forestIndex = remainingLevels.pop()
@@ -552,7 +553,7 @@ def GenerateLevelOrderForMultipleStartingKongs(settings: Settings):
         if levelIndexOptions == []:
             return GenerateLevelOrderForMultipleStartingKongs(settings)
         # Place level in newLevelOrder and remove from list of remaining slots
-        shuffledLevelIndex = random.choice(levelIndexOptions)
+        shuffledLevelIndex = general_random.choice(levelIndexOptions)
         levelIndicesToFill.remove(shuffledLevelIndex)
         newLevelOrder[shuffledLevelIndex] = levelToPlace
     return newLevelOrder
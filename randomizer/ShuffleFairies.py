@@ -1,6 +1,5 @@
 """File that shuffles fairies locations."""
 
-import random
 from randomizer.Enums.Plandomizer import PlandoItems
 from randomizer.Lists import Exceptions
 
@@ -17,6 +16,7 @@ from randomizer.Enums.Levels import Levels
 from randomizer.Enums.Locations import Locations
 from randomizer.Lists.FairyLocations import fairy_locations
 from randomizer.LogicClasses import LocationLogic
+from randomizer.RandomStreams import general_random
 
 
 class FairyPlacementInfo:
@@ -120,7 +120,7 @@ def ShuffleFairyLocations(spoiler):
                 bad_location_names = [plando_dict[level]]
                 usable_fairy_indexes = [x for x in usable_fairy_indexes if fairy_locations[level][x].name not in bad_location_names]
 
-            selection = random.sample(usable_fairy_indexes, pick_size)
+            selection = general_random.sample(usable_fairy_indexes, pick_size)
             # Give plandomizer an opportunity to have the final say
             for plando_fairy_selection in range(len(plando_dict[level])):
                 if plando_dict[level][plando_fairy_selection] != -1:
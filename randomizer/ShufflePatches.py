@@ -1,6 +1,5 @@
 """Shuffle Dirt Patch Locations."""
 
-import random
 from randomizer.Enums.Plandomizer import PlandoItems
 from randomizer.Lists import Exceptions
 
@@ -16,6 +15,7 @@ from randomizer.Enums.Levels import Levels
 from randomizer.Enums.Locations import Locations
 from randomizer.Lists.CustomLocations import CustomLocation, CustomLocations, LocationTypes
 from randomizer.LogicClasses import LocationLogic
+from randomizer.RandomStreams import general_random
 
 
 def addPatch(spoiler, patch: CustomLocation, enum_val: int, name: str, level: Levels):
@@ -79,7 +79,7 @@ def getPlandoDirtDistribution(plando_dict: dict):
     if running_total < 16:
         level_priority = [0]
         random_levels = list(range(1, 8))
-        random.shuffle(random_levels)
+        general_random.shuffle(random_levels)
         level_priority.extend(random_levels)
         amount_of_levels = 6
         for level in range(len(distribution)):
@@ -146,7 +146,7 @@ def ShufflePatches(spoiler, human_spoiler):
         del total_dirt_patch_list[Levels.DKIsles]
 
         for SingleDirtPatchLocation in range(5):
-            area_key = random.choice(list(total_dirt_patch_list.keys()))
+            area_key = general_random.choice(list(total_dirt_patch_list.keys()))
             area_dirt = total_dirt_patch_list[area_key]
             select_random_dirt_from_area(area_dirt, 2, area_key, spoiler, human_spoiler, plando_dict)
             del total_dirt_patch_list[area_key]
@@ -176,7 +176,7 @@ def select_random_dirt_from_area(area_dirt, amount, level, spoiler, human_spoile
     human_spoiler[level.name] = []
     for iterations in range(amount):
         allow_same_group_dirt = False
-        selected_patch = random.choice(area_dirt)  # selects a random patch from the list
+        selected_patch = general_random.choice(area_dirt)  # selects a random patch from the list
         selected_patch_name = selected_patch.name
         # Give plandomizer an opportunity to get the final say
         if spoiler.settings.enable_plandomizer and spoiler.settings.plandomizer_dict["plando_dirt_patches"] != []:
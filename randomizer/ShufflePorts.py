@@ -1,6 +1,5 @@
 """Shuffle Bananaport Locations."""
 
-import random
 from randomizer.Lists.MapsAndExits import RegionMapList
 import randomizer.LogicFiles.AngryAztec
 import randomizer.LogicFiles.CreepyCastle
@@ -18,6 +17,7 @@ from randomizer.Enums.Settings import ShufflePortLocations
 from randomizer.Lists.CustomLocations import CustomLocation, CustomLocations, LocationTypes, getBannedWarps
 from randomizer.Lists.Warps import BananaportVanilla
 from randomizer.LogicClasses import Event
+from randomizer.RandomStreams import general_random
 
 PortShufflerData = {
     Maps.JungleJapes: {
@@ -221,7 +221,7 @@ def selectUsefulWarpFullShuffle(list_of_custom_locations, list_of_warps, warp: C
         if len(narrow_down) > 8:
             possible_warps = narrow_down
             break
-    return random.choice(possible_warps)
+    return general_random.choice(possible_warps)
 
 
 def EventToMap(event_id: Events) -> str:
@@ -285,7 +285,7 @@ def ShufflePorts(spoiler, port_selection, human_ports):
                 pick_count = min(pick_count, len(index_lst))
                 warps = []
                 if spoiler.settings.useful_bananaport_placement and spoiler.settings.bananaport_placement_rando != ShufflePortLocations.vanilla_only:
-                    random.shuffle(index_lst)
+                    general_random.shuffle(index_lst)
                     # Populate the region dict with custom locations in each region
                     region_dict = {}
                     for x in index_lst:
@@ -325,9 +325,9 @@ def ShufflePorts(spoiler, port_selection, human_ports):
                     if spoiler.settings.bananaport_placement_rando == ShufflePortLocations.vanilla_only:
                         # Useful warps don't impact vanilla shuffle (yet). It's simpler and faster to just shuffle them
                         warps = index_lst.copy()
-                        random.shuffle(warps)
+                        general_random.shuffle(warps)
                     else:
-                        warps = random.sample(index_lst, pick_count)
+                        warps = general_random.sample(index_lst, pick_count)
                 if pick_count > 0:
                     for k in BananaportVanilla:
                         event_id = BananaportVanilla[k].event
@@ -1,10 +1,9 @@
 """Randomizes Bananaports."""
 
-import random
-
 from randomizer.Enums.Maps import Maps
 from randomizer.Lists.Warps import BananaportVanilla, VanillaBananaportSelector
 from randomizer.LogicClasses import TransitionFront
+from randomizer.RandomStreams import general_random
 
 
 def getShuffleMaps():
@@ -45,7 +44,7 @@ def ShuffleWarps(bananaport_replacements, human_ports, selected_warps):
             for warp in BananaportVanilla.values():
                 if warp.map_id == warp_map and not warp.locked:
                     shufflable_warps.append(warp.vanilla_warp)
-            random.shuffle(shufflable_warps)
+            general_random.shuffle(shufflable_warps)
             shuffle_index = 0
             # Apply shuffle
             for warp in BananaportVanilla.keys():
@@ -112,8 +111,8 @@ def ShuffleWarpsCrossMap(bananaport_replacements, human_ports, is_coupled, selec
                     is_enabled = False
                 if is_enabled:
                     available_warps.append(warp_check.swap_index)
-            selected_index = random.choice(available_warps)
-            warp_type_index = random.randint(0, 4)
+            selected_index = general_random.choice(available_warps)
+            warp_type_index = general_random.randint(0, 4)
             # Place Warp
             warp.tied_index = selected_index
             for warp_check in BananaportVanilla.values():
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-from copy import deepcopy
 from typing import TYPE_CHECKING, Dict, List, Optional, OrderedDict, Union
 
 import randomizer.Lists.Exceptions as Ex
@@ -34,6 +33,7 @@ from randomizer.Enums.Settings import (
 )
 from randomizer.Enums.Transitions import Transitions
 from randomizer.Enums.Types import Types, BarrierItems
+from randomizer.Instrumentation import GenerationEvents
 from randomizer.Lists.EnemyTypes import EnemyMetaData
 from randomizer.Lists.Item import ItemFromKong, ItemList, KongFromItem, NameFromKong
 from randomizer.Lists.Location import LocationListOriginal, PreGivenLocations
@@ -76,6 +76,8 @@ class Spoiler:
     def __init__(self, settings: Settings) -> None:
         """Initialize spoiler just with settings."""
         self.settings: Settings = settings
+        # Timings and counters of the generation, activated once it starts
+        self.events = GenerationEvents()
         self.playthrough = {}
         self.woth = {}
         self.woth_locations = {}
@@ -94,10 +96,18 @@ class Spoiler:
         self.location_data = {}
         self.enemy_replacements = []
         self.cb_placements = []
+        # Collectibles marked as added by the current search, so a reset only has to touch those
+        self.addedCollectibles = []
         self.LogicVariables = LogicVarHolder(self)
-        self.RegionList = deepcopy(RegionsOriginal)
-        self.CollectibleRegions = deepcopy(CollectibleRegionsOriginal)
-        self.LocationList = deepcopy(LocationListOriginal)
+        # The logic objects of the world are shared with the originals, only the state that changes from seed to seed is copied
+        self.RegionList = {region_id: region.Copy() for region_id, region in RegionsOriginal.items()}
+        self.CollectibleRegions = {region_id: [collectible.Copy() for collectible in collectibles] for region_id, collectibles in CollectibleRegionsOriginal.items()}
+        self.LocationList = {location_id: location.Copy() for location_id, location in LocationListOriginal.items()}
+        # Regions always reachable from each other, searched as one, and the exits leading out of their group - see GroupRegions
+        self.regionGroups = {}
+        self.groupedRegionExits = {}
+        # Where every item and location is once the world is filled - see LocationIndex
+        self.location_index = None
 
         self.move_data = []
         # 0: Cranky, 1: Funky, 2: Candy
@@ -146,6 +156,9 @@ class Spoiler:
         del self.RegionList
         del self.CollectibleRegions
         del self.LogicVariables
+        del self.regionGroups
+        del self.groupedRegionExits
+        del self.location_index
 
     def Reset(self) -> None:
         """Reset logic variables and region info that should be reset before a search."""
@@ -160,10 +173,10 @@ class Spoiler:
 
     def ResetCollectibleRegions(self) -> None:
         """Reset if each collectible has been added."""
-        for region in self.CollectibleRegions.values():
-            for collectible in region:
-                collectible.added = False
-                # collectible.enabled = collectible.vanilla
+        for collectible in self.addedCollectibles:
+            collectible.added = False
+            # collectible.enabled = collectible.vanilla
+        self.addedCollectibles = []
 
     def ClearAllLocations(self) -> None:
         """Clear item from every location."""
@@ -242,6 +255,8 @@ class Spoiler:
         settings = OrderedDict()
         settings["Settings String"] = self.settings.settings_string
         settings["Seed"] = self.settings.seed_id
+        if self.settings.fill_attempt > 0:
+            settings["Fill Attempt"] = self.settings.fill_attempt
         # settings["algorithm"] = self.settings.algorithm # Don't need this for now, probably
         logic_types = {LogicType.nologic: "No Logic", LogicType.glitch: "Glitched Logic", LogicType.glitchless: "Glitchless Logic"}
         if self.settings.logic_type in logic_types:
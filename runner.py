@@ -10,21 +10,20 @@ import zipfile
 from datetime import UTC
 from datetime import datetime as Datetime
 from io import BytesIO
-from multiprocessing import Process, Queue
 from os import environ, listdir, makedirs, path, remove, walk
-from queue import Empty
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from flask import Flask, make_response, redirect, render_template, request, send_from_directory, session
 from flask_cors import CORS
-from flask_executor import Executor
 from git import Repo
-from vidua import bps
 
+from job_queue import JOB_FINISHED, JOB_PENDING, JOB_RUNNING, GenerationService, JobStore
 from oauth import DiscordAuth
+from randomizer.CompileLogic import PreloadLogicSources
 from randomizer.Enums.Settings import SettingsMap
-from randomizer.Fill import Generate_Spoiler
-from randomizer.Patching.Patcher import load_base_rom
+from randomizer.Fill import Fill_Spoiler, Patch_Spoiler
+from randomizer.Instrumentation import formatPrometheus
+from randomizer.Patching.Patcher import create_base_rom_file, load_base_rom
 from randomizer.Settings import Settings
 from randomizer.SettingStrings import decrypt_settings_string_enum, encrypt_settings_string_enum
 from randomizer.Spoiler import Spoiler
@@ -37,12 +36,9 @@ if __name__ == "__main__":
     app = Flask(__name__, static_url_path="", static_folder="")
 else:
     app = Flask(__name__)
-app.config["EXECUTOR_MAX_WORKERS"] = environ.get("EXECUTOR_MAX_WORKERS", 2)
-app.config["EXECUTOR_TYPE"] = environ.get("EXECUTOR_TYPE", "process")
 app.config["SECRET_KEY"] = secrets.token_hex(256)
 discord = DiscordAuth(environ.get("CLIENT_ID"), environ.get("CLIENT_SECRET"), environ.get("REDIRECT", "http://localhost:8000/admin"), "463917049782075395")
 admin_roles = ["550784070188138508"]
-executor = Executor(app)
 CORS(app)
 current_total = 0
 try:
@@ -60,11 +56,17 @@ except Exception:
     # If we can't read the file, just set it to 0 in the file.
     with open("last_generated_time.cfg", "w") as f:
         f.write(str(last_generated_time))
-TIMEOUT = environ.get("TIMEOUT", 400)
-patch = open("./static/patches/shrink-dk64.bps", "rb")
-original = open("dk64.z64", "rb")
-# load all the settings strings into memory
-og_patched_rom = None
+TIMEOUT = float(environ.get("TIMEOUT", 400))
+# Number of fill attempts of each seed to run in parallel, the lowest one that succeeds is used
+FILL_ATTEMPTS = int(environ.get("FILL_ATTEMPTS", 1))
+# Number of generator processes kept running, EXECUTOR_MAX_WORKERS is still read for older configs
+GENERATOR_WORKERS = int(environ.get("GENERATOR_WORKERS", environ.get("EXECUTOR_MAX_WORKERS", 2)))
+# Most processes each generator splits the what-if checks of its placed world between, fewer if the cores are all in use
+WHAT_IF_WORKERS = int(environ.get("WHAT_IF_WORKERS", 2))
+# Where jobs and their results are stored so they survive a restart
+JOB_DATABASE = environ.get("JOB_DATABASE", "generated_seeds/jobs.db")
+# Path of the base ROM file, each generation maps it into memory rather than receiving a copy
+og_patched_rom = create_base_rom_file()
 
 
 if environ.get("HOSTED_SERVER") is not None:
@@ -102,39 +104,15 @@ def update_presets():
 update_presets()
 
 
-def generate(default_rom, generate_settings, queue, post_body):
-    """Gen a seed and write the file to an output file."""
-    try:
-        load_base_rom(default_file=default_rom)
-        settings = Settings(generate_settings)
-        spoiler = Spoiler(settings)
-        patch, spoiler = Generate_Spoiler(spoiler)
-        spoiler.FlushAllExcessSpoilerData()
-        return_dict = {}
-        return_dict["patch"] = patch
-        return_dict["spoiler"] = spoiler
-        queue.put(return_dict)
-
-    except Exception as e:
-        if environ.get("HOSTED_SERVER") is not None:
-            write_error(traceback.format_exc(), post_body)
-        print(traceback.format_exc())
-        # Return the error and the type of error.
-        error = str(type(e).__name__) + ": " + str(e)
-        queue.put(error)
+def start_worker(base_rom):
+    """Load everything a generation needs once, before any generator process is forked."""
+    load_base_rom(default_file=base_rom)
+    PreloadLogicSources()
 
 
-def start_gen(gen_key, post_body):
-    """Start the generation process."""
-    print("starting generation")
-    setting_data = post_body
-    global og_patched_rom
-    if og_patched_rom is None:
-        global original
-        global patch
-        og_patched_rom = BytesIO(bps.patch(original, patch).read())
-    if not setting_data.get("seed"):
-        setting_data["seed"] = random.randint(0, 100000000)
+def generate(post_body, fill_attempt=0):
+    """Fill a seed, returning what finish_generate needs to patch it."""
+    setting_data = dict(post_body)
     # Convert string data to enums where possible.
     for k, v in setting_data.items():
         if k in SettingsMap:
@@ -154,55 +132,114 @@ def start_gen(gen_key, post_body):
                 except Exception:
                     pass
     try:
-        queue = Queue()
-        p = Process(
-            target=generate,
-            args=(
-                og_patched_rom,
-                setting_data,
-                queue,
-                post_body,
-            ),
-        )
-        p.start()
-        try:
-            return_data = queue.get(timeout=TIMEOUT)
-        # raise an exception if we timeout
-        except Empty:
-            try:
-                p.kill()
-            except Exception:
-                pass
-            return "Seed Generation Timed Out"
-        p.join(0)
-        if type(return_data) is str:
-            return return_data
-        else:
-            # Assuming post_body.get("delayed_spoilerlog_release") is an int, and its the number of hours to delay the spoiler log release convert that to time.time() + hours as seconds.
-            try:
-                spoiler_log_release = int(post_body.get("delayed_spoilerlog_release", 0))
-            except ValueError:
-                spoiler_log_release = 0
-
-            if spoiler_log_release == 0:
-                # Lets set it to 5 years from now if we don't have a delayed spoiler log release, it'll be deleted after 4 weeks anyway.
-                unlock_time = time.time() + 157784760
-            else:
-                unlock_time = time.time() + (spoiler_log_release * 3600)
-            if setting_data.get("generate_spoilerlog", True):
-                unlock_time = 0
+        started = time.time()
+        load_base_rom(default_file=og_patched_rom)
+        settings = Settings(setting_data)
+        settings.fill_attempt = fill_attempt
+        spoiler = Spoiler(settings)
+        Fill_Spoiler(spoiler)
+    except Exception as e:
+        if environ.get("HOSTED_SERVER") is not None:
+            write_error(traceback.format_exc(), setting_data)
+        print(traceback.format_exc())
+        # Return the error and the type of error.
+        error = str(type(e).__name__) + ": " + str(e)
+        return error
+    return post_body, setting_data, spoiler, started
 
-            # Append the current time to the spoiler log as unlock_time.
-            patch = return_data["patch"]
-            spoiler = return_data["spoiler"]
-            return patch, spoiler, unlock_time, time.time()
 
+def finish_generate(state):
+    """Patch a filled seed and return the data needed to hand it out."""
+    post_body, setting_data, spoiler, started = state
+    try:
+        patch = Patch_Spoiler(spoiler)
+        spoiler.FlushAllExcessSpoilerData()
     except Exception as e:
         if environ.get("HOSTED_SERVER") is not None:
-            write_error(traceback.format_exc(), post_body)
+            write_error(traceback.format_exc(), setting_data)
         print(traceback.format_exc())
+        # Return the error and the type of error.
         error = str(type(e).__name__) + ": " + str(e)
         return error
+    # Assuming post_body.get("delayed_spoilerlog_release") is an int, and its the number of hours to delay the spoiler log release convert that to time.time() + hours as seconds.
+    try:
+        spoiler_log_release = int(post_body.get("delayed_spoilerlog_release", 0))
+    except ValueError:
+        spoiler_log_release = 0
+
+    if spoiler_log_release == 0:
+        # Lets set it to 5 years from now if we don't have a delayed spoiler log release, it'll be deleted after 4 weeks anyway.
+        unlock_time = time.time() + 157784760
+    else:
+        unlock_time = time.time() + (spoiler_log_release * 3600)
+    if setting_data.get("generate_spoilerlog", True):
+        unlock_time = 0
+    print(f"Generated seed {spoiler.settings.seed_id} in {time.time() - started:.1f}s")
+    # Only what's needed to hand out the seed is returned, so it can be kept in the job store
+    return {
+        "patch": patch,
+        "spoiler_log": spoiler.json,
+        "hash": spoiler.settings.seed_hash,
+        "seed_id": spoiler.settings.seed_id,
+        "generate_spoilerlog": spoiler.settings.generate_spoilerlog,
+        "unlock_time": unlock_time,
+        "generated_time": time.time(),
+        "events": spoiler.events.getSummary(),
+    }
+
+
+def submit_gen(gen_key, post_body):
+    """Queue a seed to be generated."""
+    print("starting generation")
+    if not post_body.get("seed"):
+        # Pick the seed now so every fill attempt uses the same one
+        post_body["seed"] = random.randint(0, 100000000)
+    jobs.submit(gen_key, post_body)
+
+
+def save_seed(resp_data):
+    """Save a generated seed to the generated_seeds folder, returning its lanky file contents and seed number."""
+    hash = resp_data["hash"]
+    spoiler_log = json.loads(resp_data["spoiler_log"])
+    unlock_time = resp_data["unlock_time"]
+    spoiler_log["Unlock Time"] = unlock_time
+    generated_time = resp_data["generated_time"]
+    spoiler_log["Generated Time"] = generated_time
+    current_seed_number = update_total()
+    file_name = str(current_seed_number)
+    # write the spoiler log to a file in generated_seeds folder. Create the folder if it doesn't exist.
+    makedirs("generated_seeds", exist_ok=True)
+    with open("generated_seeds/" + file_name + ".json", "w") as f:
+        f.write(str(json.dumps(spoiler_log)))
+
+    sections_to_retain = ["Settings", "Cosmetics", "Spoiler Hints", "Spoiler Hints Data", "Generated Time", "Item Pool"]
+    if resp_data["generate_spoilerlog"] is False:
+        spoiler_log = {k: v for k, v in spoiler_log.items() if k in sections_to_retain}
+    else:
+        del spoiler_log["Unlock Time"]
+
+    patch = resp_data["patch"]
+    # Zip all the data into a single file.
+    # Create a new zip file
+    zip_data = BytesIO()
+
+    with zipfile.ZipFile(zip_data, "w") as zip_file:
+        # Write each variable to the zip file
+        zip_file.writestr("patch", patch)
+        zip_file.writestr("hash", str(hash))
+        zip_file.writestr("spoiler_log", str(json.dumps(spoiler_log)))
+        zip_file.writestr("seed_id", str(resp_data["seed_id"]))
+        zip_file.writestr("generated_time", str(generated_time))
+        zip_file.writestr("version", version)
+        zip_file.writestr("seed_number", str(current_seed_number))
+    zip_data.seek(0)
+    # Convert the zip to a string of base64 data
+    zip_conv = codecs.encode(zip_data.getvalue(), "base64").decode()
+    # Store the patch file in generated_seeds folder.
+    makedirs("generated_seeds", exist_ok=True)
+    with open("generated_seeds/" + file_name + ".lanky", "w") as f:
+        f.write(zip_conv)
+    return zip_conv, current_seed_number
 
 
 def write_error(error, settings_string):
@@ -232,78 +269,31 @@ def lambda_function():
     # See if we have a query for gen_key.
     if query_string.get("gen_key"):
         gen_key = str(query_string.get("gen_key"))
-        if executor.futures._futures.get(gen_key) and not executor.futures.done(gen_key):
+        job_status = jobs.status(gen_key)
+        if job_status in (JOB_PENDING, JOB_RUNNING):
             # We're not done generating yet
-            # Create an ordered dict of the existing future that are not done.
-            ordered_futures = {}
-            for key in executor.futures._futures:
-                if not executor.futures.done(key) and not executor.futures.running(key):
-                    ordered_futures[key] = executor.futures._futures[key]
-            try:
-                job_index = list(ordered_futures).index(gen_key)
-                if job_index < 0:
-                    job_index = 0
-            except Exception as e:
-                job_index = 0
-            response = make_response(json.dumps({"status": executor.futures._state(gen_key), "position": job_index}), 202)
+            response = make_response(json.dumps({"status": job_status, "position": jobs.position(gen_key)}), 202)
             response.mimetype = "application/json"
             response.headers["Content-Type"] = "application/json; charset=utf-8"
             return response
-        elif executor.futures._futures.get(gen_key):
+        elif job_status == JOB_FINISHED:
             # We're done generating, return the data.
-            future = executor.futures.pop(gen_key)
-            resp_data = future.result()
+            resp_data = jobs.result(gen_key, remove=True)
+            if resp_data is None:
+                # Another request already collected this seed
+                return make_response(json.dumps({"error": "error"}), 205)
             if type(resp_data) is str:
                 response = make_response(resp_data, 208)
                 return response
-            hash = resp_data[1].settings.seed_hash
-            spoiler_log = json.loads(resp_data[1].json)
-            unlock_time = resp_data[2]
-            spoiler_log["Unlock Time"] = unlock_time
-            generated_time = resp_data[3]
-            spoiler_log["Generated Time"] = generated_time
-            current_seed_number = update_total()
-            file_name = str(current_seed_number)
-            # write the spoiler log to a file in generated_seeds folder. Create the folder if it doesn't exist.
-            makedirs("generated_seeds", exist_ok=True)
-            with open("generated_seeds/" + file_name + ".json", "w") as f:
-                f.write(str(json.dumps(spoiler_log)))
-
-            sections_to_retain = ["Settings", "Cosmetics", "Spoiler Hints", "Spoiler Hints Data", "Generated Time", "Item Pool"]
-            if resp_data[1].settings.generate_spoilerlog is False:
-                spoiler_log = {k: v for k, v in spoiler_log.items() if k in sections_to_retain}
-            else:
-                del spoiler_log["Unlock Time"]
-
-            patch = resp_data[0]
-            # Zip all the data into a single file.
-            # Create a new zip file
-            zip_data = BytesIO()
-
-            with zipfile.ZipFile(zip_data, "w") as zip_file:
-                # Write each variable to the zip file
-                zip_file.writestr("patch", patch)
-                zip_file.writestr("hash", str(hash))
-                zip_file.writestr("spoiler_log", str(json.dumps(spoiler_log)))
-                zip_file.writestr("seed_id", str(resp_data[1].settings.seed_id))
-                zip_file.writestr("generated_time", str(generated_time))
-                zip_file.writestr("version", version)
-                zip_file.writestr("seed_number", str(current_seed_number))
-            zip_data.seek(0)
-            # Convert the zip to a string of base64 data
-            zip_conv = codecs.encode(zip_data.getvalue(), "base64").decode()
-            # Store the patch file in generated_seeds folder.
-            makedirs("generated_seeds", exist_ok=True)
-            with open("generated_seeds/" + file_name + ".lanky", "w") as f:
-                f.write(zip_conv)
+            zip_conv, current_seed_number = save_seed(resp_data)
             # Return it as a text file
             response = make_response(zip_conv, 200)
             return response
         else:
-            # We don't have a future for this key, so we need to start generating.
+            # We don't have a job for this key, so we need to start generating.
             print("Starting generation from webworker: " + str(gen_key))
             post_body = json.loads(request.get_json().get("post_body"))
-            executor.submit_stored(gen_key, start_gen, gen_key, post_body)
+            submit_gen(gen_key, post_body)
             response = make_response(json.dumps({"start_time": gen_key}), 201)
             response.mimetype = "application/json"
             response.headers["Content-Type"] = "application/json; charset=utf-8"
@@ -414,6 +404,8 @@ def delete_old_files():
                     print(f"Deleted file: {filename}")
                     # also delete the lanky file
                     remove(path.join(folder_path, filename.replace(".json", ".lanky")))
+    # Drop results nobody came back for after a day
+    jobs.store.prune(86400)
 
 
 @app.route("/get_seed", methods=["GET"])
@@ -462,26 +454,15 @@ def get_status():
     # See if we have a query for gen_key.
     if query_string.get("gen_key"):
         gen_key = str(query_string.get("gen_key"))
-        if executor.futures._futures.get(gen_key) and not executor.futures.done(gen_key):
+        job_status = jobs.status(gen_key)
+        if job_status in (JOB_PENDING, JOB_RUNNING):
             # We're not done generating yet
-            # Create an ordered dict of the existing future that are not done.
-            ordered_futures = {}
-            for key in executor.futures._futures:
-                if not executor.futures.done(key) and not executor.futures.running(key):
-                    ordered_futures[key] = executor.futures._futures[key]
-            try:
-                job_index = list(ordered_futures).index(gen_key)
-                if job_index < 0:
-                    job_index = 0
-            except Exception as e:
-                job_index = 0
-            response = make_response(json.dumps({"status": executor.futures._state(gen_key), "position": job_index}), 200)
+            response = make_response(json.dumps({"status": job_status, "position": jobs.position(gen_key)}), 200)
             response.mimetype = "application/json"
             response.headers["Content-Type"] = "application/json; charset=utf-8"
             return response
-        elif executor.futures._futures.get(gen_key):
-            future = executor.futures._futures.get(gen_key)
-            resp_data = future.result()
+        elif job_status == JOB_FINISHED:
+            resp_data = jobs.result(gen_key)
             if type(resp_data) is str:
                 response = make_response(json.dumps({"status": "failure", "data": resp_data}), 200)
             else:
@@ -513,55 +494,15 @@ def get_seed_data():
     # See if we have a query for gen_key.
     if query_string.get("gen_key"):
         gen_key = str(query_string.get("gen_key"))
-        if executor.futures._futures.get(gen_key):
-            future = executor.futures.pop(gen_key)
-            resp_data = future.result()
+        resp_data = jobs.result(gen_key, remove=True)
+        if resp_data is not None:
             if type(resp_data) is str:
                 response = make_response(json.dumps({"status": "failure", "data": resp_data}), 200)
                 response.mimetype = "application/json"
                 response.headers["Content-Type"] = "application/json; charset=utf-8"
                 return response
-            hash = resp_data[1].settings.seed_hash
-            spoiler_log = json.loads(resp_data[1].json)
-            # Encrypt the time and hash with the encryption key.
-            current_seed_number = update_total()
-            file_name = str(current_seed_number)
-            unlock_time = resp_data[2]
-            generated_time = resp_data[3]
-            spoiler_log["Unlock Time"] = unlock_time
-            spoiler_log["Generated Time"] = generated_time
-            # write the spoiler log to a file in generated_seeds folder. Create the folder if it doesn't exist.
-            makedirs("generated_seeds", exist_ok=True)
-            with open("generated_seeds/" + file_name + ".json", "w") as f:
-                f.write(str(json.dumps(spoiler_log)))
-
-            sections_to_retain = ["Settings", "Cosmetics", "Spoiler Hints", "Spoiler Hints Data", "Generated Time", "Item Pool"]
-            if resp_data[1].settings.generate_spoilerlog is False:
-                spoiler_log = {k: v for k, v in spoiler_log.items() if k in sections_to_retain}
-            else:
-                del spoiler_log["Unlock Time"]
-
-            patch = resp_data[0]
-            # Zip all the data into a single file.
-            # Create a new zip file
-            zip_data = BytesIO()
-
-            with zipfile.ZipFile(zip_data, "w") as zip_file:
-                # Write each variable to the zip file
-                zip_file.writestr("patch", patch)
-                zip_file.writestr("hash", str(hash))
-                zip_file.writestr("spoiler_log", str(json.dumps(spoiler_log)))
-                zip_file.writestr("seed_id", str(resp_data[1].settings.seed_id))
-                zip_file.writestr("generated_time", str(generated_time))
-                zip_file.writestr("version", version)
-                zip_file.writestr("seed_number", str(current_seed_number))
-            zip_data.seek(0)
-            # Convert the zip to a string of base64 data
-            zip_conv = codecs.encode(zip_data.getvalue(), "base64").decode()
-            # Store the patch file in generated_seeds folder.
-            makedirs("generated_seeds", exist_ok=True)
-            with open("generated_seeds/" + file_name + ".lanky", "w") as f:
-                f.write(zip_conv)
+            hash = resp_data["hash"]
+            zip_conv, current_seed_number = save_seed(resp_data)
             response = make_response(json.dumps({"status": "complete", "hash": hash, "seed_number": current_seed_number}), 200)
             response.mimetype = "application/json"
             response.headers["Content-Type"] = "application/json; charset=utf-8"
@@ -620,6 +561,43 @@ def update_total():
     return current_total
 
 
+@app.route("/admin/jobs", methods=["GET"])
+def admin_jobs():
+    """Get wall time metrics of the jobs finished in the last hour."""
+    if not session.get("admin", False):
+        return make_response('{"message": "You do not have permission to access this page."}', 403)
+    response = make_response(json.dumps(jobs.store.metrics(time.time() - 3600)), 200)
+    response.mimetype = "application/json"
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    return response
+
+
+@app.route("/admin/events", methods=["GET"])
+def admin_events():
+    """Get the events recorded while generating a seed, or the totals of every seed generated.
+
+    Totals are JSON unless the format query is "prometheus".
+    """
+    if not session.get("admin", False):
+        return make_response('{"message": "You do not have permission to access this page."}', 403)
+    query_string = request.args.to_dict()
+    if query_string.get("gen_key"):
+        events = jobs.events.get(str(query_string.get("gen_key")))
+        if events is None:
+            return make_response('{"message": "No events for this job."}', 404)
+        response = make_response(json.dumps(events), 200)
+    elif query_string.get("format") == "prometheus":
+        response = make_response(formatPrometheus(jobs.events.get_totals()), 200)
+        response.mimetype = "text/plain"
+        response.headers["Content-Type"] = "text/plain; version=0.0.4; charset=utf-8"
+        return response
+    else:
+        response = make_response(json.dumps(jobs.events.get_totals()), 200)
+    response.mimetype = "application/json"
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    return response
+
+
 # Create a route for an admin portal
 @app.route("/admin", methods=["GET"])
 def admin_portal():
@@ -691,6 +669,10 @@ def admin_presets():
             return make_response("Local presets deleted", 200)
 
 
+makedirs(path.dirname(JOB_DATABASE) or ".", exist_ok=True)
+# Generator processes are forked from a zygote that has already loaded the randomizer, so each job starts straight away
+jobs = GenerationService(JobStore(JOB_DATABASE), generate, finish_generate, GENERATOR_WORKERS, FILL_ATTEMPTS, TIMEOUT, start_worker, (og_patched_rom,), WHAT_IF_WORKERS)
+
 # Setup the scheduler
 scheduler = BackgroundScheduler()
 scheduler.add_job(func=delete_old_files, trigger="interval", hours=2)
@@ -0,0 +1,97 @@
+"""Tests that logic compiled against the settings gives the same results as the original lambdas."""
+
+import json
+import unittest
+
+from randomizer.CompileLogic import AlwaysFalse, AlwaysTrue, CompileLogic, LogicCompiler
+from randomizer.Enums.Events import Events
+from randomizer.Enums.Kongs import Kongs
+from randomizer.ItemPool import AllItems
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+with open("static/presets/preset_files.json", "r") as file:
+    presets = [(preset["name"], preset["settings_string"]) for preset in json.load(file) if preset.get("settings_string")]
+
+
+def make_spoiler(settings_string: str) -> Spoiler:
+    """Make a spoiler from a settings string."""
+    settings_dict = decrypt_settings_string_enum(settings_string)
+    settings_dict["seed"] = 1
+    return Spoiler(Settings(settings_dict))
+
+
+def get_logic(spoiler: Spoiler) -> list:
+    """Get every object with logic that CompileLogic rewrites."""
+    owners = []
+    for region in spoiler.RegionList.values():
+        owners.extend(region.locations)
+        owners.extend(region.events)
+        owners.extend(region.exits)
+        if region.deathwarp is not None:
+            owners.append(region.deathwarp)
+    for collectibles in spoiler.CollectibleRegions.values():
+        owners.extend(collectibles)
+    return owners
+
+
+def evaluate(logic, logicVariables):
+    """Get whether logic is met, or the type of error it raised."""
+    try:
+        return bool(logic(logicVariables))
+    except Exception as error:
+        return type(error)
+
+
+class TestCompileLogic(unittest.TestCase):
+    """Tests for compiling logic lambdas."""
+
+    def test_compiled_logic_matches(self):
+        """Every compiled lambda of every preset gives the same result as the original, with nothing, half or everything owned."""
+        for name, settings_string in presets:
+            with self.subTest(preset=name):
+                spoiler = make_spoiler(settings_string)
+                original = [owner.logic for owner in get_logic(spoiler)]
+                CompileLogic(spoiler)
+                # Compiled logic is swapped in on copies of the shared logic objects
+                owners = get_logic(spoiler)
+                self.assertTrue(any(owner.logic is not logic for owner, logic in zip(owners, original)))
+                logicVariables = spoiler.LogicVariables
+                items = AllItems(spoiler.settings)
+                for owned, events in (([], []), (items[::2], list(Events)[::2]), (items, list(Events))):
+                    logicVariables.Reset()
+                    logicVariables.Update(owned)
+                    logicVariables.Events.extend(events)
+                    for kong in (Kongs.donkey, Kongs.diddy, Kongs.lanky, Kongs.tiny, Kongs.chunky):
+                        logicVariables.SetKong(kong)
+                        for owner, logic in zip(owners, original):
+                            self.assertEqual(evaluate(owner.logic, logicVariables), evaluate(logic, logicVariables), repr(vars(owner)))
+
+    def test_constant_settings_are_folded(self):
+        """Settings reads, glitch flags and glitch helpers are resolved, leaving the rest of the lambda alone."""
+        spoiler = make_spoiler(presets[0][1])
+        logicVariables = spoiler.LogicVariables
+        compiler = LogicCompiler(logicVariables)
+        auto_keys = spoiler.settings.auto_keys
+        self.assertIs(compiler.Compile(lambda l: l.settings.auto_keys), AlwaysTrue if auto_keys else AlwaysFalse)
+        self.assertIs(compiler.Compile(lambda l: not l.settings.auto_keys), AlwaysFalse if auto_keys else AlwaysTrue)
+        self.assertIs(compiler.Compile(lambda l: l.settings.auto_keys or not l.settings.auto_keys), AlwaysTrue)
+        if not logicVariables.phasewalk and not logicVariables.phasefall:
+            self.assertIs(compiler.Compile(lambda l: l.CanPhase() and l.donkey), AlwaysFalse)
+        logic = [lambda l: (l.settings.auto_keys and l.donkey) or l.diddy][0]
+        compiled = compiler.Compile(logic)
+        self.assertIsNot(compiled, logic)
+        for donkey in (False, True):
+            for diddy in (False, True):
+                logicVariables.donkey = donkey
+                logicVariables.diddy = diddy
+                self.assertEqual(compiled(logicVariables), logic(logicVariables))
+
+    def test_changing_settings_are_left_alone(self):
+        """Logic reading settings that can change during a fill, or built as a closure, isn't rewritten."""
+        compiler = LogicCompiler(make_spoiler(presets[0][1]).LogicVariables)
+        logic = [lambda l: l.settings.level_order[1] == 1][0]
+        self.assertIs(compiler.Compile(logic), logic)
+        closure = [lambda l: l.settings.auto_keys and level for level in range(1)][0]
+        self.assertIs(compiler.Compile(closure), closure)
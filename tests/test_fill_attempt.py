@@ -0,0 +1,34 @@
+"""Tests that a seed filled by a parallel fill attempt can be reproduced from its fill attempt."""
+
+import json
+import unittest
+
+from randomizer.Fill import Fill_Spoiler
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+
+def fill_seed(seed: int, fill_attempt: int) -> Spoiler:
+    """Fill a seed of the first bundled preset the way the server's fill attempts do, without patching the ROM."""
+    with open("static/presets/preset_files.json", "r") as file:
+        presets = json.load(file)
+    settings_string = [preset["settings_string"] for preset in presets if preset.get("settings_string")][0]
+    settings_dict = decrypt_settings_string_enum(settings_string)
+    settings_dict["seed"] = seed
+    # Sent the same way in the post body of a job or by cli.py
+    settings_dict["fill_attempt"] = fill_attempt
+    spoiler = Spoiler(Settings(settings_dict))
+    Fill_Spoiler(spoiler)
+    return spoiler
+
+
+class TestFillAttempt(unittest.TestCase):
+    """Tests for replaying fill attempts."""
+
+    def test_replay(self):
+        """Filling a seed again with the fill attempt recorded in its spoiler log gives the same spoiler log."""
+        spoiler = fill_seed(12345, 1)
+        fill_attempt = json.loads(spoiler.json)["Settings"]["Fill Attempt"]
+        self.assertEqual(fill_attempt, 1)
+        self.assertEqual(fill_seed(12345, fill_attempt).json, spoiler.json)
@@ -0,0 +1,239 @@
+"""Tests for the server's job store, job queue and generation service."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from job_queue import JOB_FINISHED, JOB_PENDING, JOB_RUNNING, PRIORITY_HIGH, PRIORITY_NORMAL, GenerationService, JobQueue, JobStore
+
+# Set by the zygote's initializer, so generators can tell they were forked from it
+warmed_up = None
+# Jobs filled by this process, which is only ever more than one if a generator is reused
+jobs_filled = 0
+
+
+def warm_up(value):
+    """Record that the zygote ran its initializer."""
+    global warmed_up
+    warmed_up = value
+
+
+def fill_attempt(post_body, attempt):
+    """Fill an attempt as the post body says, returning the state to finish it with."""
+    global jobs_filled
+    jobs_filled += 1
+    if post_body.get("fork"):
+        # As the what-if checks do, leaving behind a process which only the generator being stopped can end
+        pid = os.fork()
+        if pid == 0:
+            time.sleep(30)
+            os._exit(0)
+        with open(os.path.join(post_body["folder"], "forked"), "w") as file:
+            file.write(str(pid))
+    time.sleep(post_body.get("delays", {}).get(str(attempt), 0))
+    if attempt in post_body.get("failing", []):
+        raise ValueError(f"attempt {attempt} failed")
+    return post_body, attempt
+
+
+def finish_attempt(state):
+    """Finish an attempt, leaving a file behind to show it was finished."""
+    post_body, attempt = state
+    with open(os.path.join(post_body["folder"], f"finished-{attempt}"), "w") as file:
+        file.write(str(os.getpid()))
+    return {"attempt": attempt, "pid": os.getpid(), "warmed_up": warmed_up, "jobs_filled": jobs_filled, "what_if_workers": os.environ.get("WHAT_IF_WORKERS")}
+
+
+def is_running(pid: int) -> bool:
+    """Check whether a process is still running, counting one that exited but wasn't waited on as stopped."""
+    try:
+        with open(f"/proc/{pid}/stat", "r") as file:
+            return file.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+class TestJobStore(unittest.TestCase):
+    """Tests for the SQLite job store."""
+
+    def setUp(self):
+        """Make a folder for the store."""
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "jobs.db")
+
+    def tearDown(self):
+        """Remove the folder."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_job_lifetime(self):
+        """A job goes from pending to running to finished, and its result can be collected once."""
+        store = JobStore(self.path)
+        self.assertIsNone(store.status("job"))
+        store.add("job", {"seed": 1}, PRIORITY_NORMAL)
+        self.assertEqual(store.status("job"), JOB_PENDING)
+        self.assertIsNone(store.result("job"))
+        self.assertEqual(store.start("job"), {"seed": 1})
+        self.assertEqual(store.status("job"), JOB_RUNNING)
+        store.finish("job", {"patch": b"data"})
+        self.assertEqual(store.status("job"), JOB_FINISHED)
+        self.assertEqual(store.result("job"), {"patch": b"data"})
+        self.assertEqual(store.result("job", remove=True), {"patch": b"data"})
+        self.assertIsNone(store.result("job"))
+        self.assertIsNone(store.status("job"))
+
+    def test_restart(self):
+        """Unfinished jobs and uncollected results are still there after the store is reopened."""
+        store = JobStore(self.path)
+        store.add("finished", {"seed": 1}, PRIORITY_NORMAL)
+        store.start("finished")
+        store.finish("finished", "ValueError: failed")
+        store.add("running", {"seed": 2}, PRIORITY_NORMAL)
+        store.start("running")
+        store.add("pending", {"seed": 3}, PRIORITY_HIGH)
+        store.connection.close()
+        store = JobStore(self.path)
+        self.assertEqual(store.result("finished"), "ValueError: failed")
+        self.assertEqual(store.unfinished(), [("running", PRIORITY_NORMAL), ("pending", PRIORITY_HIGH)])
+        self.assertEqual(store.start("pending"), {"seed": 3})
+        metrics = store.metrics(0)
+        self.assertEqual((metrics["finished"], metrics["failed"], metrics["pending"], metrics["running"]), (1, 1, 0, 2))
+
+    def test_prune(self):
+        """Only finished jobs older than the max age are pruned."""
+        store = JobStore(self.path)
+        store.add("finished", {}, PRIORITY_NORMAL)
+        store.finish("finished", {})
+        store.add("pending", {}, PRIORITY_NORMAL)
+        store.prune(3600)
+        self.assertEqual(store.status("finished"), JOB_FINISHED)
+        store.prune(-1)
+        self.assertIsNone(store.status("finished"))
+        self.assertEqual(store.status("pending"), JOB_PENDING)
+
+
+class TestJobQueue(unittest.TestCase):
+    """Tests for the job queue."""
+
+    def test_order(self):
+        """Jobs come off the queue by priority, then in the order they were added."""
+        queue = JobQueue()
+        for gen_key, priority in (("a", PRIORITY_NORMAL), ("b", PRIORITY_HIGH), ("c", PRIORITY_NORMAL), ("d", PRIORITY_HIGH)):
+            queue.put(gen_key, priority)
+        self.assertEqual([queue.get() for _ in range(4)], ["b", "d", "a", "c"])
+
+    def test_positions(self):
+        """A job's position counts the jobs ahead of it in its own and higher priorities."""
+        queue = JobQueue()
+        for gen_key in ("a", "b", "c"):
+            queue.put(gen_key)
+        queue.put("high", PRIORITY_HIGH)
+        self.assertEqual([queue.position(gen_key) for gen_key in ("high", "a", "b", "c")], [0, 1, 2, 3])
+        self.assertEqual(queue.get(), "high")
+        self.assertEqual(queue.get(), "a")
+        self.assertIsNone(queue.position("a"))
+        self.assertEqual([queue.position(gen_key) for gen_key in ("b", "c")], [0, 1])
+        queue.put("d")
+        self.assertEqual(queue.position("d"), 2)
+
+
+class TestGenerationService(unittest.TestCase):
+    """Tests for running jobs in generator processes."""
+
+    def setUp(self):
+        """Make a folder for the job store and the attempts' files."""
+        self.folder = tempfile.mkdtemp()
+        self.store = JobStore(os.path.join(self.folder, "jobs.db"))
+
+    def tearDown(self):
+        """Remove the folder."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def make_service(self, attempts: int, timeout: float = 30, what_if_workers: int = 1) -> GenerationService:
+        """Start a service running one job at a time."""
+        return GenerationService(self.store, fill_attempt, finish_attempt, attempts, attempts, timeout, warm_up, ("warm",), what_if_workers)
+
+    def run_job(self, service: GenerationService, gen_key: str, **post_body):
+        """Submit a job and wait for its result."""
+        post_body["folder"] = self.folder
+        service.submit(gen_key, post_body)
+        deadline = time.time() + 60
+        while service.status(gen_key) != JOB_FINISHED:
+            self.assertLess(time.time(), deadline, "job didn't finish")
+            time.sleep(0.02)
+        return service.result(gen_key)
+
+    def finished_attempts(self) -> list:
+        """Get the attempts which were finished."""
+        return sorted(int(name.split("-")[1]) for name in os.listdir(self.folder) if name.startswith("finished-"))
+
+    def test_lowest_attempt_is_used(self):
+        """The lowest attempt that succeeds is used even when a later one is faster, and only it is finished."""
+        service = self.make_service(3)
+        result = self.run_job(service, "job", delays={"0": 0.5})
+        self.assertEqual(result["attempt"], 0)
+        self.assertEqual(result["warmed_up"], "warm")
+        self.assertEqual(self.finished_attempts(), [0])
+
+    def test_failed_attempts_are_skipped(self):
+        """A failed attempt is passed over for the next one that succeeds."""
+        service = self.make_service(3)
+        result = self.run_job(service, "job", failing=[0], delays={"1": 0.5})
+        self.assertEqual(result["attempt"], 1)
+        self.assertEqual(self.finished_attempts(), [1])
+
+    def test_every_attempt_failing(self):
+        """The error of the first attempt is the result when every attempt fails."""
+        service = self.make_service(2)
+        self.assertEqual(self.run_job(service, "job", failing=[0, 1]), "ValueError: attempt 0 failed")
+        self.assertEqual(self.finished_attempts(), [])
+
+    def test_fill_attempt_is_replayed(self):
+        """A job naming a fill attempt only runs that attempt."""
+        service = self.make_service(2)
+        self.assertEqual(self.run_job(service, "job", fill_attempt=5)["attempt"], 5)
+        self.assertEqual(self.finished_attempts(), [5])
+
+    def test_fresh_process_per_job(self):
+        """Every job is run by a new process forked from the warmed up zygote."""
+        service = self.make_service(1)
+        results = [self.run_job(service, f"job-{index}") for index in range(3)]
+        self.assertEqual(len({result["pid"] for result in results}), 3)
+        self.assertEqual([result["jobs_filled"] for result in results], [1, 1, 1])
+        self.assertEqual([result["warmed_up"] for result in results], ["warm"] * 3)
+
+    def test_jobs_survive_restart(self):
+        """Jobs left unfinished by a previous server are run when the service starts."""
+        self.store.add("left", {"folder": self.folder}, PRIORITY_NORMAL)
+        self.store.start("left")
+        service = self.make_service(1)
+        deadline = time.time() + 60
+        while service.status("left") != JOB_FINISHED:
+            self.assertLess(time.time(), deadline, "job didn't finish")
+            time.sleep(0.02)
+        self.assertEqual(service.result("left")["attempt"], 0)
+
+    def test_timeout(self):
+        """A job whose attempts don't finish in time times out."""
+        service = self.make_service(1, timeout=0.5)
+        self.assertEqual(self.run_job(service, "job", delays={"0": 5}), "Seed Generation Timed Out")
+
+    @unittest.skipUnless(os.path.exists("/proc"), "needs /proc to check processes")
+    def test_timeout_stops_forked_processes(self):
+        """Processes a generator forked are stopped with it when its job times out."""
+        service = self.make_service(1, timeout=1)
+        self.assertEqual(self.run_job(service, "job", fork=True, delays={"0": 5}), "Seed Generation Timed Out")
+        with open(os.path.join(self.folder, "forked"), "r") as file:
+            pid = int(file.read())
+        deadline = time.time() + 5
+        while is_running(pid):
+            self.assertLess(time.time(), deadline, "forked process is still running")
+            time.sleep(0.02)
+
+    def test_what_if_workers(self):
+        """Generators are told to use as many what-if workers as asked for, but no more than the cores spare."""
+        self.assertEqual(self.run_job(self.make_service(1), "one")["what_if_workers"], "1")
+        cores = os.cpu_count() or 1
+        self.assertEqual(self.run_job(self.make_service(1, what_if_workers=2), "two")["what_if_workers"], str(max(min(2, cores), 1)))
+        self.assertEqual(self.make_service(2, what_if_workers=cores).what_if_workers, max(cores // 2, 1))
@@ -0,0 +1,134 @@
+"""Tests for the texture codec and hue shift of LibImage."""
+
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from randomizer.Patching.LibImage import TEXTURE_BITS_PER_PIXEL, TextureFormat, arrayToImage, decodeTexture, encodeTexture, getTextureSize, hueShift, imageToArray
+
+WIDTH = 16
+HEIGHT = 8
+
+# The first pixel each format decodes from the bytes 0xA5 0x3C
+FIRST_PIXELS = {
+    TextureFormat.RGBA5551: (0xA0, 0xA0, 0xF0, 0),
+    TextureFormat.RGBA32: (0xA5, 0x3C, 0x00, 0x00),
+    TextureFormat.I8: (0xA5, 0xA5, 0xA5, 0xA5),
+    TextureFormat.I4: (0xA0, 0xA0, 0xA0, 0xA0),
+    TextureFormat.IA8: (0xA0, 0xA0, 0xA0, 0x55),
+    TextureFormat.IA4: (0xA0, 0xA0, 0xA0, 0),
+}
+
+
+def old_decode(data: bytes, width: int, height: int, format: TextureFormat) -> Image:
+    """Decode a texture pixel by pixel, the way getImageFromAddress used to."""
+    im_f = Image.new(mode="RGBA", size=(width, height))
+    pix = im_f.load()
+    for y in range(height):
+        for x in range(width):
+            if format == TextureFormat.RGBA32:
+                offset = ((y * width) + x) * 4
+                pix_data = int.from_bytes(data[offset : offset + 4], "big")
+                red = (pix_data >> 24) & 0xFF
+                green = (pix_data >> 16) & 0xFF
+                blue = (pix_data >> 8) & 0xFF
+                alpha = pix_data & 0xFF
+            else:
+                offset = ((y * width) + x) * 2
+                pix_data = int.from_bytes(data[offset : offset + 2], "big")
+                red = ((pix_data >> 11) & 31) << 3
+                green = ((pix_data >> 6) & 31) << 3
+                blue = ((pix_data >> 1) & 31) << 3
+                alpha = (pix_data & 1) * 255
+            pix[x, y] = (red, green, blue, alpha)
+    return im_f
+
+
+def old_hue_shift(im, amount):
+    """Hue shift an image pixel by pixel, the way hueShift used to."""
+    hsv_im = im.convert("HSV")
+    im_px = im.load()
+    w, h = hsv_im.size
+    hsv_px = hsv_im.load()
+    for y in range(h):
+        for x in range(w):
+            old = list(hsv_px[x, y]).copy()
+            old[0] = (old[0] + amount) % 360
+            hsv_px[x, y] = (old[0], old[1], old[2])
+    rgb_im = hsv_im.convert("RGB")
+    rgb_px = rgb_im.load()
+    for y in range(h):
+        for x in range(w):
+            new = list(rgb_px[x, y])
+            new.append(list(im_px[x, y])[3])
+            im_px[x, y] = (new[0], new[1], new[2], new[3])
+    return im
+
+
+class TestLibImage(unittest.TestCase):
+    """Tests for decodeTexture, encodeTexture and hueShift."""
+
+    def setUp(self):
+        """Make a seeded generator for random texture data and pixels."""
+        self.rng = np.random.default_rng(0)
+
+    def test_round_trip(self):
+        """Every format encodes its decoded pixels back to the same bytes, and decodes its encoded pixels to the same pixels."""
+        self.assertEqual(set(TEXTURE_BITS_PER_PIXEL), set(TextureFormat) - {TextureFormat.Null})
+        for format in TEXTURE_BITS_PER_PIXEL:
+            with self.subTest(format=format.name):
+                size = getTextureSize(WIDTH, HEIGHT, format)
+                self.assertEqual(size, WIDTH * HEIGHT * TEXTURE_BITS_PER_PIXEL[format] // 8)
+                data = self.rng.integers(0, 256, size, dtype=np.uint8).tobytes()
+                pixels = decodeTexture(data, WIDTH, HEIGHT, format)
+                self.assertEqual(pixels.shape, (HEIGHT, WIDTH, 4))
+                self.assertEqual(pixels.dtype, np.uint8)
+                self.assertEqual(encodeTexture(pixels, format), data)
+                # Any pixels encode to a texture which decodes to what the format keeps of them
+                pixels = self.rng.integers(0, 256, (HEIGHT, WIDTH, 4), dtype=np.uint8)
+                encoded = encodeTexture(pixels, format)
+                self.assertEqual(len(encoded), size)
+                decoded = decodeTexture(encoded, WIDTH, HEIGHT, format)
+                self.assertEqual(encodeTexture(decoded, format), encoded)
+
+    def test_first_pixel(self):
+        """Every format decodes known bytes to known pixels."""
+        for format, pixel in FIRST_PIXELS.items():
+            with self.subTest(format=format.name):
+                pixels = decodeTexture(bytes([0xA5, 0x3C]), WIDTH, HEIGHT, format)
+                self.assertEqual(tuple(pixels[0, 0]), pixel)
+                self.assertEqual(encodeTexture(pixels, format)[:2], bytes([0xA5, 0x3C]))
+
+    def test_short_data(self):
+        """Missing data at the end of a texture decodes as zeros."""
+        pixels = decodeTexture(bytes([0xFF, 0xFF]), WIDTH, HEIGHT, TextureFormat.RGBA5551)
+        self.assertEqual(tuple(pixels[0, 0]), (0xF8, 0xF8, 0xF8, 0xFF))
+        self.assertFalse(pixels.reshape(-1, 4)[1:].any())
+
+    def test_alpha_threshold(self):
+        """Formats with a 1 bit alpha treat pixels with an alpha above the threshold as opaque."""
+        pixels = np.array([[[255, 255, 255, 0], [255, 255, 255, 1], [255, 255, 255, 128], [255, 255, 255, 255]]], dtype=np.uint8)
+        self.assertEqual(encodeTexture(pixels, TextureFormat.RGBA5551), bytes([0xFF, 0xFE, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]))
+        self.assertEqual(encodeTexture(pixels, TextureFormat.RGBA5551, 127), bytes([0xFF, 0xFE, 0xFF, 0xFE, 0xFF, 0xFF, 0xFF, 0xFF]))
+        self.assertEqual(encodeTexture(pixels, TextureFormat.IA4, 127), bytes([0xEE, 0xFF]))
+
+    def test_matches_old_decode(self):
+        """RGBA5551 and RGBA32 textures decode to the same images as the old per-pixel loop."""
+        for format in (TextureFormat.RGBA5551, TextureFormat.RGBA32):
+            with self.subTest(format=format.name):
+                data = self.rng.integers(0, 256, getTextureSize(WIDTH, HEIGHT, format), dtype=np.uint8).tobytes()
+                expected = old_decode(data, WIDTH, HEIGHT, format)
+                self.assertEqual(arrayToImage(decodeTexture(data, WIDTH, HEIGHT, format)).tobytes(), expected.tobytes())
+
+    def test_hue_shift(self):
+        """Hue shifts give the same image as the old per-pixel loop, keep the alpha, and change the image they're given."""
+        pixels = self.rng.integers(0, 256, (HEIGHT, WIDTH, 4), dtype=np.uint8)
+        for amount in (0, 1, 90, 180, 250, 359, -1, -120, -359):
+            with self.subTest(amount=amount):
+                expected = old_hue_shift(arrayToImage(pixels), amount)
+                image = arrayToImage(pixels)
+                shifted = hueShift(image, amount)
+                self.assertIs(shifted, image)
+                self.assertEqual(shifted.tobytes(), expected.tobytes())
+                np.testing.assert_array_equal(imageToArray(shifted)[:, :, 3], pixels[:, :, 3])
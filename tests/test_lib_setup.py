@@ -0,0 +1,166 @@
+"""Tests for the setup and character spawner file codecs."""
+
+import struct
+import unittest
+
+from randomizer.Patching.LibSetup import ActorRecord, ModelTwoRecord, MysteryRecord, SetupFile, SpawnerFile, SpawnerRecord
+
+
+def make_setup_bytes(trailer: bytes = b"") -> bytes:
+    """Build a setup file with two model two objects, one mystery record and one actor."""
+    data = bytearray()
+    data += struct.pack(">I", 2)
+    for index in range(2):
+        record = ModelTwoRecord()
+        record.x = 100.5 * (index + 1)
+        record.y = -20
+        record.z = 3.25
+        record.scale = 1
+        record.type = 0x74 + index
+        record.id = 0x10 + index
+        data += record.data
+    data += struct.pack(">I", 1)
+    data += bytes(range(MysteryRecord.size))
+    data += struct.pack(">I", 1)
+    actor = ActorRecord()
+    actor.x = 5
+    actor.type = 0x40
+    actor.id = 0x20
+    data += actor.data
+    return bytes(data + trailer)
+
+
+def make_fence(fence_id: int, point_count: int, point0_count: int) -> bytes:
+    """Build a fence with some points, ending in its ID."""
+    data = struct.pack(">H", point_count) + bytes(range(point_count * 6))
+    data += struct.pack(">H", point0_count) + bytes(point0_count * 10)
+    return data + struct.pack(">HH", fence_id, 1)
+
+
+def make_spawner(enemy_id: int, index: int, extra_count: int) -> bytes:
+    """Build a spawner with some extra data."""
+    data = bytearray(SpawnerRecord.size)
+    data[0x0] = enemy_id
+    struct.pack_into(">3h", data, 0x4, -100, 50, 300)
+    data[0xF] = 0x32
+    data[0x11] = extra_count
+    data[0x13] = index
+    return bytes(data) + bytes(range(1, (extra_count * 2) + 1))
+
+
+def make_spawner_bytes() -> bytes:
+    """Build a spawner file with two fences and three spawners."""
+    data = struct.pack(">H", 2) + make_fence(1, 2, 1) + make_fence(4, 0, 0)
+    data += struct.pack(">H", 3) + make_spawner(0x10, 1, 0) + make_spawner(0x44, 2, 3) + make_spawner(0x20, 3, 1)
+    return data
+
+
+class TestSetupFile(unittest.TestCase):
+    """Tests for decoding and encoding setup files."""
+
+    def test_round_trip(self):
+        """Decoding and encoding a setup file gives the same bytes."""
+        data = make_setup_bytes(b"\x00\x00\x00\x00rest of file")
+        setup = SetupFile.decode(data)
+        self.assertEqual(len(setup.model_two), 2)
+        self.assertEqual(len(setup.mystery), 1)
+        self.assertEqual(len(setup.actors), 1)
+        self.assertEqual(setup.encode(), data)
+
+    def test_fields(self):
+        """Typed fields read back what was written."""
+        setup = SetupFile.decode(make_setup_bytes())
+        self.assertEqual(setup.getModelTwoIds(), [0x10, 0x11])
+        self.assertEqual(setup.getActorIds(), [0x20])
+        self.assertEqual(setup.model_two[1].x, 201)
+        self.assertEqual(setup.model_two[0].y, -20)
+        self.assertEqual(setup.model_two[0].type, 0x74)
+        self.assertEqual(setup.actors[0].type, 0x40)
+
+    def test_edit_round_trip(self):
+        """An edited setup file decodes to the edited records."""
+        setup = SetupFile.decode(make_setup_bytes())
+        setup.model_two[0].id = 0x99
+        setup.model_two.append(ModelTwoRecord())
+        setup.actors = []
+        decoded = SetupFile.decode(setup.encode())
+        self.assertEqual(decoded.getModelTwoIds(), [0x99, 0x11, 0])
+        self.assertEqual(decoded.getActorIds(), [])
+        self.assertEqual(decoded.encode(), setup.encode())
+
+    def test_shrunk_file_keeps_trailing_bytes(self):
+        """Bytes a shrunk setup file used to cover are left as they were."""
+        data = make_setup_bytes()
+        setup = SetupFile.decode(data)
+        setup.model_two.pop()
+        encoded = setup.encode()
+        self.assertEqual(len(encoded), len(data))
+        self.assertEqual(encoded[-ModelTwoRecord.size :], data[-ModelTwoRecord.size :])
+
+    def test_missing_file(self):
+        """A missing or empty setup file has no records."""
+        for data in (None, b""):
+            setup = SetupFile.decode(data)
+            self.assertEqual((setup.model_two, setup.mystery, setup.actors), ([], [], []))
+            self.assertEqual(SetupFile.decode(setup.encode()).getModelTwoIds(), [])
+
+    def test_truncated_file(self):
+        """A setup file cut short decodes with the missing bytes as zeros."""
+        data = make_setup_bytes()[:-0x20]
+        setup = SetupFile.decode(data)
+        self.assertEqual(len(setup.actors), 1)
+        self.assertEqual(len(setup.actors[0].data), ActorRecord.size)
+        self.assertEqual(setup.actors[0].id, 0)
+        self.assertEqual(setup.encode()[: len(data)], data)
+
+
+class TestSpawnerFile(unittest.TestCase):
+    """Tests for decoding and encoding character spawner files."""
+
+    def test_round_trip(self):
+        """Decoding and encoding a spawner file gives the same bytes."""
+        data = make_spawner_bytes() + b"rest of file"
+        spawners = SpawnerFile.decode(data)
+        self.assertEqual(len(spawners.fences), 2)
+        self.assertEqual(len(spawners.spawners), 3)
+        self.assertEqual(spawners.encode(), data)
+
+    def test_fields(self):
+        """Typed fields read back what was written."""
+        spawners = SpawnerFile.decode(make_spawner_bytes())
+        self.assertEqual(spawners.getFenceIds(), [1, 4])
+        self.assertEqual([spawner.enemy_id for spawner in spawners.spawners], [0x10, 0x44, 0x20])
+        self.assertEqual([spawner.index for spawner in spawners.spawners], [1, 2, 3])
+        self.assertEqual([len(spawner.data) for spawner in spawners.spawners], [0x16, 0x1C, 0x18])
+        self.assertEqual(spawners.spawners[1].getCoords(), [-100, 50, 300])
+        self.assertEqual(spawners.spawners[1].scale, 0x32)
+
+    def test_edit_round_trip(self):
+        """An edited spawner file decodes to the edited spawners."""
+        spawners = SpawnerFile.decode(make_spawner_bytes())
+        spawners.spawners[0].enemy_id = 0x33
+        spawners.spawners.pop(1)
+        spawners.fences.append(make_fence(7, 1, 0))
+        decoded = SpawnerFile.decode(spawners.encode())
+        self.assertEqual(decoded.getFenceIds(), [1, 4, 7])
+        self.assertEqual([spawner.enemy_id for spawner in decoded.spawners], [0x33, 0x20])
+        self.assertEqual(decoded.encode(), spawners.encode())
+
+    def test_missing_file(self):
+        """A missing or empty spawner file has no fences or spawners."""
+        for data in (None, b""):
+            spawners = SpawnerFile.decode(data)
+            self.assertEqual((spawners.fences, spawners.spawners), ([], []))
+            self.assertEqual(SpawnerFile.decode(spawners.encode()).spawners, [])
+
+    def test_truncated_file(self):
+        """A spawner file cut short decodes with the missing bytes as zeros."""
+        data = make_spawner_bytes()[:-5]
+        spawners = SpawnerFile.decode(data)
+        self.assertEqual(len(spawners.spawners), 3)
+        self.assertEqual(len(spawners.spawners[2].data), 0x18)
+        self.assertEqual(spawners.spawners[2].data[-5:], bytes(5))
+        truncated = make_spawner_bytes()[:3]
+        spawners = SpawnerFile.decode(truncated)
+        self.assertEqual(len(spawners.fences), 2)
+        self.assertEqual(spawners.spawners, [])
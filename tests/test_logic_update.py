@@ -0,0 +1,299 @@
+"""Tests that counting owned items incrementally gives the same logic variables as counting them from scratch."""
+
+import json
+import random
+import unittest
+
+from randomizer.Enums.Events import Events
+from randomizer.Enums.Items import Items
+from randomizer.Enums.Kongs import Kongs
+from randomizer.Enums.Locations import Locations
+from randomizer.ItemPool import AllItems
+from randomizer.Logic import STARTING_SLAM, LogicVarHolder
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+with open("static/presets/preset_files.json", "r") as file:
+    presets = {preset["name"]: preset["settings_string"] for preset in json.load(file) if preset.get("settings_string")}
+settings_string = list(presets.values())[0]
+# Kept by Update to count incrementally, which the original implementation didn't have
+COUNTING_STATE = ("spoiler", "settings", "OwnedItemCounts", "countedOwnedItems", "countedLength", "countedBannedItems", "KongBits")
+
+
+def logic_state(logicVariables: LogicVarHolder) -> dict:
+    """Get the logic variables, leaving out the spoiler and settings they're shared with."""
+    return {key: value for key, value in vars(logicVariables).items() if key not in ("spoiler", "settings")}
+
+
+def compared_state(logicVariables: LogicVarHolder) -> dict:
+    """Get the logic variables the original implementation of Update set, with blueprints as a sorted list."""
+    state = {key: value for key, value in vars(logicVariables).items() if key not in COUNTING_STATE}
+    state["Blueprints"] = sorted(state["Blueprints"])
+    return state
+
+
+def baseline_update(logicVariables: LogicVarHolder, ownedItems: list):
+    """Update logic variables the way Update originally did, scanning the whole list of owned items."""
+    ownedItems = [item for item in ownedItems if item not in logicVariables.banned_items]
+
+    logicVariables.latest_owned_items = ownedItems
+    logicVariables.found_test_item = logicVariables.found_test_item or Items.TestItem in ownedItems
+
+    logicVariables.donkey = logicVariables.donkey or Items.Donkey in ownedItems or logicVariables.startkong == Kongs.donkey
+    logicVariables.diddy = logicVariables.diddy or Items.Diddy in ownedItems or logicVariables.startkong == Kongs.diddy
+    logicVariables.lanky = logicVariables.lanky or Items.Lanky in ownedItems or logicVariables.startkong == Kongs.lanky
+    logicVariables.tiny = logicVariables.tiny or Items.Tiny in ownedItems or logicVariables.startkong == Kongs.tiny
+    logicVariables.chunky = logicVariables.chunky or Items.Chunky in ownedItems or logicVariables.startkong == Kongs.chunky
+
+    logicVariables.climbing = logicVariables.climbing or Items.Climbing in ownedItems
+    logicVariables.vines = logicVariables.vines or Items.Vines in ownedItems
+    logicVariables.swim = logicVariables.swim or Items.Swim in ownedItems
+    logicVariables.oranges = logicVariables.oranges or Items.Oranges in ownedItems
+    logicVariables.barrels = logicVariables.barrels or Items.Barrels in ownedItems
+    logicVariables.can_use_vines = logicVariables.vines  # and logicVariables.climbing to restore old behavior
+
+    logicVariables.progDonkey = sum(1 for x in ownedItems if x == Items.ProgressiveDonkeyPotion)
+    logicVariables.blast = logicVariables.blast or (Items.BaboonBlast in ownedItems or logicVariables.progDonkey >= 1) and logicVariables.donkey
+    logicVariables.strongKong = logicVariables.strongKong or (Items.StrongKong in ownedItems or logicVariables.progDonkey >= 2) and logicVariables.donkey
+    logicVariables.grab = logicVariables.grab or (Items.GorillaGrab in ownedItems or logicVariables.progDonkey >= 3) and logicVariables.donkey
+
+    logicVariables.progDiddy = sum(1 for x in ownedItems if x == Items.ProgressiveDiddyPotion)
+    logicVariables.charge = logicVariables.charge or (Items.ChimpyCharge in ownedItems or logicVariables.progDiddy >= 1) and logicVariables.diddy
+    logicVariables.jetpack = logicVariables.jetpack or (Items.RocketbarrelBoost in ownedItems or logicVariables.progDiddy >= 2) and logicVariables.diddy
+    logicVariables.spring = logicVariables.spring or (Items.SimianSpring in ownedItems or logicVariables.progDiddy >= 3) and logicVariables.diddy
+
+    logicVariables.progLanky = sum(1 for x in ownedItems if x == Items.ProgressiveLankyPotion)
+    logicVariables.handstand = logicVariables.handstand or (Items.Orangstand in ownedItems or logicVariables.progLanky >= 1) and logicVariables.lanky
+    logicVariables.balloon = logicVariables.balloon or (Items.BaboonBalloon in ownedItems or logicVariables.progLanky >= 2) and logicVariables.lanky
+    logicVariables.sprint = logicVariables.sprint or (Items.OrangstandSprint in ownedItems or logicVariables.progLanky >= 3) and logicVariables.lanky
+
+    logicVariables.progTiny = sum(1 for x in ownedItems if x == Items.ProgressiveTinyPotion)
+    logicVariables.mini = logicVariables.mini or (Items.MiniMonkey in ownedItems or logicVariables.progTiny >= 1) and logicVariables.tiny
+    logicVariables.twirl = logicVariables.twirl or (Items.PonyTailTwirl in ownedItems or logicVariables.progTiny >= 2) and logicVariables.tiny
+    logicVariables.monkeyport = logicVariables.monkeyport or (Items.Monkeyport in ownedItems or logicVariables.progTiny >= 3) and logicVariables.tiny
+
+    logicVariables.progChunky = sum(1 for x in ownedItems if x == Items.ProgressiveChunkyPotion)
+    logicVariables.hunkyChunky = logicVariables.hunkyChunky or (Items.HunkyChunky in ownedItems or logicVariables.progChunky >= 1) and logicVariables.chunky
+    logicVariables.punch = logicVariables.punch or (Items.PrimatePunch in ownedItems or logicVariables.progChunky >= 2) and logicVariables.chunky
+    logicVariables.gorillaGone = logicVariables.gorillaGone or (Items.GorillaGone in ownedItems or logicVariables.progChunky >= 3) and logicVariables.chunky
+
+    logicVariables.coconut = logicVariables.coconut or Items.Coconut in ownedItems and logicVariables.donkey
+    logicVariables.peanut = logicVariables.peanut or Items.Peanut in ownedItems and logicVariables.diddy
+    logicVariables.grape = logicVariables.grape or Items.Grape in ownedItems and logicVariables.lanky
+    logicVariables.feather = logicVariables.feather or Items.Feather in ownedItems and logicVariables.tiny
+    logicVariables.pineapple = logicVariables.pineapple or Items.Pineapple in ownedItems and logicVariables.chunky
+
+    logicVariables.bongos = logicVariables.bongos or Items.Bongos in ownedItems and logicVariables.donkey
+    logicVariables.guitar = logicVariables.guitar or Items.Guitar in ownedItems and logicVariables.diddy
+    logicVariables.trombone = logicVariables.trombone or Items.Trombone in ownedItems and logicVariables.lanky
+    logicVariables.saxophone = logicVariables.saxophone or Items.Saxophone in ownedItems and logicVariables.tiny
+    logicVariables.triangle = logicVariables.triangle or Items.Triangle in ownedItems and logicVariables.chunky
+
+    logicVariables.crankyAccess = logicVariables.crankyAccess or Items.Cranky in ownedItems
+    logicVariables.funkyAccess = logicVariables.funkyAccess or Items.Funky in ownedItems
+    logicVariables.candyAccess = logicVariables.candyAccess or Items.Candy in ownedItems
+    logicVariables.snideAccess = logicVariables.snideAccess or Items.Snide in ownedItems
+
+    logicVariables.nintendoCoin = logicVariables.nintendoCoin or Items.NintendoCoin in ownedItems
+    logicVariables.rarewareCoin = logicVariables.rarewareCoin or Items.RarewareCoin in ownedItems
+
+    logicVariables.JapesKey = logicVariables.JapesKey or Items.JungleJapesKey in ownedItems
+    logicVariables.AztecKey = logicVariables.AztecKey or Items.AngryAztecKey in ownedItems
+    logicVariables.FactoryKey = logicVariables.FactoryKey or Items.FranticFactoryKey in ownedItems
+    logicVariables.GalleonKey = logicVariables.GalleonKey or Items.GloomyGalleonKey in ownedItems
+    logicVariables.ForestKey = logicVariables.ForestKey or Items.FungiForestKey in ownedItems
+    logicVariables.CavesKey = logicVariables.CavesKey or Items.CrystalCavesKey in ownedItems
+    logicVariables.CastleKey = logicVariables.CastleKey or Items.CreepyCastleKey in ownedItems
+    logicVariables.HelmKey = logicVariables.HelmKey or Items.HideoutHelmKey in ownedItems
+
+    logicVariables.HelmDonkey1 = logicVariables.HelmDonkey1 or Items.HelmDonkey1 in ownedItems
+    logicVariables.HelmDonkey2 = logicVariables.HelmDonkey2 or Items.HelmDonkey2 in ownedItems
+    logicVariables.HelmDiddy1 = logicVariables.HelmDiddy1 or Items.HelmDiddy1 in ownedItems
+    logicVariables.HelmDiddy2 = logicVariables.HelmDiddy2 or Items.HelmDiddy2 in ownedItems
+    logicVariables.HelmLanky1 = logicVariables.HelmLanky1 or Items.HelmLanky1 in ownedItems
+    logicVariables.HelmLanky2 = logicVariables.HelmLanky2 or Items.HelmLanky2 in ownedItems
+    logicVariables.HelmTiny1 = logicVariables.HelmTiny1 or Items.HelmTiny1 in ownedItems
+    logicVariables.HelmTiny2 = logicVariables.HelmTiny2 or Items.HelmTiny2 in ownedItems
+    logicVariables.HelmChunky1 = logicVariables.HelmChunky1 or Items.HelmChunky1 in ownedItems
+    logicVariables.HelmChunky2 = logicVariables.HelmChunky2 or Items.HelmChunky2 in ownedItems
+
+    has_all = True
+    if not logicVariables.settings.fast_start_beginning_of_game:
+        for loc in (Locations.IslesSwimTrainingBarrel, Locations.IslesVinesTrainingBarrel, Locations.IslesBarrelsTrainingBarrel, Locations.IslesOrangesTrainingBarrel):
+            if logicVariables.spoiler.LocationList[loc].item not in ownedItems:
+                has_all = False
+    logicVariables.allTrainingChecks = logicVariables.allTrainingChecks or has_all
+
+    logicVariables.Slam = sum(1 for x in ownedItems if x == Items.ProgressiveSlam) + STARTING_SLAM
+    if Items.ProgressiveSlam in logicVariables.banned_items:  # If slam is banned, prevent logic from owning a better slam
+        logicVariables.Slam = STARTING_SLAM
+    logicVariables.AmmoBelts = sum(1 for x in ownedItems if x == Items.ProgressiveAmmoBelt)
+    logicVariables.InstUpgrades = sum(1 for x in ownedItems if x == Items.ProgressiveInstrumentUpgrade)
+    logicVariables.Melons = 1
+    if logicVariables.bongos or logicVariables.guitar or logicVariables.trombone or logicVariables.saxophone or logicVariables.triangle or logicVariables.InstUpgrades > 0:
+        logicVariables.Melons = 2
+    if logicVariables.InstUpgrades >= 2:
+        logicVariables.Melons = 3
+
+    logicVariables.GoldenBananas = sum(1 for x in ownedItems if x == Items.GoldenBanana)
+    logicVariables.BananaFairies = sum(1 for x in ownedItems if x == Items.BananaFairy)
+    logicVariables.BananaMedals = sum(1 for x in ownedItems if x == Items.BananaMedal)
+    logicVariables.BattleCrowns = sum(1 for x in ownedItems if x == Items.BattleCrown)
+    logicVariables.RainbowCoins = sum(1 for x in ownedItems if x == Items.RainbowCoin)
+
+    logicVariables.camera = logicVariables.camera or Items.CameraAndShockwave in ownedItems or Items.Camera in ownedItems
+    logicVariables.shockwave = logicVariables.shockwave or Items.CameraAndShockwave in ownedItems or Items.Shockwave in ownedItems
+
+    logicVariables.scope = logicVariables.scope or Items.SniperSight in ownedItems
+    # Having the homing ammo ability also requires having reliable access to homing ammo. This is not a perfect fix, but should cover 99.9% of cases and won't show up in hint paths.
+    logicVariables.homing = logicVariables.homing or (
+        Items.HomingAmmo in ownedItems and (Events.ForestEntered in logicVariables.Events or Events.CastleEntered in logicVariables.Events or logicVariables.assumeFillSuccess)
+    )
+
+    logicVariables.superSlam = logicVariables.Slam >= 2
+    logicVariables.superDuperSlam = logicVariables.Slam >= 3
+
+    logicVariables.Blueprints = [x for x in ownedItems if x >= Items.JungleJapesDonkeyBlueprint and x <= Items.DKIslesChunkyBlueprint]
+    logicVariables.Hints = [x for x in ownedItems if x >= Items.JapesDonkeyHint and x <= Items.CastleChunkyHint]
+    logicVariables.Beans = sum(1 for x in ownedItems if x == Items.Bean)
+    logicVariables.Pearls = sum(1 for x in ownedItems if x == Items.Pearl)
+
+    logicVariables.UpdateCoins()
+
+    logicVariables.bananaHoard = logicVariables.bananaHoard or Items.BananaHoard in ownedItems
+
+
+class TestLogicUpdate(unittest.TestCase):
+    """Tests for LogicVarHolder.Update."""
+
+    def setUp(self):
+        """Make a spoiler, a set of logic variables updated incrementally and one that recounts on every update."""
+        settings_dict = decrypt_settings_string_enum(settings_string)
+        settings_dict["seed"] = 1
+        self.spoiler = Spoiler(Settings(settings_dict))
+        self.incremental = LogicVarHolder(self.spoiler)
+        self.recounted = LogicVarHolder(self.spoiler)
+        self.items = AllItems(self.spoiler.settings)
+
+    def update(self, ownedItems: list):
+        """Update both sets of logic variables and check they match."""
+        self.incremental.Update(ownedItems)
+        # Forget what was counted, so everything is counted from scratch
+        self.recounted.countedOwnedItems = None
+        self.recounted.Update(list(ownedItems))
+        self.assertEqual(logic_state(self.incremental), logic_state(self.recounted))
+
+    def test_adding_items(self):
+        """Items added to the same list or to a copy of it are counted the same as a recount."""
+        rng = random.Random(0)
+        owned = []
+        for item in rng.sample(self.items, len(self.items)):
+            owned.append(item)
+            if rng.random() < 0.3:
+                owned = owned.copy()
+            self.update(owned)
+
+    def test_removing_items(self):
+        """Lists with items removed or replaced, passed as new lists, are counted the same as a full count."""
+        rng = random.Random(1)
+        owned = rng.sample(self.items, len(self.items) // 2)
+        self.update(owned)
+        for _ in range(50):
+            owned = owned.copy()
+            removed = owned.pop(rng.randrange(len(owned)))
+            self.update(owned)
+            owned.append(rng.choice(self.items))
+            self.update(owned)
+            owned.append(removed)
+            self.update(owned)
+            # Replaced so the list is the same length as last time
+            owned = owned.copy()
+            owned[rng.randrange(len(owned))] = rng.choice(self.items)
+            self.update(owned)
+        # A list shorter than the one counted can't be the same list with items added
+        owned.pop()
+        self.update(owned)
+        self.assertEqual(self.incremental.OwnedItemCounts[Items.GoldenBanana], owned.count(Items.GoldenBanana))
+
+    def test_banned_items(self):
+        """Banning or unbanning items recounts the same as a full count."""
+        owned = self.items[: len(self.items) // 2]
+        self.update(owned)
+        for banned in ([owned[0]], [owned[0], owned[1]], []):
+            self.incremental.banned_items = list(banned)
+            self.recounted.banned_items = list(banned)
+            self.update(owned)
+            owned.append(owned[0])
+            self.update(owned)
+
+    def test_snapshot_restore(self):
+        """Counting carries on from a restored snapshot as if the updates since it hadn't happened."""
+        owned = self.items[:100]
+        self.update(owned)
+        snapshot = self.incremental.Snapshot()
+        recounted_snapshot = self.recounted.Snapshot()
+        self.update(owned + self.items[100:150])
+        self.incremental.Restore(snapshot)
+        self.recounted.Restore(recounted_snapshot)
+        self.assertEqual(logic_state(self.incremental), logic_state(self.recounted))
+        self.update(owned + self.items[150:200])
+        # Given the list that holds the items it counted, a restored snapshot only counts the items added to it
+        resumed = owned + self.items[200:210]
+        self.incremental.Restore(snapshot)
+        self.incremental.countedOwnedItems = resumed
+        self.incremental.countedLength = len(owned)
+        self.recounted.Restore(recounted_snapshot)
+        self.update(resumed)
+
+    def test_kongs(self):
+        """The owned kongs follow the kong flags."""
+        self.update([])
+        kongs = [kong for kong in (Kongs.donkey, Kongs.diddy, Kongs.lanky, Kongs.tiny, Kongs.chunky) if self.incremental.HasKong(kong)]
+        self.assertEqual(self.incremental.GetKongs(), kongs)
+        self.update([Items.Donkey, Items.Diddy, Items.Lanky, Items.Tiny, Items.Chunky])
+        self.assertEqual(self.incremental.GetKongs(), [Kongs.donkey, Kongs.diddy, Kongs.lanky, Kongs.tiny, Kongs.chunky])
+        # The list returned is the caller's to change
+        self.incremental.GetKongs().clear()
+        self.assertEqual(len(self.incremental.GetKongs()), 5)
+
+    def test_matches_original(self):
+        """For every preset, updating incrementally sets the same counts, blueprints, hints and kong and move flags as the original implementation."""
+        for name, preset in presets.items():
+            with self.subTest(preset=name):
+                settings_dict = decrypt_settings_string_enum(preset)
+                settings_dict["seed"] = 1
+                spoiler = Spoiler(Settings(settings_dict))
+                # Presets that don't shuffle items have none in the pool, so every item is owned in turn instead
+                items = AllItems(spoiler.settings) or list(Items)
+                # Training barrels hold their moves, so whether all of them were found depends on the items owned
+                for location, item in (
+                    (Locations.IslesSwimTrainingBarrel, Items.Swim),
+                    (Locations.IslesVinesTrainingBarrel, Items.Vines),
+                    (Locations.IslesBarrelsTrainingBarrel, Items.Barrels),
+                    (Locations.IslesOrangesTrainingBarrel, Items.Oranges),
+                ):
+                    spoiler.LocationList[location].item = item
+                incremental = LogicVarHolder(spoiler)
+                original = LogicVarHolder(spoiler)
+                rng = random.Random(name)
+                owned = []
+                remaining = rng.sample(items, len(items))
+                while len(remaining) > 0:
+                    count = rng.randrange(1, 20)
+                    owned.extend(remaining[:count])
+                    remaining = remaining[count:]
+                    if len(owned) > len(items) // 2 and Events.ForestEntered not in incremental.Events:
+                        incremental.AddEvent(Events.ForestEntered)
+                        original.AddEvent(Events.ForestEntered)
+                    incremental.Update(owned)
+                    baseline_update(original, list(owned))
+                    self.assertEqual(compared_state(incremental), compared_state(original))
+                # Banning items recounts them the same as the original too
+                banned = [Items.ProgressiveSlam, owned[0]]
+                incremental.BanItems(banned.copy())
+                original.BanItems(banned.copy())
+                incremental.Update(owned)
+                baseline_update(original, list(owned))
+                self.assertEqual(compared_state(incremental), compared_state(original))
+                self.assertEqual(incremental.Slam, STARTING_SLAM)
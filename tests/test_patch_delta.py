@@ -0,0 +1,310 @@
+"""Tests that the VCDIFF patches built from the written ranges rebuild the patched ROM from dk64.z64."""
+
+import random
+import unittest
+import zlib
+
+from randomizer.Patching.PatchDelta import createVCDiff, getBPSSegments, getPatchOperations, loadBaseSegments
+from randomizer.Patching.Patcher import LocalROM, dirty_ranges
+
+
+def encode_bps_number(value: int) -> bytes:
+    """Encode a number as a BPS variable length integer."""
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value == 0:
+            encoded.append(0x80 | byte)
+            return bytes(encoded)
+        encoded.append(byte)
+        value -= 1
+
+
+def encode_bps_relative(value: int) -> bytes:
+    """Encode a signed relative offset as a BPS number."""
+    return encode_bps_number((abs(value) << 1) | (value < 0))
+
+
+def make_bps(source: bytes, commands: list) -> bytes:
+    """Make a BPS patch from ("read", length), ("add", data), ("source", offset, length) and ("target", offset, length) commands."""
+    body = bytearray()
+    output_offset = 0
+    source_offset = 0
+    target_offset = 0
+    for command in commands:
+        if command[0] == "read":
+            length = command[1]
+            body += encode_bps_number(((length - 1) << 2) | 0)
+        elif command[0] == "add":
+            length = len(command[1])
+            body += encode_bps_number(((length - 1) << 2) | 1) + command[1]
+        elif command[0] == "source":
+            _, offset, length = command
+            body += encode_bps_number(((length - 1) << 2) | 2) + encode_bps_relative(offset - source_offset)
+            source_offset = offset + length
+        else:
+            _, offset, length = command
+            body += encode_bps_number(((length - 1) << 2) | 3) + encode_bps_relative(offset - target_offset)
+            target_offset = offset + length
+        output_offset += length
+    patch = b"BPS1" + encode_bps_number(len(source)) + encode_bps_number(output_offset) + encode_bps_number(0) + body
+    patch += zlib.crc32(source).to_bytes(4, "little") + bytes(4)
+    return patch + zlib.crc32(patch).to_bytes(4, "little")
+
+
+def read_number(data: bytes, offset: int, bps: bool = False):
+    """Read a BPS or VCDIFF variable length integer, returning it and the offset after it."""
+    value = 0
+    shift = 1
+    while True:
+        byte = data[offset]
+        offset += 1
+        if bps:
+            value += (byte & 0x7F) * shift
+            if byte & 0x80:
+                return value, offset
+            shift <<= 7
+            value += shift
+        else:
+            value = (value << 7) | (byte & 0x7F)
+            if not byte & 0x80:
+                return value, offset
+
+
+def copy_within(output: bytearray, offset: int, length: int):
+    """Copy bytes from earlier in the output to its end, where the copy may overlap what it writes."""
+    while length > 0:
+        chunk = min(length, len(output) - offset)
+        output += output[offset : offset + chunk]
+        offset += chunk
+        length -= chunk
+
+
+def apply_bps(source: bytes, patch: bytes) -> bytes:
+    """Apply a BPS patch."""
+    assert patch[:4] == b"BPS1"
+    _, offset = read_number(patch, 4, True)
+    _, offset = read_number(patch, offset, True)
+    metadata_size, offset = read_number(patch, offset, True)
+    offset += metadata_size
+    output = bytearray()
+    source_offset = 0
+    target_offset = 0
+    while offset < len(patch) - 12:
+        data, offset = read_number(patch, offset, True)
+        command = data & 3
+        length = (data >> 2) + 1
+        if command == 0:
+            output += source[len(output) : len(output) + length]
+        elif command == 1:
+            output += patch[offset : offset + length]
+            offset += length
+        else:
+            relative, offset = read_number(patch, offset, True)
+            relative = -(relative >> 1) if relative & 1 else relative >> 1
+            if command == 2:
+                source_offset += relative
+                output += source[source_offset : source_offset + length]
+                source_offset += length
+            else:
+                target_offset += relative
+                copy_within(output, target_offset, length)
+                target_offset += length
+    return bytes(output)
+
+
+def default_code_table() -> list:
+    """Build the default VCDIFF instruction code table as ((type, size, mode), (type, size, mode)), where type 1 is ADD, 2 is RUN and 3 is COPY."""
+    empty = (0, 0, 0)
+    table = [((2, 0, 0), empty), ((1, 0, 0), empty)]
+    table += [((1, size, 0), empty) for size in range(1, 18)]
+    for mode in range(9):
+        table += [((3, size, mode), empty) for size in [0] + list(range(4, 19))]
+    for mode in range(6):
+        table += [((1, add_size, 0), (3, copy_size, mode)) for add_size in range(1, 5) for copy_size in range(4, 7)]
+    for mode in range(6, 9):
+        table += [((1, add_size, 0), (3, 4, mode)) for add_size in range(1, 5)]
+    table += [((3, 4, mode), (1, 1, 0)) for mode in range(9)]
+    assert len(table) == 256
+    return table
+
+
+def apply_vcdiff(source: bytes, patch: bytes) -> bytes:
+    """Apply a VCDIFF patch using the default code table, as any RFC 3284 decoder would."""
+    assert patch[:4] == bytes([0xD6, 0xC3, 0xC4, 0x00])
+    assert patch[4] == 0, "secondary compression and custom code tables aren't used"
+    table = default_code_table()
+    offset = 5
+    output = bytearray()
+    while offset < len(patch):
+        window_indicator = patch[offset]
+        offset += 1
+        segment = b""
+        if window_indicator & 0x03:
+            segment_length, offset = read_number(patch, offset)
+            segment_position, offset = read_number(patch, offset)
+            segment = (source if window_indicator & 0x01 else bytes(output))[segment_position : segment_position + segment_length]
+        _, offset = read_number(patch, offset)
+        window_length, offset = read_number(patch, offset)
+        assert patch[offset] == 0
+        offset += 1
+        data_length, offset = read_number(patch, offset)
+        instructions_length, offset = read_number(patch, offset)
+        addresses_length, offset = read_number(patch, offset)
+        if window_indicator & 0x04:
+            offset += 4
+        data = patch[offset : offset + data_length]
+        offset += data_length
+        instructions = patch[offset : offset + instructions_length]
+        offset += instructions_length
+        addresses = patch[offset : offset + addresses_length]
+        offset += addresses_length
+        window = bytearray()
+        near = [0] * 4
+        next_near = 0
+        same = [0] * (3 * 256)
+        data_offset = instruction_offset = address_offset = 0
+        while instruction_offset < len(instructions):
+            index = instructions[instruction_offset]
+            instruction_offset += 1
+            for kind, size, mode in table[index]:
+                if kind == 0:
+                    continue
+                if size == 0:
+                    size, instruction_offset = read_number(instructions, instruction_offset)
+                if kind == 1:
+                    window += data[data_offset : data_offset + size]
+                    data_offset += size
+                elif kind == 2:
+                    window += data[data_offset : data_offset + 1] * size
+                    data_offset += 1
+                else:
+                    here = len(segment) + len(window)
+                    if mode < 6:
+                        value, address_offset = read_number(addresses, address_offset)
+                        address = value if mode == 0 else here - value if mode == 1 else near[mode - 2] + value
+                    else:
+                        address = same[(mode - 6) * 256 + addresses[address_offset]]
+                        address_offset += 1
+                    near[next_near] = address
+                    next_near = (next_near + 1) % 4
+                    same[address % len(same)] = address
+                    if address + size <= len(segment):
+                        window += segment[address : address + size]
+                    elif address >= len(segment):
+                        copy_within(window, address - len(segment), size)
+                    else:
+                        for position in range(address, address + size):
+                            window.append(segment[position] if position < len(segment) else window[position - len(segment)])
+        assert len(window) == window_length
+        output += window
+    return bytes(output)
+
+
+def patch_rom(base: bytes, writes: list) -> tuple:
+    """Write (offset, data) pairs over a copy of the base ROM, returning the patched ROM and the ranges written."""
+    patched = bytearray(base)
+    written = []
+    for offset, data in writes:
+        patched[offset : offset + len(data)] = data
+        written.append([offset, offset + len(data)])
+    return bytes(patched), written
+
+
+class TestPatchDelta(unittest.TestCase):
+    """Tests for building VCDIFF patches."""
+
+    def setUp(self):
+        """Make a stand in for dk64.z64 and a base ROM patch using every BPS command."""
+        rng = random.Random(0)
+        self.rng = rng
+        self.source = rng.randbytes(0x4000)
+        self.commands = [
+            ("read", 0x400),
+            ("add", rng.randbytes(0x100)),
+            ("source", 0x2000, 0x800),
+            # Copies of the same bytes overlapping what they write, as BPS uses for runs
+            ("target", 0xCFC, 0x300),
+            ("source", 0x100, 0x200),
+            ("read", 0x300),
+            ("target", 0x10, 0x1000),
+            ("add", bytes(0x80)),
+            ("source", 0x3F00, 0x100),
+        ]
+        self.bps = make_bps(self.source, self.commands)
+        self.base = apply_bps(self.source, self.bps)
+
+    def check_patch(self, source: bytes, bps: bytes, base: bytes, writes: list):
+        """Check the VCDIFF patch of the written ROM rebuilds it from the source, exactly as the base ROM patch and the writes do."""
+        patched, written = patch_rom(base, writes)
+        source_size, segments = getBPSSegments(bps)
+        self.assertEqual(source_size, len(source))
+        patch = createVCDiff(patched, source_size, getPatchOperations(source_size, segments, written, len(patched)))
+        self.assertEqual(apply_vcdiff(source, patch), patched)
+        return patch
+
+    def test_segments(self):
+        """The segments cover the base ROM in order and point at the bytes the BPS patch builds it from."""
+        source_size, segments = getBPSSegments(self.bps)
+        position = 0
+        for start, length, address in segments:
+            self.assertEqual(start, position)
+            if address is not None:
+                copied = (self.source + self.base)[address : address + length]
+                self.assertEqual(copied, self.base[start : start + length])
+            position += length
+        self.assertEqual(position, len(self.base))
+
+    def test_unwritten(self):
+        """A ROM nothing was written to is rebuilt only from the source and the bytes the BPS patch adds."""
+        patch = self.check_patch(self.source, self.bps, self.base, [])
+        self.assertLess(len(patch), 0x100 + 0x80 + 0x100)
+
+    def test_written(self):
+        """Writes anywhere, including over bytes copied later in the base ROM and past its end, are rebuilt."""
+        base_size = len(self.base)
+        writes = [
+            (0, b"\xff" * 4),
+            (0x3F0, self.rng.randbytes(0x20)),
+            (0x410, self.rng.randbytes(0x10)),
+            (0x420, b"\x00"),
+            (0x600, self.rng.randbytes(0x40)),
+            (0x1800, self.rng.randbytes(0x200)),
+            (base_size - 8, self.rng.randbytes(8)),
+            (base_size, self.rng.randbytes(0x30)),
+        ]
+        self.check_patch(self.source, self.bps, self.base, writes)
+
+    def test_random_writes(self):
+        """Random overlapping writes are rebuilt."""
+        for _ in range(20):
+            writes = []
+            for _ in range(self.rng.randrange(1, 30)):
+                offset = self.rng.randrange(len(self.base) + 0x10)
+                writes.append((offset, self.rng.randbytes(self.rng.randrange(1, 0x100))))
+            self.check_patch(self.source, self.bps, self.base, writes)
+
+    def test_shrink_patch(self):
+        """The patches built on the real shrink patch rebuild the ROM from a source of the size it expects."""
+        source_size, _ = loadBaseSegments()
+        with open("./static/patches/shrink-dk64.bps", "rb") as file:
+            bps = file.read()
+        source = self.rng.randbytes(source_size)
+        base = apply_bps(source, bps)
+        writes = [(self.rng.randrange(len(base)), self.rng.randbytes(self.rng.randrange(1, 0x1000))) for _ in range(50)]
+        self.check_patch(source, bps, base, writes)
+
+    def test_local_rom_ranges(self):
+        """The ranges LocalROM records while patching are enough to rebuild the ROM."""
+        rom = LocalROM()
+        base = rom.rom.getvalue()
+        for offset, data in ((0x10, b"\x01\x02"), (0x12, b"\x03"), (0x100, bytes(0x40)), (0x80, b"\xaa" * 0x90), (len(base) - 2, b"\xbb" * 4)):
+            rom.seek(offset)
+            rom.writeBytes(data)
+        rom.seek(0x2000)
+        rom.writeMultipleBytes(0x12345678, 4)
+        patched = rom.rom.getvalue()
+        source_size = len(base)
+        patch = createVCDiff(patched, source_size, getPatchOperations(source_size, [(0, source_size, 0)], dirty_ranges, len(patched)))
+        self.assertEqual(apply_vcdiff(base, patch), patched)
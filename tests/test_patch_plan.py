@@ -0,0 +1,91 @@
+"""Tests that planning the assembly patches gives the same ROM as writing them in the order patchAssembly makes them."""
+
+import json
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+import randomizer.Patching.ASMPatcher as ASMPatcher
+from randomizer.Enums.Items import Items
+from randomizer.Patching.Patcher import LocalROM
+from randomizer.Patching.PatchPlan import PatchPlan
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+with open("static/presets/preset_files.json", "r") as file:
+    presets = [preset for preset in json.load(file) if preset.get("settings_string")]
+
+ROM_SIZE = 0x2000000
+OVERLAY_TABLE = 0x1FFB000
+
+
+def make_rom() -> LocalROM:
+    """Make a full size ROM of filler bytes, with a made up start for every overlay."""
+    data = bytearray(bytes(range(251)) * (ROM_SIZE // 251 + 1))[:ROM_SIZE]
+    for overlay in range(11):
+        start = 0x100000 if overlay == 1 else 0x400000 + overlay * 0x40000
+        data[OVERLAY_TABLE + 8 * overlay : OVERLAY_TABLE + 8 * overlay + 4] = start.to_bytes(4, "big")
+    rom = LocalROM()
+    rom.rom = BytesIO(bytes(data))
+    return rom
+
+
+def make_spoiler(settings_string: str) -> Spoiler:
+    """Make the spoiler of a preset, with the parts patchAssembly reads that are only set while generating filled in."""
+    settings_dict = decrypt_settings_string_enum(settings_string)
+    settings_dict["seed"] = 5
+    spoiler = Spoiler(Settings(settings_dict))
+    spoiler.arcade_item_reward = Items.NintendoCoin
+    spoiler.jetpac_item_reward = Items.RarewareCoin
+    spoiler.japes_rock_actor = 45
+    spoiler.aztec_vulture_actor = 46
+    spoiler.coin_requirements = {}
+    spoiler.dk_face_puzzle = [1, None] * 4 + [2]
+    spoiler.chunky_face_puzzle = [None, 2] * 4 + [1]
+    spoiler.arcade_order = [1, 2, 3, 0]
+    return spoiler
+
+
+class TestPatchPlan(unittest.TestCase):
+    """Tests for the plans patchAssembly writes the ROM through."""
+
+    def test_order(self):
+        """The constant writes can go anywhere among the settings writes without changing the ROM.
+
+        patchAssembly applies every constant write before the settings writes, where they used to be interleaved.
+        Writing them all after the settings writes gives the same ROM, and the settings writes never read a byte
+        the constant writes change, so every order of the two, the old interleaved one included, gives that ROM.
+        """
+        for preset in presets:
+            with self.subTest(preset=preset["name"]):
+                spoiler = make_spoiler(preset["settings_string"])
+                constant_first = make_rom()
+                reads = []
+                read_bytes = constant_first.readBytes
+
+                def read(size: int) -> bytes:
+                    """Read through the ROM, noting what was read."""
+                    reads.append((constant_first.rom.tell(), size))
+                    return read_bytes(size)
+
+                with patch.object(constant_first, "readBytes", side_effect=read):
+                    settings_plan = ASMPatcher.patchAssembly(constant_first, spoiler)
+                constant_plan = ASMPatcher.compileConstantAssembly(tuple(sorted(ASMPatcher.populateOverlayOffsets(constant_first).items())))
+                self.assertGreater(len(settings_plan.values), 0)
+                self.assertGreater(len(constant_plan.values), 0)
+
+                constant_last = make_rom()
+                with patch.object(ASMPatcher, "compileConstantAssembly", return_value=PatchPlan()):
+                    ASMPatcher.patchAssembly(constant_last, spoiler)
+                constant_plan.apply(constant_last)
+                self.assertEqual(constant_first.rom.getvalue(), constant_last.rom.getvalue())
+
+                for start, size in reads:
+                    self.assertFalse(any(position in constant_plan.values for position in range(start, start + size)))
+                # Writing the plans to the ROM is the same as writing each byte the plans hold
+                written = bytearray(make_rom().rom.getvalue())
+                for plan in (constant_plan, settings_plan):
+                    for position, value in plan.values.items():
+                        written[position] = value
+                self.assertEqual(constant_first.rom.getvalue(), bytes(written))
@@ -0,0 +1,73 @@
+"""Tests for the named random number streams of a generation."""
+
+import threading
+import unittest
+from contextvars import Context
+
+from randomizer.RandomStreams import COSMETICS, FILL, NoActiveStreams, RandomStreams, cosmetic_random, fill_random
+
+
+def draw() -> list:
+    """Draw a few values from the fill and cosmetic streams."""
+    return [fill_random.randint(0, 1 << 30), cosmetic_random.random(), fill_random.random()]
+
+
+class TestRandomStreams(unittest.TestCase):
+    """Tests for RandomStreams and the stream proxies."""
+
+    def test_no_active_streams(self):
+        """Drawing with no streams active raises rather than drawing from an unseeded stream."""
+        with self.assertRaises(NoActiveStreams):
+            Context().run(fill_random.random)
+        errors = []
+
+        def draw_in_thread():
+            """Draw in a new thread, which doesn't share the streams of this one."""
+            try:
+                cosmetic_random.randint(0, 10)
+            except NoActiveStreams as error:
+                errors.append(error)
+
+        def start_thread():
+            """Activate streams here, then draw in a new thread."""
+            RandomStreams(1).activate()
+            thread = threading.Thread(target=draw_in_thread)
+            thread.start()
+            thread.join()
+
+        Context().run(start_thread)
+        self.assertEqual(len(errors), 1)
+
+    def test_reproducible(self):
+        """Streams of the same seed draw the same values, and activating them again starts them over."""
+
+        def draw_seed(seed) -> list:
+            """Draw from new streams of a seed."""
+            RandomStreams(seed).activate()
+            return draw()
+
+        first = Context().run(draw_seed, "seed")
+        self.assertEqual(Context().run(draw_seed, "seed"), first)
+        self.assertNotEqual(Context().run(draw_seed, "other"), first)
+
+    def test_independent(self):
+        """Extra draws from one stream don't change another, and a stream can be reset or reseeded on its own."""
+
+        def draw_streams(extra_draws: int) -> tuple:
+            """Draw from the cosmetic stream after some extra draws from the fill stream."""
+            streams = RandomStreams("seed")
+            streams.activate()
+            for _ in range(extra_draws):
+                fill_random.random()
+            cosmetic = cosmetic_random.random()
+            streams.reset(COSMETICS)
+            self.assertEqual(cosmetic_random.random(), cosmetic)
+            fill = fill_random.random()
+            streams.reseed(FILL, "attempt")
+            return cosmetic, fill, fill_random.random()
+
+        plain = Context().run(draw_streams, 0)
+        extra = Context().run(draw_streams, 5)
+        self.assertEqual(extra[0], plain[0])
+        self.assertNotEqual(extra[1], plain[1])
+        self.assertEqual(extra[2], plain[2])
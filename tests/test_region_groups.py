@@ -0,0 +1,105 @@
+"""Tests that searching groups of always-connected regions as one reaches the same locations as searching every region."""
+
+import json
+import random
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import randomizer.ShuffleExits as ShuffleExits
+from randomizer.Enums.SearchMode import SearchMode
+from randomizer.Enums.Settings import ShuffleLoadingZones
+from randomizer.Fill import Fill_Spoiler, GetAccessibleLocations, GroupRegions
+from randomizer.ItemPool import AllItems
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+with open("static/presets/preset_files.json", "r") as file:
+    presets = {preset["name"]: preset["settings_string"] for preset in json.load(file) if preset.get("settings_string")}
+
+
+class WorldBuilt(Exception):
+    """Raised in place of the item fill, to stop once the world is built."""
+
+
+@contextmanager
+def build_world(name: str, seed: int):
+    """Build the world of a preset's seed up to the item fill, with its exits shuffled, logic compiled and regions grouped."""
+    settings_dict = decrypt_settings_string_enum(presets[name])
+    settings_dict["seed"] = seed
+    spoiler = Spoiler(Settings(settings_dict))
+    try:
+        with patch("randomizer.Fill.FillWorld", side_effect=WorldBuilt):
+            try:
+                Fill_Spoiler(spoiler)
+            except WorldBuilt:
+                pass
+        yield spoiler
+    finally:
+        # Generating a seed puts the shuffled exits back at the end, which stopping at the fill skips
+        ShuffleExits.Reset(spoiler)
+
+
+def search(spoiler: Spoiler, owned: list, grouped: bool) -> tuple:
+    """Get the locations and events reachable with the given items, with or without the region groups."""
+    groups = spoiler.regionGroups
+    exits = spoiler.groupedRegionExits
+    if not grouped:
+        spoiler.regionGroups = {}
+        spoiler.groupedRegionExits = {}
+    try:
+        spoiler.Reset()
+        accessible = GetAccessibleLocations(spoiler, owned.copy(), SearchMode.GetReachable)
+        return set(accessible), set(spoiler.LogicVariables.Events)
+    finally:
+        spoiler.regionGroups = groups
+        spoiler.groupedRegionExits = exits
+
+
+class TestRegionGroups(unittest.TestCase):
+    """Tests for grouping regions in searches."""
+
+    def check_searches(self, spoiler: Spoiler, seed: int):
+        """Check grouped and ungrouped searches reach the same locations and events with random sets of items owned."""
+        self.assertGreater(len(spoiler.regionGroups), 0)
+        rng = random.Random(seed)
+        items = AllItems(spoiler.settings)
+        for fraction in (0, 0.1, 0.25, 0.4, 0.6, 0.8, 1):
+            owned = rng.sample(items, int(len(items) * fraction))
+            self.assertEqual(search(spoiler, owned, True), search(spoiler, owned, False), f"{fraction} of the items owned")
+
+    def test_level_shuffle(self):
+        """Searches match with level entrances shuffled, and again once the fill's retry reshuffles them."""
+        with build_world("Beginner Settings", 1) as spoiler:
+            self.assertEqual(spoiler.settings.shuffle_loading_zones, ShuffleLoadingZones.levels)
+            self.check_searches(spoiler, 1)
+            # As FillWorld does when retrying hard
+            ShuffleExits.ShuffleExits(spoiler)
+            spoiler.UpdateExits()
+            GroupRegions(spoiler)
+            self.check_searches(spoiler, 2)
+
+    def test_loading_zone_shuffle(self):
+        """Searches match with every loading zone shuffled."""
+        for seed in (1, 2):
+            with self.subTest(seed=seed), build_world("Balanced LZR", seed) as spoiler:
+                self.assertEqual(spoiler.settings.shuffle_loading_zones, ShuffleLoadingZones.all)
+                self.check_searches(spoiler, seed)
+
+    def test_random_start(self):
+        """Searches match with every loading zone shuffled and a random starting region."""
+        with build_world("Hell Mode", 1) as spoiler:
+            self.assertTrue(spoiler.settings.random_starting_region)
+            self.check_searches(spoiler, 1)
+
+    def test_groups(self):
+        """Regions of a group are connected both ways and share one group, and only exits out of it are kept."""
+        with build_world("Balanced LZR", 1) as spoiler:
+            for regionId, group in spoiler.regionGroups.items():
+                self.assertIn(regionId, group)
+                self.assertEqual(group, tuple(sorted(group)))
+                for member in group:
+                    self.assertIs(spoiler.regionGroups[member], group)
+                for exit in spoiler.groupedRegionExits[regionId]:
+                    self.assertIn(exit, spoiler.RegionList[regionId].exits)
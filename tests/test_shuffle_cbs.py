@@ -0,0 +1,95 @@
+"""Tests that colored banana shuffle gives every kong exactly 100 bananas per level within the game's object limits."""
+
+import json
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+import randomizer.ShuffleExits as ShuffleExits
+from randomizer.Enums.Collectibles import Collectibles
+from randomizer.Enums.Kongs import GetKongs
+from randomizer.Enums.Levels import Levels
+from randomizer.Enums.Settings import CBRando
+from randomizer.Fill import Fill_Spoiler
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+with open("static/presets/preset_files.json", "r") as file:
+    settings_string = [preset["settings_string"] for preset in json.load(file) if preset.get("settings_string")][0]
+
+# Most bunches and singles ShuffleCBs places, without and with Isles
+PLACEMENT_LIMITS = {CBRando.on: 1127, CBRando.on_with_isles: 1400}
+MAX_BALLOONS = 105
+# Bananas each collectible is worth
+COLLECTIBLE_VALUES = {Collectibles.balloon: 10, Collectibles.bunch: 5, Collectibles.banana: 1}
+
+
+class WorldBuilt(Exception):
+    """Raised in place of the item fill, to stop once the world is built."""
+
+
+def shuffle_cbs(seed: int, cb_rando: CBRando) -> Spoiler:
+    """Build the world of a seed of the first bundled preset with colored bananas shuffled, stopping before the item fill."""
+    settings_dict = decrypt_settings_string_enum(settings_string)
+    settings_dict["seed"] = seed
+    settings_dict["cb_rando"] = cb_rando
+    spoiler = Spoiler(Settings(settings_dict))
+    try:
+        with patch("randomizer.Fill.FillWorld", side_effect=WorldBuilt):
+            Fill_Spoiler(spoiler)
+    except WorldBuilt:
+        pass
+    finally:
+        # Generating a seed puts the shuffled exits back at the end, which stopping at the fill skips
+        ShuffleExits.Reset(spoiler)
+    return spoiler
+
+
+class TestShuffleCBs(unittest.TestCase):
+    """Tests for colored banana shuffle."""
+
+    def check_placements(self, spoiler: Spoiler, cb_rando: CBRando):
+        """Check the bananas placed and the collectibles the logic sees for them."""
+        levels = [Levels.JungleJapes, Levels.AngryAztec, Levels.FranticFactory, Levels.GloomyGalleon, Levels.FungiForest, Levels.CrystalCaves, Levels.CreepyCastle]
+        if cb_rando == CBRando.on_with_isles:
+            levels.append(Levels.DKIsles)
+        bananas = Counter()
+        objects = 0
+        balloons = 0
+        group_kongs = {}
+        for placement in spoiler.cb_placements:
+            if placement["type"] == "balloons":
+                bananas[(placement["level"], placement["kong"])] += 10
+                balloons += 1
+            else:
+                # Every part of a group goes to the same kong
+                self.assertEqual(group_kongs.setdefault((placement["level"], placement["group"]), placement["kong"]), placement["kong"])
+                for location in placement["locations"]:
+                    self.assertIn(location[0], (1, 5))
+                    bananas[(placement["level"], placement["kong"])] += location[0]
+                    objects += 1
+        self.assertEqual(bananas, Counter({(level, kong): 100 for level in levels for kong in GetKongs()}))
+        self.assertLessEqual(objects, PLACEMENT_LIMITS[cb_rando])
+        self.assertLessEqual(balloons, MAX_BALLOONS)
+        # The logic sees the same bananas
+        collected = Counter()
+        for collectibles in spoiler.CollectibleRegions.values():
+            for collectible in collectibles:
+                if collectible.type in COLLECTIBLE_VALUES:
+                    collected[collectible.kong] += COLLECTIBLE_VALUES[collectible.type] * collectible.amount
+        self.assertEqual(collected, Counter({kong: 100 * len(levels) for kong in GetKongs()}))
+
+    def test_placements(self):
+        """Every kong gets exactly 100 bananas in every level within the placement limit, across seeds, with and without Isles."""
+        for cb_rando in (CBRando.on, CBRando.on_with_isles):
+            for seed in (1, 2, 3):
+                with self.subTest(cb_rando=cb_rando.name, seed=seed):
+                    spoiler = shuffle_cbs(seed, cb_rando)
+                    self.check_placements(spoiler, cb_rando)
+
+    def test_reproducible(self):
+        """A seed places the same bananas every time."""
+        first = shuffle_cbs(4, CBRando.on)
+        second = shuffle_cbs(4, CBRando.on)
+        self.assertEqual(first.cb_placements, second.cb_placements)
@@ -0,0 +1,74 @@
+"""Tests that the world state of one seed doesn't leak into the next seed made in the same process."""
+
+import json
+import unittest
+
+from randomizer.Enums.Items import Items
+from randomizer.Lists.Location import LocationListOriginal
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.ShuffleCrates import ShuffleMelonCrates
+from randomizer.ShufflePatches import ShufflePatches
+from randomizer.Spoiler import Spoiler
+
+
+def make_settings() -> Settings:
+    """Make the settings of the first bundled preset."""
+    with open("static/presets/preset_files.json", "r") as file:
+        presets = json.load(file)
+    settings_string = [preset["settings_string"] for preset in presets if preset.get("settings_string")][0]
+    settings_dict = decrypt_settings_string_enum(settings_string)
+    settings_dict["seed"] = 1
+    return Settings(settings_dict)
+
+
+def snapshot_locations(location_list: dict) -> dict:
+    """Get the per-seed state of every location."""
+    state = {}
+    for location_id, location in location_list.items():
+        map_data = [(map_id.map, map_id.id, map_id.flag, map_id.kong) for map_id in location.default_mapid_data or []]
+        state[location_id] = (location.name, location.level, location.item, location.inaccessible, map_data, location.placement_index)
+    return state
+
+
+def snapshot_regions(spoiler: Spoiler) -> dict:
+    """Get the locations listed in every region."""
+    return {region_id: [location.id for location in region.locations] for region_id, region in spoiler.RegionList.items()}
+
+
+class TestSpoilerState(unittest.TestCase):
+    """Tests for the isolation of spoilers made in one process."""
+
+    def test_second_spoiler_is_unchanged(self):
+        """A spoiler made after another seed shuffled its locations matches one made before."""
+        original = snapshot_locations(LocationListOriginal)
+        reference = Spoiler(make_settings())
+        reference_locations = snapshot_locations(reference.LocationList)
+        reference_regions = snapshot_regions(reference)
+
+        first = Spoiler(make_settings())
+        ShufflePatches(first, {})
+        ShuffleMelonCrates(first, {})
+        for location_id, location in first.LocationList.items():
+            location.PlaceItem(first, Items.GoldenBanana)
+            if location.placement_index is not None:
+                location.placement_index.append(-1)
+            for map_id in location.default_mapid_data or []:
+                map_id.map = 99
+        self.assertNotEqual(snapshot_locations(first.LocationList), reference_locations)
+        self.assertNotEqual(snapshot_regions(first), reference_regions)
+
+        second = Spoiler(make_settings())
+        self.assertEqual(snapshot_locations(second.LocationList), reference_locations)
+        self.assertEqual(snapshot_regions(second), reference_regions)
+        self.assertEqual(snapshot_locations(LocationListOriginal), original)
+
+    def test_copied_map_data_is_shared_within_a_location(self):
+        """A location's map data and default map data stay the same list in its copy."""
+        spoiler = Spoiler(make_settings())
+        for location_id, location in LocationListOriginal.items():
+            copied = spoiler.LocationList[location_id]
+            if location.default_mapid_data is location.map_id_list:
+                self.assertIs(copied.default_mapid_data, copied.map_id_list)
+            for map_id, copied_map_id in zip(location.default_mapid_data or [], copied.default_mapid_data or []):
+                self.assertIsNot(map_id, copied_map_id)
@@ -0,0 +1,115 @@
+"""Tests for the on-disk cache of generated cosmetic textures."""
+
+import gzip
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+import randomizer.Patching.TextureCache as TextureCacheModule
+from randomizer.Patching.LibImage import TextureFormat, arrayToImage, encodeTexture, hueShift, imageToArray
+from randomizer.Patching.TextureCache import TextureCache, getCachedTextureData, getTextureCacheKey
+
+
+def build_hue_shifted(pixels: np.ndarray, shift: int, compressed: bool) -> bytes:
+    """Build a hue shifted texture the way hueShiftImageContainer does, from pixels rather than a file in the ROM."""
+    data = encodeTexture(imageToArray(hueShift(arrayToImage(pixels), shift)), TextureFormat.RGBA5551)
+    if compressed:
+        data = gzip.compress(data, compresslevel=9)
+    return data
+
+
+class TestTextureCache(unittest.TestCase):
+    """Tests for storing, finding and evicting cached textures."""
+
+    def setUp(self):
+        """Make a folder for the cache."""
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the folder."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_get_put(self):
+        """Stored data is found by its key, and nothing is found for other keys."""
+        cache = TextureCache(self.folder, 1024)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", b"first")
+        cache.put("b", b"second")
+        self.assertEqual(cache.get("a"), b"first")
+        self.assertEqual(cache.get("b"), b"second")
+        cache.put("a", b"replaced")
+        self.assertEqual(cache.get("a"), b"replaced")
+        self.assertIsNone(cache.get("c"))
+        # Another process using the same folder finds the same entries
+        self.assertEqual(TextureCache(self.folder, 1024).get("b"), b"second")
+
+    def test_disabled(self):
+        """A cache with no room stores nothing, and data bigger than the cache isn't stored."""
+        cache = TextureCache(self.folder, 0)
+        cache.put("a", b"data")
+        self.assertIsNone(cache.get("a"))
+        cache = TextureCache(self.folder, 4)
+        cache.put("a", b"too big")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.getEntries(), [])
+
+    def test_eviction(self):
+        """The least recently used entries are removed once the cache grows past its size cap."""
+        cache = TextureCache(self.folder, 30)
+        now = time.time()
+        for index, key in enumerate(("a", "b", "c")):
+            cache.put(key, bytes(10))
+            os.utime(cache.getPath(key), (now - 100 + index, now - 100 + index))
+        # Reading an entry makes it the most recently used
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("d", bytes(10))
+        self.assertIsNone(cache.get("b"))
+        for key in ("a", "c", "d"):
+            self.assertEqual(cache.get(key), bytes(10))
+        self.assertLessEqual(cache.getSize(), 30)
+        # Entries other processes added count too
+        TextureCache(self.folder, 30).put("e", bytes(10))
+        cache.put("f", bytes(10))
+        self.assertLessEqual(cache.getSize(), 30)
+        self.assertEqual(cache.get("f"), bytes(10))
+
+    def test_key(self):
+        """Keys change with the sources, transform, parameters, randomizer version and builder code."""
+        key = getTextureCacheKey(["source"], "hue_shift", (7, 32, 32, 1))
+        self.assertEqual(key, getTextureCacheKey(["source"], "hue_shift", (7, 32, 32, 1)))
+        self.assertNotEqual(key, getTextureCacheKey(["other"], "hue_shift", (7, 32, 32, 1)))
+        self.assertNotEqual(key, getTextureCacheKey(["source"], "mask", (7, 32, 32, 1)))
+        self.assertNotEqual(key, getTextureCacheKey(["source"], "hue_shift", (7, 32, 32, 2)))
+        with patch.object(TextureCacheModule, "builder_hash", None), patch.object(TextureCacheModule, "version", "0.0.0"):
+            self.assertNotEqual(key, getTextureCacheKey(["source"], "hue_shift", (7, 32, 32, 1)))
+        with patch.object(TextureCacheModule, "builder_hash", None), patch.object(TextureCacheModule, "BUILDER_FILES", ("LibImage.py",)):
+            self.assertNotEqual(key, getTextureCacheKey(["source"], "hue_shift", (7, 32, 32, 1)))
+        self.assertEqual(key, getTextureCacheKey(["source"], "hue_shift", (7, 32, 32, 1)))
+
+    def test_hit_matches_rebuild(self):
+        """A texture found in the cache is the same as building it again, and isn't built again."""
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 256, (32, 32, 4), dtype=np.uint8)
+        builds = []
+
+        def build(compressed: bool) -> bytes:
+            """Build the texture, noting that it was built."""
+            builds.append(compressed)
+            return build_hue_shifted(pixels, 120, compressed)
+
+        with patch.object(TextureCacheModule, "texture_cache", TextureCache(self.folder, 1024 * 1024)):
+            for compressed in (False, True):
+                built = getCachedTextureData(["pixels"], "hue_shift", (compressed, 120), lambda: build(compressed))
+                cached = getCachedTextureData(["pixels"], "hue_shift", (compressed, 120), lambda: build(compressed))
+                rebuilt = build_hue_shifted(pixels, 120, compressed)
+                if compressed:
+                    # Compressed files hold the time they were compressed at
+                    built, cached, rebuilt = gzip.decompress(built), gzip.decompress(cached), gzip.decompress(rebuilt)
+                self.assertEqual(cached, built)
+                self.assertEqual(cached, rebuilt)
+        self.assertEqual(builds, [False, True])
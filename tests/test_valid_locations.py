@@ -0,0 +1,75 @@
+"""Tests that the cached valid location tables place items exactly as the tables computed for every seed did."""
+
+import json
+import unittest
+from unittest.mock import patch
+
+import randomizer.Settings as SettingsModule
+from randomizer.Enums.Levels import Levels
+from randomizer.Enums.Types import Types
+from randomizer.Fill import Fill_Spoiler
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+with open("static/presets/preset_files.json", "r") as file:
+    settings_string = [preset["settings_string"] for preset in json.load(file) if preset.get("settings_string")][0]
+
+
+def make_spoiler(seed: int) -> Spoiler:
+    """Make a spoiler of the first bundled preset."""
+    settings_dict = decrypt_settings_string_enum(settings_string)
+    settings_dict["seed"] = seed
+    return Spoiler(Settings(settings_dict))
+
+
+def snapshot_tables(valid_locations: dict) -> dict:
+    """Get the valid location tables as sorted lists, so tables stored as lists and as sets compare equal."""
+    return {typ: ({kong: sorted(kong_locations) for kong, kong_locations in locations.items()} if type(locations) is dict else sorted(locations)) for typ, locations in valid_locations.items()}
+
+
+class TestValidLocations(unittest.TestCase):
+    """Tests for the valid location tables."""
+
+    def setUp(self):
+        """Start without any cached tables."""
+        SettingsModule.ValidLocationsCache.clear()
+
+    def test_tables_match(self):
+        """The cached tables hold the same locations as the tables computed without the cache."""
+        spoiler = make_spoiler(1)
+        spoiler.settings.update_valid_locations(spoiler)
+        cached = snapshot_tables(spoiler.settings.valid_locations)
+        spoiler.settings.compile_valid_locations(spoiler)
+        self.assertEqual(cached, snapshot_tables(spoiler.settings.valid_locations))
+
+    def test_rigged_tables_are_not_shared(self):
+        """Tables rigged by fill for one seed aren't handed out by the cache to the next update or the next seed."""
+        first = make_spoiler(1)
+        first.settings.update_valid_locations(first)
+        expected = snapshot_tables(first.settings.valid_locations)
+        valid_locations = first.settings.valid_locations
+        self.assertIn(Types.Blueprint, valid_locations)
+        # Rigged the way fill rigs them to fill Helm and the bosses
+        for kong in valid_locations[Types.Blueprint]:
+            valid_locations[Types.Blueprint][kong] = [loc for loc in valid_locations[Types.Blueprint][kong] if first.LocationList[loc].level == Levels.HideoutHelm]
+        for typ in valid_locations:
+            if type(valid_locations[typ]) is not dict:
+                valid_locations[typ] = []
+        self.assertNotEqual(snapshot_tables(first.settings.valid_locations), expected)
+        first.settings.update_valid_locations(first)
+        self.assertEqual(snapshot_tables(first.settings.valid_locations), expected)
+        second = make_spoiler(1)
+        second.settings.update_valid_locations(second)
+        self.assertEqual(snapshot_tables(second.settings.valid_locations), expected)
+
+    def test_spoiler_unchanged(self):
+        """A fixed seed gives the same spoiler log with the cached tables, cold and warm, as with tables computed as lists."""
+        with patch.object(Settings, "update_valid_locations", Settings.compile_valid_locations):
+            uncached = make_spoiler(12345)
+            Fill_Spoiler(uncached)
+        self.assertEqual(len(SettingsModule.ValidLocationsCache), 0)
+        for _ in range(2):
+            cached = make_spoiler(12345)
+            Fill_Spoiler(cached)
+            self.assertEqual(cached.json, uncached.json)
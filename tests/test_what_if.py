@@ -0,0 +1,48 @@
+"""Tests that what-if checks split between worker processes give the same results as running them one after another."""
+
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from randomizer.Fill import CheckBeatableWithoutEach, Fill_Spoiler
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.Spoiler import Spoiler
+
+with open("static/presets/preset_files.json", "r") as file:
+    settings_string = [preset["settings_string"] for preset in json.load(file) if preset.get("settings_string")][0]
+
+
+class TestWhatIf(unittest.TestCase):
+    """Tests for CheckBeatableWithoutEach."""
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs processes to be forked")
+    def test_workers_match_sequential(self):
+        """Checks of the placed world split between 2 workers give the same results, in the same order, as checking each location here."""
+        calls = []
+
+        def check_both(spoiler: Spoiler, locationIds: list) -> list:
+            """Run the checks the fill asks for one after another and with 2 workers."""
+            with patch.dict(os.environ, {"WHAT_IF_WORKERS": "1"}):
+                sequential = CheckBeatableWithoutEach(spoiler, locationIds)
+            items = {locationId: spoiler.LocationList[locationId].item for locationId in locationIds}
+            with patch.dict(os.environ, {"WHAT_IF_WORKERS": "2"}):
+                parallel = CheckBeatableWithoutEach(spoiler, locationIds)
+            self.assertEqual({locationId: spoiler.LocationList[locationId].item for locationId in locationIds}, items)
+            calls.append((sequential, parallel))
+            return sequential
+
+        settings_dict = decrypt_settings_string_enum(settings_string)
+        settings_dict["seed"] = 12345
+        spoiler = Spoiler(Settings(settings_dict))
+        self.assertTrue(spoiler.settings.shuffle_items)
+        with patch("randomizer.Fill.CheckBeatableWithoutEach", side_effect=check_both):
+            Fill_Spoiler(spoiler)
+        self.assertGreater(len(calls), 0)
+        for sequential, parallel in calls:
+            self.assertEqual(parallel, sequential)
+        # Some of the items are needed and some aren't, so the checks tell locations apart
+        results = [beatable for sequential, parallel in calls for beatable, hints in sequential]
+        self.assertIn(False, results)
+        self.assertIn(True, results)